@@ -193,8 +193,11 @@ export const DashboardChatbot: React.FC = () => {
 
       try {
         try {
+          // token 이벤트는 생성 중인 초안, delta 이벤트는 검증을 마친 최종 답변
+          let draftVisible = false;
           await streamGraphRagAnswer(payload, (event) => {
-            if (event.type === 'delta') {
+            if (event.type === 'token') {
+              draftVisible = true;
               setMessages((prev) =>
                 prev.map((message) =>
                   message.id === assistantId
@@ -205,6 +208,19 @@ export const DashboardChatbot: React.FC = () => {
               return;
             }
 
+            if (event.type === 'delta') {
+              const replaceDraft = draftVisible;
+              draftVisible = false;
+              setMessages((prev) =>
+                prev.map((message) =>
+                  message.id === assistantId
+                    ? { ...message, content: `${replaceDraft ? '' : message.content}${event.text}` }
+                    : message
+                )
+              );
+              return;
+            }
+
             if (event.type === 'done') {
               finalResponse = event.response;
               return;
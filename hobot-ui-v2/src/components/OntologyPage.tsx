@@ -691,8 +691,11 @@ const OntologyPage: React.FC<{ mode?: 'architecture' | 'macro' }> = ({ mode = 'a
         let finalResponse: GraphRagAnswerResponse | null = null;
 
         try {
+            // token 이벤트는 생성 중인 초안, delta 이벤트는 검증을 마친 최종 답변
+            let draftVisible = false;
             await streamGraphRagAnswer(payload, (event) => {
-                if (event.type === 'delta') {
+                if (event.type === 'token') {
+                    draftVisible = true;
                     setChatMessages((prev) =>
                         prev.map((message) =>
                             message.id === assistantMessageId
@@ -702,6 +705,18 @@ const OntologyPage: React.FC<{ mode?: 'architecture' | 'macro' }> = ({ mode = 'a
                     );
                     return;
                 }
+                if (event.type === 'delta') {
+                    const replaceDraft = draftVisible;
+                    draftVisible = false;
+                    setChatMessages((prev) =>
+                        prev.map((message) =>
+                            message.id === assistantMessageId
+                                ? { ...message, content: `${replaceDraft ? '' : message.content}${event.text}` }
+                                : message
+                        )
+                    );
+                    return;
+                }
                 if (event.type === 'done') {
                     finalResponse = event.response;
                     return;
@@ -93,6 +93,9 @@ export interface GraphRagAnswerResponse {
 
 export type GraphRagAnswerStreamEvent =
   | { type: 'started'; flow_run_id?: string; message?: string }
+  | { type: 'progress'; stage: string; message?: string; elapsed_ms?: number; [key: string]: unknown }
+  | { type: 'token'; text: string; elapsed_ms?: number }
+  | { type: 'heartbeat'; elapsed_ms?: number }
   | { type: 'delta'; text: string }
   | { type: 'done'; flow_run_id?: string; response: GraphRagAnswerResponse }
   | { type: 'error'; error: string; status_code?: number };
@@ -57,3 +57,24 @@ def when_ready(server):
     except Exception as e:
         logger.error(f"[Gunicorn when_ready] 스케줄러 시작 실패: {e}", exc_info=True)
         # 스케줄러 실패해도 애플리케이션은 계속 실행
+
+
+def _drain_llm_usage_logs(logger_name: str):
+    """백그라운드로 모아둔 LLM 사용 로그를 프로세스 종료 전에 적재"""
+    import logging
+
+    try:
+        from service.llm_monitoring import shutdown_llm_usage_log_sink
+        shutdown_llm_usage_log_sink()
+    except Exception as e:
+        logging.getLogger(logger_name).error(f"[Gunicorn] LLM 사용 로그 drain 실패: {e}", exc_info=True)
+
+
+# Gunicorn 훅: 워커 프로세스 종료 직전 (워커 프로세스에서 실행)
+def worker_exit(server, worker):
+    _drain_llm_usage_logs("gunicorn.worker_exit")
+
+
+# Gunicorn 훅: 마스터 종료 직전 (스케줄러가 도는 메인 프로세스의 로그 drain)
+def on_exit(server):
+    _drain_llm_usage_logs("gunicorn.on_exit")
@@ -145,7 +145,8 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     """현재 사용자 정보 가져오기"""
     token = credentials.credentials
     payload = auth.verify_token(token)
-    user = auth.get_user_by_id(payload.get("id"))
+    # 토큰 subject별 짧은 TTL 캐시 (AUTH_PRINCIPAL_VERSION_CHECK_SECONDS마다 users.auth_version으로 다른 워커의 변경/삭제 확인)
+    user = auth.get_current_principal(payload.get("id"))
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
@@ -458,12 +459,13 @@ async def get_fred_data(
     """FRED 데이터 조회 API"""
     try:
         from service.macro_trading.collectors.fred_collector import (
-            get_fred_collector, RateLimitError, FREDAPIError, DataInsufficientError
+            RateLimitError, FREDAPIError, DataInsufficientError
         )
+        from service.macro_trading.signals.fred_series_store import get_fred_series_reader
         from service.macro_trading.validators.data_validator import FREDDataValidator
         from datetime import date, timedelta
         
-        collector = get_fred_collector()
+        collector = get_fred_series_reader()  # FRED_SERIES_STORE_ENABLED 이면 인메모리 저장소, 아니면 FREDCollector
         validator = FREDDataValidator()
         
         # 최근 N일간 데이터 조회
@@ -546,13 +548,14 @@ async def get_yield_curve_spread_data(
     """장단기 금리차 데이터 조회 API (DGS10 - DGS2)"""
     try:
         from service.macro_trading.collectors.fred_collector import (
-            get_fred_collector, RateLimitError, FREDAPIError, DataInsufficientError
+            RateLimitError, FREDAPIError, DataInsufficientError
         )
+        from service.macro_trading.signals.fred_series_store import get_fred_series_reader
         from service.macro_trading.validators.data_validator import FREDDataValidator
         from datetime import date, timedelta
         import pandas as pd
         
-        collector = get_fred_collector()
+        collector = get_fred_series_reader()  # FRED_SERIES_STORE_ENABLED 이면 인메모리 저장소, 아니면 FREDCollector
         validator = FREDDataValidator()
         
         # DGS10과 DGS2 데이터 조회
@@ -692,12 +695,13 @@ async def get_real_interest_rate_data(
     """실질 금리 시계열 데이터 조회 API (DFII10)"""
     try:
         from service.macro_trading.collectors.fred_collector import (
-            get_fred_collector, RateLimitError, FREDAPIError, DataInsufficientError
+            RateLimitError, FREDAPIError, DataInsufficientError
         )
+        from service.macro_trading.signals.fred_series_store import get_fred_series_reader
         from datetime import date, timedelta
         import pandas as pd
         
-        collector = get_fred_collector()
+        collector = get_fred_series_reader()  # FRED_SERIES_STORE_ENABLED 이면 인메모리 저장소, 아니면 FREDCollector
         
         # DFII10 데이터 직접 조회
         try:
@@ -2165,6 +2169,7 @@ async def save_user_kis_credentials(
     try:
         from service.database.db import get_db_connection
         from service.utils.encryption import encrypt_data
+        from service.utils.credential_store import invalidate_user_credentials
         
         # 암호화
         app_key_encrypted = encrypt_data(request.app_key)
@@ -2214,11 +2219,14 @@ async def save_user_kis_credentials(
                 ))
             
             conn.commit()
-            
-            return {
-                "status": "success",
-                "message": "KIS 인증 정보가 저장되었습니다."
-            }
+
+        # 복호화 인증 정보 캐시 무효화 (다음 조회 시 새 값으로 로드)
+        invalidate_user_credentials(current_user["id"], "kis")
+
+        return {
+            "status": "success",
+            "message": "KIS 인증 정보가 저장되었습니다."
+        }
     except Exception as e:
         logging.error(f"Error saving KIS credentials: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2463,6 +2471,10 @@ async def delete_user(user_id: str, admin_user: dict = Depends(require_admin)):
         deleted = auth.delete_user(user_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="User not found")
+
+        # 인증 정보는 FK CASCADE로 함께 삭제되므로 캐시도 제거
+        from service.utils.credential_store import invalidate_user_credentials
+        invalidate_user_credentials(user_id)
         
         return {"status": "success", "message": "User deleted"}
     except HTTPException:
@@ -3425,6 +3437,23 @@ async def update_crypto_config(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# 인증 정보 캐시 통계 API (admin 전용)
+@api_router.get("/admin/credential-cache/stats")
+async def get_credential_cache_stats(admin_user: dict = Depends(require_admin)):
+    """인증 정보/사용자 캐시 적중률 및 키 유도/복호화 소요 시간 (admin 전용)"""
+    from service.utils.credential_store import get_credential_store
+    from service.utils.encryption import get_encryption_stats
+
+    return {
+        "status": "success",
+        "data": {
+            "credential_cache": get_credential_store().stats(),
+            "encryption": get_encryption_stats(),
+            "principal_cache": auth.get_principal_cache_stats(),
+        }
+    }
+
+
 # 로그 조회 API (admin 전용)
 @api_router.get("/admin/logs")
 async def get_logs(
@@ -3433,9 +3462,13 @@ async def get_logs(
     log_file: Optional[str] = Query(None, description="백엔드 로그 파일명 (log.txt, error.log, access.log)"),
     start_time: Optional[str] = Query(None, description="시작 시간 (YYYY-MM-DDTHH:MM 형식)"),
     end_time: Optional[str] = Query(None, description="종료 시간 (YYYY-MM-DDTHH:MM 형식)"),
+    level: Optional[str] = Query(None, description="최소 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)"),
+    cursor: Optional[str] = Query(None, description="follow 모드 커서 (이전 응답의 cursor, 이후 추가된 줄만 조회)"),
     admin_user: dict = Depends(require_admin)
 ):
     """로그 조회 (admin 전용)"""
+    from service.utils.log_reader import tail_lines
+
     try:
         base_path = os.path.dirname(os.path.abspath(__file__))
         log_content = ""
@@ -3471,16 +3504,15 @@ async def get_logs(
                     for nginx_log in nginx_logs:
                         if os.path.exists(nginx_log):
                             try:
-                                with open(nginx_log, 'r', encoding='utf-8', errors='ignore') as f:
-                                    all_lines = f.readlines()
-                                    log_content = ''.join(all_lines[-lines:])
-                                    return {
-                                        "status": "success",
-                                        "log_type": log_type,
-                                        "content": log_content,
-                                        "file": nginx_log,
-                                        "lines": len(log_content.split('\n'))
-                                    }
+                                # 파일 끝에서 블록 단위로 거꾸로 읽어 최근 N줄만
+                                log_content = '\n'.join(tail_lines(nginx_log, lines).lines)
+                                return {
+                                    "status": "success",
+                                    "log_type": log_type,
+                                    "content": log_content,
+                                    "file": nginx_log,
+                                    "lines": len(log_content.split('\n'))
+                                }
                             except PermissionError:
                                 continue
                             except Exception:
@@ -3503,16 +3535,15 @@ async def get_logs(
                 for nginx_log in nginx_logs:
                     if os.path.exists(nginx_log):
                         try:
-                            with open(nginx_log, 'r', encoding='utf-8', errors='ignore') as f:
-                                all_lines = f.readlines()
-                                log_content = ''.join(all_lines[-lines:])
-                                return {
-                                    "status": "success",
-                                    "log_type": log_type,
-                                    "content": log_content,
-                                    "file": nginx_log,
-                                    "lines": len(log_content.split('\n'))
-                                }
+                            # 파일 끝에서 블록 단위로 거꾸로 읽어 최근 N줄만
+                            log_content = '\n'.join(tail_lines(nginx_log, lines).lines)
+                            return {
+                                "status": "success",
+                                "log_type": log_type,
+                                "content": log_content,
+                                "file": nginx_log,
+                                "lines": len(log_content.split('\n'))
+                            }
                         except PermissionError:
                             continue
                         except Exception:
@@ -3560,155 +3591,82 @@ async def get_logs(
             if not log_path or not os.path.exists(log_path):
                 return {"status": "success", "log_type": log_type, "content": f"Log file {log_name} not found", "file": log_name}
             
-            import re
-            from datetime import datetime
-            
-            # 타임스탬프 파싱을 위한 정규식
-            # log.txt 형식: 2025-11-01 21:51:25,255 - INFO - ...
-            timestamp_pattern = re.compile(r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}(?:,\d+)?)')
-            # access.log/error.log 형식 (Gunicorn): IP - - [01/Nov/2025:21:51:25 +0000] ...
-            gunicorn_timestamp_pattern = re.compile(r'\[(\d{2}/\w+/\d{4}:\d{2}:\d{2}:\d{2})')
-            
-            def parse_timestamp(line):
-                """로그 라인에서 타임스탬프를 파싱하여 datetime 객체로 반환"""
-                try:
-                    # log.txt 형식: 2025-11-01 21:51:25,255
-                    match = timestamp_pattern.match(line)
-                    if match:
-                        ts_str = match.group(1).replace(',', '.')
-                        return datetime.strptime(ts_str, '%Y-%m-%d %H:%M:%S.%f')
-                    
-                    # Gunicorn access.log/error.log 형식: [01/Nov/2025:21:51:25:00]
-                    match = gunicorn_timestamp_pattern.search(line)
-                    if match:
-                        ts_str = match.group(1)
-                        return datetime.strptime(ts_str, '%d/%b/%Y:%H:%M:%S')
-                    
-                    # 타임스탬프를 찾을 수 없으면 현재 시간 반환 (맨 뒤로 정렬)
-                    return datetime.now()
-                except:
-                    # 파싱 실패 시 현재 시간 반환
-                    return datetime.now()
-            
-            # 로그 파일 읽기
-            # 시간 필터가 없으면 파일 끝에서 최근 N줄만 읽기 (tail과 동일하게)
-            # 시간 필터가 있으면 전체 파일을 읽어서 필터링
-            all_log_entries = []  # (timestamp, log_line) 튜플 리스트
+            from service.utils.log_reader import get_log_reader
+
+            reader = get_log_reader(log_path)
             try:
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    if start_time or end_time:
-                        # 시간 필터가 있으면 전체 파일 읽기
-                        file_lines = f.readlines()
-                    else:
-                        # 시간 필터가 없으면 파일 끝에서 최근 N줄만 읽기 (효율적이고 정확함)
-                        # 파일 크기가 크면 seek로 끝부분만 읽기
-                        try:
-                            # 파일 크기 확인
-                            f.seek(0, 2)  # 파일 끝으로 이동
-                            file_size = f.tell()
-                            
-                            # 최근 대략 N줄을 읽기 위해 (평균 라인 길이 * N * 2)만큼만 읽기
-                            # 안전하게 더 많이 읽기 위해 * 3
-                            read_size = min(lines * 200 * 3, file_size)  # 평균 라인 길이 200자 가정
-                            f.seek(max(0, file_size - read_size))
-                            file_lines = f.readlines()
-                            # 실제로는 마지막 N줄만 사용 (Traceback 등 여러 줄 에러 포함)
-                            file_lines = file_lines[-lines * 2:]  # 여유있게 2배로
-                        except:
-                            # seek 실패 시 전체 파일 읽기
-                            f.seek(0)
-                            file_lines = f.readlines()
-                            file_lines = file_lines[-lines * 2:]
-                    
-                    if file_lines:
-                        # 타임스탬프가 없는 줄(예: Traceback의 일부)을 처리하기 위해
-                        # 이전 줄의 타임스탬프를 상속받도록 처리
-                        last_timestamp = None
-                        for line in file_lines:
-                            line = line.rstrip('\n\r')
-                            if not line.strip():  # 빈 줄은 건너뛰기
-                                continue
-                            
-                            # 타임스탬프 패턴이 있는지 먼저 확인
-                            has_timestamp = bool(timestamp_pattern.match(line) or gunicorn_timestamp_pattern.search(line))
-                            
-                            if has_timestamp:
-                                # 타임스탬프가 있으면 파싱
-                                timestamp = parse_timestamp(line)
-                                last_timestamp = timestamp
-                            else:
-                                # 타임스탬프가 없으면 이전 줄의 타임스탬프 상속
-                                if last_timestamp is not None:
-                                    timestamp = last_timestamp
-                                else:
-                                    # 첫 줄이 타임스탬프가 없으면 건너뛰기
-                                    continue
-                            
-                            all_log_entries.append((timestamp, line))
-            except Exception as e:
-                logging.warning(f"Could not read {log_path}: {e}")
-                return {"status": "error", "message": f"Error reading log file: {str(e)}", "file": log_name}
-            
-            if all_log_entries:
-                # 타임스탬프 기준으로 정렬 (오래된 것부터 최신 순)
-                all_log_entries.sort(key=lambda x: x[0])
-                
-                # 시간 필터 적용
-                # 프론트엔드에서 UTC+9 시간을 보내므로, 로그 타임스탬프와 직접 비교
-                # 로그 타임스탬프는 서버의 로컬 시간대(UTC+9)로 저장되어 있다고 가정
-                filtered_entries = all_log_entries
-                if start_time or end_time:
+                if cursor:
+                    # follow 모드: 커서 이후 추가된 줄만 (파일 회전/잘림 시 처음부터, reset=True)
+                    chunk = reader.follow(cursor)
+                    return {
+                        "status": "success",
+                        "log_type": log_type,
+                        "content": '\n'.join(line for line in chunk.lines if line.strip()),
+                        "file": log_name,
+                        "lines": len(chunk.lines),
+                        "cursor": chunk.cursor,
+                        "reset": chunk.reset,
+                    }
+
+                if start_time or end_time or level:
+                    # 시간/레벨 필터: 세그먼트 인덱스로 해당 구간만 읽기
+                    start_dt = end_dt = None
                     try:
+                        # 프론트엔드에서 UTC+9 시간을 보내므로, 로그 타임스탬프(서버 로컬 시간)와 직접 비교
                         if start_time:
-                            # UTC+9 시간대를 naive datetime으로 파싱 (로그와 동일한 시간대)
                             start_dt = datetime.strptime(start_time, '%Y-%m-%dT%H:%M')
-                            filtered_entries = [entry for entry in filtered_entries if entry[0] >= start_dt]
                         if end_time:
-                            # UTC+9 시간대를 naive datetime으로 파싱 (로그와 동일한 시간대)
-                            end_dt = datetime.strptime(end_time, '%Y-%m-%dT%H:%M')
                             # 종료 시간에 59초 59밀리초 추가하여 해당 시간대까지 포함
-                            end_dt = end_dt.replace(second=59, microsecond=999999)
-                            filtered_entries = [entry for entry in filtered_entries if entry[0] <= end_dt]
+                            end_dt = datetime.strptime(end_time, '%Y-%m-%dT%H:%M').replace(second=59, microsecond=999999)
                     except ValueError as e:
                         logging.warning(f"Invalid time format: {e}")
-                        # 시간 파싱 실패 시 필터링하지 않음
-                
-                # 최근 N줄만 선택 (시간 필터 적용 후)
-                recent_entries = filtered_entries[-lines:] if len(filtered_entries) > lines else filtered_entries
-                
-                # 로그 내용 구성
-                log_content = '\n'.join([line for _, line in recent_entries])
-                
-                # 파일 정보 구성
-                file_info = log_name
-                file_info += f" (Total: {len(all_log_entries)} lines"
-                if start_time or end_time:
-                    file_info += f", Filtered: {len(filtered_entries)} lines"
-                file_info += f", Showing: {len(recent_entries)} lines)"
-                if start_time or end_time:
-                    file_info += f" | Time Range: {start_time or 'N/A'} ~ {end_time or 'N/A'}"
-                
-                log_file_name = file_info
-                
-                return {
-                    "status": "success",
-                    "log_type": log_type,
-                    "content": log_content,
-                    "file": log_file_name,
-                    "lines": len(recent_entries)
-                }
-            else:
-                return {"status": "success", "log_type": log_type, "content": f"No content in {log_name}", "file": log_name}
+                        # 시간 파싱 실패 시 시간 필터링하지 않음
+                    try:
+                        chunk = reader.search(start=start_dt, end=end_dt, min_level=level, limit=lines)
+                    except ValueError as e:
+                        raise HTTPException(status_code=400, detail=str(e))
+                    total_lines = reader.total_lines()
+                else:
+                    # 필터가 없으면 파일 끝에서 블록 단위로 거꾸로 읽어 최근 N줄만
+                    chunk = reader.tail(lines)
+                    total_lines = None
+            except HTTPException:
+                raise
+            except Exception as e:
+                logging.warning(f"Could not read {log_path}: {e}")
+                return {"status": "error", "message": f"Error reading log file: {str(e)}", "file": log_name}
+
+            recent_lines = [line for line in chunk.lines if line.strip()]
+            if not recent_lines:
+                return {"status": "success", "log_type": log_type, "content": f"No content in {log_name}", "file": log_name, "cursor": chunk.cursor}
+
+            # 파일 정보 구성
+            file_info = log_name
+            file_info += " ("
+            if total_lines is not None:
+                file_info += f"Total: {total_lines} lines, "
+            file_info += f"Showing: {len(recent_lines)} lines)"
+            if start_time or end_time:
+                file_info += f" | Time Range: {start_time or 'N/A'} ~ {end_time or 'N/A'}"
+            if level:
+                file_info += f" | Level: {level.upper()}+"
+
+            return {
+                "status": "success",
+                "log_type": log_type,
+                "content": '\n'.join(recent_lines),
+                "file": file_info,
+                "lines": len(recent_lines),
+                "cursor": chunk.cursor,
+            }
         elif log_type == "frontend":
             # 프론트엔드 빌드 로그
             frontend_log = os.path.join(base_path, "logs", "frontend-build.log")
             if os.path.exists(frontend_log):
                 log_file = frontend_log
                 try:
-                    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        all_lines = f.readlines()
-                        # 최근 N줄만 반환
-                        log_content = ''.join(all_lines[-lines:])
+                    # 최근 N줄만 반환 (파일 끝에서 블록 단위로 거꾸로 읽기)
+                    log_content = '\n'.join(tail_lines(log_file, lines).lines)
                     return {
                         "status": "success",
                         "log_type": log_type,
@@ -5311,6 +5269,17 @@ async def startup_event():
         logging.info("[Gunicorn Worker] 스케줄러는 메인 프로세스의 when_ready 훅에서 시작됩니다.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 실행되는 이벤트"""
+    # 백그라운드 싱크에 남은 LLM 사용 로그 적재
+    try:
+        from service.llm_monitoring import shutdown_llm_usage_log_sink
+        shutdown_llm_usage_log_sink()
+    except Exception as e:
+        logging.error(f"LLM 사용 로그 drain 실패: {e}", exc_info=True)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8081)
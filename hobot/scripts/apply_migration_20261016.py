@@ -0,0 +1,61 @@
+import sys
+import os
+from dotenv import load_dotenv
+import pymysql
+
+# Add parent directory to path to allow importing service modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+load_dotenv(override=True)
+
+from service.database.db import get_db_connection
+from service.macro_trading.collectors.kr_real_estate_collector import (
+    TRANSACTION_GENERATED_COLUMNS,
+    TRANSACTION_INDEXES,
+)
+
+
+def apply_migration():
+    """
+    kr_real_estate_transactions에 조회용 stored generated column(lawd_cd, apt_name, umd_name, jibun)과 인덱스 추가.
+    STORED 컬럼 추가는 테이블 전체 복사가 일어나므로 수집 작업이 없는 시간대에 실행한다.
+    """
+    print("Starting migration...")
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            for step, (column, ddl) in enumerate(TRANSACTION_GENERATED_COLUMNS, start=1):
+                try:
+                    print(f"{step}. Adding {column} column...")
+                    cursor.execute(f"ALTER TABLE kr_real_estate_transactions ADD COLUMN {column} {ddl}")
+                    print("   -> Done.")
+                except pymysql.err.OperationalError as e:
+                    if e.args[0] == 1060:  # Duplicate column name
+                        print(f"   -> Column {column} already exists. Skipping.")
+                    else:
+                        raise e
+
+            for step, (index_name, columns) in enumerate(TRANSACTION_INDEXES, start=len(TRANSACTION_GENERATED_COLUMNS) + 1):
+                try:
+                    print(f"{step}. Adding {index_name} index...")
+                    cursor.execute(f"ALTER TABLE kr_real_estate_transactions ADD INDEX {index_name} {columns}")
+                    print("   -> Done.")
+                except pymysql.err.OperationalError as e:
+                    if e.args[0] == 1061:  # Duplicate key name
+                        print(f"   -> Index {index_name} already exists. Skipping.")
+                    else:
+                        raise e
+
+            conn.commit()
+            print("Migration completed successfully.")
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    apply_migration()
@@ -0,0 +1,50 @@
+import sys
+import os
+from dotenv import load_dotenv
+import pymysql
+
+# Add parent directory to path to allow importing service modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+load_dotenv(override=True)
+
+from service.database.db import get_db_connection
+from service.macro_trading.collectors.kr_real_estate_summary import (
+    DISTRIBUTION_COLUMNS,
+    SUMMARY_TABLE,
+)
+
+
+def apply_migration():
+    """
+    kr_real_estate_monthly_summary에 분포 통계 컬럼(median_price, p25/median/p75_price_per_m2, area_tx_count) 추가.
+    적용 후 다음 집계 실행부터 값이 채워진다.
+    """
+    print("Starting migration...")
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            for step, (column, ddl) in enumerate(DISTRIBUTION_COLUMNS, start=1):
+                try:
+                    print(f"{step}. Adding {column} column...")
+                    cursor.execute(f"ALTER TABLE {SUMMARY_TABLE} ADD COLUMN {column} {ddl}")
+                    print("   -> Done.")
+                except pymysql.err.OperationalError as e:
+                    if e.args[0] == 1060:  # Duplicate column name
+                        print(f"   -> Column {column} already exists. Skipping.")
+                    else:
+                        raise e
+
+            conn.commit()
+            print("Migration completed successfully.")
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    apply_migration()
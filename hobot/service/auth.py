@@ -6,6 +6,9 @@ import hashlib
 import secrets
 import json
 import base64
+import copy
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 import jwt
@@ -15,12 +18,18 @@ from io import BytesIO
 from fastapi import HTTPException, status
 from service.database.db import get_db_connection
 from service.utils.encryption import encrypt_data, decrypt_data
+from service.utils.credential_store import invalidate_user_credentials
 
 # JWT 시크릿 키 (환경 변수에서 가져오거나 기본값 사용)
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", secrets.token_urlsafe(32))
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# 인증 사용자(principal) 캐시 TTL (초). 0이면 캐시하지 않는다.
+DEFAULT_PRINCIPAL_CACHE_TTL_SECONDS = 30.0
+# 캐시 적중 중 users.auth_version 재확인 주기 (초). 이 주기 안의 적중은 DB를 거치지 않는다.
+DEFAULT_PRINCIPAL_VERSION_CHECK_SECONDS = 5.0
+
 
 def _row_to_dict(row) -> Dict:
     """MySQL Row를 딕셔너리로 변환"""
@@ -118,6 +127,137 @@ def get_user_by_id(user_id: str) -> Optional[Dict]:
         return _row_to_dict(row)
 
 
+class PrincipalCache:
+    """
+    토큰 subject(사용자 ID)별 users 행 캐시 (get_current_user 전용)
+
+    - 짧은 TTL 동안 전체 사용자 행(MFA secret/백업 코드 포함) 조회 없이 같은 사용자 행을 반환한다.
+    - role/MFA/비밀번호 등 사용자 정보를 바꾸는 함수는 users.auth_version을 올리고 invalidate()를 호출한다.
+      invalidate()는 같은 프로세스의 항목을 즉시 무효로 만들고, 바뀌기 전에 시작된 조회 결과도 캐시하지 않는다.
+    - 캐시는 워커(프로세스)별이므로, version_loader를 주면 항목당 version_check_seconds에 한 번만
+      DB의 auth_version(PK 단건 조회)과 캐시된 행의 auth_version을 비교한다. 그 사이 적중은 DB를 거치지 않으며,
+      다른 워커에서 바뀐/삭제된 사용자는 최대 version_check_seconds 안에 반영된다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        clock=time.monotonic,
+        version_check_seconds: Optional[float] = None,
+    ):
+        if ttl_seconds is None:
+            try:
+                ttl_seconds = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", DEFAULT_PRINCIPAL_CACHE_TTL_SECONDS))
+            except ValueError:
+                ttl_seconds = DEFAULT_PRINCIPAL_CACHE_TTL_SECONDS
+        self.ttl_seconds = max(float(ttl_seconds), 0.0)
+        if version_check_seconds is None:
+            try:
+                version_check_seconds = float(
+                    os.getenv("AUTH_PRINCIPAL_VERSION_CHECK_SECONDS", DEFAULT_PRINCIPAL_VERSION_CHECK_SECONDS)
+                )
+            except ValueError:
+                version_check_seconds = DEFAULT_PRINCIPAL_VERSION_CHECK_SECONDS
+        self.version_check_seconds = max(float(version_check_seconds), 0.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple] = {}  # user_id -> (expires_at, version, user, checked_at)
+        self._versions: Dict[str, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "stale_hits": 0, "version_checks": 0}
+
+    def get(self, user_id: str, loader, version_loader=None) -> Optional[Dict]:
+        """
+        version_loader(user_id): DB의 현재 auth_version (사용자 없음이면 None).
+        """
+        key = str(user_id)
+        with self._lock:
+            now = self._clock()
+            version = self._versions.setdefault(key, 0)
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] <= now or entry[1] != version):
+                entry = None
+            if entry is not None and (version_loader is None or now - entry[3] < self.version_check_seconds):
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry[2])
+
+        if entry is not None:
+            shared_version = version_loader(user_id)
+            with self._lock:
+                self._stats["version_checks"] += 1
+                if shared_version is not None and shared_version == entry[2].get("auth_version"):
+                    if self._entries.get(key) is entry:
+                        self._entries[key] = entry[:3] + (self._clock(),)
+                    self._stats["hits"] += 1
+                    return copy.deepcopy(entry[2])
+                # 다른 워커에서 변경/삭제됨
+                self._stats["stale_hits"] += 1
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+
+        with self._lock:
+            self._stats["misses"] += 1
+        user = loader(user_id)
+
+        # 사용자 없음(None)은 캐시하지 않는다 (삭제 직후 토큰은 매번 DB로 확인).
+        if user is not None and self.ttl_seconds > 0:
+            with self._lock:
+                if self._versions.get(key, 0) == version:
+                    now = self._clock()
+                    self._entries[key] = (now + self.ttl_seconds, version, copy.deepcopy(user), now)
+        return user
+
+    def invalidate(self, user_id: str) -> int:
+        """사용자 버전 증가 + 캐시 제거. 새 버전 반환."""
+        key = str(user_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._stats["invalidations"] += 1
+            return self._versions[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in set(self._entries) | set(self._versions):
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            now = self._clock()
+            stats["entries"] = sum(1 for entry in self._entries.values() if entry[0] > now)
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["version_check_seconds"] = self.version_check_seconds
+        return stats
+
+
+_principal_cache = PrincipalCache()
+
+
+def get_auth_version(user_id: str) -> Optional[int]:
+    """users.auth_version만 조회 (PK 단건). 사용자가 없으면 None."""
+    init_db()  # 지연 초기화
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT auth_version FROM users WHERE id = %s", (user_id,))
+        row = cursor.fetchone()
+    return int(row["auth_version"]) if row else None
+
+
+def get_current_principal(user_id: str) -> Optional[Dict]:
+    """인증된 요청의 사용자 조회 (PrincipalCache 경유, 항목당 주기적으로 auth_version으로 워커 간 변경 확인)"""
+    return _principal_cache.get(user_id, get_user_by_id, get_auth_version)
+
+
+def invalidate_principal(user_id: str) -> int:
+    """사용자 정보(role/MFA/비밀번호 등) 변경 후 호출"""
+    return _principal_cache.invalidate(user_id)
+
+
+def get_principal_cache_stats() -> Dict:
+    return _principal_cache.stats()
+
+
 def create_user(username: str, password: str, role: str = "user") -> Dict:
     """새 사용자 생성 (username이 id가 됨)"""
     init_db()  # 지연 초기화
@@ -205,6 +345,7 @@ def update_user(user_id: str, new_user_id: Optional[str] = None,
         update_values.append(role)
     
     if update_fields:
+        update_fields.append("auth_version = auth_version + 1")
         update_fields.append("updated_at = %s")
         update_values.append(datetime.now())
         update_values.append(user_id)
@@ -216,6 +357,7 @@ def update_user(user_id: str, new_user_id: Optional[str] = None,
                 update_values
             )
             conn.commit()
+        invalidate_principal(user_id)
     
     # id 변경 처리
     if new_user_id is not None and new_user_id != user_id:
@@ -231,10 +373,14 @@ def update_user(user_id: str, new_user_id: Optional[str] = None,
             # users 테이블의 id 업데이트
             cursor.execute("""
                 UPDATE users 
-                SET id = %s, updated_at = %s
+                SET id = %s, auth_version = auth_version + 1, updated_at = %s
                 WHERE id = %s
             """, (new_user_id, datetime.now(), user_id))
             conn.commit()
+        invalidate_principal(user_id)
+        invalidate_principal(new_user_id)
+        invalidate_user_credentials(user_id)
+        invalidate_user_credentials(new_user_id)
         user_id = new_user_id
     
     # 업데이트된 사용자 정보 반환
@@ -254,7 +400,9 @@ def delete_user(user_id: str) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
         conn.commit()
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
+    invalidate_principal(user_id)
+    return deleted
 
 
 def is_system_admin(user_id: str) -> bool:
@@ -426,7 +574,8 @@ def verify_mfa_setup(user_id: str, secret: str, code: str) -> Dict:
         cursor = conn.cursor()
         cursor.execute("""
             UPDATE users
-            SET mfa_enabled = TRUE,
+            SET auth_version = auth_version + 1,
+                mfa_enabled = TRUE,
                 mfa_secret_encrypted = %s,
                 mfa_backup_codes = %s,
                 updated_at = %s
@@ -438,6 +587,7 @@ def verify_mfa_setup(user_id: str, secret: str, code: str) -> Dict:
             user_id
         ))
         conn.commit()
+    invalidate_principal(user_id)
     
     return {
         "backup_codes": backup_codes  # 평문으로 반환 (사용자가 저장해야 함)
@@ -474,13 +624,15 @@ def disable_mfa(user_id: str, password: str) -> bool:
         cursor = conn.cursor()
         cursor.execute("""
             UPDATE users
-            SET mfa_enabled = FALSE,
+            SET auth_version = auth_version + 1,
+                mfa_enabled = FALSE,
                 mfa_secret_encrypted = NULL,
                 mfa_backup_codes = NULL,
                 updated_at = %s
             WHERE id = %s
         """, (datetime.now(), user_id))
         conn.commit()
+    invalidate_principal(user_id)
     
     return True
 
@@ -530,11 +682,13 @@ def verify_user_mfa(user_id: str, code: str) -> bool:
                     cursor = conn.cursor()
                     cursor.execute("""
                         UPDATE users
-                        SET mfa_backup_codes = %s,
+                        SET auth_version = auth_version + 1,
+                            mfa_backup_codes = %s,
                             updated_at = %s
                         WHERE id = %s
                     """, (json.dumps(hashed_codes), datetime.now(), user_id))
                     conn.commit()
+                invalidate_principal(user_id)
                 return True
         except Exception:
             pass
@@ -623,11 +777,13 @@ def regenerate_backup_codes(user_id: str, password: str) -> List[str]:
         cursor = conn.cursor()
         cursor.execute("""
             UPDATE users
-            SET mfa_backup_codes = %s,
+            SET auth_version = auth_version + 1,
+                mfa_backup_codes = %s,
                 updated_at = %s
             WHERE id = %s
         """, (json.dumps(hashed_backup_codes), datetime.now(), user_id))
         conn.commit()
+    invalidate_principal(user_id)
     
     return backup_codes
 
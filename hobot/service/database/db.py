@@ -219,6 +219,7 @@ def init_database():
                 mfa_enabled BOOLEAN DEFAULT FALSE COMMENT 'MFA 활성화 여부',
                 mfa_secret_encrypted TEXT COMMENT '암호화된 MFA Secret Key',
                 mfa_backup_codes JSON COMMENT 'MFA 백업 코드 목록',
+                auth_version INT NOT NULL DEFAULT 0 COMMENT '인증 정보 버전 (role/MFA/id 변경 시 증가)',
                 created_at DATETIME NOT NULL,
                 updated_at DATETIME NOT NULL,
                 INDEX idx_id (id)
@@ -240,6 +241,11 @@ def init_database():
             cursor.execute("ALTER TABLE users ADD COLUMN mfa_backup_codes JSON COMMENT 'MFA 백업 코드 목록'")
         except Exception:
             pass
+
+        try:
+            cursor.execute("ALTER TABLE users ADD COLUMN auth_version INT NOT NULL DEFAULT 0 COMMENT '인증 정보 버전 (role/MFA/id 변경 시 증가)'")
+        except Exception:
+            pass  # 이미 존재하는 경우 무시
         
         # 사용자별 KIS API 인증 정보 테이블
         cursor.execute("""
@@ -572,6 +578,76 @@ def init_database():
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='뉴스 추출 결과 캐시'
         """)
 
+        # GraphRAG 질문 임베딩 캐시 테이블 (워커 간 공유 tier)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS graph_rag_query_embedding_cache (
+                cache_key CHAR(64) PRIMARY KEY COMMENT 'sha256(정규화 질문 + model + dimension + task_type)',
+                question_norm VARCHAR(1000) NOT NULL COMMENT '정규화된 질문',
+                model VARCHAR(100) NOT NULL COMMENT '임베딩 모델',
+                dimension INT NOT NULL COMMENT '임베딩 출력 차원',
+                embedding JSON NOT NULL COMMENT '임베딩 벡터',
+                hit_count INT NOT NULL DEFAULT 0 COMMENT '공유 tier 적중 횟수',
+                last_hit_at DATETIME NULL COMMENT '마지막 적중 일시(UTC)',
+                expires_at DATETIME NOT NULL COMMENT '만료 일시(UTC)',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성 일시',
+                INDEX idx_expires_at (expires_at)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='GraphRAG 질문 임베딩 캐시'
+        """)
+
+        # GraphRAG 데이터 적재 워터마크 (Document/IndicatorObservation 적재 시 version 증가)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS graph_rag_data_watermark (
+                source VARCHAR(50) PRIMARY KEY COMMENT '적재 소스(document, indicator_observation)',
+                version BIGINT NOT NULL DEFAULT 0 COMMENT '적재 버전(적재 배치마다 +1)',
+                last_row_count INT NOT NULL DEFAULT 0 COMMENT '마지막 적재 row 수',
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '마지막 적재 일시'
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='GraphRAG 데이터 적재 워터마크'
+        """)
+
+        # fred_data → Neo4j IndicatorObservation 증분 동기화 high-water mark (지표별)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS graph_indicator_sync_state (
+                indicator_code VARCHAR(64) PRIMARY KEY COMMENT '지표 코드',
+                high_water_mark DATETIME NOT NULL COMMENT '마지막으로 동기화한 fred_data 변경 시각(updated_at/created_at)',
+                last_row_count INT NOT NULL DEFAULT 0 COMMENT '마지막 동기화 row 수',
+                last_max_lag_sec DOUBLE NULL COMMENT '마지막 동기화 최대 지연(초, 변경 시각 → Neo4j 반영)',
+                last_synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '마지막 동기화 일시'
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='지표 그래프 증분 동기화 상태'
+        """)
+
+        # fred_data 수정 일시 컬럼 (그래프 증분 동기화 기준, ON DUPLICATE KEY UPDATE 정정 행도 추적)
+        try:
+            cursor.execute("""
+                ALTER TABLE fred_data
+                ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                    COMMENT '수정 일시 (그래프 증분 동기화 기준)',
+                ADD INDEX idx_updated_at (updated_at)
+            """)
+        except Exception:
+            pass  # 이미 존재하거나 fred_data 미생성인 경우 무시
+
+        # GraphRAG 답변 캐시 테이블 (질문/route/scope/워터마크 기반)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS graph_rag_answer_cache (
+                cache_key CHAR(64) PRIMARY KEY COMMENT 'sha256(정규화 질문 + scope_hash)',
+                scope_hash CHAR(64) NOT NULL COMMENT 'sha256(route + scope + model + watermark)',
+                question_norm VARCHAR(1000) NOT NULL COMMENT '정규화된 질문',
+                route_type VARCHAR(100) NULL COMMENT 'query route selected_type',
+                model VARCHAR(100) NOT NULL COMMENT '답변 모델',
+                watermark VARCHAR(100) NOT NULL COMMENT '저장 시점 데이터 워터마크',
+                watermark_generation BIGINT NOT NULL DEFAULT 0 COMMENT '워터마크 세대(소스별 version 합계, 단조 증가)',
+                question_embedding JSON NULL COMMENT '근접 질문 매칭용 질문 임베딩',
+                response_json LONGTEXT NOT NULL COMMENT 'GraphRagAnswerResponse JSON',
+                hit_count INT NOT NULL DEFAULT 0 COMMENT '적중 횟수',
+                last_hit_at DATETIME NULL COMMENT '마지막 적중 일시(UTC)',
+                expires_at DATETIME NOT NULL COMMENT '만료 일시(UTC)',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성 일시',
+                INDEX idx_scope_hash_created (scope_hash, created_at),
+                INDEX idx_expires_at (expires_at),
+                INDEX idx_watermark_generation (watermark_generation)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='GraphRAG 답변 캐시'
+        """)
+
         # AI 전략 결정 이력 테이블
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS ai_strategy_decisions (
@@ -0,0 +1,493 @@
+"""
+GraphRAG 답변 캐시.
+
+- scope_hash: route 유형 + 질의 scope(country/region/property/time_range/...) + 모델 + 데이터 워터마크
+- cache_key: 정규화된 질문 + scope_hash (정확 일치)
+- 근접 질문(선택): 같은 scope_hash 후보 중 질문 임베딩 cosine 유사도가 임계값 이상이면 재사용
+- 1차: 프로세스 내 LRU, 2차(선택): MySQL graph_rag_answer_cache (워커 간 공유)
+
+워터마크가 키에 포함되므로 신규 Document/IndicatorObservation 적재 시 기존 엔트리는 자연히 miss가 된다.
+공유 tier 정리는 watermark_generation(소스별 version 합계, 단조 증가)이 이 프로세스가 본 값보다
+작은 row만 지운다. 워터마크 스냅샷은 워커마다 최대 30초 늦을 수 있으므로 "다른 워터마크" 기준으로
+지우면 더 새 워터마크로 저장된 row까지 지워진다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from service.utils.env import safe_float, safe_int, truthy_env
+
+from .data_watermark import graph_data_watermark_generation
+from .embedding_cache import normalize_embedding_query_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANSWER_CACHE_MAX_ENTRIES = 512
+DEFAULT_ANSWER_CACHE_TTL_SEC = 6 * 3600
+DEFAULT_ANSWER_CACHE_SEMANTIC_THRESHOLD = 0.95
+DEFAULT_ANSWER_CACHE_SEMANTIC_CANDIDATES = 50
+# 공유 tier 정리(만료/구 워터마크 row 삭제)는 쓰기 N회마다 한 번만 수행한다.
+ANSWER_CACHE_SHARED_PRUNE_EVERY_WRITES = 100
+
+
+def best_cosine_match(
+    question_embedding: Sequence[float],
+    embeddings: Sequence[Sequence[float]],
+) -> Optional[Tuple[int, float]]:
+    """후보 임베딩 중 코사인 유사도가 가장 높은 (인덱스, 유사도). 후보들은 질의와 같은 차원이어야 한다."""
+    if not embeddings or not question_embedding:
+        return None
+    query = np.asarray(question_embedding, dtype=np.float64)
+    matrix = np.asarray(embeddings, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarities = np.where(norms > 0.0, (matrix @ query) / norms, 0.0)
+    best_index = int(np.argmax(similarities))
+    return best_index, float(similarities[best_index])
+
+
+def build_answer_scope_hash(
+    *,
+    route_type: str,
+    scope: Dict[str, Any],
+    model: str,
+    watermark: str,
+) -> str:
+    content = json.dumps(
+        {
+            "route_type": str(route_type or "").strip(),
+            "scope": {key: scope[key] for key in sorted(scope) if scope[key] not in (None, "", [])},
+            "model": str(model or "").strip(),
+            "watermark": str(watermark or "").strip(),
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def build_answer_cache_key(*, question: str, scope_hash: str) -> str:
+    content = f"{normalize_embedding_query_text(question)}|{scope_hash}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class GraphRagAnswerCache:
+    """GraphRAG 답변 2-tier 캐시 (in-process LRU + optional MySQL)"""
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        shared_enabled: Optional[bool] = None,
+        semantic_threshold: Optional[float] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if max_entries is None:
+            max_entries = safe_int(os.getenv("GRAPH_RAG_ANSWER_CACHE_MAX_ENTRIES"), DEFAULT_ANSWER_CACHE_MAX_ENTRIES)
+        if ttl_seconds is None:
+            ttl_seconds = safe_int(os.getenv("GRAPH_RAG_ANSWER_CACHE_TTL_SEC"), DEFAULT_ANSWER_CACHE_TTL_SEC)
+        if shared_enabled is None:
+            shared_enabled = truthy_env(os.getenv("GRAPH_RAG_ANSWER_CACHE_SHARED_ENABLED", "1"), default=True)
+        if semantic_threshold is None:
+            semantic_threshold = safe_float(
+                os.getenv("GRAPH_RAG_ANSWER_CACHE_SEMANTIC_THRESHOLD"),
+                DEFAULT_ANSWER_CACHE_SEMANTIC_THRESHOLD,
+            )
+        self.max_entries = max(int(max_entries), 0)
+        self.ttl_seconds = max(int(ttl_seconds), 1)
+        self.shared_enabled = bool(shared_enabled)
+        self.semantic_threshold = min(max(float(semantic_threshold), 0.0), 1.0)
+        self.semantic_candidates = max(
+            safe_int(os.getenv("GRAPH_RAG_ANSWER_CACHE_SEMANTIC_CANDIDATES"), DEFAULT_ANSWER_CACHE_SEMANTIC_CANDIDATES),
+            1,
+        )
+        self._connection_factory = connection_factory
+        # cache_key -> (expires_at, scope_hash, question_embedding, response_payload)
+        self._entries: "OrderedDict[str, Tuple[float, str, Optional[List[float]], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared_write_count = 0
+        self._stats: Dict[str, int] = {
+            "lookups": 0,
+            "memory_hits": 0,
+            "shared_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "expired": 0,
+            "evictions": 0,
+            "shared_errors": 0,
+        }
+
+    def _incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._stats[name] = self._stats.get(name, 0) + value
+
+    def _get_connection(self):
+        if self._connection_factory is not None:
+            return self._connection_factory()
+        from service.database.db import get_db_connection
+
+        return get_db_connection()
+
+    # ------------------------------------------------------------------
+    # memory tier
+    # ------------------------------------------------------------------
+    def _memory_get(self, cache_key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[cache_key]
+                self._stats["expired"] += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            return entry[3]
+
+    def _memory_semantic_get(
+        self,
+        scope_hash: str,
+        question_embedding: Sequence[float],
+        now: float,
+    ) -> Optional[Tuple[str, float, Dict[str, Any]]]:
+        # 후보만 lock 안에서 복사하고, 유사도 계산(O(N·dim))은 lock 밖에서 numpy로 한 번에 수행한다.
+        dim = len(question_embedding)
+        with self._lock:
+            candidates = [
+                (cache_key, embedding, payload)
+                for cache_key, (expires_at, entry_scope, embedding, payload) in self._entries.items()
+                if entry_scope == scope_hash and expires_at > now and embedding and len(embedding) == dim
+            ]
+        if not candidates or dim == 0:
+            return None
+
+        best_index, similarity = best_cosine_match(question_embedding, [embedding for _, embedding, _ in candidates])
+        if similarity < self.semantic_threshold:
+            return None
+
+        cache_key, _, payload = candidates[best_index]
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+        return cache_key, similarity, payload
+
+    def _memory_put(
+        self,
+        cache_key: str,
+        scope_hash: str,
+        question_embedding: Optional[List[float]],
+        payload: Dict[str, Any],
+        expires_at: float,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[cache_key] = (expires_at, scope_hash, question_embedding, payload)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # shared(MySQL) tier
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _parse_json(raw: Any) -> Any:
+        if isinstance(raw, (str, bytes)):
+            return json.loads(raw)
+        return raw
+
+    def _shared_touch(self, cursor, cache_key: str) -> None:
+        cursor.execute(
+            """
+            UPDATE graph_rag_answer_cache
+            SET hit_count = hit_count + 1, last_hit_at = UTC_TIMESTAMP()
+            WHERE cache_key = %s
+            """,
+            (cache_key,),
+        )
+
+    def _shared_get(self, cache_key: str) -> Optional[Tuple[Dict[str, Any], Optional[List[float]], str, float]]:
+        if not self.shared_enabled:
+            return None
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT response_json, question_embedding, scope_hash,
+                           TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), expires_at) AS remaining_sec
+                    FROM graph_rag_answer_cache
+                    WHERE cache_key = %s
+                      AND expires_at > UTC_TIMESTAMP()
+                    """,
+                    (cache_key,),
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                self._shared_touch(cursor, cache_key)
+            payload = self._parse_json(row.get("response_json"))
+            embedding = self._parse_json(row.get("question_embedding"))
+        except Exception as exc:
+            self._incr("shared_errors")
+            logger.warning("[GraphRagAnswerCache] shared read failed: %s", exc)
+            return None
+        if not isinstance(payload, dict):
+            return None
+        remaining_sec = max(safe_int(row.get("remaining_sec"), self.ttl_seconds), 1)
+        return payload, embedding or None, str(row.get("scope_hash") or ""), float(min(remaining_sec, self.ttl_seconds))
+
+    def _shared_semantic_get(
+        self,
+        scope_hash: str,
+        question_embedding: Sequence[float],
+    ) -> Optional[Tuple[str, float, Dict[str, Any], List[float], float]]:
+        if not self.shared_enabled:
+            return None
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                # idx_scope_hash_created 범위 조회: 같은 scope/워터마크의 최근 후보만 비교한다.
+                cursor.execute(
+                    """
+                    SELECT cache_key, question_embedding,
+                           TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), expires_at) AS remaining_sec
+                    FROM graph_rag_answer_cache
+                    WHERE scope_hash = %s
+                      AND expires_at > UTC_TIMESTAMP()
+                      AND question_embedding IS NOT NULL
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    """,
+                    (scope_hash, self.semantic_candidates),
+                )
+                rows = cursor.fetchall() or []
+                dim = len(question_embedding)
+                candidates: List[Tuple[Dict[str, Any], List[float]]] = []
+                for row in rows:
+                    try:
+                        embedding = [float(value) for value in (self._parse_json(row.get("question_embedding")) or [])]
+                    except Exception:
+                        continue
+                    if embedding and len(embedding) == dim:
+                        candidates.append((row, embedding))
+                match = best_cosine_match(question_embedding, [embedding for _, embedding in candidates])
+                if match is None or match[1] < self.semantic_threshold:
+                    return None
+                row, embedding = candidates[match[0]]
+                best = (str(row.get("cache_key")), match[1], embedding, safe_int(row.get("remaining_sec"), 0))
+                cursor.execute(
+                    "SELECT response_json FROM graph_rag_answer_cache WHERE cache_key = %s",
+                    (best[0],),
+                )
+                payload_row = cursor.fetchone()
+                if not payload_row:
+                    return None
+                self._shared_touch(cursor, best[0])
+            payload = self._parse_json(payload_row.get("response_json"))
+        except Exception as exc:
+            self._incr("shared_errors")
+            logger.warning("[GraphRagAnswerCache] shared semantic read failed: %s", exc)
+            return None
+        if not isinstance(payload, dict):
+            return None
+        remaining_sec = float(min(max(best[3], 1), self.ttl_seconds))
+        return best[0], best[1], payload, best[2], remaining_sec
+
+    def _shared_put(
+        self,
+        *,
+        cache_key: str,
+        scope_hash: str,
+        question: str,
+        route_type: str,
+        model: str,
+        watermark: str,
+        question_embedding: Optional[List[float]],
+        payload: Dict[str, Any],
+    ) -> None:
+        if not self.shared_enabled:
+            return
+        generation = graph_data_watermark_generation(watermark)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO graph_rag_answer_cache
+                        (cache_key, scope_hash, question_norm, route_type, model, watermark,
+                         question_embedding, response_json, expires_at, watermark_generation)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, DATE_ADD(UTC_TIMESTAMP(), INTERVAL %s SECOND), %s)
+                    ON DUPLICATE KEY UPDATE
+                        question_embedding = VALUES(question_embedding),
+                        response_json = VALUES(response_json),
+                        expires_at = VALUES(expires_at)
+                    """,
+                    (
+                        cache_key,
+                        scope_hash,
+                        normalize_embedding_query_text(question)[:1000],
+                        str(route_type or "")[:100] or None,
+                        str(model or "")[:100],
+                        str(watermark or "")[:100],
+                        json.dumps(question_embedding) if question_embedding else None,
+                        json.dumps(payload, ensure_ascii=False, default=str),
+                        self.ttl_seconds,
+                        generation,
+                    ),
+                )
+                with self._lock:
+                    self._shared_write_count += 1
+                    should_prune = self._shared_write_count % ANSWER_CACHE_SHARED_PRUNE_EVERY_WRITES == 0
+                if should_prune:
+                    # 만료 row와 이 워터마크보다 오래된 세대의 row만 정리한다 (더 새 세대 row는 보존).
+                    cursor.execute(
+                        """
+                        DELETE FROM graph_rag_answer_cache
+                        WHERE expires_at <= UTC_TIMESTAMP() OR watermark_generation < %s
+                        """,
+                        (generation,),
+                    )
+        except Exception as exc:
+            self._incr("shared_errors")
+            logger.warning("[GraphRagAnswerCache] shared write failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def get(
+        self,
+        *,
+        question: str,
+        scope_hash: str,
+        question_embedding: Optional[Sequence[float]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회. 적중 시 {"response": payload, "match": "exact"|"semantic", "similarity": float, "tier": ...} 반환.
+
+        question_embedding이 주어지면 정확 일치 miss 후 같은 scope의 근접 질문을 찾는다.
+        """
+        cache_key = build_answer_cache_key(question=question, scope_hash=scope_hash)
+        self._incr("lookups")
+        now = time.monotonic()
+
+        payload = self._memory_get(cache_key, now)
+        if payload is not None:
+            self._incr("memory_hits")
+            return {"response": payload, "match": "exact", "similarity": 1.0, "tier": "memory"}
+
+        shared = self._shared_get(cache_key)
+        if shared is not None:
+            payload, embedding, stored_scope_hash, remaining_sec = shared
+            self._incr("shared_hits")
+            self._memory_put(cache_key, stored_scope_hash or scope_hash, embedding, payload, now + remaining_sec)
+            return {"response": payload, "match": "exact", "similarity": 1.0, "tier": "shared"}
+
+        if question_embedding:
+            semantic = self._memory_semantic_get(scope_hash, question_embedding, now)
+            if semantic is not None:
+                self._incr("semantic_hits")
+                return {"response": semantic[2], "match": "semantic", "similarity": round(semantic[1], 4), "tier": "memory"}
+            shared_semantic = self._shared_semantic_get(scope_hash, question_embedding)
+            if shared_semantic is not None:
+                matched_key, similarity, payload, embedding, remaining_sec = shared_semantic
+                self._incr("semantic_hits")
+                self._memory_put(matched_key, scope_hash, embedding, payload, now + remaining_sec)
+                return {"response": payload, "match": "semantic", "similarity": round(similarity, 4), "tier": "shared"}
+
+        self._incr("misses")
+        return None
+
+    def put(
+        self,
+        *,
+        question: str,
+        scope_hash: str,
+        route_type: str,
+        model: str,
+        watermark: str,
+        payload: Dict[str, Any],
+        question_embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        if not isinstance(payload, dict) or not payload:
+            return
+        cache_key = build_answer_cache_key(question=question, scope_hash=scope_hash)
+        embedding = [float(value) for value in question_embedding] if question_embedding else None
+        self._memory_put(cache_key, scope_hash, embedding, payload, time.monotonic() + self.ttl_seconds)
+        self._shared_put(
+            cache_key=cache_key,
+            scope_hash=scope_hash,
+            question=question,
+            route_type=route_type,
+            model=model,
+            watermark=watermark,
+            question_embedding=embedding,
+            payload=payload,
+        )
+        self._incr("stores")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            memory_entries = len(self._entries)
+        lookups = int(stats.get("lookups") or 0)
+        hits = (
+            int(stats.get("memory_hits") or 0)
+            + int(stats.get("shared_hits") or 0)
+            + int(stats.get("semantic_hits") or 0)
+        )
+        return {
+            "pid": os.getpid(),
+            "memory_entries": memory_entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "shared_enabled": self.shared_enabled,
+            "semantic_threshold": self.semantic_threshold,
+            "lookups": lookups,
+            "hits": hits,
+            "memory_hits": int(stats.get("memory_hits") or 0),
+            "shared_hits": int(stats.get("shared_hits") or 0),
+            "semantic_hits": int(stats.get("semantic_hits") or 0),
+            "misses": int(stats.get("misses") or 0),
+            "stores": int(stats.get("stores") or 0),
+            "expired": int(stats.get("expired") or 0),
+            "evictions": int(stats.get("evictions") or 0),
+            "shared_errors": int(stats.get("shared_errors") or 0),
+            "hit_rate_pct": round((hits / lookups) * 100.0, 2) if lookups else 0.0,
+        }
+
+
+_graph_rag_answer_cache: Optional[GraphRagAnswerCache] = None
+_graph_rag_answer_cache_lock = threading.Lock()
+
+
+def get_graph_rag_answer_cache() -> GraphRagAnswerCache:
+    """프로세스 싱글톤 답변 캐시"""
+    global _graph_rag_answer_cache
+    if _graph_rag_answer_cache is not None:
+        return _graph_rag_answer_cache
+    with _graph_rag_answer_cache_lock:
+        if _graph_rag_answer_cache is None:
+            _graph_rag_answer_cache = GraphRagAnswerCache()
+        return _graph_rag_answer_cache
+
+
+def reset_graph_rag_answer_cache() -> None:
+    global _graph_rag_answer_cache
+    with _graph_rag_answer_cache_lock:
+        _graph_rag_answer_cache = None
@@ -0,0 +1,123 @@
+"""
+GraphRAG 데이터 적재 워터마크.
+
+- Document / IndicatorObservation 적재 배치가 끝날 때 bump_graph_data_watermark()로 version을 올린다.
+- 답변 캐시는 워터마크를 캐시 키에 포함하므로, 달력 날짜가 아니라 신규 데이터 적재 시점에 무효화된다.
+- 조회는 요청마다 MySQL을 치지 않도록 짧은 TTL 동안 프로세스 내 스냅샷을 재사용한다.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from service.utils.env import safe_int
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_SOURCE_DOCUMENT = "document"
+WATERMARK_SOURCE_INDICATOR_OBSERVATION = "indicator_observation"
+WATERMARK_SOURCES = (WATERMARK_SOURCE_DOCUMENT, WATERMARK_SOURCE_INDICATOR_OBSERVATION)
+DEFAULT_WATERMARK_REFRESH_SEC = 30
+
+_snapshot: Optional[Tuple[float, str]] = None
+_snapshot_lock = threading.Lock()
+
+
+def _default_connection():
+    from service.database.db import get_db_connection
+
+    return get_db_connection()
+
+
+def format_graph_data_watermark(versions: Dict[str, int]) -> str:
+    """{"document": 12, "indicator_observation": 3} -> "document:12|indicator_observation:3" """
+    return "|".join(f"{source}:{safe_int(versions.get(source), 0)}" for source in WATERMARK_SOURCES)
+
+
+def graph_data_watermark_generation(watermark: Optional[str]) -> int:
+    """
+    "document:12|indicator_observation:3" -> 15.
+
+    소스별 version은 증가만 하므로 합계도 단조 증가한다. 워터마크 문자열끼리는 대소 비교가
+    안 되므로, 어느 쪽이 더 오래된 워터마크인지는 이 값으로 판단한다.
+    """
+    generation = 0
+    for part in str(watermark or "").split("|"):
+        _, _, version = part.rpartition(":")
+        generation += max(safe_int(version, 0), 0)
+    return generation
+
+
+def bump_graph_data_watermark(
+    source: str,
+    *,
+    row_count: int = 0,
+    connection_factory: Optional[Callable[[], Any]] = None,
+) -> bool:
+    """적재 소스의 워터마크 version을 1 올린다. 실패해도 적재 흐름은 중단하지 않는다."""
+    normalized_source = str(source or "").strip().lower()
+    if normalized_source not in WATERMARK_SOURCES:
+        logger.warning("[GraphDataWatermark] unknown source=%s", source)
+        return False
+    try:
+        with (connection_factory or _default_connection)() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO graph_rag_data_watermark (source, version, last_row_count)
+                VALUES (%s, 1, %s)
+                ON DUPLICATE KEY UPDATE
+                    version = version + 1,
+                    last_row_count = VALUES(last_row_count)
+                """,
+                (normalized_source, max(int(row_count or 0), 0)),
+            )
+    except Exception as exc:
+        logger.warning("[GraphDataWatermark] bump failed(source=%s): %s", normalized_source, exc)
+        return False
+    invalidate_graph_data_watermark_snapshot()
+    return True
+
+
+def load_graph_data_watermark(*, connection_factory: Optional[Callable[[], Any]] = None) -> Optional[str]:
+    """MySQL에서 현재 워터마크를 읽는다. 조회 실패 시 None(캐시 비활성)."""
+    try:
+        with (connection_factory or _default_connection)() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT source, version FROM graph_rag_data_watermark")
+            rows = cursor.fetchall() or []
+    except Exception as exc:
+        logger.warning("[GraphDataWatermark] load failed: %s", exc)
+        return None
+    versions = {str(row.get("source") or ""): safe_int(row.get("version"), 0) for row in rows}
+    return format_graph_data_watermark(versions)
+
+
+def get_graph_data_watermark(
+    *,
+    refresh_sec: Optional[int] = None,
+    connection_factory: Optional[Callable[[], Any]] = None,
+) -> Optional[str]:
+    """프로세스 내 스냅샷(TTL=GRAPH_RAG_WATERMARK_REFRESH_SEC)을 우선 사용하는 워터마크 조회."""
+    global _snapshot
+    if refresh_sec is None:
+        refresh_sec = safe_int(os.getenv("GRAPH_RAG_WATERMARK_REFRESH_SEC"), DEFAULT_WATERMARK_REFRESH_SEC)
+    now = time.monotonic()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot[0] > now:
+        return snapshot[1]
+
+    watermark = load_graph_data_watermark(connection_factory=connection_factory)
+    if watermark is None:
+        return None
+    with _snapshot_lock:
+        _snapshot = (now + max(int(refresh_sec), 0), watermark)
+    return watermark
+
+
+def invalidate_graph_data_watermark_snapshot() -> None:
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
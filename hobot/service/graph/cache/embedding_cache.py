@@ -0,0 +1,396 @@
+"""
+GraphRAG 질문 임베딩 캐시.
+
+- key: 정규화된 질문 + 임베딩 모델 + 출력 차원 + task_type
+- 1차: 프로세스 내 LRU (TTL + 최대 엔트리 수 기반 eviction)
+- 2차(선택): MySQL graph_rag_query_embedding_cache 테이블 (gunicorn 워커 간 공유)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from service.utils.env import safe_int, truthy_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 2048
+DEFAULT_EMBEDDING_CACHE_TTL_SEC = 7 * 24 * 3600
+DEFAULT_EMBEDDING_CACHE_SHARED_MAX_ROWS = 50000
+# 공유 tier 정리(만료/초과 row 삭제)는 쓰기 N회마다 한 번만 수행한다.
+EMBEDDING_CACHE_SHARED_PRUNE_EVERY_WRITES = 200
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_embedding_query_text(text: Optional[str]) -> str:
+    """캐시 키용 질문 정규화 (NFKC + 공백 축약 + casefold)"""
+    normalized = unicodedata.normalize("NFKC", str(text or ""))
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+    return normalized.casefold()
+
+
+def build_embedding_cache_key(
+    *,
+    question: str,
+    model: str,
+    dimension: int,
+    task_type: str = "RETRIEVAL_QUERY",
+) -> str:
+    content = "|".join(
+        [
+            normalize_embedding_query_text(question),
+            str(model or "").strip(),
+            str(int(dimension)),
+            str(task_type or "").strip().upper(),
+        ]
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class QueryEmbeddingCache:
+    """질문 임베딩 2-tier 캐시 (in-process LRU + optional MySQL)"""
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        shared_enabled: Optional[bool] = None,
+        shared_max_rows: Optional[int] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if max_entries is None:
+            max_entries = safe_int(
+                os.getenv("GRAPH_RAG_EMBEDDING_CACHE_MAX_ENTRIES"),
+                DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES,
+            )
+        if ttl_seconds is None:
+            ttl_seconds = safe_int(
+                os.getenv("GRAPH_RAG_EMBEDDING_CACHE_TTL_SEC"),
+                DEFAULT_EMBEDDING_CACHE_TTL_SEC,
+            )
+        if shared_enabled is None:
+            shared_enabled = truthy_env(
+                os.getenv("GRAPH_RAG_EMBEDDING_CACHE_SHARED_ENABLED", "1"),
+                default=True,
+            )
+        if shared_max_rows is None:
+            shared_max_rows = safe_int(
+                os.getenv("GRAPH_RAG_EMBEDDING_CACHE_SHARED_MAX_ROWS"),
+                DEFAULT_EMBEDDING_CACHE_SHARED_MAX_ROWS,
+            )
+        self.max_entries = max(int(max_entries), 0)
+        self.ttl_seconds = max(int(ttl_seconds), 1)
+        self.shared_enabled = bool(shared_enabled)
+        self.shared_max_rows = max(int(shared_max_rows), 0)
+        self._connection_factory = connection_factory
+        self._entries: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared_write_count = 0
+        self._stats: Dict[str, float] = {
+            "lookups": 0,
+            "memory_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "expired": 0,
+            "evictions": 0,
+            "shared_errors": 0,
+            "embed_calls": 0,
+            "embed_failures": 0,
+            "lookup_latency_ms_total": 0.0,
+            "embed_latency_ms_total": 0.0,
+        }
+
+    def _incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._stats[name] = self._stats.get(name, 0) + value
+
+    def _get_connection(self):
+        if self._connection_factory is not None:
+            return self._connection_factory()
+        from service.database.db import get_db_connection
+
+        return get_db_connection()
+
+    # ------------------------------------------------------------------
+    # memory tier
+    # ------------------------------------------------------------------
+    def _memory_get(self, cache_key: str, now: float) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, vector = entry
+            if expires_at <= now:
+                del self._entries[cache_key]
+                self._stats["expired"] += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            return vector
+
+    def _memory_put(self, cache_key: str, vector: List[float], expires_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[cache_key] = (expires_at, vector)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # shared(MySQL) tier
+    # ------------------------------------------------------------------
+    def _shared_get(self, cache_key: str) -> Optional[Tuple[List[float], float]]:
+        if not self.shared_enabled:
+            return None
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT embedding,
+                           TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), expires_at) AS remaining_sec
+                    FROM graph_rag_query_embedding_cache
+                    WHERE cache_key = %s
+                      AND expires_at > UTC_TIMESTAMP()
+                    """,
+                    (cache_key,),
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                cursor.execute(
+                    """
+                    UPDATE graph_rag_query_embedding_cache
+                    SET hit_count = hit_count + 1, last_hit_at = UTC_TIMESTAMP()
+                    WHERE cache_key = %s
+                    """,
+                    (cache_key,),
+                )
+        except Exception as exc:
+            self._incr("shared_errors")
+            logger.warning("[QueryEmbeddingCache] shared read failed: %s", exc)
+            return None
+
+        raw_embedding = row.get("embedding")
+        try:
+            vector = json.loads(raw_embedding) if isinstance(raw_embedding, (str, bytes)) else raw_embedding
+            vector = [float(value) for value in (vector or [])]
+        except Exception as exc:
+            logger.warning("[QueryEmbeddingCache] shared row parse failed: %s", exc)
+            return None
+        if not vector:
+            return None
+        remaining_sec = max(safe_int(row.get("remaining_sec"), self.ttl_seconds), 1)
+        return vector, float(min(remaining_sec, self.ttl_seconds))
+
+    def _shared_put(
+        self,
+        *,
+        cache_key: str,
+        question: str,
+        model: str,
+        dimension: int,
+        vector: List[float],
+    ) -> None:
+        if not self.shared_enabled:
+            return
+        payload = json.dumps(vector)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO graph_rag_query_embedding_cache
+                        (cache_key, question_norm, model, dimension, embedding, expires_at)
+                    VALUES (%s, %s, %s, %s, %s, DATE_ADD(UTC_TIMESTAMP(), INTERVAL %s SECOND))
+                    ON DUPLICATE KEY UPDATE
+                        embedding = VALUES(embedding),
+                        expires_at = VALUES(expires_at)
+                    """,
+                    (
+                        cache_key,
+                        normalize_embedding_query_text(question)[:1000],
+                        model,
+                        int(dimension),
+                        payload,
+                        self.ttl_seconds,
+                    ),
+                )
+                with self._lock:
+                    self._shared_write_count += 1
+                    should_prune = self._shared_write_count % EMBEDDING_CACHE_SHARED_PRUNE_EVERY_WRITES == 0
+                if should_prune:
+                    self._prune_shared(cursor)
+        except Exception as exc:
+            self._incr("shared_errors")
+            logger.warning("[QueryEmbeddingCache] shared write failed: %s", exc)
+
+    def _prune_shared(self, cursor) -> None:
+        cursor.execute("DELETE FROM graph_rag_query_embedding_cache WHERE expires_at <= UTC_TIMESTAMP()")
+        if self.shared_max_rows <= 0:
+            return
+        cursor.execute("SELECT COUNT(*) AS row_count FROM graph_rag_query_embedding_cache")
+        row = cursor.fetchone() or {}
+        overflow = safe_int(row.get("row_count"), 0) - self.shared_max_rows
+        if overflow > 0:
+            # 가장 오래 사용되지 않은 row부터 삭제 (LRU 근사)
+            cursor.execute(
+                """
+                DELETE FROM graph_rag_query_embedding_cache
+                ORDER BY COALESCE(last_hit_at, created_at) ASC
+                LIMIT %s
+                """,
+                (overflow,),
+            )
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def get(self, *, question: str, model: str, dimension: int, task_type: str = "RETRIEVAL_QUERY") -> Optional[List[float]]:
+        started_at = time.perf_counter()
+        cache_key = build_embedding_cache_key(
+            question=question,
+            model=model,
+            dimension=dimension,
+            task_type=task_type,
+        )
+        self._incr("lookups")
+        try:
+            now = time.monotonic()
+            vector = self._memory_get(cache_key, now)
+            if vector is not None:
+                self._incr("memory_hits")
+                return list(vector)
+
+            shared = self._shared_get(cache_key)
+            if shared is not None:
+                vector, remaining_sec = shared
+                if len(vector) == int(dimension):
+                    self._incr("shared_hits")
+                    self._memory_put(cache_key, vector, now + remaining_sec)
+                    return list(vector)
+
+            self._incr("misses")
+            return None
+        finally:
+            self._incr("lookup_latency_ms_total", (time.perf_counter() - started_at) * 1000.0)
+
+    def put(
+        self,
+        *,
+        question: str,
+        model: str,
+        dimension: int,
+        vector: List[float],
+        task_type: str = "RETRIEVAL_QUERY",
+    ) -> None:
+        if not vector:
+            return
+        cache_key = build_embedding_cache_key(
+            question=question,
+            model=model,
+            dimension=dimension,
+            task_type=task_type,
+        )
+        stored = [float(value) for value in vector]
+        self._memory_put(cache_key, stored, time.monotonic() + self.ttl_seconds)
+        self._shared_put(
+            cache_key=cache_key,
+            question=question,
+            model=model,
+            dimension=dimension,
+            vector=stored,
+        )
+        self._incr("stores")
+
+    def get_or_compute(
+        self,
+        *,
+        question: str,
+        model: str,
+        dimension: int,
+        compute: Callable[[], Optional[List[float]]],
+        task_type: str = "RETRIEVAL_QUERY",
+    ) -> Optional[List[float]]:
+        cached = self.get(question=question, model=model, dimension=dimension, task_type=task_type)
+        if cached is not None:
+            return cached
+
+        started_at = time.perf_counter()
+        self._incr("embed_calls")
+        vector = compute()
+        self._incr("embed_latency_ms_total", (time.perf_counter() - started_at) * 1000.0)
+        if not vector:
+            self._incr("embed_failures")
+            return vector
+        self.put(question=question, model=model, dimension=dimension, vector=vector, task_type=task_type)
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            memory_entries = len(self._entries)
+        lookups = int(stats.get("lookups") or 0)
+        hits = int(stats.get("memory_hits") or 0) + int(stats.get("shared_hits") or 0)
+        embed_calls = int(stats.get("embed_calls") or 0)
+        return {
+            "pid": os.getpid(),
+            "memory_entries": memory_entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "shared_enabled": self.shared_enabled,
+            "lookups": lookups,
+            "hits": hits,
+            "memory_hits": int(stats.get("memory_hits") or 0),
+            "shared_hits": int(stats.get("shared_hits") or 0),
+            "misses": int(stats.get("misses") or 0),
+            "stores": int(stats.get("stores") or 0),
+            "expired": int(stats.get("expired") or 0),
+            "evictions": int(stats.get("evictions") or 0),
+            "shared_errors": int(stats.get("shared_errors") or 0),
+            "embed_calls": embed_calls,
+            "embed_failures": int(stats.get("embed_failures") or 0),
+            "hit_rate_pct": round((hits / lookups) * 100.0, 2) if lookups else 0.0,
+            "avg_lookup_latency_ms": (
+                round(float(stats.get("lookup_latency_ms_total") or 0.0) / lookups, 3) if lookups else 0.0
+            ),
+            "avg_embed_latency_ms": (
+                round(float(stats.get("embed_latency_ms_total") or 0.0) / embed_calls, 3) if embed_calls else 0.0
+            ),
+        }
+
+
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+_query_embedding_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """프로세스 싱글톤 질문 임베딩 캐시"""
+    global _query_embedding_cache
+    if _query_embedding_cache is not None:
+        return _query_embedding_cache
+    with _query_embedding_cache_lock:
+        if _query_embedding_cache is None:
+            _query_embedding_cache = QueryEmbeddingCache()
+        return _query_embedding_cache
+
+
+def reset_query_embedding_cache() -> None:
+    global _query_embedding_cache
+    with _query_embedding_cache_lock:
+        _query_embedding_cache = None
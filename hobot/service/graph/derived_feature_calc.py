@@ -1,29 +1,186 @@
 """
 Macro Knowledge Graph (MKG) - Derived Feature Calculator
 Phase A-6: IndicatorObservation → DerivedFeature 계산
+
+- 모든 지표의 관측치를 한 번의 bulk read로 가져와 (indicator_code, obs_date) long 패널을 만든다.
+- 피처는 FEATURE_REGISTRY에 등록된 벡터 연산(groupby shift/rolling/merge_asof)으로 패널 전체에 대해 한 번에 계산한다.
+- 결과는 UNWIND 배치로 DerivedFeature MERGE.
+- incremental=True면 지표별 마지막 계산일 이후 관측치만 다시 쓰고, 계산에 필요한 과거 구간만 함께 읽는다.
 """
 import logging
-from datetime import date
-from typing import List, Optional, Dict, Any
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from .neo4j_client import get_neo4j_client
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FEATURE_WRITE_BATCH_SIZE = 2000
+ZSCORE_WINDOW = 20
+YOY_LOOKBACK_DAYS = 365
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    파생 피처 정의
+
+    compute(panel) -> pd.Series
+        panel: indicator_code, obs_date(datetime64), value 컬럼을 가진 long 프레임
+               (indicator_code, obs_date 순 정렬, RangeIndex)
+        반환: panel과 같은 index의 피처 값 (계산 불가 구간은 NaN)
+    lookback_obs: 한 시점을 계산하는 데 필요한 직전 관측치 수 (incremental 재계산 시 함께 읽을 과거 구간)
+    """
+    name: str
+    description: str
+    compute: Callable[[pd.DataFrame], pd.Series]
+    lookback_obs: int = 1
+
+
+def _previous_value(panel: pd.DataFrame) -> pd.Series:
+    return panel.groupby("indicator_code", sort=False)["value"].shift(1)
+
+
+def _pct_change(current: pd.Series, base: pd.Series) -> pd.Series:
+    base = base.where(base != 0)
+    return (current - base) / base.abs() * 100
+
+
+def _compute_delta_1d(panel: pd.DataFrame) -> pd.Series:
+    return panel["value"] - _previous_value(panel)
+
+
+def _compute_pct_change_1d(panel: pd.DataFrame) -> pd.Series:
+    return _pct_change(panel["value"], _previous_value(panel))
+
+
+def _compute_zscore(panel: pd.DataFrame, window: int = ZSCORE_WINDOW) -> pd.Series:
+    rolling = panel.groupby("indicator_code", sort=False)["value"].rolling(window, min_periods=window)
+    mean = rolling.mean().reset_index(level=0, drop=True)
+    std = rolling.std(ddof=0).reset_index(level=0, drop=True)
+    std = std.where(std > 0)
+    return (panel["value"] - mean.reindex(panel.index)) / std.reindex(panel.index)
+
+
+def _compute_yoy_pct(panel: pd.DataFrame) -> pd.Series:
+    """1년 전 시점에 이미 관측돼 있던 마지막 값 대비 변화율 (%)"""
+    left = pd.DataFrame(
+        {
+            "row_id": panel.index,
+            "indicator_code": panel["indicator_code"].values,
+            "lookup_date": (panel["obs_date"] - pd.Timedelta(days=YOY_LOOKBACK_DAYS)).astype("datetime64[ns]"),
+        }
+    ).sort_values("lookup_date", kind="stable")
+    right = (
+        panel.loc[panel["value"].notna(), ["indicator_code", "obs_date", "value"]]
+        .rename(columns={"obs_date": "lookup_date", "value": "base_value"})
+        .sort_values("lookup_date", kind="stable")
+    )
+    matched = pd.merge_asof(
+        left,
+        right,
+        on="lookup_date",
+        by="indicator_code",
+        direction="backward",
+        allow_exact_matches=True,
+    ).set_index("row_id")["base_value"]
+    return _pct_change(panel["value"], matched.reindex(panel.index))
+
+
+FEATURE_REGISTRY: Dict[str, FeatureSpec] = {}
+
+
+def register_feature(spec: FeatureSpec) -> FeatureSpec:
+    """피처 등록 (같은 이름이면 교체)"""
+    FEATURE_REGISTRY[spec.name] = spec
+    return spec
+
+
+register_feature(FeatureSpec("delta_1d", "전일 대비 변화량", _compute_delta_1d, lookback_obs=1))
+register_feature(FeatureSpec("pct_change_1d", "전일 대비 변화율(%)", _compute_pct_change_1d, lookback_obs=1))
+register_feature(
+    FeatureSpec(
+        f"zscore_{ZSCORE_WINDOW}",
+        f"최근 {ZSCORE_WINDOW}개 관측치 기준 z-score",
+        _compute_zscore,
+        lookback_obs=ZSCORE_WINDOW - 1,
+    )
+)
+# 일간 지표 1년치(영업일 기준 ~260, 달력일 기준 ~366)를 덮도록 여유를 둔다.
+register_feature(FeatureSpec("yoy_pct", "전년 동기 대비 변화율(%)", _compute_yoy_pct, lookback_obs=400))
+
+
+def compute_feature_panel(
+    observations: pd.DataFrame,
+    feature_names: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    관측치 long 프레임(indicator_code, obs_date, value)에 등록 피처를 한 번에 계산한다.
+
+    Returns:
+        indicator_code, obs_date, feature_name, value 컬럼의 long 프레임 (NaN/inf 제외)
+    """
+    columns = ["indicator_code", "obs_date", "feature_name", "value"]
+    if observations is None or observations.empty:
+        return pd.DataFrame(columns=columns)
+
+    panel = observations[["indicator_code", "obs_date", "value"]].copy()
+    panel["obs_date"] = pd.to_datetime(panel["obs_date"]).astype("datetime64[ns]")
+    panel["value"] = pd.to_numeric(panel["value"], errors="coerce").astype(float)
+    panel = (
+        panel.sort_values(["indicator_code", "obs_date"], kind="stable")
+        .drop_duplicates(subset=["indicator_code", "obs_date"], keep="last")
+        .reset_index(drop=True)
+    )
+
+    frames = []
+    for name in feature_names or list(FEATURE_REGISTRY):
+        spec = FEATURE_REGISTRY[name]
+        values = spec.compute(panel).astype(float)
+        frame = pd.DataFrame(
+            {
+                "indicator_code": panel["indicator_code"],
+                "obs_date": panel["obs_date"],
+                "feature_name": spec.name,
+                "value": values,
+            }
+        )
+        frames.append(frame[np.isfinite(frame["value"])])
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _to_native_date(value: Any) -> Any:
+    if value is None:
+        return None
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
 
 class DerivedFeatureCalculator:
     """IndicatorObservation에서 파생 피처 계산"""
 
-    # 계산할 피처 정의
+    # 계산할 피처 정의 (FEATURE_REGISTRY 기준)
     FEATURES = [
-        {'name': 'delta_1d', 'description': '전일 대비 변화량'},
-        {'name': 'pct_change_1d', 'description': '전일 대비 변화율(%)'},
+        {'name': spec.name, 'description': spec.description}
+        for spec in FEATURE_REGISTRY.values()
     ]
 
-    def __init__(self):
-        self.neo4j_client = get_neo4j_client()
+    def __init__(self, neo4j_client=None, write_batch_size: Optional[int] = None):
+        self.neo4j_client = neo4j_client or get_neo4j_client()
+        self.write_batch_size = max(
+            int(write_batch_size or os.getenv("DERIVED_FEATURE_WRITE_BATCH_SIZE", DEFAULT_FEATURE_WRITE_BATCH_SIZE)),
+            1,
+        )
 
     @staticmethod
     def merge_asof_daily_anchor(
@@ -34,12 +191,10 @@ class DerivedFeatureCalculator:
         """
         다주기 시계열을 daily anchor로 정렬한다.
         - anchor: 일 단위 date range
-        - join: pd.merge_asof(direction='backward')
+        - join: as-of backward (anchor 시점까지 관측된 마지막 값)
+        - 전 지표를 한 번에 wide 패널로 pivot한 뒤 forward-fill → anchor로 reindex
         """
-        normalized_frames: Dict[str, pd.DataFrame] = {}
-        observed_starts: List[pd.Timestamp] = []
-        observed_ends: List[pd.Timestamp] = []
-
+        frames: List[pd.DataFrame] = []
         for indicator_code, series in series_by_indicator.items():
             if series is None or len(series) == 0:
                 continue
@@ -48,77 +203,255 @@ class DerivedFeatureCalculator:
             if ts.empty:
                 continue
 
-            index = pd.to_datetime(ts.index).tz_localize(None)
-            frame = pd.DataFrame({"date": index, indicator_code: ts.values})
-            frame = (
-                frame.sort_values("date")
-                .drop_duplicates(subset=["date"], keep="last")
-                .reset_index(drop=True)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "indicator_code": indicator_code,
+                        "date": pd.to_datetime(ts.index).tz_localize(None),
+                        "value": ts.values,
+                    }
+                )
             )
-            normalized_frames[indicator_code] = frame
-            observed_starts.append(frame["date"].min())
-            observed_ends.append(frame["date"].max())
 
-        if not normalized_frames:
+        if not frames:
             return pd.DataFrame(columns=["date"])
 
-        anchor_start = pd.Timestamp(start_date) if start_date else min(observed_starts)
-        anchor_end = pd.Timestamp(end_date) if end_date else max(observed_ends)
-        anchor = pd.DataFrame({"date": pd.date_range(anchor_start, anchor_end, freq="D")})
-
-        merged = anchor.sort_values("date").reset_index(drop=True)
-        for indicator_code, frame in normalized_frames.items():
-            merged = pd.merge_asof(
-                merged.sort_values("date"),
-                frame.sort_values("date"),
-                on="date",
-                direction="backward",
-                allow_exact_matches=True,
-            )
+        long_frame = pd.concat(frames, ignore_index=True)
+        long_frame = long_frame.sort_values("date", kind="stable").drop_duplicates(
+            subset=["indicator_code", "date"],
+            keep="last",
+        )
+        indicator_order = list(dict.fromkeys(frame["indicator_code"].iat[0] for frame in frames))
+        wide = long_frame.pivot(index="date", columns="indicator_code", values="value")
+        wide = wide.reindex(columns=indicator_order).sort_index().ffill()
 
-        return merged
+        anchor_start = pd.Timestamp(start_date) if start_date else wide.index.min()
+        anchor_end = pd.Timestamp(end_date) if end_date else wide.index.max()
+        anchor_index = pd.date_range(anchor_start, anchor_end, freq="D")
 
-    def calculate_delta_1d(
+        merged = wide.reindex(anchor_index, method="ffill")
+        merged.index.name = "date"
+        merged.columns.name = None
+        return merged.reset_index()
+
+    # ------------------------------------------------------------------
+    # bulk read / write
+    # ------------------------------------------------------------------
+    def _list_indicator_codes(self) -> List[str]:
+        query = "MATCH (i:EconomicIndicator) RETURN i.indicator_code AS code"
+        return [row['code'] for row in self.neo4j_client.run_read(query)]
+
+    def _load_last_computed_dates(
         self,
-        indicator_code: str,
-        limit: int = 365,
-        as_of_date: Optional[date] = None,
-    ) -> Dict[str, Any]:
-        """전일 대비 변화량(delta_1d) 계산 및 저장"""
-        as_of_value = (as_of_date or date.today()).isoformat()
+        indicator_codes: List[str],
+        feature_names: List[str],
+        as_of_date: date,
+    ) -> Dict[str, date]:
+        """지표별로 모든 대상 피처가 계산된 마지막 obs_date (피처 중 가장 이른 값)"""
+        rows = self.neo4j_client.run_read(
+            """
+            MATCH (f:DerivedFeature)
+            WHERE f.indicator_code IN $codes
+              AND f.feature_name IN $feature_names
+              AND f.obs_date <= date($as_of_date)
+            WITH f.indicator_code AS code, f.feature_name AS feature_name, max(f.obs_date) AS last_date
+            WITH code, collect(last_date) AS last_dates, count(*) AS feature_count
+            WHERE feature_count = size($feature_names)
+            UNWIND last_dates AS last_date
+            RETURN code, min(last_date) AS last_date
+            """,
+            {"codes": indicator_codes, "feature_names": feature_names, "as_of_date": as_of_date.isoformat()},
+        )
+        return {row["code"]: _to_native_date(row["last_date"]) for row in rows if row.get("last_date") is not None}
+
+    def load_observation_panel(
+        self,
+        indicator_codes: List[str],
+        *,
+        as_of_date: date,
+        read_limit: int,
+        context_limit: int,
+        cutoffs: Optional[Dict[str, date]] = None,
+    ) -> pd.DataFrame:
+        """
+        전 지표 관측치를 한 번의 쿼리로 읽는다.
+        - cutoff가 없는 지표: 최신 read_limit개
+        - cutoff가 있는 지표: cutoff 이후 전부(최대 read_limit개) + cutoff 이전 context_limit개 (계산용 과거 구간)
+        """
+        targets = [
+            {
+                "code": code,
+                "cutoff": (cutoffs or {}).get(code).isoformat() if (cutoffs or {}).get(code) else None,
+            }
+            for code in indicator_codes
+        ]
+        rows = self.neo4j_client.run_read(
+            """
+            UNWIND $targets AS t
+            MATCH (i:EconomicIndicator {indicator_code: t.code})
+            CALL {
+              WITH i, t
+              MATCH (i)-[:HAS_OBSERVATION]->(o:IndicatorObservation)
+              WHERE o.obs_date <= date($as_of_date)
+                AND coalesce(o.effective_date, o.obs_date) <= date($as_of_date)
+                AND date(coalesce(o.published_at, datetime(toString(o.obs_date) + "T00:00:00"))) <= date($as_of_date)
+                AND coalesce(o.as_of_date, o.obs_date) <= date($as_of_date)
+                AND (t.cutoff IS NULL OR o.obs_date > date(t.cutoff))
+              RETURN o
+              ORDER BY o.obs_date DESC
+              LIMIT $read_limit
+              UNION
+              WITH i, t
+              MATCH (i)-[:HAS_OBSERVATION]->(o:IndicatorObservation)
+              WHERE t.cutoff IS NOT NULL
+                AND o.obs_date <= date(t.cutoff)
+                AND coalesce(o.effective_date, o.obs_date) <= date($as_of_date)
+                AND date(coalesce(o.published_at, datetime(toString(o.obs_date) + "T00:00:00"))) <= date($as_of_date)
+                AND coalesce(o.as_of_date, o.obs_date) <= date($as_of_date)
+              RETURN o
+              ORDER BY o.obs_date DESC
+              LIMIT $context_limit
+            }
+            RETURN t.code AS indicator_code, o.obs_date AS obs_date, o.value AS value
+            """,
+            {
+                "targets": targets,
+                "as_of_date": as_of_date.isoformat(),
+                "read_limit": int(read_limit),
+                "context_limit": int(context_limit),
+            },
+        )
+        panel = pd.DataFrame(rows, columns=["indicator_code", "obs_date", "value"])
+        if not panel.empty:
+            panel["obs_date"] = pd.to_datetime(panel["obs_date"].map(_to_native_date))
+        return panel
+
+    def write_features(self, features: pd.DataFrame, as_of_date: date) -> Dict[str, int]:
+        """계산된 피처를 UNWIND 배치로 MERGE"""
+        totals = {"features_written": 0, "nodes_created": 0, "relationships_created": 0, "properties_set": 0, "batches": 0}
+        if features is None or features.empty:
+            return totals
+
+        rows = [
+            {
+                "indicator_code": code,
+                "feature_name": feature_name,
+                "obs_date": obs_date.date().isoformat(),
+                "value": float(value),
+            }
+            for code, obs_date, feature_name, value in features[
+                ["indicator_code", "obs_date", "feature_name", "value"]
+            ].itertuples(index=False, name=None)
+        ]
         query = """
-        MATCH (i:EconomicIndicator {indicator_code: $code})-[:HAS_OBSERVATION]->(o:IndicatorObservation)
-        WHERE o.obs_date <= date($as_of_date)
-          AND coalesce(o.effective_date, o.obs_date) <= date($as_of_date)
-          AND date(coalesce(o.published_at, datetime(toString(o.obs_date) + "T00:00:00"))) <= date($as_of_date)
-          AND coalesce(o.as_of_date, o.obs_date) <= date($as_of_date)
-        WITH o ORDER BY o.obs_date DESC LIMIT $limit
-        WITH collect(o) AS observations
-        UNWIND range(0, size(observations)-2) AS idx
-        WITH observations[idx] AS current, observations[idx+1] AS prev
-        WHERE current.value IS NOT NULL AND prev.value IS NOT NULL
-        WITH current, prev, current.value - prev.value AS delta
+        UNWIND $rows AS row
+        MATCH (o:IndicatorObservation {indicator_code: row.indicator_code, obs_date: date(row.obs_date)})
         MERGE (f:DerivedFeature {
-            indicator_code: $code,
-            feature_name: 'delta_1d',
-            obs_date: current.obs_date
+            indicator_code: row.indicator_code,
+            feature_name: row.feature_name,
+            obs_date: o.obs_date
         })
-        SET f.value = delta,
-            f.effective_date = coalesce(current.effective_date, current.obs_date),
-            f.published_at = coalesce(current.published_at, datetime(toString(current.obs_date) + "T00:00:00")),
-            f.as_of_date = coalesce(current.as_of_date, date($as_of_date)),
-            f.revision_flag = coalesce(current.revision_flag, false),
+        SET f.value = row.value,
+            f.effective_date = coalesce(o.effective_date, o.obs_date),
+            f.published_at = coalesce(o.published_at, datetime(toString(o.obs_date) + "T00:00:00")),
+            f.as_of_date = coalesce(o.as_of_date, date($as_of_date)),
+            f.revision_flag = coalesce(o.revision_flag, false),
             f.updated_at = datetime()
-        MERGE (current)-[:HAS_FEATURE]->(f)
-        RETURN count(f) AS features_created
+        MERGE (o)-[:HAS_FEATURE]->(f)
         """
+        for start in range(0, len(rows), self.write_batch_size):
+            batch = rows[start:start + self.write_batch_size]
+            result = self.neo4j_client.run_write(query, {"rows": batch, "as_of_date": as_of_date.isoformat()}) or {}
+            totals["features_written"] += len(batch)
+            totals["nodes_created"] += int(result.get("nodes_created", 0) or 0)
+            totals["relationships_created"] += int(result.get("relationships_created", 0) or 0)
+            totals["properties_set"] += int(result.get("properties_set", 0) or 0)
+            totals["batches"] += 1
+        return totals
 
-        result = self.neo4j_client.run_write(
-            query,
-            {"code": indicator_code, "limit": limit, "as_of_date": as_of_value},
+    # ------------------------------------------------------------------
+    # calculation
+    # ------------------------------------------------------------------
+    def calculate_features(
+        self,
+        indicator_codes: Optional[List[str]] = None,
+        feature_names: Optional[List[str]] = None,
+        limit: int = 365,
+        as_of_date: Optional[date] = None,
+        incremental: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        등록 피처를 전 지표 패널에 대해 한 번에 계산/저장한다.
+
+        Args:
+            limit: 지표별로 (재)계산해 저장할 최신 관측치 수
+            incremental: True면 지표별 마지막 계산일 이후 관측치만 저장 (계산용 과거 구간은 함께 읽음)
+        """
+        as_of = as_of_date or date.today()
+        names = list(feature_names or FEATURE_REGISTRY)
+        unknown = [name for name in names if name not in FEATURE_REGISTRY]
+        if unknown:
+            raise ValueError(f"Unknown derived features: {unknown}")
+        codes = list(indicator_codes) if indicator_codes is not None else self._list_indicator_codes()
+        if not codes:
+            return {"indicators": 0, "observations": 0, "features": {}, "write": self.write_features(None, as_of)}
+
+        context_limit = max(FEATURE_REGISTRY[name].lookback_obs for name in names)
+        cutoffs = self._load_last_computed_dates(codes, names, as_of) if incremental else {}
+        panel = self.load_observation_panel(
+            codes,
+            as_of_date=as_of,
+            read_limit=int(limit) + context_limit,
+            context_limit=context_limit,
+            cutoffs=cutoffs,
         )
-        logger.info(f"[DerivedFeature] {indicator_code} delta_1d: {result}")
-        return result
+        features = compute_feature_panel(panel, names)
+
+        if not features.empty:
+            # 저장 대상: cutoff 이후(incremental) 또는 지표별 최신 limit개 관측치
+            rank = features.groupby(["indicator_code", "feature_name"], sort=False)["obs_date"].rank(
+                method="first",
+                ascending=False,
+            )
+            keep = rank <= int(limit)
+            if cutoffs:
+                cutoff_ts = pd.to_datetime(features["indicator_code"].map(cutoffs))
+                keep &= cutoff_ts.isna() | (features["obs_date"] > cutoff_ts)
+            features = features[keep]
+
+        write_result = self.write_features(features, as_of)
+        counts = (
+            features.groupby("feature_name").size().to_dict()
+            if not features.empty
+            else {}
+        )
+        logger.info(
+            "[DerivedFeature] indicators=%s observations=%s incremental=%s features=%s write=%s",
+            len(codes),
+            len(panel),
+            incremental,
+            counts,
+            write_result,
+        )
+        return {
+            "indicators": len(codes),
+            "observations": int(len(panel)),
+            "incremental": incremental,
+            "cutoffs": {code: value.isoformat() for code, value in cutoffs.items()},
+            "features": {name: int(counts.get(name, 0)) for name in names},
+            "write": write_result,
+        }
+
+    def calculate_delta_1d(
+        self,
+        indicator_code: str,
+        limit: int = 365,
+        as_of_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """전일 대비 변화량(delta_1d) 계산 및 저장"""
+        result = self.calculate_features([indicator_code], ["delta_1d"], limit=limit, as_of_date=as_of_date)
+        logger.info(f"[DerivedFeature] {indicator_code} delta_1d: {result['write']}")
+        return result["write"]
 
     def calculate_pct_change_1d(
         self,
@@ -127,68 +460,30 @@ class DerivedFeatureCalculator:
         as_of_date: Optional[date] = None,
     ) -> Dict[str, Any]:
         """전일 대비 변화율(pct_change_1d) 계산 및 저장"""
-        as_of_value = (as_of_date or date.today()).isoformat()
-        query = """
-        MATCH (i:EconomicIndicator {indicator_code: $code})-[:HAS_OBSERVATION]->(o:IndicatorObservation)
-        WHERE o.obs_date <= date($as_of_date)
-          AND coalesce(o.effective_date, o.obs_date) <= date($as_of_date)
-          AND date(coalesce(o.published_at, datetime(toString(o.obs_date) + "T00:00:00"))) <= date($as_of_date)
-          AND coalesce(o.as_of_date, o.obs_date) <= date($as_of_date)
-        WITH o ORDER BY o.obs_date DESC LIMIT $limit
-        WITH collect(o) AS observations
-        UNWIND range(0, size(observations)-2) AS idx
-        WITH observations[idx] AS current, observations[idx+1] AS prev
-        WHERE current.value IS NOT NULL AND prev.value IS NOT NULL AND prev.value <> 0
-        WITH current, prev, ((current.value - prev.value) / abs(prev.value)) * 100 AS pct_change
-        MERGE (f:DerivedFeature {
-            indicator_code: $code,
-            feature_name: 'pct_change_1d',
-            obs_date: current.obs_date
-        })
-        SET f.value = pct_change,
-            f.effective_date = coalesce(current.effective_date, current.obs_date),
-            f.published_at = coalesce(current.published_at, datetime(toString(current.obs_date) + "T00:00:00")),
-            f.as_of_date = coalesce(current.as_of_date, date($as_of_date)),
-            f.revision_flag = coalesce(current.revision_flag, false),
-            f.updated_at = datetime()
-        MERGE (current)-[:HAS_FEATURE]->(f)
-        RETURN count(f) AS features_created
-        """
-
-        result = self.neo4j_client.run_write(
-            query,
-            {"code": indicator_code, "limit": limit, "as_of_date": as_of_value},
-        )
-        logger.info(f"[DerivedFeature] {indicator_code} pct_change_1d: {result}")
-        return result
+        result = self.calculate_features([indicator_code], ["pct_change_1d"], limit=limit, as_of_date=as_of_date)
+        logger.info(f"[DerivedFeature] {indicator_code} pct_change_1d: {result['write']}")
+        return result["write"]
 
     def calculate_all_features(
         self,
         indicator_codes: Optional[List[str]] = None,
         limit: int = 365,
         as_of_date: Optional[date] = None,
+        incremental: bool = False,
+        feature_names: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """모든 지표에 대해 파생 피처 계산"""
-        if indicator_codes is None:
-            # Neo4j에서 EconomicIndicator 목록 조회
-            query = "MATCH (i:EconomicIndicator) RETURN i.indicator_code AS code"
-            indicator_codes = [row['code'] for row in self.neo4j_client.run_read(query)]
-
-        results = {}
-        for code in indicator_codes:
-            logger.info(f"[DerivedFeature] Calculating features for {code}...")
-            try:
-                delta_result = self.calculate_delta_1d(code, limit, as_of_date=as_of_date)
-                pct_result = self.calculate_pct_change_1d(code, limit, as_of_date=as_of_date)
-                results[code] = {
-                    "delta_1d": delta_result,
-                    "pct_change_1d": pct_result
-                }
-            except Exception as e:
-                logger.error(f"[DerivedFeature] {code} failed: {e}")
-                results[code] = {"error": str(e)}
-
-        return results
+        """모든 지표에 대해 파생 피처 계산 (bulk read → 패널 계산 → 배치 write)"""
+        try:
+            return self.calculate_features(
+                indicator_codes,
+                feature_names,
+                limit=limit,
+                as_of_date=as_of_date,
+                incremental=incremental,
+            )
+        except Exception as e:
+            logger.error(f"[DerivedFeature] calculation failed: {e}")
+            return {"error": str(e)}
 
     def verify_features(self) -> Dict[str, Any]:
         """파생 피처 검증"""
@@ -207,10 +502,10 @@ class DerivedFeatureCalculator:
         return {"features": results}
 
 
-def calculate_all_derived_features(limit: int = 365) -> Dict[str, Any]:
+def calculate_all_derived_features(limit: int = 365, incremental: bool = False) -> Dict[str, Any]:
     """모든 파생 피처 계산 (편의 함수)"""
     calc = DerivedFeatureCalculator()
-    results = calc.calculate_all_features(limit=limit)
+    results = calc.calculate_all_features(limit=limit, incremental=incremental)
     verification = calc.verify_features()
     return {"calculation": results, "verification": verification}
 
@@ -221,10 +516,10 @@ if __name__ == "__main__":
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     from dotenv import load_dotenv
     load_dotenv()
-    
+
     result = calculate_all_derived_features(limit=365)
     print("\n=== RESULT ===")
     print(result.get("verification", {}))
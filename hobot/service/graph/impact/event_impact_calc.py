@@ -1,21 +1,112 @@
 """
 Phase C-1: Event Window Impact 계산 모듈.
+
+calculate_for_all_windows는 in-memory 엔진으로 동작한다.
+- AFFECTS 대상 관계 / 대상 지표의 관측치·피처 시계열을 한 번씩만 읽는다.
+- 모든 window와 fallback(feature → raw → nearest → latest proxy)을 정렬 배열 + searchsorted + 누적합으로 메모리에서 계산한다.
+- 관계별 최종 결과를 UNWIND 배치로 한 번에 기록한다.
+- incremental=True면 마지막 계산(r.impact_computed_at) 이후 생성/갱신된 이벤트·관계, 또는 관측치/피처가 정정된 지표의 관계만 다시 계산한다.
 """
 
 import logging
-from datetime import date
-from typing import Any, Dict, Iterable, Optional
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from ..neo4j_client import get_neo4j_client
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_IMPACT_WRITE_BATCH_SIZE = 2000
+
+
+def _to_native(value: Any) -> Any:
+    if value is not None and hasattr(value, "to_native"):
+        return value.to_native()
+    return value
+
+
+def _to_ordinal(value: Any) -> Optional[int]:
+    value = _to_native(value)
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.toordinal()
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _newer_than(stamp: Any, reference: Any) -> bool:
+    stamp, reference = _to_native(stamp), _to_native(reference)
+    if stamp is None:
+        return False
+    if reference is None:
+        return True
+    try:
+        return stamp > reference
+    except TypeError:
+        # aware/naive 혼재 시에는 재계산 쪽으로 판단한다.
+        return True
+
+
+@dataclass
+class _SeriesArrays:
+    """지표 한 개의 관측치 시계열 (obs_date 오름차순, 날짜 unique)"""
+    days: np.ndarray
+    values: np.ndarray
+    features: np.ndarray
+    value_sum: np.ndarray
+    value_count: np.ndarray
+    feature_sum: np.ndarray
+    feature_count: np.ndarray
+
+    @classmethod
+    def build(cls, rows: List[Tuple[int, float, float]]) -> "_SeriesArrays":
+        deduped = {}
+        for day, value, feature in rows:
+            deduped[day] = (value, feature)
+        days = np.array(sorted(deduped), dtype=np.int64)
+        values = np.array([deduped[day][0] for day in days], dtype=np.float64)
+        features = np.array([deduped[day][1] for day in days], dtype=np.float64)
+
+        def prefix(array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            observed = ~np.isnan(array)
+            total = np.concatenate(([0.0], np.cumsum(np.where(observed, array, 0.0))))
+            count = np.concatenate(([0], np.cumsum(observed)))
+            return total, count
+
+        value_sum, value_count = prefix(values)
+        feature_sum, feature_count = prefix(features)
+        return cls(days, values, features, value_sum, value_count, feature_sum, feature_count)
+
+    @staticmethod
+    def window_mean(total: np.ndarray, count: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """[lo, hi) 구간의 NaN 제외 평균 (관측 0개면 NaN)"""
+        n = count[hi] - count[lo]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(n > 0, (total[hi] - total[lo]) / np.maximum(n, 1), np.nan)
+
 
 class EventImpactCalculator:
     """Event -> EconomicIndicator 관계에 observed_delta를 채운다."""
 
-    def __init__(self, neo4j_client=None):
+    def __init__(self, neo4j_client=None, write_batch_size: Optional[int] = None):
         self.neo4j_client = neo4j_client or get_neo4j_client()
+        self.write_batch_size = max(
+            int(write_batch_size or os.getenv("EVENT_IMPACT_WRITE_BATCH_SIZE", DEFAULT_IMPACT_WRITE_BATCH_SIZE)),
+            1,
+        )
 
     def calculate_for_window(
         self,
@@ -25,6 +116,7 @@ class EventImpactCalculator:
         fallback_max_gap_days: int = 120,
         as_of_date: Optional[date] = None,
     ) -> Dict[str, Any]:
+        """단일 window를 그래프 쿼리(4-pass)로 계산한다. 여러 window는 calculate_for_all_windows 사용."""
         as_of_value = (as_of_date or date.today()).isoformat()
 
         feature_query = """
@@ -142,26 +234,283 @@ class EventImpactCalculator:
             "latest_proxy_result": latest_proxy_result,
         }
 
-    def calculate_for_all_windows(
+    # ------------------------------------------------------------------
+    # in-memory engine
+    # ------------------------------------------------------------------
+    def _read_clock(self) -> str:
+        """로드 직전 Neo4j 서버 시각 (impact_computed_at 스탬프용, updated_at과 같은 시계)"""
+        rows = self.neo4j_client.run_read("RETURN toString(datetime()) AS now")
+        return rows[0]["now"]
+
+    def _load_relationships(self) -> List[Dict[str, Any]]:
+        return self.neo4j_client.run_read(
+            """
+            MATCH (ev:Event)-[r:AFFECTS]->(i:EconomicIndicator)
+            RETURN ev.event_id AS event_id,
+                   i.indicator_code AS indicator_code,
+                   CASE WHEN ev.event_time IS NULL THEN NULL ELSE date(ev.event_time) END AS event_date,
+                   coalesce(ev.updated_at, ev.created_at) AS event_updated_at,
+                   coalesce(r.updated_at, r.created_at) AS link_updated_at,
+                   r.impact_computed_at AS computed_at
+            """
+        )
+
+    def _load_series_revisions(self, indicator_codes: List[str], feature_name: str) -> Dict[str, Any]:
+        """지표별 관측치/피처 마지막 갱신 시각"""
+        rows = self.neo4j_client.run_read(
+            """
+            UNWIND $codes AS code
+            MATCH (i:EconomicIndicator {indicator_code: code})-[:HAS_OBSERVATION]->(o:IndicatorObservation)
+            OPTIONAL MATCH (o)-[:HAS_FEATURE]->(f:DerivedFeature {feature_name: $feature_name})
+            WITH code, max(o.updated_at) AS obs_updated_at, max(f.updated_at) AS feature_updated_at
+            RETURN code,
+                   CASE WHEN feature_updated_at IS NOT NULL AND (obs_updated_at IS NULL OR feature_updated_at > obs_updated_at)
+                        THEN feature_updated_at ELSE obs_updated_at END AS series_updated_at
+            """,
+            {"codes": indicator_codes, "feature_name": feature_name},
+        )
+        return {row["code"]: row.get("series_updated_at") for row in rows}
+
+    def _load_series(self, indicator_codes: List[str], feature_name: str) -> Dict[str, _SeriesArrays]:
+        rows = self.neo4j_client.run_read(
+            """
+            UNWIND $codes AS code
+            MATCH (i:EconomicIndicator {indicator_code: code})-[:HAS_OBSERVATION]->(o:IndicatorObservation)
+            OPTIONAL MATCH (o)-[:HAS_FEATURE]->(f:DerivedFeature {feature_name: $feature_name})
+            RETURN code, o.obs_date AS obs_date, o.value AS value, f.value AS feature_value
+            """,
+            {"codes": indicator_codes, "feature_name": feature_name},
+        )
+        grouped: Dict[str, List[Tuple[int, float, float]]] = {}
+        for row in rows:
+            day = _to_ordinal(row.get("obs_date"))
+            if day is None:
+                continue
+            grouped.setdefault(row["code"], []).append(
+                (day, _as_float(row.get("value")), _as_float(row.get("feature_value")))
+            )
+        return {code: _SeriesArrays.build(items) for code, items in grouped.items()}
+
+    @staticmethod
+    def _resolve_indicator(
+        series: _SeriesArrays,
+        event_days: np.ndarray,
+        windows: List[int],
+        baseline_method: str,
+        fallback_max_gap_days: int,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        한 지표에 걸린 이벤트들의 최종 impact를 계산한다.
+        기존 쿼리 순서(window마다 feature 덮어쓰기 → raw/nearest/proxy는 비어 있을 때만)를 그대로 따른다.
+        event_days: 이벤트 날짜 ordinal (event_time 없음 = -1)
+        """
+        size = len(event_days)
+        delta = np.full(size, np.nan)
+        window_out = np.zeros(size, dtype=np.int64)
+        method = np.full(size, None, dtype=object)
+        baseline = np.full(size, None, dtype=object)
+        prev_day = np.full(size, -1, dtype=np.int64)
+        post_day = np.full(size, -1, dtype=np.int64)
+
+        days = series.days
+        has_event = event_days >= 0
+        split = np.searchsorted(days, event_days, side="left")
+
+        # nearest: event_date 직전/이후(포함) 관측치 (윈도우와 무관하므로 한 번만 계산)
+        n_obs = len(days)
+        prev_idx = split - 1
+        post_idx = split
+        nearest_ok = has_event & (prev_idx >= 0) & (post_idx < n_obs)
+        safe_prev = np.clip(prev_idx, 0, max(n_obs - 1, 0))
+        safe_post = np.clip(post_idx, 0, max(n_obs - 1, 0))
+        if n_obs:
+            nearest_ok &= (event_days - days[safe_prev] <= fallback_max_gap_days)
+            nearest_ok &= (days[safe_post] - event_days <= fallback_max_gap_days)
+            nearest_ok &= ~np.isnan(series.values[safe_prev]) & ~np.isnan(series.values[safe_post])
+        else:
+            nearest_ok &= False
+
+        proxy_ok = n_obs >= 2 and not np.isnan(series.values[-1]) and not np.isnan(series.values[-2])
+
+        for window in windows:
+            lo = np.searchsorted(days, event_days - window, side="left")
+            hi = np.searchsorted(days, event_days + window, side="left")
+
+            feature_delta = (
+                _SeriesArrays.window_mean(series.feature_sum, series.feature_count, split, hi)
+                - _SeriesArrays.window_mean(series.feature_sum, series.feature_count, lo, split)
+            )
+            feature_ok = has_event & ~np.isnan(feature_delta)
+            delta[feature_ok] = feature_delta[feature_ok]
+            window_out[feature_ok] = window
+            method[feature_ok] = "event_window_feature"
+            baseline[feature_ok] = baseline_method
+
+            raw_delta = (
+                _SeriesArrays.window_mean(series.value_sum, series.value_count, split, hi)
+                - _SeriesArrays.window_mean(series.value_sum, series.value_count, lo, split)
+            )
+            raw_ok = np.isnan(delta) & has_event & ~np.isnan(raw_delta)
+            delta[raw_ok] = raw_delta[raw_ok]
+            window_out[raw_ok] = window
+            method[raw_ok] = "event_window_raw"
+            baseline[raw_ok] = baseline_method + "_raw_observation"
+
+            near = np.isnan(delta) & nearest_ok
+            if near.any():
+                delta[near] = series.values[safe_post[near]] - series.values[safe_prev[near]]
+                prev_day[near] = days[safe_prev[near]]
+                post_day[near] = days[safe_post[near]]
+                window_out[near] = post_day[near] - prev_day[near]
+                method[near] = "event_nearest_obs"
+                baseline[near] = "nearest_observation"
+
+            proxy = np.isnan(delta) & proxy_ok
+            if proxy.any():
+                delta[proxy] = series.values[-1] - series.values[-2]
+                prev_day[proxy] = days[-2]
+                post_day[proxy] = days[-1]
+                window_out[proxy] = days[-1] - days[-2]
+                method[proxy] = "event_proxy_latest_pair"
+                baseline[proxy] = "latest_pair_proxy"
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for idx in range(size):
+            if method[idx] is None:
+                results.append(None)
+                continue
+            results.append(
+                {
+                    "observed_delta": float(delta[idx]),
+                    "window_days": int(window_out[idx]),
+                    "baseline_method": baseline[idx],
+                    "method": method[idx],
+                    "prev_obs_date": date.fromordinal(int(prev_day[idx])).isoformat() if prev_day[idx] > 0 else None,
+                    "post_obs_date": date.fromordinal(int(post_day[idx])).isoformat() if post_day[idx] > 0 else None,
+                }
+            )
+        return results
+
+    def _write_impacts(self, rows: List[Dict[str, Any]], as_of_value: str, computed_at: str) -> Dict[str, int]:
+        """
+        computed_at은 로드 시작 전 시각이다. 쓰기 시각으로 찍으면 로드~쓰기 사이에 정정된
+        관측치/피처(updated_at < 쓰기 시각)가 다음 incremental 실행에서 누락된다.
+        """
+        totals = {"rows": 0, "properties_set": 0, "batches": 0}
+        query = """
+        UNWIND $rows AS row
+        MATCH (ev:Event {event_id: row.event_id})-[r:AFFECTS]->(i:EconomicIndicator {indicator_code: row.indicator_code})
+        SET r.impact_computed_at = datetime($computed_at)
+        WITH r, row
+        WHERE row.method IS NOT NULL
+        SET r.observed_delta = row.observed_delta,
+            r.window_days = row.window_days,
+            r.baseline_method = row.baseline_method,
+            r.as_of = date($as_of),
+            r.method = row.method,
+            r.prev_obs_date = CASE WHEN row.prev_obs_date IS NULL THEN r.prev_obs_date ELSE date(row.prev_obs_date) END,
+            r.post_obs_date = CASE WHEN row.post_obs_date IS NULL THEN r.post_obs_date ELSE date(row.post_obs_date) END
+        """
+        for start in range(0, len(rows), self.write_batch_size):
+            batch = rows[start:start + self.write_batch_size]
+            result = self.neo4j_client.run_write(query, {"rows": batch, "as_of": as_of_value, "computed_at": computed_at}) or {}
+            totals["rows"] += len(batch)
+            totals["properties_set"] += int(result.get("properties_set", 0) or 0)
+            totals["batches"] += 1
+        return totals
+
+    def calculate_windows_in_memory(
         self,
         windows: Iterable[int] = (3, 7, 14),
         feature_name: str = "delta_1d",
+        baseline_method: str = "mean_prev_window",
+        fallback_max_gap_days: int = 120,
         as_of_date: Optional[date] = None,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
-        results: Dict[str, Any] = {}
-        for window in windows:
-            try:
-                results[str(window)] = self.calculate_for_window(
-                    window_days=window,
-                    feature_name=feature_name,
-                    as_of_date=as_of_date,
+        """모든 window/fallback을 한 번의 로드로 계산하고 배치로 기록한다."""
+        as_of_value = (as_of_date or date.today()).isoformat()
+        window_list = [int(window) for window in windows]
+        computed_at = self._read_clock()
+
+        relationships = [row for row in self._load_relationships() if row.get("event_id") and row.get("indicator_code")]
+        codes = sorted({row["indicator_code"] for row in relationships})
+
+        if incremental and relationships:
+            revisions = self._load_series_revisions(codes, feature_name)
+            relationships = [
+                row
+                for row in relationships
+                if row.get("computed_at") is None
+                or _newer_than(row.get("event_updated_at"), row.get("computed_at"))
+                or _newer_than(row.get("link_updated_at"), row.get("computed_at"))
+                or _newer_than(revisions.get(row["indicator_code"]), row.get("computed_at"))
+            ]
+            codes = sorted({row["indicator_code"] for row in relationships})
+
+        series_by_code = self._load_series(codes, feature_name) if codes else {}
+
+        by_code: Dict[str, List[Dict[str, Any]]] = {}
+        for row in relationships:
+            by_code.setdefault(row["indicator_code"], []).append(row)
+
+        write_rows: List[Dict[str, Any]] = []
+        method_counts: Dict[str, int] = {}
+        for code, rels in by_code.items():
+            series = series_by_code.get(code)
+            if series is None:
+                resolved: List[Optional[Dict[str, Any]]] = [None] * len(rels)
+            else:
+                event_days = np.array(
+                    [_to_ordinal(rel.get("event_date")) or -1 for rel in rels],
+                    dtype=np.int64,
                 )
-            except Exception as exc:
-                logger.exception("[EventImpact] Failed on window=%s", window)
-                results[str(window)] = {"error": str(exc)}
-        return results
+                resolved = self._resolve_indicator(series, event_days, window_list, baseline_method, fallback_max_gap_days)
+            for rel, impact in zip(rels, resolved):
+                row = {"event_id": rel["event_id"], "indicator_code": code, "method": None}
+                if impact:
+                    row.update(impact)
+                    method_counts[impact["method"]] = method_counts.get(impact["method"], 0) + 1
+                write_rows.append(row)
+
+        write_result = self._write_impacts(write_rows, as_of_value, computed_at)
+        logger.info(
+            "[EventImpact] windows=%s incremental=%s relationships=%s indicators=%s methods=%s write=%s",
+            window_list,
+            incremental,
+            len(write_rows),
+            len(series_by_code),
+            method_counts,
+            write_result,
+        )
+        return {
+            "windows": window_list,
+            "incremental": incremental,
+            "relationships": len(write_rows),
+            "indicators": len(series_by_code),
+            "methods": method_counts,
+            "write_result": write_result,
+        }
+
+    def calculate_for_all_windows(
+        self,
+        windows: Iterable[int] = (3, 7, 14),
+        feature_name: str = "delta_1d",
+        as_of_date: Optional[date] = None,
+        incremental: bool = False,
+    ) -> Dict[str, Any]:
+        try:
+            return self.calculate_windows_in_memory(
+                windows=windows,
+                feature_name=feature_name,
+                as_of_date=as_of_date,
+                incremental=incremental,
+            )
+        except Exception as exc:
+            logger.exception("[EventImpact] Failed on windows=%s", list(windows))
+            return {"error": str(exc)}
 
 
-def run_event_impact_calculation(windows: Iterable[int] = (3, 7, 14)) -> Dict[str, Any]:
+def run_event_impact_calculation(windows: Iterable[int] = (3, 7, 14), incremental: bool = False) -> Dict[str, Any]:
     calculator = EventImpactCalculator()
-    return calculator.calculate_for_all_windows(windows=windows)
+    return calculator.calculate_for_all_windows(windows=windows, incremental=incremental)
@@ -3,8 +3,13 @@ Macro Knowledge Graph (MKG) - Indicator Loader
 Phase A-5: MySQL fred_data → Neo4j IndicatorObservation 동기화
 """
 import logging
+import time
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+
+from service.utils.env import env_flag
+
+from .cache.data_watermark import WATERMARK_SOURCE_INDICATOR_OBSERVATION, bump_graph_data_watermark
 from .neo4j_client import get_neo4j_client
 
 logger = logging.getLogger(__name__)
@@ -27,6 +32,9 @@ class IndicatorLoader:
 
     BASE_COLUMNS = ("indicator_code", "date", "value")
     OPTIONAL_COLUMNS = ("effective_date", "published_at", "as_of_date", "revision_flag", "source")
+    # 증분 동기화 변경 시각 컬럼 (ON UPDATE CURRENT_TIMESTAMP, db.init_database 마이그레이션으로 추가)
+    CHANGE_TIMESTAMP_COLUMN = "updated_at"
+    CHANGE_MARK_SAFETY_SEC = 2
 
     def __init__(self):
         self.neo4j_client = get_neo4j_client()
@@ -70,6 +78,29 @@ class IndicatorLoader:
             )
             return [str(row["COLUMN_NAME"]) for row in cursor.fetchall()]
 
+    def _select_columns(self, available_columns: set) -> List[str]:
+        select_columns = list(self.BASE_COLUMNS)
+        for column in self.OPTIONAL_COLUMNS:
+            if column in available_columns:
+                select_columns.append(column)
+        return select_columns
+
+    def _row_to_observation(self, row: Dict[str, Any], end_date: date) -> Dict[str, Any]:
+        obs_date = self._to_iso_date(row.get("date"), fallback=end_date)
+        effective_date = self._to_iso_date(row.get("effective_date"), fallback=row.get("date") or end_date)
+        as_of_date = self._to_iso_date(row.get("as_of_date"), fallback=end_date)
+        published_at = self._to_iso_datetime(row.get("published_at"), fallback_date=effective_date)
+        return {
+            'indicator_code': row['indicator_code'],
+            'date': obs_date,
+            'value': float(row['value']),
+            'effective_date': effective_date,
+            'published_at': published_at,
+            'as_of_date': as_of_date,
+            'revision_flag': bool(row.get("revision_flag", False)),
+            'source': str(row.get("source") or "FRED"),
+        }
+
     def fetch_from_mysql(
         self,
         indicator_codes: List[str],
@@ -85,11 +116,7 @@ class IndicatorLoader:
         if start_date is None:
             start_date = end_date - timedelta(days=365)
 
-        available_columns = set(self._get_fred_data_columns())
-        select_columns = list(self.BASE_COLUMNS)
-        for column in self.OPTIONAL_COLUMNS:
-            if column in available_columns:
-                select_columns.append(column)
+        select_columns = self._select_columns(set(self._get_fred_data_columns()))
 
         with self._get_mysql_connection() as conn:
             cursor = conn.cursor()
@@ -112,28 +139,128 @@ class IndicatorLoader:
             results = cursor.fetchall()
 
             # dict 형태로 변환
-            observations = []
-            for row in results:
-                obs_date = self._to_iso_date(row.get("date"), fallback=end_date)
-                effective_date = self._to_iso_date(row.get("effective_date"), fallback=row.get("date") or end_date)
-                as_of_date = self._to_iso_date(row.get("as_of_date"), fallback=end_date)
-                published_at = self._to_iso_datetime(row.get("published_at"), fallback_date=effective_date)
-                observations.append({
-                    'indicator_code': row['indicator_code'],
-                    'date': obs_date,
-                    'value': float(row['value']),
-                    'effective_date': effective_date,
-                    'published_at': published_at,
-                    'as_of_date': as_of_date,
-                    'revision_flag': bool(row.get("revision_flag", False)),
-                    'source': str(row.get("source") or "FRED"),
-                })
+            observations = [self._row_to_observation(row, end_date) for row in results]
 
             logger.info(f"[IndicatorLoader] Fetched {len(observations)} observations from MySQL")
             return observations
 
-    def upsert_to_neo4j(self, observations: List[Dict[str, Any]], batch_size: int = 500) -> Dict[str, int]:
-        """Neo4j에 IndicatorObservation MERGE (멱등)"""
+    def _load_sync_state(self, indicator_codes: List[str]) -> Dict[str, datetime]:
+        """graph_indicator_sync_state에서 지표별 high-water mark 조회"""
+        placeholders = ', '.join(['%s'] * len(indicator_codes))
+        with self._get_mysql_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT indicator_code, high_water_mark
+                FROM graph_indicator_sync_state
+                WHERE indicator_code IN ({placeholders})
+                """,
+                tuple(indicator_codes),
+            )
+            return {
+                str(row["indicator_code"]): row["high_water_mark"]
+                for row in cursor.fetchall()
+                if row.get("high_water_mark") is not None
+            }
+
+    def _save_sync_state(self, states: List[Tuple[str, datetime, int, Optional[float]]]) -> None:
+        if not states:
+            return
+        with self._get_mysql_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO graph_indicator_sync_state
+                    (indicator_code, high_water_mark, last_row_count, last_max_lag_sec)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    high_water_mark = GREATEST(high_water_mark, VALUES(high_water_mark)),
+                    last_row_count = VALUES(last_row_count),
+                    last_max_lag_sec = VALUES(last_max_lag_sec)
+                """,
+                states,
+            )
+
+    def fetch_changes_from_mysql(
+        self,
+        watermarks: Dict[str, Optional[datetime]],
+        bootstrap_start_date: date,
+        change_column: str,
+        available_columns: set,
+    ) -> Tuple[List[Tuple[Dict[str, Any], datetime]], Optional[datetime]]:
+        """
+        high-water mark 이후 변경(신규/정정)된 fred_data 행만 조회한다.
+        mark가 없는 지표는 bootstrap_start_date 이후 관측치를 읽어 시작점을 잡는다.
+        반환: ([(observation, change_ts)] (indicator_code, date 순), 조회 시작 시점 DB 시각)
+        """
+        end_date = date.today()
+        select_sql = ", ".join(self._select_columns(available_columns) + [f"{change_column} AS change_ts"])
+        tracked = {code: mark for code, mark in watermarks.items() if mark is not None}
+        bootstrap_codes = [code for code, mark in watermarks.items() if mark is None]
+
+        rows: List[Dict[str, Any]] = []
+        with self._get_mysql_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT NOW() AS db_now")
+            db_now = (cursor.fetchone() or {}).get("db_now")
+            if tracked:
+                # 최소 mark 이후 변경분을 변경 시각 인덱스로 한 번에 읽고, 지표별 mark로 다시 거른다.
+                placeholders = ', '.join(['%s'] * len(tracked))
+                cursor.execute(
+                    f"""
+                    SELECT {select_sql}
+                    FROM fred_data
+                    WHERE {change_column} > %s
+                      AND indicator_code IN ({placeholders})
+                    ORDER BY indicator_code, date
+                    """,
+                    (min(tracked.values()),) + tuple(tracked),
+                )
+                rows.extend(
+                    row for row in cursor.fetchall()
+                    if row.get("change_ts") is not None and row["change_ts"] > tracked[row["indicator_code"]]
+                )
+            if bootstrap_codes:
+                placeholders = ', '.join(['%s'] * len(bootstrap_codes))
+                cursor.execute(
+                    f"""
+                    SELECT {select_sql}
+                    FROM fred_data
+                    WHERE indicator_code IN ({placeholders})
+                      AND date >= %s
+                    ORDER BY indicator_code, date
+                    """,
+                    tuple(bootstrap_codes) + (bootstrap_start_date,),
+                )
+                rows.extend(cursor.fetchall())
+
+        return [(self._row_to_observation(row, end_date), row.get("change_ts")) for row in rows], db_now
+
+    @staticmethod
+    def _iter_batches(
+        observations: List[Dict[str, Any]],
+        batch_size: int,
+        group_by_indicator: bool,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        if not group_by_indicator:
+            for i in range(0, len(observations), batch_size):
+                yield observations[i:i + batch_size]
+            return
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for obs in observations:
+            groups.setdefault(obs["indicator_code"], []).append(obs)
+        for group in groups.values():
+            for i in range(0, len(group), batch_size):
+                yield group[i:i + batch_size]
+
+    def upsert_to_neo4j(
+        self,
+        observations: List[Dict[str, Any]],
+        batch_size: int = 500,
+        group_by_indicator: bool = False,
+    ) -> Dict[str, int]:
+        """Neo4j에 IndicatorObservation MERGE (멱등). group_by_indicator=True면 지표별로 UNWIND 배치를 나눈다."""
         if not observations:
             return {"created": 0, "properties_set": 0}
 
@@ -141,9 +268,7 @@ class IndicatorLoader:
         total_props_set = 0
 
         # 배치 처리
-        for i in range(0, len(observations), batch_size):
-            batch = observations[i:i+batch_size]
-
+        for batch_no, batch in enumerate(self._iter_batches(observations, batch_size, group_by_indicator), start=1):
             query = """
             UNWIND $observations AS obs
             MATCH (i:EconomicIndicator {indicator_code: obs.indicator_code})
@@ -190,8 +315,10 @@ class IndicatorLoader:
             total_created += result.get("nodes_created", 0)
             total_props_set += result.get("properties_set", 0)
 
-            logger.info(f"[IndicatorLoader] Batch {i//batch_size + 1}: {result}")
+            logger.info(f"[IndicatorLoader] Batch {batch_no}: {result}")
 
+        # 신규 IndicatorObservation 적재 → GraphRAG 답변 캐시 무효화
+        bump_graph_data_watermark(WATERMARK_SOURCE_INDICATOR_OBSERVATION, row_count=len(observations))
         return {"nodes_created": total_created, "properties_set": total_props_set}
 
     def sync_observations(
@@ -226,6 +353,124 @@ class IndicatorLoader:
             "properties_set": result["properties_set"]
         }
 
+    def sync_incremental(
+        self,
+        indicator_codes: Optional[List[str]] = None,
+        bootstrap_days: int = 365,
+    ) -> Dict[str, Any]:
+        """
+        변경분(CDC) 동기화: 지표별 high-water mark 이후 신규/정정된 fred_data 행만 Neo4j에 반영한다.
+        fred_data.updated_at이 없는 배포(init_database 마이그레이션 미적용)에서는 기간 기반 sync_observations로 대체한다.
+        """
+        if indicator_codes is None:
+            indicator_codes = SYNC_INDICATOR_CODES
+        if not indicator_codes:
+            return {"status": "no_data", "mode": "incremental", "observations_synced": 0}
+
+        available_columns = set(self._get_fred_data_columns())
+        change_column = self.CHANGE_TIMESTAMP_COLUMN
+        if change_column not in available_columns:
+            logger.warning(
+                "[IndicatorLoader] fred_data.updated_at 컬럼이 없어 기간 동기화로 대체합니다 "
+                "(init_database 마이그레이션 필요)"
+            )
+            end_date = date.today()
+            result = self.sync_observations(
+                indicator_codes=indicator_codes,
+                start_date=end_date - timedelta(days=bootstrap_days),
+                end_date=end_date,
+            )
+            return {**result, "mode": "range"}
+
+        marks = self._load_sync_state(indicator_codes)
+        watermarks: Dict[str, Optional[datetime]] = {code: marks.get(code) for code in indicator_codes}
+        bootstrap_codes = sorted(code for code, mark in watermarks.items() if mark is None)
+        fetch_started = time.monotonic()
+        changes, db_now = self.fetch_changes_from_mysql(
+            watermarks,
+            bootstrap_start_date=date.today() - timedelta(days=bootstrap_days),
+            change_column=change_column,
+            available_columns=available_columns,
+        )
+        logger.info(
+            f"[IndicatorLoader] Incremental sync: {len(changes)} changed rows "
+            f"(tracked={len(indicator_codes) - len(bootstrap_codes)}, bootstrap={len(bootstrap_codes)}, "
+            f"column={change_column})"
+        )
+        # 조회 직전 같은 초에 기록 중이던 행을 놓치지 않도록 mark는 (조회 시점 DB 시각 - 안전 구간)을 넘지 않게 한다.
+        mark_cap = (
+            db_now - timedelta(seconds=self.CHANGE_MARK_SAFETY_SEC) if isinstance(db_now, datetime) else None
+        )
+        # 최초 적재 기간에 행이 없는 지표도 시작점을 저장해 매 실행마다 다시 bootstrap하지 않게 한다.
+        changed_codes = {obs["indicator_code"] for obs, _ in changes}
+        empty_bootstrap_states = (
+            [(code, mark_cap, 0, None) for code in bootstrap_codes if code not in changed_codes]
+            if mark_cap is not None
+            else []
+        )
+        if not changes:
+            self._save_sync_state(empty_bootstrap_states)
+            return {
+                "status": "no_changes",
+                "mode": "incremental",
+                "observations_synced": 0,
+                "bootstrap_indicators": bootstrap_codes,
+            }
+
+        observations = [obs for obs, _ in changes]
+        result = self.upsert_to_neo4j(observations, group_by_indicator=True)
+
+        # 반영 완료 후에만 mark를 전진시킨다. 지연 = 변경 시각 → Neo4j 반영 시각
+        # mark는 mark_cap을 넘지 않으며, 안전 구간 안의 행은 다음 실행에서 한 번 더 MERGE된다(멱등).
+        # 변경 시각은 DB 시계 기준이므로 반영 시각도 DB 시각 + 경과 시간으로 계산한다.
+        if isinstance(db_now, datetime):
+            synced_at = db_now + timedelta(seconds=time.monotonic() - fetch_started)
+        else:
+            synced_at = datetime.now()
+        per_indicator: Dict[str, Dict[str, Any]] = {}
+        lags: List[float] = []
+        for obs, change_ts in changes:
+            if not isinstance(change_ts, datetime):
+                continue
+            lag_sec = max((synced_at - change_ts.replace(tzinfo=None)).total_seconds(), 0.0)
+            lags.append(lag_sec)
+            entry = per_indicator.setdefault(
+                obs["indicator_code"], {"high_water_mark": change_ts, "rows": 0, "max_lag_sec": 0.0}
+            )
+            entry["rows"] += 1
+            entry["high_water_mark"] = max(entry["high_water_mark"], change_ts)
+            entry["max_lag_sec"] = max(entry["max_lag_sec"], lag_sec)
+
+        self._save_sync_state([
+            (
+                code,
+                min(entry["high_water_mark"], mark_cap) if mark_cap is not None else entry["high_water_mark"],
+                entry["rows"],
+                round(entry["max_lag_sec"], 3),
+            )
+            for code, entry in per_indicator.items()
+        ] + empty_bootstrap_states)
+
+        lag_metrics = {
+            "max_sec": round(max(lags), 3) if lags else None,
+            "avg_sec": round(sum(lags) / len(lags), 3) if lags else None,
+            "by_indicator": {code: round(entry["max_lag_sec"], 3) for code, entry in per_indicator.items()},
+        }
+        logger.info(
+            f"[IndicatorLoader] Incremental sync complete: indicators={len(per_indicator)} "
+            f"rows={len(observations)} max_lag_sec={lag_metrics['max_sec']} result={result}"
+        )
+        return {
+            "status": "success",
+            "mode": "incremental",
+            "observations_synced": len(observations),
+            "changed_indicators": sorted(per_indicator),
+            "bootstrap_indicators": bootstrap_codes,
+            "nodes_created": result["nodes_created"],
+            "properties_set": result["properties_set"],
+            "sync_lag": lag_metrics,
+        }
+
     def verify_sync(self) -> Dict[str, Any]:
         """동기화 결과 검증"""
         query = """
@@ -243,13 +488,21 @@ class IndicatorLoader:
         return {"indicators": results}
 
 
-def sync_all_indicators(days: int = 365) -> Dict[str, Any]:
-    """모든 지표 동기화 (편의 함수)"""
+def sync_all_indicators(days: int = 365, incremental: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    모든 지표 동기화 (편의 함수)
+    incremental=None이면 GRAPH_INDICATOR_SYNC_INCREMENTAL(기본 1)을 따른다. days는 증분 모드에서 최초 적재 기간.
+    """
+    if incremental is None:
+        incremental = env_flag("GRAPH_INDICATOR_SYNC_INCREMENTAL")
     loader = IndicatorLoader()
-    end_date = date.today()
-    start_date = end_date - timedelta(days=days)
-    
-    result = loader.sync_observations(start_date=start_date, end_date=end_date)
+
+    if incremental:
+        result = loader.sync_incremental(bootstrap_days=days)
+    else:
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
+        result = loader.sync_observations(start_date=start_date, end_date=end_date)
     verification = loader.verify_sync()
     
     return {
@@ -11,6 +11,9 @@ from typing import Any, Dict, Optional, Sequence
 
 from fastapi import APIRouter, HTTPException, Query
 
+from ..cache.answer_cache import get_graph_rag_answer_cache
+from ..cache.data_watermark import get_graph_data_watermark
+from ..cache.embedding_cache import get_query_embedding_cache
 from ..neo4j_client import get_neo4j_client
 
 logger = logging.getLogger(__name__)
@@ -390,10 +393,33 @@ class GraphRagMonitoringMetrics:
 def graph_rag_metrics(days: int = Query(7, ge=1, le=90)):
     try:
         collector = GraphRagMonitoringMetrics()
+        data = collector.collect_summary(days=days)
+        data["query_embedding_cache"] = get_query_embedding_cache().get_stats()
+        data["answer_cache"] = get_graph_rag_answer_cache().get_stats()
         return {
             "status": "success",
-            "data": collector.collect_summary(days=days),
+            "data": data,
         }
     except Exception as error:
         logger.error("[GraphRAGMetrics] failed: %s", error, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to collect GraphRAG metrics") from error
+
+
+@router.get("/metrics/embedding-cache")
+def graph_rag_embedding_cache_metrics():
+    """질문 임베딩 캐시 hit/miss/latency 카운터 (현재 워커 프로세스 기준)"""
+    return {
+        "status": "success",
+        "data": get_query_embedding_cache().get_stats(),
+    }
+
+
+@router.get("/metrics/answer-cache")
+def graph_rag_answer_cache_metrics():
+    """답변 캐시 hit/miss 카운터(현재 워커 프로세스 기준)와 현재 데이터 워터마크"""
+    data = get_graph_rag_answer_cache().get_stats()
+    data["watermark"] = get_graph_data_watermark()
+    return {
+        "status": "success",
+        "data": data,
+    }
@@ -6,6 +6,8 @@ Entity의 다양한 표기법을 canonical_id로 매핑하는 사전
 from typing import Optional, Dict, List, Tuple
 import re
 
+from .mention_index import MentionIndex, ALIAS_NAMESPACE, build_mention_index, get_mention_index
+
 # Alias → canonical Entity 매핑
 # Key: 다양한 alias/표기법, Value: (entity_type, canonical_id, canonical_name)
 ALIAS_DICTIONARY: Dict[str, Tuple[str, str, str]] = {
@@ -136,6 +138,7 @@ class AliasLookup:
     def __init__(self):
         self.dictionary = ALIAS_DICTIONARY.copy()
         self.unresolved_cache: Dict[str, int] = {}  # 미해결 alias 누적
+        self._index: Optional[MentionIndex] = None  # 부분 매칭용 인덱스 (add_alias 시 재빌드)
     
     def lookup(self, mention: str) -> Optional[Tuple[str, str, str]]:
         """
@@ -161,15 +164,26 @@ class AliasLookup:
         if cleaned in self.dictionary:
             return self.dictionary[cleaned]
         
-        # 부분 매칭 (한 단어가 다른 것에 포함된 경우)
-        for alias, entity_info in self.dictionary.items():
-            if alias in normalized or normalized in alias:
-                return entity_info
+        # 부분 매칭 (한 단어가 다른 것에 포함된 경우) - 사전 순서상 가장 앞선 alias 우선
+        index = self._get_index()
+        contained_id = index.first_match_id(normalized, ALIAS_NAMESPACE)  # alias ⊂ mention
+        containing_ids = index.containing(normalized, ALIAS_NAMESPACE)  # mention ⊂ alias
+        candidates = [pattern_id for pattern_id in (contained_id, containing_ids[0] if containing_ids else None) if pattern_id is not None]
+        if candidates:
+            return self.dictionary[index.pattern(min(candidates))]
         
         # 미해결 alias 기록
         self._record_unresolved(mention)
         return None
     
+    def _get_index(self) -> MentionIndex:
+        if self._index is None:
+            if self.dictionary == ALIAS_DICTIONARY:
+                self._index = get_mention_index()
+            else:
+                self._index = build_mention_index(alias_dictionary=self.dictionary)
+        return self._index
+    
     def _record_unresolved(self, mention: str):
         """미해결 alias 누적 기록"""
         normalized = mention.lower().strip()
@@ -178,6 +192,7 @@ class AliasLookup:
     def add_alias(self, alias: str, entity_type: str, canonical_id: str, canonical_name: str):
         """새로운 alias 추가"""
         self.dictionary[alias.lower().strip()] = (entity_type, canonical_id, canonical_name)
+        self._index = None
     
     def get_unresolved_stats(self) -> Dict[str, int]:
         """미해결 alias 통계 반환 (빈도순 정렬)"""
@@ -0,0 +1,170 @@
+"""
+Alias / 지역명 멘션 다중 패턴 인덱스
+NEL alias 사전과 부동산 지역 alias 사전을 한 번에 적재하는 Aho-Corasick 오토마톤 + 부분문자열 색인
+
+- iter_matches(): 텍스트를 한 번 훑으면서 텍스트 안에 등장하는 모든 패턴을 찾는다.
+- containing(): 주어진 조각을 부분문자열로 포함하는 패턴 목록을 해시 조회 한 번으로 돌려준다.
+- 패턴 id는 등록 순서이므로 "사전 순서상 첫 매칭" 우선순위를 그대로 재현할 수 있다.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ALIAS_NAMESPACE = "alias"
+REGION_NAMESPACE = "region"
+
+
+class MentionIndex:
+    """네임스페이스별 패턴을 담는 Aho-Corasick 오토마톤"""
+
+    def __init__(self):
+        self._patterns: List[str] = []
+        self._namespaces: List[str] = []
+        self._payloads: List[Any] = []
+        self._ids_by_key: Dict[Tuple[str, str], int] = {}
+
+        # trie: 노드별 전이, 실패 링크, 해당 노드에서 끝나는 패턴 id
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own_output: List[List[int]] = [[]]
+        self._output: List[List[int]] = [[]]
+        self._built = True
+
+        # namespace -> 부분문자열 -> 그 부분문자열을 포함하는 패턴 id (오름차순)
+        self._containing: Dict[str, Dict[str, List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: str, payload: Any = None, namespace: str = ALIAS_NAMESPACE, index_substrings: bool = True) -> int:
+        """
+        패턴 등록 (이미 있으면 payload만 갱신하고 기존 id 유지)
+
+        Args:
+            index_substrings: False면 containing() 대상에서 제외 (오토마톤 매칭에는 포함)
+        """
+        key = (namespace, pattern)
+        if key in self._ids_by_key:
+            pattern_id = self._ids_by_key[key]
+            self._payloads[pattern_id] = payload
+            return pattern_id
+
+        pattern_id = len(self._patterns)
+        self._patterns.append(pattern)
+        self._namespaces.append(namespace)
+        self._payloads.append(payload)
+        self._ids_by_key[key] = pattern_id
+
+        if pattern:
+            node = 0
+            for ch in pattern:
+                next_node = self._goto[node].get(ch)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][ch] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._own_output.append([])
+                    self._output.append([])
+                node = next_node
+            self._own_output[node].append(pattern_id)
+            self._built = False
+
+        if index_substrings:
+            bucket = self._containing.setdefault(namespace, {})
+            fragments = {""}
+            for start in range(len(pattern)):
+                for end in range(start + 1, len(pattern) + 1):
+                    fragments.add(pattern[start:end])
+            for fragment in fragments:
+                bucket.setdefault(fragment, []).append(pattern_id)
+        return pattern_id
+
+    def build(self) -> None:
+        """BFS로 실패 링크와 출력 집합을 계산한다."""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._output[child] = list(self._own_output[child])
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._own_output[child] + self._output[self._fail[child]]
+                queue.append(child)
+        self._built = True
+
+    def iter_matches(self, text: str, namespace: Optional[str] = None) -> Iterator[Tuple[int, int, int]]:
+        """텍스트 안의 모든 패턴 등장을 (start, end, pattern_id)로 한 번의 선형 스캔에서 찾는다."""
+        if not self._built:
+            self.build()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for pos, ch in enumerate(text or ""):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in output[state]:
+                if namespace is None or self._namespaces[pattern_id] == namespace:
+                    yield pos + 1 - len(self._patterns[pattern_id]), pos + 1, pattern_id
+
+    def first_match_id(self, text: str, namespace: Optional[str] = None) -> Optional[int]:
+        """텍스트에 포함된 패턴 중 등록 순서가 가장 빠른 id"""
+        return min((pattern_id for _, _, pattern_id in self.iter_matches(text, namespace)), default=None)
+
+    def containing(self, fragment: str, namespace: str = ALIAS_NAMESPACE) -> List[int]:
+        """fragment를 부분문자열로 포함하는 패턴 id 목록 (등록 순서)"""
+        return self._containing.get(namespace, {}).get(fragment or "", [])
+
+    def pattern(self, pattern_id: int) -> str:
+        return self._patterns[pattern_id]
+
+    def payload(self, pattern_id: int) -> Any:
+        return self._payloads[pattern_id]
+
+
+def build_mention_index(
+    alias_dictionary: Optional[Dict[str, Any]] = None,
+    region_alias_to_codes: Optional[Dict[str, Any]] = None,
+    region_fuzzy_min_length: int = 3,
+) -> MentionIndex:
+    """alias 사전과 지역 alias 사전으로 인덱스를 만든다. (사전 삽입 순서 = 우선순위)"""
+    index = MentionIndex()
+    for alias, entity_info in (alias_dictionary or {}).items():
+        index.add(alias, entity_info, namespace=ALIAS_NAMESPACE)
+    for alias, codes in (region_alias_to_codes or {}).items():
+        index.add(
+            alias,
+            codes,
+            namespace=REGION_NAMESPACE,
+            index_substrings=len(alias) >= region_fuzzy_min_length,
+        )
+    index.build()
+    return index
+
+
+# Global instance
+_mention_index: Optional[MentionIndex] = None
+_mention_index_lock = threading.Lock()
+
+
+def get_mention_index() -> MentionIndex:
+    """NEL alias + 지역 alias 기본 사전으로 만든 공용 인덱스 (프로세스당 1회 빌드)"""
+    global _mention_index
+    if _mention_index is None:
+        with _mention_index_lock:
+            if _mention_index is None:
+                from service.graph.nel.alias_dictionary import ALIAS_DICTIONARY
+                from service.graph.rag.kr_region_scope import REGION_ALIAS_TO_CODES
+
+                _mention_index = build_mention_index(ALIAS_DICTIONARY, REGION_ALIAS_TO_CODES)
+    return _mention_index
+
@@ -2,18 +2,84 @@
 Macro Knowledge Graph (MKG) - News Loader
 Phase A-8: MySQL economic_news → Neo4j Document upsert + 기본 링크
 """
+import contextvars
 import logging
 import hashlib
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from .cache.data_watermark import WATERMARK_SOURCE_DOCUMENT, bump_graph_data_watermark
 from .neo4j_client import get_neo4j_client
 from .normalization.category_mapping import get_related_themes, normalize_category
 from .normalization.country_mapping import normalize_country
 from .nel.nel_pipeline import get_nel_pipeline
+from service.utils.env import env_float, env_int
 
 logger = logging.getLogger(__name__)
 
+_RATE_LIMIT_MARKERS = ("429", "resource_exhausted", "rate limit", "ratelimit", "too many requests", "quota")
+
+
+def _is_rate_limit_error(error: Any) -> bool:
+    message = str(error or "").lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+class _AdaptiveExtractionLimiter:
+    """
+    추출 워커 공용 동시성 제한 (AIMD).
+    - rate limit: 허용 동시성을 절반으로 줄이고 지수 백오프 동안 신규 호출을 멈춘다.
+    - 성공이 현재 허용치만큼 연속되면 동시성을 1씩 회복한다.
+    """
+
+    def __init__(self, max_concurrency: int, base_backoff_sec: float = 2.0, max_backoff_sec: float = 60.0):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.base_backoff_sec = max(0.0, float(base_backoff_sec))
+        self.max_backoff_sec = max(self.base_backoff_sec, float(max_backoff_sec))
+        self.current_limit = self.max_concurrency
+        self.rate_limited_count = 0
+        self._in_flight = 0
+        self._backoff_sec = 0.0
+        self._paused_until = 0.0
+        self._success_streak = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                wait_sec = self._paused_until - time.monotonic()
+                if wait_sec <= 0 and self._in_flight < self.current_limit:
+                    self._in_flight += 1
+                    return
+                self._cond.wait(timeout=wait_sec if wait_sec > 0 else None)
+
+    def release(self, rate_limited: bool = False):
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if rate_limited:
+                self.rate_limited_count += 1
+                self._success_streak = 0
+                self.current_limit = max(1, self.current_limit // 2)
+                self._backoff_sec = min(
+                    self.max_backoff_sec,
+                    self._backoff_sec * 2 if self._backoff_sec else self.base_backoff_sec,
+                )
+                self._paused_until = max(self._paused_until, time.monotonic() + self._backoff_sec)
+                logger.warning(
+                    "[NewsLoader] Extraction rate limited: concurrency=%s backoff=%.1fs",
+                    self.current_limit,
+                    self._backoff_sec,
+                )
+            else:
+                self._success_streak += 1
+                if self._success_streak >= self.current_limit:
+                    self._success_streak = 0
+                    self.current_limit = min(self.max_concurrency, self.current_limit + 1)
+                    self._backoff_sec = self._backoff_sec / 2 if self._backoff_sec > self.base_backoff_sec else 0.0
+            self._cond.notify_all()
+
 
 class NewsLoader:
     """MySQL economic_news → Neo4j Document 동기화 및 기본 링크"""
@@ -209,6 +275,8 @@ class NewsLoader:
                 extra=f"nodes_created={total_created} properties_set={total_props_set}",
             )
         
+        # 신규 Document 적재 → GraphRAG 답변 캐시 무효화
+        bump_graph_data_watermark(WATERMARK_SOURCE_DOCUMENT, row_count=total_docs)
         return {"nodes_created": total_created, "properties_set": total_props_set}
     
     def link_to_themes(self, news_list: List[Dict[str, Any]]) -> Dict[str, int]:
@@ -596,305 +664,196 @@ class NewsLoader:
             "extraction": extraction_summary,
         }
 
-    def extract_and_persist(
+    def _build_extraction_rows(
         self,
-        news_list: List[Dict[str, Any]],
-        max_docs: Optional[int] = None,
-        default_horizon_days: int = 7,
-        progress_log_interval: int = 25,
+        news: Dict[str, Any],
+        extraction: Any,
+        default_horizon_days: int,
     ) -> Dict[str, Any]:
-        """
-        Phase B 정식 적재 경로.
-        Document에서 LLM 추출을 수행하고 Event/Fact/Claim/Evidence/AFFECTS를 Neo4j에 저장한다.
-        """
-        if not news_list:
-            return {
-                "status": "no_data",
-                "processed_docs": 0,
-                "success_docs": 0,
-                "failed_docs": 0,
-            }
-
-        from .news_extractor import get_news_extractor
-
-        extractor = get_news_extractor()
-        if not getattr(extractor, "client", None):
-            logger.warning("[NewsLoader] Extraction skipped: Gemini client is not initialized.")
-            return {
-                "status": "skipped",
-                "reason": "missing_gemini_api_key",
-                "processed_docs": 0,
-                "success_docs": 0,
-                "failed_docs": 0,
-            }
-
-        target_news = news_list[:max_docs] if max_docs else news_list
-        total_docs = len(target_news)
-        step_interval = max(1, progress_log_interval)
-        extraction_started_at = time.monotonic()
-        logger.info(
-            "[NewsLoader][Extraction] start total_docs=%s horizon_days=%s log_interval=%s",
-            total_docs,
-            default_horizon_days,
-            step_interval,
+        """추출 결과 1건을 Neo4j 적재용 row 묶음으로 변환한다. (doc_id 단위, 쓰기 없음)"""
+        doc_id = news["doc_id"]
+        event_rows: List[Dict[str, Any]] = []
+        fact_rows: List[Dict[str, Any]] = []
+        claim_rows: List[Dict[str, Any]] = []
+        evidence_rows: Dict[str, Dict[str, Any]] = {}
+        event_theme_rows: List[Dict[str, Any]] = []
+        event_indicator_rows: List[Dict[str, Any]] = []
+        theme_affects_rows: List[Dict[str, Any]] = []
+        claim_about_rows: List[Dict[str, Any]] = []
+        fact_evidence_rows: List[Dict[str, str]] = []
+        claim_evidence_rows: List[Dict[str, str]] = []
+        causes_rows: List[Dict[str, Any]] = []
+        entity_rows: Dict[str, Dict[str, Any]] = {}
+        entity_alias_rows: Dict[str, Dict[str, Any]] = {}
+
+        event_name_to_id: Dict[str, str] = {}
+        default_event_time = self._to_iso_datetime(news.get("published_at")) or self._to_iso_datetime(datetime.utcnow())
+        document_country = (str(news.get("country") or "").strip() or None)
+        document_country_code = (
+            str(news.get("country_code") or "").strip().upper()
+            or normalize_country(document_country or "")
         )
-        total_write = {
-            "nodes_created": 0,
-            "nodes_deleted": 0,
-            "relationships_created": 0,
-            "relationships_deleted": 0,
-            "properties_set": 0,
-            "constraints_added": 0,
-            "indexes_added": 0,
-        }
-        success_docs = 0
-        failed_docs = 0
-        skipped_docs = 0
-        failed_doc_ids: List[str] = []
-
-        for index, news in enumerate(target_news, start=1):
-            doc_id = news["doc_id"]
-            title = news.get("title") or ""
-            article_text = news.get("text") or news.get("description") or title
-
-            if not article_text:
-                skipped_docs += 1
-                if index % step_interval == 0 or index == total_docs:
-                    self._log_progress(
-                        stage="Extraction",
-                        processed=index,
-                        total=total_docs,
-                        started_at=extraction_started_at,
-                        success=success_docs,
-                        failed=failed_docs,
-                        skipped=skipped_docs,
-                        extra=(
-                            f"nodes_created={total_write['nodes_created']} "
-                            f"rels_created={total_write['relationships_created']}"
-                        ),
-                    )
-                continue
-
-            try:
-                extraction = extractor.extract(
-                    doc_id=doc_id,
-                    article_text=article_text,
-                    title=title,
-                )
-            except Exception as exc:
-                failed_docs += 1
-                failed_doc_ids.append(doc_id)
-                logger.warning("[NewsLoader] Extraction failed for %s: %s", doc_id, exc)
-                self._mark_extraction_failure(doc_id, str(exc))
-                if index % step_interval == 0 or index == total_docs:
-                    self._log_progress(
-                        stage="Extraction",
-                        processed=index,
-                        total=total_docs,
-                        started_at=extraction_started_at,
-                        success=success_docs,
-                        failed=failed_docs,
-                        skipped=skipped_docs,
-                        extra=(
-                            f"nodes_created={total_write['nodes_created']} "
-                            f"rels_created={total_write['relationships_created']}"
-                        ),
-                    )
-                continue
 
-            event_rows: List[Dict[str, Any]] = []
-            fact_rows: List[Dict[str, Any]] = []
-            claim_rows: List[Dict[str, Any]] = []
-            evidence_rows: Dict[str, Dict[str, Any]] = {}
-            event_theme_rows: List[Dict[str, Any]] = []
-            event_indicator_rows: List[Dict[str, Any]] = []
-            theme_affects_rows: List[Dict[str, Any]] = []
-            claim_about_rows: List[Dict[str, Any]] = []
-            fact_evidence_rows: List[Dict[str, str]] = []
-            claim_evidence_rows: List[Dict[str, str]] = []
-            causes_rows: List[Dict[str, Any]] = []
-            entity_rows: Dict[str, Dict[str, Any]] = {}
-            entity_alias_rows: Dict[str, Dict[str, Any]] = {}
-
-            event_name_to_id: Dict[str, str] = {}
-            default_event_time = self._to_iso_datetime(news.get("published_at")) or self._to_iso_datetime(datetime.utcnow())
-            document_country = (str(news.get("country") or "").strip() or None)
-            document_country_code = (
-                str(news.get("country_code") or "").strip().upper()
-                or normalize_country(document_country or "")
+        def ensure_event(
+            event_name: str,
+            event_type: str = "other",
+            summary: Optional[str] = None,
+            event_time: Optional[str] = None,
+            impact_level: str = "medium",
+            event_country: Optional[str] = None,
+            event_country_code: Optional[str] = None,
+        ) -> str:
+            normalized_name = event_name.strip()
+            cache_key = normalized_name.lower()
+            if cache_key in event_name_to_id:
+                return event_name_to_id[cache_key]
+            resolved_country = (event_country or document_country or "").strip() or None
+            resolved_country_code = (
+                (event_country_code or "").strip().upper()
+                or normalize_country(resolved_country or "")
+                or document_country_code
+            )
+            event_id = self._build_deterministic_id(
+                "EVT", f"{doc_id}:{normalized_name}"
+            )
+            event_name_to_id[cache_key] = event_id
+            event_rows.append(
+                {
+                    "doc_id": doc_id,
+                    "event_id": event_id,
+                    "event_name": normalized_name,
+                    "event_type": event_type or "other",
+                    "summary": (summary or normalized_name)[:300],
+                    "event_time": event_time or default_event_time,
+                    "country": resolved_country,
+                    "country_code": resolved_country_code,
+                    "impact_level": impact_level or "medium",
+                }
+            )
+            return event_id
+
+        for event in extraction.events:
+            event_time = self._to_iso_datetime(event.event_date) or default_event_time
+            event_id = ensure_event(
+                event_name=event.event_name,
+                event_type=event.event_type,
+                summary=event.description or event.event_name,
+                event_time=event_time,
+                impact_level=event.impact_level,
             )
 
-            def ensure_event(
-                event_name: str,
-                event_type: str = "other",
-                summary: Optional[str] = None,
-                event_time: Optional[str] = None,
-                impact_level: str = "medium",
-                event_country: Optional[str] = None,
-                event_country_code: Optional[str] = None,
-            ) -> str:
-                normalized_name = event_name.strip()
-                cache_key = normalized_name.lower()
-                if cache_key in event_name_to_id:
-                    return event_name_to_id[cache_key]
-                resolved_country = (event_country or document_country or "").strip() or None
-                resolved_country_code = (
-                    (event_country_code or "").strip().upper()
-                    or normalize_country(resolved_country or "")
-                    or document_country_code
-                )
-                event_id = self._build_deterministic_id(
-                    "EVT", f"{doc_id}:{normalized_name}"
-                )
-                event_name_to_id[cache_key] = event_id
-                event_rows.append(
+            for raw_theme in event.related_themes:
+                theme_id = self._resolve_theme_id(raw_theme)
+                if theme_id:
+                    event_theme_rows.append({"event_id": event_id, "theme_id": theme_id})
+
+            for raw_indicator in event.related_indicators:
+                indicator_code = (raw_indicator or "").strip().upper()
+                if not indicator_code:
+                    continue
+                event_indicator_rows.append(
                     {
                         "event_id": event_id,
-                        "event_name": normalized_name,
-                        "event_type": event_type or "other",
-                        "summary": (summary or normalized_name)[:300],
-                        "event_time": event_time or default_event_time,
-                        "country": resolved_country,
-                        "country_code": resolved_country_code,
-                        "impact_level": impact_level or "medium",
+                        "indicator_code": indicator_code,
+                        "polarity": "mixed",
+                        "weight": 0.55,
+                        "confidence": 0.55,
+                        "horizon_days": default_horizon_days,
+                        "source": "llm_extraction_event_indicator",
                     }
                 )
-                return event_id
-
-            for event in extraction.events:
-                event_time = self._to_iso_datetime(event.event_date) or default_event_time
-                event_id = ensure_event(
-                    event_name=event.event_name,
-                    event_type=event.event_type,
-                    summary=event.description or event.event_name,
-                    event_time=event_time,
-                    impact_level=event.impact_level,
-                )
 
-                for raw_theme in event.related_themes:
-                    theme_id = self._resolve_theme_id(raw_theme)
-                    if theme_id:
-                        event_theme_rows.append({"event_id": event_id, "theme_id": theme_id})
+        def add_evidence(evidence_obj: Any, default_text: str) -> Optional[str]:
+            if not evidence_obj:
+                return None
+            evidence_text = (getattr(evidence_obj, "evidence_text", None) or default_text or "").strip()
+            if not evidence_text:
+                return None
+            evidence_id = getattr(evidence_obj, "evidence_id", None)
+            if not evidence_id:
+                evidence_id = evidence_obj.generate_evidence_id(doc_id)
+            evidence_rows[evidence_id] = {
+                "doc_id": doc_id,
+                "evidence_id": evidence_id,
+                "evidence_text": evidence_text[:1000],
+                "source_sentence": (getattr(evidence_obj, "source_sentence", None) or evidence_text)[:1000],
+                "language": (getattr(evidence_obj, "language", None) or "en"),
+                "confidence": self._confidence_score(getattr(evidence_obj, "confidence", None)),
+            }
+            return evidence_id
 
-                for raw_indicator in event.related_indicators:
-                    indicator_code = (raw_indicator or "").strip().upper()
-                    if not indicator_code:
-                        continue
-                    event_indicator_rows.append(
-                        {
-                            "event_id": event_id,
-                            "indicator_code": indicator_code,
-                            "polarity": "mixed",
-                            "weight": 0.55,
-                            "confidence": 0.55,
-                            "horizon_days": default_horizon_days,
-                            "source": "llm_extraction_event_indicator",
-                        }
-                    )
+        for fact in extraction.facts:
+            fact_id = self._build_deterministic_id("FACT", f"{doc_id}:{fact.fact_text}")
+            fact_rows.append(
+                {
+                    "doc_id": doc_id,
+                    "fact_id": fact_id,
+                    "fact_text": fact.fact_text[:1000],
+                    "fact_type": fact.fact_type,
+                    "date_mentioned": fact.date_mentioned.isoformat() if fact.date_mentioned else None,
+                }
+            )
+            for evidence in fact.evidences:
+                evidence_id = add_evidence(evidence, fact.fact_text)
+                if evidence_id:
+                    fact_evidence_rows.append({"fact_id": fact_id, "evidence_id": evidence_id})
 
-            def add_evidence(evidence_obj: Any, default_text: str) -> Optional[str]:
-                if not evidence_obj:
-                    return None
-                evidence_text = (getattr(evidence_obj, "evidence_text", None) or default_text or "").strip()
-                if not evidence_text:
-                    return None
-                evidence_id = getattr(evidence_obj, "evidence_id", None)
-                if not evidence_id:
-                    evidence_id = evidence_obj.generate_evidence_id(doc_id)
-                evidence_rows[evidence_id] = {
-                    "evidence_id": evidence_id,
-                    "evidence_text": evidence_text[:1000],
-                    "source_sentence": (getattr(evidence_obj, "source_sentence", None) or evidence_text)[:1000],
-                    "language": (getattr(evidence_obj, "language", None) or "en"),
-                    "confidence": self._confidence_score(getattr(evidence_obj, "confidence", None)),
+        for claim in extraction.claims:
+            claim_id = self._build_deterministic_id("CLM", f"{doc_id}:{claim.claim_text}")
+            claim_rows.append(
+                {
+                    "doc_id": doc_id,
+                    "claim_id": claim_id,
+                    "claim_text": claim.claim_text[:1000],
+                    "claim_type": claim.claim_type,
+                    "author": claim.author,
+                    "sentiment": claim.sentiment.value if hasattr(claim.sentiment, "value") else str(claim.sentiment),
                 }
-                return evidence_id
+            )
+            for evidence in claim.evidences:
+                evidence_id = add_evidence(evidence, claim.claim_text)
+                if evidence_id:
+                    claim_evidence_rows.append({"claim_id": claim_id, "evidence_id": evidence_id})
 
-            for fact in extraction.facts:
-                fact_id = self._build_deterministic_id("FACT", f"{doc_id}:{fact.fact_text}")
-                fact_rows.append(
-                    {
-                        "fact_id": fact_id,
-                        "fact_text": fact.fact_text[:1000],
-                        "fact_type": fact.fact_type,
-                        "date_mentioned": fact.date_mentioned.isoformat() if fact.date_mentioned else None,
-                    }
-                )
-                for evidence in fact.evidences:
-                    evidence_id = add_evidence(evidence, fact.fact_text)
-                    if evidence_id:
-                        fact_evidence_rows.append({"fact_id": fact_id, "evidence_id": evidence_id})
-
-            for claim in extraction.claims:
-                claim_id = self._build_deterministic_id("CLM", f"{doc_id}:{claim.claim_text}")
-                claim_rows.append(
-                    {
-                        "claim_id": claim_id,
-                        "claim_text": claim.claim_text[:1000],
-                        "claim_type": claim.claim_type,
-                        "author": claim.author,
-                        "sentiment": claim.sentiment.value if hasattr(claim.sentiment, "value") else str(claim.sentiment),
-                    }
-                )
-                for evidence in claim.evidences:
-                    evidence_id = add_evidence(evidence, claim.claim_text)
-                    if evidence_id:
-                        claim_evidence_rows.append({"claim_id": claim_id, "evidence_id": evidence_id})
-
-            for link in extraction.links:
-                source_ref = (link.source_ref or "").strip()
-                target_ref = (link.target_ref or "").strip()
-                if not source_ref or not target_ref:
-                    continue
+        for link in extraction.links:
+            source_ref = (link.source_ref or "").strip()
+            target_ref = (link.target_ref or "").strip()
+            if not source_ref or not target_ref:
+                continue
 
-                link_type = link.link_type.value if hasattr(link.link_type, "value") else str(link.link_type)
-                source_event_id = ensure_event(source_ref)
-                evidence_id = add_evidence(link.evidence, f"{source_ref} {link_type} {target_ref}")
+            link_type = link.link_type.value if hasattr(link.link_type, "value") else str(link.link_type)
+            source_event_id = ensure_event(source_ref)
+            evidence_id = add_evidence(link.evidence, f"{source_ref} {link_type} {target_ref}")
 
-                link_claim_id = self._build_deterministic_id(
-                    "CLM",
-                    f"{doc_id}:{source_ref}:{target_ref}:{link_type}",
-                )
-                claim_rows.append(
-                    {
-                        "claim_id": link_claim_id,
-                        "claim_text": f"{source_ref} {link_type} {target_ref}"[:1000],
-                        "claim_type": "analysis",
-                        "author": "llm_link",
-                        "sentiment": "neutral",
-                    }
-                )
-                claim_about_rows.append({"claim_id": link_claim_id, "event_id": source_event_id})
-                if evidence_id:
-                    claim_evidence_rows.append({"claim_id": link_claim_id, "evidence_id": evidence_id})
-
-                if link.target_type == "Theme":
-                    theme_id = self._resolve_theme_id(target_ref)
-                    if not theme_id:
-                        continue
-                    event_theme_rows.append({"event_id": source_event_id, "theme_id": theme_id})
-                    if link_type == "AFFECTS":
-                        theme_affects_rows.append(
-                            {
-                                "event_id": source_event_id,
-                                "theme_id": theme_id,
-                                "polarity": self.THEME_DEFAULT_POLARITY.get(theme_id, "mixed"),
-                                "weight": float(max(link.strength, 0.30)),
-                                "confidence": self._confidence_score(
-                                    getattr(link.evidence, "confidence", None),
-                                    default=float(max(link.strength, 0.45)),
-                                ),
-                                "horizon_days": default_horizon_days,
-                                "source": "llm_extraction_link",
-                            }
-                        )
-                elif link.target_type == "Indicator":
-                    indicator_code = target_ref.upper()
-                    event_indicator_rows.append(
+            link_claim_id = self._build_deterministic_id(
+                "CLM",
+                f"{doc_id}:{source_ref}:{target_ref}:{link_type}",
+            )
+            claim_rows.append(
+                {
+                    "doc_id": doc_id,
+                    "claim_id": link_claim_id,
+                    "claim_text": f"{source_ref} {link_type} {target_ref}"[:1000],
+                    "claim_type": "analysis",
+                    "author": "llm_link",
+                    "sentiment": "neutral",
+                }
+            )
+            claim_about_rows.append({"claim_id": link_claim_id, "event_id": source_event_id})
+            if evidence_id:
+                claim_evidence_rows.append({"claim_id": link_claim_id, "evidence_id": evidence_id})
+
+            if link.target_type == "Theme":
+                theme_id = self._resolve_theme_id(target_ref)
+                if not theme_id:
+                    continue
+                event_theme_rows.append({"event_id": source_event_id, "theme_id": theme_id})
+                if link_type == "AFFECTS":
+                    theme_affects_rows.append(
                         {
                             "event_id": source_event_id,
-                            "indicator_code": indicator_code,
-                            "polarity": "mixed",
+                            "theme_id": theme_id,
+                            "polarity": self.THEME_DEFAULT_POLARITY.get(theme_id, "mixed"),
                             "weight": float(max(link.strength, 0.30)),
                             "confidence": self._confidence_score(
                                 getattr(link.evidence, "confidence", None),
@@ -904,343 +863,582 @@ class NewsLoader:
                             "source": "llm_extraction_link",
                         }
                     )
-                elif link.target_type == "Event" and link_type == "CAUSES":
-                    target_event_id = ensure_event(target_ref)
-                    causes_rows.append(
-                        {
-                            "src_event_id": source_event_id,
-                            "dst_event_id": target_event_id,
-                            "confidence": self._confidence_score(
-                                getattr(link.evidence, "confidence", None),
-                                default=float(max(link.strength, 0.40)),
-                            ),
-                        }
-                    )
+            elif link.target_type == "Indicator":
+                indicator_code = target_ref.upper()
+                event_indicator_rows.append(
+                    {
+                        "event_id": source_event_id,
+                        "indicator_code": indicator_code,
+                        "polarity": "mixed",
+                        "weight": float(max(link.strength, 0.30)),
+                        "confidence": self._confidence_score(
+                            getattr(link.evidence, "confidence", None),
+                            default=float(max(link.strength, 0.45)),
+                        ),
+                        "horizon_days": default_horizon_days,
+                        "source": "llm_extraction_link",
+                    }
+                )
+            elif link.target_type == "Event" and link_type == "CAUSES":
+                target_event_id = ensure_event(target_ref)
+                causes_rows.append(
+                    {
+                        "src_event_id": source_event_id,
+                        "dst_event_id": target_event_id,
+                        "confidence": self._confidence_score(
+                            getattr(link.evidence, "confidence", None),
+                            default=float(max(link.strength, 0.40)),
+                        ),
+                    }
+                )
 
-            combined_text = " ".join(
-                part for part in (news.get("title"), news.get("description"), news.get("text")) if part
-            )
-            llm_entities = []
-            for fact in extraction.facts:
-                llm_entities.extend(fact.entities_mentioned)
+        combined_text = " ".join(
+            part for part in (news.get("title"), news.get("description"), news.get("text")) if part
+        )
+        llm_entities = []
+        for fact in extraction.facts:
+            llm_entities.extend(fact.entities_mentioned)
 
-            nel_result = self.nel_pipeline.process_with_llm_mentions(combined_text, llm_entities)
-            for mention in nel_result.mentions:
-                if not mention.canonical_id:
-                    continue
-                canonical_id = mention.canonical_id
-                existing = entity_rows.get(canonical_id)
-                if existing:
-                    existing["confidence"] = max(existing["confidence"], mention.confidence)
-                else:
-                    entity_rows[canonical_id] = {
-                        "canonical_id": canonical_id,
-                        "name": mention.canonical_name or mention.text,
-                        "entity_type": (mention.entity_type or "unknown").lower(),
-                        "confidence": mention.confidence,
-                    }
-                alias_key = f"{canonical_id}:{mention.text.strip().lower()}"
-                entity_alias_rows[alias_key] = {
+        nel_result = self.nel_pipeline.process_with_llm_mentions(combined_text, llm_entities)
+        for mention in nel_result.mentions:
+            if not mention.canonical_id:
+                continue
+            canonical_id = mention.canonical_id
+            existing = entity_rows.get(canonical_id)
+            if existing:
+                existing["confidence"] = max(existing["confidence"], mention.confidence)
+            else:
+                entity_rows[canonical_id] = {
+                    "doc_id": doc_id,
                     "canonical_id": canonical_id,
-                    "alias": mention.text[:150],
-                    "lang": "en",
+                    "name": mention.canonical_name or mention.text,
+                    "entity_type": (mention.entity_type or "unknown").lower(),
+                    "confidence": mention.confidence,
                 }
-
-            write_total = {
-                "nodes_created": 0,
-                "nodes_deleted": 0,
-                "relationships_created": 0,
-                "relationships_deleted": 0,
-                "properties_set": 0,
-                "constraints_added": 0,
-                "indexes_added": 0,
+            alias_key = f"{canonical_id}:{mention.text.strip().lower()}"
+            entity_alias_rows[alias_key] = {
+                "canonical_id": canonical_id,
+                "alias": mention.text[:150],
+                "lang": "en",
             }
+        return {
+            "doc_id": doc_id,
+            "metadata": {
+                "doc_id": doc_id,
+                "schema_version": extraction.schema_version,
+                "extractor_version": extraction.extractor_version,
+                "model_name": extraction.model_name,
+                "extraction_confidence": extraction.extraction_confidence,
+                "error_count": len(extraction.error_messages),
+                "extracted_at": self._to_iso_datetime(extraction.extracted_at) or default_event_time,
+            },
+            "events": event_rows,
+            "event_themes": event_theme_rows,
+            "event_indicators": event_indicator_rows,
+            "theme_affects": theme_affects_rows,
+            "causes": causes_rows,
+            "facts": fact_rows,
+            "claims": claim_rows,
+            "claim_about": claim_about_rows,
+            "evidence": list(evidence_rows.values()),
+            "fact_evidence": fact_evidence_rows,
+            "claim_evidence": claim_evidence_rows,
+            "entities": list(entity_rows.values()),
+            "entity_aliases": list(entity_alias_rows.values()),
+        }
 
-            metadata_query = """
-            MATCH (d:Document {doc_id: $doc_id})
+    # 여러 문서의 row를 합쳐 한 번에 UNWIND 하는 추출 적재 쿼리 (실행 순서 유지)
+    EXTRACTION_WRITE_QUERIES = (
+        (
+            "metadata",
+            """
+            UNWIND $rows AS row
+            MATCH (d:Document {doc_id: row.doc_id})
             SET d.extraction_status = "success",
-                d.extraction_schema_version = $schema_version,
-                d.extraction_version = $extractor_version,
-                d.extraction_model = $model_name,
-                d.extraction_confidence = $extraction_confidence,
-                d.extraction_error_count = $error_count,
-                d.extracted_at = datetime($extracted_at),
+                d.extraction_schema_version = row.schema_version,
+                d.extraction_version = row.extractor_version,
+                d.extraction_model = row.model_name,
+                d.extraction_confidence = row.extraction_confidence,
+                d.extraction_error_count = row.error_count,
+                d.extracted_at = datetime(row.extracted_at),
                 d.extraction_updated_at = datetime()
+            """,
+        ),
+        (
+            "events",
             """
-            metadata_result = self.neo4j_client.run_write(
-                metadata_query,
-                {
-                    "doc_id": doc_id,
-                    "schema_version": extraction.schema_version,
-                    "extractor_version": extraction.extractor_version,
-                    "model_name": extraction.model_name,
-                    "extraction_confidence": extraction.extraction_confidence,
-                    "error_count": len(extraction.error_messages),
-                    "extracted_at": self._to_iso_datetime(extraction.extracted_at) or default_event_time,
-                },
-            )
-            self._merge_write_result(write_total, metadata_result)
-
-            if event_rows:
-                event_query = """
-                UNWIND $events AS row
-                MATCH (d:Document {doc_id: $doc_id})
-                MERGE (ev:Event {event_id: row.event_id})
-                SET ev.event_name = row.event_name,
-                    ev.type = row.event_type,
-                    ev.summary = row.summary,
-                    ev.event_time = datetime(row.event_time),
-                    ev.country = coalesce(row.country, ev.country, d.country),
-                    ev.country_code = coalesce(row.country_code, ev.country_code, d.country_code),
-                    ev.impact_level = row.impact_level,
-                    ev.source = "llm_extraction",
-                    ev.updated_at = datetime()
-                MERGE (d)-[:MENTIONS]->(ev)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(event_query, {"doc_id": doc_id, "events": event_rows}),
-                )
+            UNWIND $rows AS row
+            MATCH (d:Document {doc_id: row.doc_id})
+            MERGE (ev:Event {event_id: row.event_id})
+            SET ev.event_name = row.event_name,
+                ev.type = row.event_type,
+                ev.summary = row.summary,
+                ev.event_time = datetime(row.event_time),
+                ev.country = coalesce(row.country, ev.country, d.country),
+                ev.country_code = coalesce(row.country_code, ev.country_code, d.country_code),
+                ev.impact_level = row.impact_level,
+                ev.source = "llm_extraction",
+                ev.updated_at = datetime()
+            MERGE (d)-[:MENTIONS]->(ev)
+            """,
+        ),
+        (
+            "event_themes",
+            """
+            UNWIND $rows AS row
+            MATCH (ev:Event {event_id: row.event_id})
+            MATCH (t:MacroTheme {theme_id: row.theme_id})
+            MERGE (ev)-[r:ABOUT_THEME]->(t)
+            ON CREATE SET r.source = "llm_extraction", r.created_at = datetime()
+            SET r.updated_at = datetime()
+            """,
+        ),
+        (
+            "event_indicators",
+            """
+            UNWIND $rows AS row
+            MATCH (ev:Event {event_id: row.event_id})
+            MATCH (i:EconomicIndicator {indicator_code: row.indicator_code})
+            MERGE (ev)-[r:AFFECTS]->(i)
+            ON CREATE SET r.polarity = row.polarity,
+                          r.weight = row.weight,
+                          r.confidence = row.confidence,
+                          r.horizon_days = row.horizon_days,
+                          r.source = row.source,
+                          r.created_at = datetime()
+            SET r.updated_at = datetime()
+            """,
+        ),
+        (
+            "theme_affects",
+            """
+            UNWIND $rows AS row
+            MATCH (ev:Event {event_id: row.event_id})
+            MATCH (t:MacroTheme {theme_id: row.theme_id})
+            MATCH (i:EconomicIndicator)-[:BELONGS_TO]->(t)
+            MERGE (ev)-[r:AFFECTS]->(i)
+            ON CREATE SET r.polarity = row.polarity,
+                          r.weight = row.weight,
+                          r.confidence = row.confidence,
+                          r.horizon_days = row.horizon_days,
+                          r.source = row.source,
+                          r.created_at = datetime()
+            SET r.updated_at = datetime()
+            """,
+        ),
+        (
+            "causes",
+            """
+            UNWIND $rows AS row
+            MATCH (src:Event {event_id: row.src_event_id})
+            MATCH (dst:Event {event_id: row.dst_event_id})
+            MERGE (src)-[r:CAUSES]->(dst)
+            ON CREATE SET r.confidence = row.confidence,
+                          r.source = "llm_extraction",
+                          r.created_at = datetime()
+            SET r.updated_at = datetime()
+            """,
+        ),
+        (
+            "facts",
+            """
+            UNWIND $rows AS row
+            MATCH (d:Document {doc_id: row.doc_id})
+            MERGE (f:Fact {fact_id: row.fact_id})
+            SET f.text = row.fact_text,
+                f.fact_type = row.fact_type,
+                f.date_mentioned = CASE
+                  WHEN row.date_mentioned IS NOT NULL THEN date(row.date_mentioned)
+                  ELSE NULL
+                END,
+                f.source = "llm_extraction",
+                f.updated_at = datetime()
+            MERGE (d)-[:MENTIONS]->(f)
+            """,
+        ),
+        (
+            "claims",
+            """
+            UNWIND $rows AS row
+            MATCH (d:Document {doc_id: row.doc_id})
+            MERGE (c:Claim {claim_id: row.claim_id})
+            SET c.text = row.claim_text,
+                c.claim_type = row.claim_type,
+                c.author = row.author,
+                c.sentiment = row.sentiment,
+                c.source = "llm_extraction",
+                c.updated_at = datetime()
+            MERGE (d)-[:MENTIONS]->(c)
+            """,
+        ),
+        (
+            "claim_about",
+            """
+            UNWIND $rows AS row
+            MATCH (c:Claim {claim_id: row.claim_id})
+            MATCH (ev:Event {event_id: row.event_id})
+            MERGE (c)-[r:ABOUT]->(ev)
+            ON CREATE SET r.source = "llm_extraction", r.created_at = datetime()
+            SET r.updated_at = datetime()
+            """,
+        ),
+        (
+            "evidence",
+            """
+            UNWIND $rows AS row
+            MATCH (d:Document {doc_id: row.doc_id})
+            MERGE (evi:Evidence {evidence_id: row.evidence_id})
+            SET evi.text = row.evidence_text,
+                evi.source_sentence = row.source_sentence,
+                evi.lang = row.language,
+                evi.confidence = row.confidence,
+                evi.source = "llm_extraction",
+                evi.updated_at = datetime()
+            MERGE (d)-[:HAS_EVIDENCE]->(evi)
+            """,
+        ),
+        (
+            "fact_evidence",
+            """
+            UNWIND $rows AS row
+            MATCH (evi:Evidence {evidence_id: row.evidence_id})
+            MATCH (f:Fact {fact_id: row.fact_id})
+            MERGE (evi)-[:SUPPORTS]->(f)
+            """,
+        ),
+        (
+            "claim_evidence",
+            """
+            UNWIND $rows AS row
+            MATCH (evi:Evidence {evidence_id: row.evidence_id})
+            MATCH (c:Claim {claim_id: row.claim_id})
+            MERGE (evi)-[:SUPPORTS]->(c)
+            """,
+        ),
+        (
+            "entities",
+            """
+            UNWIND $rows AS row
+            MATCH (d:Document {doc_id: row.doc_id})
+            MERGE (e:Entity {canonical_id: row.canonical_id})
+            SET e.name = coalesce(e.name, row.name),
+                e.entity_type = coalesce(e.entity_type, row.entity_type),
+                e.source = coalesce(e.source, "nel_pipeline"),
+                e.updated_at = datetime()
+            MERGE (d)-[r:MENTIONS]->(e)
+            ON CREATE SET r.confidence = row.confidence,
+                          r.source = "nel_pipeline",
+                          r.created_at = datetime()
+            SET r.updated_at = datetime()
+            """,
+        ),
+        (
+            "entity_aliases",
+            """
+            UNWIND $rows AS row
+            MERGE (a:EntityAlias {
+                canonical_id: row.canonical_id,
+                alias: row.alias,
+                lang: row.lang
+            })
+            SET a.source = "nel_pipeline",
+                a.updated_at = datetime()
+            WITH row, a
+            MATCH (e:Entity {canonical_id: row.canonical_id})
+            MERGE (e)-[:HAS_ALIAS]->(a)
+            """,
+        ),
+    )
 
-            if event_theme_rows:
-                theme_query = """
-                UNWIND $rows AS row
-                MATCH (ev:Event {event_id: row.event_id})
-                MATCH (t:MacroTheme {theme_id: row.theme_id})
-                MERGE (ev)-[r:ABOUT_THEME]->(t)
-                ON CREATE SET r.source = "llm_extraction", r.created_at = datetime()
-                SET r.updated_at = datetime()
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(theme_query, {"rows": event_theme_rows}),
-                )
+    @staticmethod
+    def _empty_write_result() -> Dict[str, int]:
+        return {
+            "nodes_created": 0,
+            "nodes_deleted": 0,
+            "relationships_created": 0,
+            "relationships_deleted": 0,
+            "properties_set": 0,
+            "constraints_added": 0,
+            "indexes_added": 0,
+        }
 
-            if event_indicator_rows:
-                indicator_affect_query = """
-                UNWIND $rows AS row
-                MATCH (ev:Event {event_id: row.event_id})
-                MATCH (i:EconomicIndicator {indicator_code: row.indicator_code})
-                MERGE (ev)-[r:AFFECTS]->(i)
-                ON CREATE SET r.polarity = row.polarity,
-                              r.weight = row.weight,
-                              r.confidence = row.confidence,
-                              r.horizon_days = row.horizon_days,
-                              r.source = row.source,
-                              r.created_at = datetime()
-                SET r.updated_at = datetime()
-                """
+    def _run_extraction_writes(self, bundles: List[Dict[str, Any]], chunk_rows: int = 1000) -> Dict[str, int]:
+        """문서 여러 건의 row를 종류별로 합쳐 UNWIND 배치로 쓴다."""
+        write_total = self._empty_write_result()
+        for row_key, query in self.EXTRACTION_WRITE_QUERIES:
+            if row_key == "metadata":
+                rows = [bundle["metadata"] for bundle in bundles]
+            else:
+                rows = [row for bundle in bundles for row in bundle[row_key]]
+            if row_key == "entity_aliases":
+                rows = list({(row["canonical_id"], row["alias"], row["lang"]): row for row in rows}.values())
+            for offset in range(0, len(rows), chunk_rows):
                 self._merge_write_result(
                     write_total,
-                    self.neo4j_client.run_write(indicator_affect_query, {"rows": event_indicator_rows}),
+                    self.neo4j_client.run_write(query, {"rows": rows[offset:offset + chunk_rows]}),
                 )
+        return write_total
 
-            if theme_affects_rows:
-                theme_affect_query = """
-                UNWIND $rows AS row
-                MATCH (ev:Event {event_id: row.event_id})
-                MATCH (t:MacroTheme {theme_id: row.theme_id})
-                MATCH (i:EconomicIndicator)-[:BELONGS_TO]->(t)
-                MERGE (ev)-[r:AFFECTS]->(i)
-                ON CREATE SET r.polarity = row.polarity,
-                              r.weight = row.weight,
-                              r.confidence = row.confidence,
-                              r.horizon_days = row.horizon_days,
-                              r.source = row.source,
-                              r.created_at = datetime()
-                SET r.updated_at = datetime()
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(theme_affect_query, {"rows": theme_affects_rows}),
-                )
+    def _write_extraction_bundles(
+        self,
+        bundles: List[Dict[str, Any]],
+    ) -> Tuple[Dict[str, int], List[Tuple[str, str]]]:
+        """
+        묶음 쓰기 실행. 배치 전체가 실패하면 문서 단위로 다시 써서 실패 문서만 골라낸다.
+        반환: (write_result, [(실패 doc_id, 에러 메시지)])
+        """
+        if not bundles:
+            return self._empty_write_result(), []
+        try:
+            return self._run_extraction_writes(bundles), []
+        except Exception as exc:
+            if len(bundles) == 1:
+                return self._empty_write_result(), [(bundles[0]["doc_id"], str(exc))]
+            logger.warning(
+                "[NewsLoader] Extraction batch write failed (docs=%s), retrying per document: %s",
+                len(bundles),
+                exc,
+            )
 
-            if causes_rows:
-                causes_query = """
-                UNWIND $rows AS row
-                MATCH (src:Event {event_id: row.src_event_id})
-                MATCH (dst:Event {event_id: row.dst_event_id})
-                MERGE (src)-[r:CAUSES]->(dst)
-                ON CREATE SET r.confidence = row.confidence,
-                              r.source = "llm_extraction",
-                              r.created_at = datetime()
-                SET r.updated_at = datetime()
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(causes_query, {"rows": causes_rows}),
+        write_total = self._empty_write_result()
+        failures: List[Tuple[str, str]] = []
+        for bundle in bundles:
+            try:
+                self._merge_write_result(write_total, self._run_extraction_writes([bundle]))
+            except Exception as doc_exc:
+                failures.append((bundle["doc_id"], str(doc_exc)))
+        return write_total, failures
+
+    @staticmethod
+    def _is_rate_limited_extraction(extraction: Any) -> bool:
+        """NewsExtractor.extract는 LLM 오류를 빈 결과 + error_messages로 돌려주므로 결과에서 rate limit을 판별한다."""
+        if extraction is None:
+            return False
+        if extraction.events or extraction.facts or extraction.claims or extraction.links:
+            return False
+        return any(_is_rate_limit_error(message) for message in (extraction.error_messages or []))
+
+    def _extract_with_backoff(
+        self,
+        extractor: Any,
+        limiter: "_AdaptiveExtractionLimiter",
+        doc_id: str,
+        article_text: str,
+        title: str,
+        max_rate_limit_retries: int,
+    ) -> Any:
+        """추출 워커: rate limit이면 공용 limiter가 동시성을 줄이고 쉬는 동안 기다렸다가 재시도한다."""
+        extraction = None
+        for attempt in range(max_rate_limit_retries + 1):
+            limiter.acquire()
+            rate_limited = False
+            try:
+                extraction = extractor.extract(
+                    doc_id=doc_id,
+                    article_text=article_text,
+                    title=title,
                 )
+                rate_limited = self._is_rate_limited_extraction(extraction)
+            except Exception as exc:
+                rate_limited = _is_rate_limit_error(exc)
+                if not rate_limited or attempt >= max_rate_limit_retries:
+                    raise
+                continue
+            finally:
+                limiter.release(rate_limited=rate_limited)
+            if not rate_limited or attempt >= max_rate_limit_retries:
+                return extraction
+            logger.info(
+                "[NewsLoader] Extraction rate limited for %s, retry %s/%s",
+                doc_id,
+                attempt + 1,
+                max_rate_limit_retries,
+            )
+        return extraction
 
-            if fact_rows:
-                fact_query = """
-                UNWIND $facts AS row
-                MATCH (d:Document {doc_id: $doc_id})
-                MERGE (f:Fact {fact_id: row.fact_id})
-                SET f.text = row.fact_text,
-                    f.fact_type = row.fact_type,
-                    f.date_mentioned = CASE
-                      WHEN row.date_mentioned IS NOT NULL THEN date(row.date_mentioned)
-                      ELSE NULL
-                    END,
-                    f.source = "llm_extraction",
-                    f.updated_at = datetime()
-                MERGE (d)-[:MENTIONS]->(f)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(fact_query, {"doc_id": doc_id, "facts": fact_rows}),
-                )
+    def extract_and_persist(
+        self,
+        news_list: List[Dict[str, Any]],
+        max_docs: Optional[int] = None,
+        default_horizon_days: int = 7,
+        progress_log_interval: int = 25,
+        max_workers: Optional[int] = None,
+        write_batch_docs: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Phase B 정식 적재 경로.
+        Document에서 LLM 추출을 수행하고 Event/Fact/Claim/Evidence/AFFECTS를 Neo4j에 저장한다.
 
-            if claim_rows:
-                claim_query = """
-                UNWIND $claims AS row
-                MATCH (d:Document {doc_id: $doc_id})
-                MERGE (c:Claim {claim_id: row.claim_id})
-                SET c.text = row.claim_text,
-                    c.claim_type = row.claim_type,
-                    c.author = row.author,
-                    c.sentiment = row.sentiment,
-                    c.source = "llm_extraction",
-                    c.updated_at = datetime()
-                MERGE (d)-[:MENTIONS]->(c)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(claim_query, {"doc_id": doc_id, "claims": claim_rows}),
-                )
+        단계별 파이프라인:
+        1) 추출 워커 풀(max_workers, NEWS_EXTRACTION_MAX_WORKERS)이 LLM 호출을 동시에 수행한다.
+           rate limit 응답 시 공용 limiter가 동시성을 절반으로 줄이고 지수 백오프한다.
+        2) 호출 스레드가 완료 순서대로 row를 만들고(단일 writer),
+        3) write_batch_docs(NEWS_EXTRACTION_WRITE_BATCH_DOCS) 문서마다 종류별 UNWIND 배치로 모아 쓴다.
+        """
+        if not news_list:
+            return {
+                "status": "no_data",
+                "processed_docs": 0,
+                "success_docs": 0,
+                "failed_docs": 0,
+            }
 
-            if claim_about_rows:
-                claim_about_query = """
-                UNWIND $rows AS row
-                MATCH (c:Claim {claim_id: row.claim_id})
-                MATCH (ev:Event {event_id: row.event_id})
-                MERGE (c)-[r:ABOUT]->(ev)
-                ON CREATE SET r.source = "llm_extraction", r.created_at = datetime()
-                SET r.updated_at = datetime()
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(claim_about_query, {"rows": claim_about_rows}),
-                )
+        from .news_extractor import get_news_extractor
 
-            if evidence_rows:
-                evidence_query = """
-                UNWIND $rows AS row
-                MATCH (d:Document {doc_id: $doc_id})
-                MERGE (evi:Evidence {evidence_id: row.evidence_id})
-                SET evi.text = row.evidence_text,
-                    evi.source_sentence = row.source_sentence,
-                    evi.lang = row.language,
-                    evi.confidence = row.confidence,
-                    evi.source = "llm_extraction",
-                    evi.updated_at = datetime()
-                MERGE (d)-[:HAS_EVIDENCE]->(evi)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(
-                        evidence_query, {"doc_id": doc_id, "rows": list(evidence_rows.values())}
-                    ),
-                )
+        extractor = get_news_extractor()
+        if not getattr(extractor, "client", None):
+            logger.warning("[NewsLoader] Extraction skipped: Gemini client is not initialized.")
+            return {
+                "status": "skipped",
+                "reason": "missing_gemini_api_key",
+                "processed_docs": 0,
+                "success_docs": 0,
+                "failed_docs": 0,
+            }
 
-            if fact_evidence_rows:
-                fact_support_query = """
-                UNWIND $rows AS row
-                MATCH (evi:Evidence {evidence_id: row.evidence_id})
-                MATCH (f:Fact {fact_id: row.fact_id})
-                MERGE (evi)-[:SUPPORTS]->(f)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(fact_support_query, {"rows": fact_evidence_rows}),
-                )
+        if max_workers is None:
+            max_workers = env_int("NEWS_EXTRACTION_MAX_WORKERS", 4)
+        if write_batch_docs is None:
+            write_batch_docs = env_int("NEWS_EXTRACTION_WRITE_BATCH_DOCS", 20)
+        max_workers = max(1, int(max_workers))
+        write_batch_docs = max(1, int(write_batch_docs))
+        limiter = _AdaptiveExtractionLimiter(
+            max_concurrency=max_workers,
+            base_backoff_sec=env_float("NEWS_EXTRACTION_RATE_LIMIT_BACKOFF_SEC", 2.0),
+            max_backoff_sec=env_float("NEWS_EXTRACTION_RATE_LIMIT_MAX_BACKOFF_SEC", 60.0),
+        )
+        max_rate_limit_retries = max(0, env_int("NEWS_EXTRACTION_RATE_LIMIT_RETRIES", 3))
 
-            if claim_evidence_rows:
-                claim_support_query = """
-                UNWIND $rows AS row
-                MATCH (evi:Evidence {evidence_id: row.evidence_id})
-                MATCH (c:Claim {claim_id: row.claim_id})
-                MERGE (evi)-[:SUPPORTS]->(c)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(claim_support_query, {"rows": claim_evidence_rows}),
-                )
+        target_news = news_list[:max_docs] if max_docs else news_list
+        total_docs = len(target_news)
+        step_interval = max(1, progress_log_interval)
+        extraction_started_at = time.monotonic()
+        logger.info(
+            "[NewsLoader][Extraction] start total_docs=%s horizon_days=%s log_interval=%s workers=%s write_batch=%s",
+            total_docs,
+            default_horizon_days,
+            step_interval,
+            max_workers,
+            write_batch_docs,
+        )
+        total_write = self._empty_write_result()
+        counts = {"processed": 0, "success": 0, "failed": 0, "skipped": 0}
+        failed_doc_ids: List[str] = []
+        pending_bundles: List[Dict[str, Any]] = []
 
-            if entity_rows:
-                entity_query = """
-                UNWIND $rows AS row
-                MATCH (d:Document {doc_id: $doc_id})
-                MERGE (e:Entity {canonical_id: row.canonical_id})
-                SET e.name = coalesce(e.name, row.name),
-                    e.entity_type = coalesce(e.entity_type, row.entity_type),
-                    e.source = coalesce(e.source, "nel_pipeline"),
-                    e.updated_at = datetime()
-                MERGE (d)-[r:MENTIONS]->(e)
-                ON CREATE SET r.confidence = row.confidence,
-                              r.source = "nel_pipeline",
-                              r.created_at = datetime()
-                SET r.updated_at = datetime()
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(
-                        entity_query,
-                        {"doc_id": doc_id, "rows": list(entity_rows.values())},
-                    ),
-                )
+        def log_progress(force: bool = False):
+            processed = counts["processed"]
+            if not force and processed % step_interval != 0 and processed != total_docs:
+                return
+            self._log_progress(
+                stage="Extraction",
+                processed=processed,
+                total=total_docs,
+                started_at=extraction_started_at,
+                success=counts["success"],
+                failed=counts["failed"],
+                skipped=counts["skipped"],
+                extra=(
+                    f"nodes_created={total_write['nodes_created']} "
+                    f"rels_created={total_write['relationships_created']} "
+                    f"pending_write={len(pending_bundles)} concurrency={limiter.current_limit}"
+                ),
+            )
 
-            if entity_alias_rows:
-                alias_query = """
-                UNWIND $rows AS row
-                MERGE (a:EntityAlias {
-                    canonical_id: row.canonical_id,
-                    alias: row.alias,
-                    lang: row.lang
-                })
-                SET a.source = "nel_pipeline",
-                    a.updated_at = datetime()
-                WITH row, a
-                MATCH (e:Entity {canonical_id: row.canonical_id})
-                MERGE (e)-[:HAS_ALIAS]->(a)
-                """
-                self._merge_write_result(
-                    write_total,
-                    self.neo4j_client.run_write(alias_query, {"rows": list(entity_alias_rows.values())}),
-                )
+        def mark_failed(doc_id: str, error_message: str):
+            counts["failed"] += 1
+            failed_doc_ids.append(doc_id)
+            try:
+                self._mark_extraction_failure(doc_id, error_message)
+            except Exception as mark_exc:
+                logger.warning("[NewsLoader] Failed to mark extraction failure for %s: %s", doc_id, mark_exc)
+
+        def flush():
+            if not pending_bundles:
+                return
+            batch = list(pending_bundles)
+            pending_bundles.clear()
+            write_result, failures = self._write_extraction_bundles(batch)
+            self._merge_write_result(total_write, write_result)
+            for doc_id, error_message in failures:
+                logger.warning("[NewsLoader] Extraction write failed for %s: %s", doc_id, error_message)
+                mark_failed(doc_id, error_message)
+            counts["success"] += len(batch) - len(failures)
+
+        def handle_result(news: Dict[str, Any], future: Any):
+            doc_id = news["doc_id"]
+            try:
+                extraction = future.result()
+            except Exception as exc:
+                logger.warning("[NewsLoader] Extraction failed for %s: %s", doc_id, exc)
+                mark_failed(doc_id, str(exc))
+            else:
+                try:
+                    pending_bundles.append(self._build_extraction_rows(news, extraction, default_horizon_days))
+                except Exception as exc:
+                    logger.warning("[NewsLoader] Extraction row build failed for %s: %s", doc_id, exc)
+                    mark_failed(doc_id, str(exc))
+                if len(pending_bundles) >= write_batch_docs:
+                    flush()
+            counts["processed"] += 1
+            log_progress()
+
+        max_in_flight = max_workers * 2
+        in_flight: Dict[Any, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="news-extract") as executor:
+            for news in target_news:
+                title = news.get("title") or ""
+                article_text = news.get("text") or news.get("description") or title
+                if not article_text:
+                    counts["skipped"] += 1
+                    counts["processed"] += 1
+                    log_progress()
+                    continue
 
-            self._merge_write_result(total_write, write_total)
-            success_docs += 1
-            if index % step_interval == 0 or index == total_docs:
-                self._log_progress(
-                    stage="Extraction",
-                    processed=index,
-                    total=total_docs,
-                    started_at=extraction_started_at,
-                    success=success_docs,
-                    failed=failed_docs,
-                    skipped=skipped_docs,
-                    extra=(
-                        f"nodes_created={total_write['nodes_created']} "
-                        f"rels_created={total_write['relationships_created']}"
-                    ),
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._extract_with_backoff,
+                    extractor,
+                    limiter,
+                    news["doc_id"],
+                    article_text,
+                    title,
+                    max_rate_limit_retries,
                 )
+                in_flight[future] = news
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        handle_result(in_flight.pop(finished), finished)
+
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for finished in done:
+                    handle_result(in_flight.pop(finished), finished)
+
+        flush()
+        if counts["success"] > 0:
+            # 신규 Event/Fact/Claim 적재 → GraphRAG 답변 캐시 무효화
+            bump_graph_data_watermark(WATERMARK_SOURCE_DOCUMENT, row_count=counts["success"])
+        log_progress(force=True)
 
         logger.info(
-            "[NewsLoader] Extraction persisted: processed=%s success=%s failed=%s skipped=%s",
+            "[NewsLoader] Extraction persisted: processed=%s success=%s failed=%s skipped=%s rate_limited=%s",
             len(target_news),
-            success_docs,
-            failed_docs,
-            skipped_docs,
+            counts["success"],
+            counts["failed"],
+            counts["skipped"],
+            limiter.rate_limited_count,
         )
         return {
             "status": "success",
             "processed_docs": len(target_news),
-            "success_docs": success_docs,
-            "failed_docs": failed_docs,
-            "skipped_docs": skipped_docs,
+            "success_docs": counts["success"],
+            "failed_docs": counts["failed"],
+            "skipped_docs": counts["skipped"],
             "failed_doc_ids": failed_doc_ids,
             "write_result": total_write,
+            "rate_limited_calls": limiter.rate_limited_count,
         }
 
     def backfill_extractions(
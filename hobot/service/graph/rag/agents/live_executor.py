@@ -12,6 +12,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from service.database.db import get_db_connection
 from service.graph.neo4j_client import get_neo4j_client
+from service.graph.rag.agents.schema_catalog import get_schema_catalog, is_schema_catalog_enabled, is_schema_error
 from service.graph.rag.kr_region_scope import LAWD_NAME_BY_CODE, parse_region_input_to_lawd_codes
 from service.graph.rag.security_id import build_equity_focus_identifiers
 from service.graph.rag.templates import GRAPH_TEMPLATE_SPECS, SQL_TEMPLATE_SPECS
@@ -88,6 +89,18 @@ def _fetch_table_columns(cursor, table_name: str) -> List[str]:
     return resolved
 
 
+def _resolve_existing_tables(cursor, table_names: Iterable[str]) -> List[str]:
+    if is_schema_catalog_enabled():
+        return get_schema_catalog().existing_tables(table_names, cursor=cursor)
+    return _fetch_existing_tables(cursor, table_names)
+
+
+def _resolve_table_columns(cursor, table_name: str) -> List[str]:
+    if is_schema_catalog_enabled():
+        return get_schema_catalog().get_columns(table_name, cursor=cursor)
+    return _fetch_table_columns(cursor, table_name)
+
+
 def _row_get_ci(row: Any, key: str) -> Any:
     if not isinstance(row, dict):
         return None
@@ -869,7 +882,7 @@ def _execute_sql_template(
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            existing_tables = set(_fetch_existing_tables(cursor, target_tables))
+            existing_tables = set(_resolve_existing_tables(cursor, target_tables))
             prioritized_specs = _prioritize_sql_specs(
                 specs,
                 available_tables=existing_tables,
@@ -894,7 +907,7 @@ def _execute_sql_template(
             for selected_spec in prioritized_specs:
                 table_name = str(selected_spec.get("table") or "").strip()
                 try:
-                    columns = _fetch_table_columns(cursor, table_name)
+                    columns = _resolve_table_columns(cursor, table_name)
                     if not columns:
                         attempts.append(
                             {
@@ -999,6 +1012,9 @@ def _execute_sql_template(
                         first_degraded_result = result
 
                 except Exception as inner_exc:
+                    if is_schema_catalog_enabled() and is_schema_error(inner_exc):
+                        # Unknown column/table: the schema changed under the snapshot; reload it next time.
+                        get_schema_catalog().invalidate()
                     logger.warning(
                         "[GraphRAGAgentLiveExecutor] sql template attempt failed (%s:%s): %s",
                         agent_name,
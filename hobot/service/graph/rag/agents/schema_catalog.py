@@ -0,0 +1,331 @@
+"""Process-wide MySQL schema catalog for live SQL executors and tool probes.
+
+Tables, columns and index definitions of the current database are loaded from
+``information_schema`` in one pass and kept in memory. Lookups are served from the
+snapshot; a cheap fingerprint query (table/column/index counts, latest create_time and
+order-independent CRC32 checksums of column names/types and index columns) is re-run at
+most every ``version_check_sec`` and triggers a reload only when the fingerprint changes.
+The checksums catch column renames and type changes, which leave the counts unchanged and
+which MySQL 8 may not reflect in the cached ``create_time``. A full reload is forced every
+``ttl_sec`` and right after ``invalidate()``.
+
+Database I/O runs outside the snapshot lock: one thread refreshes while the others keep
+serving the previous snapshot (only the very first load makes callers wait).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pymysql
+
+from service.utils.env import env_flag, env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERSION_CHECK_SEC = 30
+DEFAULT_TTL_SEC = 3600
+
+# MySQL errors that mean the cached snapshot no longer matches the database:
+# 1054 ER_BAD_FIELD_ERROR (unknown column), 1146 ER_NO_SUCH_TABLE.
+SCHEMA_ERROR_CODES = frozenset({1054, 1146})
+
+_FINGERPRINT_QUERY = (
+    "SELECT "
+    "(SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = DATABASE()) AS table_count, "
+    "(SELECT MAX(create_time) FROM information_schema.tables WHERE table_schema = DATABASE()) AS max_create_time, "
+    "(SELECT COUNT(*) FROM information_schema.columns WHERE table_schema = DATABASE()) AS column_count, "
+    "(SELECT COUNT(*) FROM information_schema.statistics WHERE table_schema = DATABASE()) AS index_column_count, "
+    "(SELECT SUM(CRC32(CONCAT_WS('.', table_name, ordinal_position, column_name, column_type))) "
+    "FROM information_schema.columns WHERE table_schema = DATABASE()) AS column_checksum, "
+    "(SELECT SUM(CRC32(CONCAT_WS('.', table_name, index_name, seq_in_index, column_name))) "
+    "FROM information_schema.statistics WHERE table_schema = DATABASE()) AS index_checksum"
+)
+_COLUMNS_QUERY = (
+    "SELECT table_name, column_name "
+    "FROM information_schema.columns "
+    "WHERE table_schema = DATABASE() "
+    "ORDER BY table_name ASC, ordinal_position ASC"
+)
+_TABLES_QUERY = (
+    "SELECT table_name "
+    "FROM information_schema.tables "
+    "WHERE table_schema = DATABASE()"
+)
+_INDEXES_QUERY = (
+    "SELECT table_name, index_name, column_name, non_unique "
+    "FROM information_schema.statistics "
+    "WHERE table_schema = DATABASE() "
+    "ORDER BY table_name ASC, index_name ASC, seq_in_index ASC"
+)
+
+
+def _row_get_ci(row: Any, key: str) -> Any:
+    if not isinstance(row, dict):
+        return None
+    if key in row:
+        return row.get(key)
+    lowered_key = str(key or "").lower()
+    for candidate_key, candidate_value in row.items():
+        if str(candidate_key or "").lower() == lowered_key:
+            return candidate_value
+    return None
+
+
+def _row_text(row: Any, key: str) -> str:
+    return str(_row_get_ci(row, key) or "").strip()
+
+
+def is_schema_error(exc: BaseException) -> bool:
+    """True when a pymysql error reports an unknown column/table (the snapshot may be stale)."""
+    if not isinstance(exc, pymysql.err.MySQLError):
+        return False
+    args = getattr(exc, "args", ()) or ()
+    return bool(args) and args[0] in SCHEMA_ERROR_CODES
+
+
+def is_schema_catalog_enabled() -> bool:
+    return env_flag("GRAPH_RAG_SCHEMA_CATALOG_ENABLED")
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    name: str
+    columns: Tuple[str, ...] = ()
+    # index_name -> ordered column names
+    indexes: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    unique_indexes: Tuple[str, ...] = ()
+
+    def has_columns(self, columns: Iterable[str]) -> bool:
+        available = set(self.columns)
+        return all(column in available for column in columns)
+
+    def is_indexed_prefix(self, column: str) -> bool:
+        """True when ``column`` leads some index, i.e. range/order filters on it can use an index."""
+        return any(index_columns and index_columns[0] == column for index_columns in self.indexes.values())
+
+
+class SchemaCatalog:
+    """information_schema snapshot shared by every executor thread in the process."""
+
+    def __init__(
+        self,
+        *,
+        version_check_sec: Optional[int] = None,
+        ttl_sec: Optional[int] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if version_check_sec is None:
+            version_check_sec = env_int("GRAPH_RAG_SCHEMA_CATALOG_VERSION_CHECK_SEC", DEFAULT_VERSION_CHECK_SEC)
+        if ttl_sec is None:
+            ttl_sec = env_int("GRAPH_RAG_SCHEMA_CATALOG_TTL_SEC", DEFAULT_TTL_SEC)
+        self.version_check_sec = max(int(version_check_sec), 0)
+        self.ttl_sec = max(int(ttl_sec), 0)
+        self._connection_factory = connection_factory
+
+        # _lock guards the in-memory snapshot; _refresh_lock lets only one thread hit information_schema.
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._tables: Optional[Dict[str, TableSchema]] = None
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        # invalidate() bumps the generation; a load only satisfies the generation it started under.
+        self._generation = 0
+        self._loaded_generation = 0
+        self._stats = {"loads": 0, "version_checks": 0, "lookups": 0, "invalidations": 0}
+
+    # ------------------------------------------------------------------
+    # public lookups
+    # ------------------------------------------------------------------
+    def existing_tables(self, table_names: Iterable[str], *, cursor: Any = None) -> List[str]:
+        """Return the subset of ``table_names`` present in the database, preserving input order."""
+        tables = self._snapshot(cursor)
+        resolved: List[str] = []
+        for name in table_names:
+            text = str(name or "").strip()
+            if text and text in tables and text not in resolved:
+                resolved.append(text)
+        return resolved
+
+    def get_table(self, table_name: str, *, cursor: Any = None) -> Optional[TableSchema]:
+        return self._snapshot(cursor).get(str(table_name or "").strip())
+
+    def get_columns(self, table_name: str, *, cursor: Any = None) -> List[str]:
+        table = self.get_table(table_name, cursor=cursor)
+        return list(table.columns) if table else []
+
+    def get_indexes(self, table_name: str, *, cursor: Any = None) -> Dict[str, Tuple[str, ...]]:
+        table = self.get_table(table_name, cursor=cursor)
+        return dict(table.indexes) if table else {}
+
+    def validate_columns(self, table_name: str, columns: Iterable[str], *, cursor: Any = None) -> List[str]:
+        """Return the requested columns that do not exist on the table (all of them if the table is missing)."""
+        requested = [str(column or "").strip() for column in columns if str(column or "").strip()]
+        table = self.get_table(table_name, cursor=cursor)
+        if table is None:
+            return requested
+        available = set(table.columns)
+        return [column for column in requested if column not in available]
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next lookup (e.g. after an unknown-column error)."""
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "tables": len(self._tables or {}),
+                "loaded_at": self._loaded_at,
+            }
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _cursor(self, cursor: Any) -> Iterator[Any]:
+        if cursor is not None:
+            yield cursor
+            return
+        factory = self._connection_factory
+        if factory is None:
+            from service.database.db import get_db_connection
+
+            factory = get_db_connection
+        with factory() as conn:
+            yield conn.cursor()
+
+    def _pending_refresh(self) -> Optional[str]:
+        """Called with ``_lock`` held. Returns "load", "check" or None."""
+        now = time.monotonic()
+        if (
+            self._tables is None
+            or self._loaded_generation != self._generation
+            or (self.ttl_sec and now - self._loaded_at >= self.ttl_sec)
+        ):
+            return "load"
+        if now - self._checked_at >= self.version_check_sec:
+            return "check"
+        return None
+
+    def _snapshot(self, cursor: Any) -> Dict[str, TableSchema]:
+        with self._lock:
+            self._stats["lookups"] += 1
+            tables = self._tables
+            if self._pending_refresh() is None:
+                return tables or {}
+
+        if tables is not None:
+            # Another thread is already refreshing: keep serving the current snapshot.
+            if not self._refresh_lock.acquire(blocking=False):
+                return tables
+        else:
+            self._refresh_lock.acquire()
+        try:
+            with self._lock:
+                action = self._pending_refresh()
+                generation = self._generation
+                current_fingerprint = self._fingerprint
+            if action is not None:
+                with self._cursor(cursor) as active_cursor:
+                    fingerprint = self._read_fingerprint(active_cursor)
+                    if action == "load":
+                        self._load(active_cursor, fingerprint, generation)
+                    elif fingerprint != current_fingerprint:
+                        logger.info("[GraphRAGSchemaCatalog] schema changed, reloading (%s -> %s)", current_fingerprint, fingerprint)
+                        self._load(active_cursor, fingerprint, generation)
+        finally:
+            self._refresh_lock.release()
+
+        with self._lock:
+            return self._tables or {}
+
+    def _read_fingerprint(self, cursor: Any) -> Tuple[Any, ...]:
+        cursor.execute(_FINGERPRINT_QUERY)
+        row = cursor.fetchone() or {}
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._stats["version_checks"] += 1
+        return (
+            _row_get_ci(row, "table_count"),
+            str(_row_get_ci(row, "max_create_time") or ""),
+            _row_get_ci(row, "column_count"),
+            _row_get_ci(row, "index_column_count"),
+            str(_row_get_ci(row, "column_checksum") or ""),
+            str(_row_get_ci(row, "index_checksum") or ""),
+        )
+
+    def _load(self, cursor: Any, fingerprint: Tuple[Any, ...], generation: int) -> None:
+        columns_by_table: Dict[str, List[str]] = {}
+        cursor.execute(_TABLES_QUERY)
+        for row in cursor.fetchall() or []:
+            table_name = _row_text(row, "table_name")
+            if table_name:
+                columns_by_table.setdefault(table_name, [])
+
+        cursor.execute(_COLUMNS_QUERY)
+        for row in cursor.fetchall() or []:
+            table_name = _row_text(row, "table_name")
+            column_name = _row_text(row, "column_name")
+            if table_name and column_name:
+                columns_by_table.setdefault(table_name, []).append(column_name)
+
+        indexes_by_table: Dict[str, Dict[str, List[str]]] = {}
+        unique_by_table: Dict[str, set] = {}
+        cursor.execute(_INDEXES_QUERY)
+        for row in cursor.fetchall() or []:
+            table_name = _row_text(row, "table_name")
+            index_name = _row_text(row, "index_name")
+            column_name = _row_text(row, "column_name")
+            if not (table_name and index_name and column_name):
+                continue
+            indexes_by_table.setdefault(table_name, {}).setdefault(index_name, []).append(column_name)
+            if str(_row_get_ci(row, "non_unique")) in {"0", "False"}:
+                unique_by_table.setdefault(table_name, set()).add(index_name)
+
+        tables = {
+            table_name: TableSchema(
+                name=table_name,
+                columns=tuple(columns),
+                indexes={
+                    index_name: tuple(index_columns)
+                    for index_name, index_columns in indexes_by_table.get(table_name, {}).items()
+                },
+                unique_indexes=tuple(sorted(unique_by_table.get(table_name, set()))),
+            )
+            for table_name, columns in columns_by_table.items()
+        }
+        with self._lock:
+            self._tables = tables
+            self._fingerprint = fingerprint
+            self._loaded_at = time.monotonic()
+            self._loaded_generation = generation
+            self._stats["loads"] += 1
+        logger.debug("[GraphRAGSchemaCatalog] loaded %s tables", len(tables))
+
+
+_catalog: Optional[SchemaCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_schema_catalog() -> SchemaCatalog:
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = SchemaCatalog()
+    return _catalog
+
+
+def reset_schema_catalog() -> None:
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
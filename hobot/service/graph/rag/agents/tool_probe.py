@@ -12,6 +12,7 @@ from pymysql.cursors import DictCursor
 
 from service.database import db as db_module
 from service.graph.neo4j_client import get_neo4j_client
+from service.graph.rag.agents.schema_catalog import get_schema_catalog, is_schema_catalog_enabled
 
 logger = logging.getLogger(__name__)
 _SQL_FAILURE_LOGGED: set[str] = set()
@@ -97,7 +98,11 @@ def run_sql_probe(agent_name: str) -> Dict[str, Any]:
     try:
         with _connect_mysql() as conn:
             with conn.cursor() as cursor:
-                existing_tables = _fetch_existing_tables(cursor, table_names)
+                catalog = get_schema_catalog() if is_schema_catalog_enabled() else None
+                if catalog is not None:
+                    existing_tables = catalog.existing_tables(table_names, cursor=cursor)
+                else:
+                    existing_tables = _fetch_existing_tables(cursor, table_names)
                 if not existing_tables:
                     return {
                         "tool": "sql",
@@ -110,6 +115,11 @@ def run_sql_probe(agent_name: str) -> Dict[str, Any]:
                 checks: List[Dict[str, Any]] = []
                 for table_name in existing_tables[:max_tables]:
                     date_col = table_map.get(table_name) or ""
+                    date_col_missing = bool(
+                        date_col and catalog is not None and catalog.validate_columns(table_name, [date_col], cursor=cursor)
+                    )
+                    if date_col_missing:
+                        date_col = ""
                     if date_col:
                         query = (
                             f"SELECT COUNT(*) AS row_count, MAX(`{date_col}`) AS latest_date "
@@ -119,13 +129,14 @@ def run_sql_probe(agent_name: str) -> Dict[str, Any]:
                         query = f"SELECT COUNT(*) AS row_count FROM `{table_name}`"
                     cursor.execute(query)
                     row = cursor.fetchone() or {}
-                    checks.append(
-                        {
-                            "table": table_name,
-                            "row_count": int(row.get("row_count") or 0),
-                            "latest_date": row.get("latest_date"),
-                        }
-                    )
+                    check = {
+                        "table": table_name,
+                        "row_count": int(row.get("row_count") or 0),
+                        "latest_date": row.get("latest_date"),
+                    }
+                    if date_col_missing:
+                        check["date_column_missing"] = table_map.get(table_name)
+                    checks.append(check)
 
                 return {
                     "tool": "sql",
@@ -5,12 +5,14 @@ Phase D-1: Question -> subgraph context API.
 import logging
 import os
 import re
+import threading
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from ..cache.embedding_cache import get_query_embedding_cache
 from ..neo4j_client import get_neo4j_client
 from ..normalization.country_mapping import get_country_name, normalize_country
 from .kr_region_scope import (
@@ -18,6 +20,7 @@ from .kr_region_scope import (
     format_lawd_codes_csv,
     parse_region_input_to_lawd_codes,
 )
+from .retrieval_executor import GraphRagRetrievalExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -258,6 +261,10 @@ class GraphRagContextBuilder:
         self.vector_weight = max(_safe_float(os.getenv("GRAPH_RAG_VECTOR_WEIGHT", "0.45"), 0.45), 0.0)
         self.fallback_weight = max(_safe_float(os.getenv("GRAPH_RAG_FALLBACK_WEIGHT", "0.15"), 0.15), 0.0)
         self.stock_focus_weight = max(_safe_float(os.getenv("GRAPH_RAG_STOCK_FOCUS_WEIGHT", "0.6"), 0.6), 0.0)
+        self.query_embedding_cache_enabled = _truthy_env(
+            os.getenv("GRAPH_RAG_EMBEDDING_CACHE_ENABLED", "1"),
+            default=True,
+        )
         self._embedding_client = None
 
     @staticmethod
@@ -685,6 +692,16 @@ class GraphRagContextBuilder:
         if client is None:
             return None
 
+        if not self.query_embedding_cache_enabled:
+            return self._request_query_embedding(client, query_text)
+        return get_query_embedding_cache().get_or_compute(
+            question=query_text,
+            model=self.query_embedding_model,
+            dimension=self.query_embedding_dimension,
+            compute=lambda: self._request_query_embedding(client, query_text),
+        )
+
+    def _request_query_embedding(self, client, query_text: str) -> Optional[List[float]]:
         try:
             from google.genai import types
 
@@ -810,9 +827,10 @@ class GraphRagContextBuilder:
         keyword_documents: List[Dict[str, Any]],
         fallback_documents: List[Dict[str, Any]],
         vector_documents: List[Dict[str, Any]],
-        stock_documents: List[Dict[str, Any]],
+        stock_documents: Optional[List[Dict[str, Any]]] = None,
         limit: int,
     ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        stock_documents = stock_documents or []
         doc_map: Dict[str, Dict[str, Any]] = {}
         source_map: Dict[str, Set[str]] = {}
         bm25_raw: Dict[str, float] = {}
@@ -1869,123 +1887,141 @@ class GraphRagContextBuilder:
                 normalized_company_keys.add(company_key)
         normalized_focus_companies = normalized_focus_companies[:16]
 
-        matched_theme_ids = self._resolve_theme_candidates(
-            question=request.question,
-            start_iso=start_iso,
-            end_iso=end_iso,
-            country=scope_filters.get("country"),
-            country_name=scope_filters.get("country_name"),
-            country_code=scope_filters.get("country_code"),
-            country_codes=scope_filters.get("country_codes"),
-            country_names=scope_filters.get("country_names"),
-        )
-        matched_indicator_codes = self._resolve_indicator_candidates(request.question)
+        scope_kwargs = {
+            "start_iso": start_iso,
+            "end_iso": end_iso,
+            "country": scope_filters.get("country"),
+            "country_name": scope_filters.get("country_name"),
+            "country_code": scope_filters.get("country_code"),
+            "country_codes": scope_filters.get("country_codes"),
+            "country_names": scope_filters.get("country_names"),
+        }
         question_terms = self._extract_question_search_terms(request.question)
+        has_stock_focus = bool(normalized_focus_symbols or normalized_focus_companies)
+        executor = GraphRagRetrievalExecutor()
+
+        def _run_vector_stage() -> Tuple[Optional[List[float]], List[Dict[str, Any]]]:
+            # Hybrid Search 2) Vector 후보 (질문 임베딩 기반) - 임베딩 호출과 벡터 검색을 한 stage로 묶는다.
+            embedding = self._embed_query_vector(request.question)
+            if not embedding:
+                return None, []
+            return embedding, self._fetch_documents_by_vector(
+                **scope_kwargs,
+                query_embedding=embedding,
+                limit=request.top_k_documents,
+            )
 
-        events = self._fetch_events(
-            start_iso=start_iso,
-            end_iso=end_iso,
-            country=scope_filters.get("country"),
-            country_name=scope_filters.get("country_name"),
-            country_code=scope_filters.get("country_code"),
-            country_codes=scope_filters.get("country_codes"),
-            country_names=scope_filters.get("country_names"),
-            theme_filter=matched_theme_ids,
-            indicator_filter=matched_indicator_codes,
-            limit=request.top_k_events,
+        # Wave 1) 질문만으로 실행 가능한 stage: 테마/지표 후보, BM25, 벡터, 종목 포커스
+        seed_results = executor.run_wave(
+            "seed",
+            {
+                "themes": lambda: self._resolve_theme_candidates(question=request.question, **scope_kwargs),
+                "indicators": lambda: self._resolve_indicator_candidates(request.question),
+                # Hybrid Search 1) BM25 full-text 후보
+                "fulltext": lambda: self._fetch_documents_by_fulltext(
+                    **scope_kwargs,
+                    question=request.question,
+                    limit=request.top_k_documents,
+                ),
+                "vector": _run_vector_stage if self.vector_search_enabled else None,
+                "stock_focus": (
+                    (
+                        lambda: self._fetch_documents_for_us_single_stock(
+                            **scope_kwargs,
+                            focus_symbols=normalized_focus_symbols,
+                            focus_companies=normalized_focus_companies,
+                            limit=request.top_k_documents,
+                        )
+                    )
+                    if has_stock_focus
+                    else None
+                ),
+            },
+            defaults={
+                "themes": [],
+                "indicators": [],
+                "fulltext": [],
+                "vector": (None, []),
+                "stock_focus": [],
+            },
         )
-        event_ids = [row["event_id"] for row in events if row.get("event_id")]
+        matched_theme_ids: List[str] = seed_results["themes"] or []
+        matched_indicator_codes: List[str] = seed_results["indicators"] or []
+        keyword_documents: List[Dict[str, Any]] = seed_results["fulltext"] or []
+        query_embedding, vector_documents = seed_results["vector"] or (None, [])
+        vector_documents = vector_documents or []
+        stock_documents: List[Dict[str, Any]] = seed_results["stock_focus"] or []
 
-        base_documents = self._fetch_documents(
-            start_iso=start_iso,
-            end_iso=end_iso,
-            country=scope_filters.get("country"),
-            country_name=scope_filters.get("country_name"),
-            country_code=scope_filters.get("country_code"),
-            country_codes=scope_filters.get("country_codes"),
-            country_names=scope_filters.get("country_names"),
-            theme_filter=matched_theme_ids,
-            event_filter=event_ids,
-            limit=request.top_k_documents,
+        # Hybrid Search 3) CONTAINS fallback 후보
+        # Full-text만으로 놓칠 수 있는 인물명/복합 키워드 문서를 보강한다.
+        run_question_terms_fallback = bool(question_terms) and len(keyword_documents) < request.top_k_documents
+        # ABOUT_THEME 링크 누락 문서를 보강하기 위해 테마 키워드 텍스트 매칭을 병행한다.
+        # 질문 키워드가 있으면 base 문서 수에 따라 채택 여부가 갈리므로 base 문서와 함께 선행 실행한다.
+        theme_keyword_stage = (
+            (
+                lambda: self._fetch_documents_by_theme_keywords_fallback(
+                    **scope_kwargs,
+                    theme_ids=matched_theme_ids,
+                    limit=request.top_k_documents,
+                )
+            )
+            if matched_theme_ids
+            else None
         )
 
-        # Hybrid Search 1) BM25 full-text 후보
-        keyword_documents = self._fetch_documents_by_fulltext(
-            start_iso=start_iso,
-            end_iso=end_iso,
-            country=scope_filters.get("country"),
-            country_name=scope_filters.get("country_name"),
-            country_code=scope_filters.get("country_code"),
-            country_codes=scope_filters.get("country_codes"),
-            country_names=scope_filters.get("country_names"),
-            question=request.question,
-            limit=request.top_k_documents,
+        # Wave 2) 테마/지표 후보에 의존하는 이벤트 조회 + CONTAINS fallback
+        anchor_results = executor.run_wave(
+            "anchor",
+            {
+                "events": lambda: self._fetch_events(
+                    **scope_kwargs,
+                    theme_filter=matched_theme_ids,
+                    indicator_filter=matched_indicator_codes,
+                    limit=request.top_k_events,
+                ),
+                "question_terms_fallback": (
+                    (
+                        lambda: self._fetch_documents_by_question_terms_fallback(
+                            **scope_kwargs,
+                            question=request.question,
+                            limit=request.top_k_documents,
+                        )
+                    )
+                    if run_question_terms_fallback
+                    else None
+                ),
+                "theme_keyword_fallback": theme_keyword_stage if not question_terms else None,
+            },
+            defaults={"events": [], "question_terms_fallback": [], "theme_keyword_fallback": []},
         )
+        events: List[Dict[str, Any]] = anchor_results["events"] or []
+        fallback_documents: List[Dict[str, Any]] = anchor_results["question_terms_fallback"] or []
+        event_ids = [row["event_id"] for row in events if row.get("event_id")]
 
-        # Hybrid Search 2) Vector 후보 (질문 임베딩 기반)
-        query_embedding = self._embed_query_vector(request.question) if self.vector_search_enabled else None
-        vector_documents: List[Dict[str, Any]] = []
-        if query_embedding:
-            vector_documents = self._fetch_documents_by_vector(
-                start_iso=start_iso,
-                end_iso=end_iso,
-                country=scope_filters.get("country"),
-                country_name=scope_filters.get("country_name"),
-                country_code=scope_filters.get("country_code"),
-                country_codes=scope_filters.get("country_codes"),
-                country_names=scope_filters.get("country_names"),
-                query_embedding=query_embedding,
-                limit=request.top_k_documents,
-            )
-
-        # Hybrid Search 3) CONTAINS fallback 후보
-        fallback_documents: List[Dict[str, Any]] = []
-        if question_terms and len(keyword_documents) < request.top_k_documents:
-            # Full-text만으로 놓칠 수 있는 인물명/복합 키워드 문서를 보강한다.
-            fallback_documents = self._fetch_documents_by_question_terms_fallback(
-                start_iso=start_iso,
-                end_iso=end_iso,
-                country=scope_filters.get("country"),
-                country_name=scope_filters.get("country_name"),
-                country_code=scope_filters.get("country_code"),
-                country_codes=scope_filters.get("country_codes"),
-                country_names=scope_filters.get("country_names"),
-                question=request.question,
-                limit=request.top_k_documents,
-            )
-
+        # Wave 3) 이벤트에 의존하는 base 문서 조회
+        document_results = executor.run_wave(
+            "documents",
+            {
+                "base_documents": lambda: self._fetch_documents(
+                    **scope_kwargs,
+                    theme_filter=matched_theme_ids,
+                    event_filter=event_ids,
+                    limit=request.top_k_documents,
+                ),
+                "theme_keyword_fallback": theme_keyword_stage if question_terms else None,
+            },
+            defaults={"base_documents": [], "theme_keyword_fallback": []},
+        )
+        base_documents: List[Dict[str, Any]] = document_results["base_documents"] or []
         theme_keyword_documents: List[Dict[str, Any]] = []
         if matched_theme_ids and (not question_terms or len(base_documents) < request.top_k_documents):
-            # ABOUT_THEME 링크 누락 문서를 보강하기 위해 테마 키워드 텍스트 매칭을 병행한다.
-            theme_keyword_documents = self._fetch_documents_by_theme_keywords_fallback(
-                start_iso=start_iso,
-                end_iso=end_iso,
-                country=scope_filters.get("country"),
-                country_name=scope_filters.get("country_name"),
-                country_code=scope_filters.get("country_code"),
-                country_codes=scope_filters.get("country_codes"),
-                country_names=scope_filters.get("country_names"),
-                theme_ids=matched_theme_ids,
-                limit=request.top_k_documents,
-            )
+            theme_keyword_documents = (
+                anchor_results["theme_keyword_fallback"]
+                if not question_terms
+                else document_results["theme_keyword_fallback"]
+            ) or []
         merged_fallback_documents = fallback_documents + theme_keyword_documents
 
-        stock_documents: List[Dict[str, Any]] = []
-        has_stock_focus = bool(normalized_focus_symbols or normalized_focus_companies)
-        if has_stock_focus:
-            stock_documents = self._fetch_documents_for_us_single_stock(
-                start_iso=start_iso,
-                end_iso=end_iso,
-                country=scope_filters.get("country"),
-                country_name=scope_filters.get("country_name"),
-                country_code=scope_filters.get("country_code"),
-                country_codes=scope_filters.get("country_codes"),
-                country_names=scope_filters.get("country_names"),
-                focus_symbols=normalized_focus_symbols,
-                focus_companies=normalized_focus_companies,
-                limit=request.top_k_documents,
-            )
-
         documents, retrieval_meta = self._merge_hybrid_documents(
             base_documents=base_documents,
             keyword_documents=keyword_documents,
@@ -2027,24 +2063,47 @@ class GraphRagContextBuilder:
         for row in documents:
             discovered_theme_ids.update(row.get("theme_ids") or [])
 
-        stories = self._fetch_stories(
-            start_date=start_date,
-            end_date=end_date,
-            theme_filter=sorted(discovered_theme_ids),
-            limit=request.top_k_stories,
+        # Wave 4) 병합된 문서/테마 기준 확장 조회: Story, Evidence, 메타데이터
+        story_theme_filter = sorted(discovered_theme_ids)
+        expansion_results = executor.run_wave(
+            "expansion",
+            {
+                "stories": lambda: self._fetch_stories(
+                    start_date=start_date,
+                    end_date=end_date,
+                    theme_filter=story_theme_filter,
+                    limit=request.top_k_stories,
+                ),
+                "evidences": lambda: self._fetch_evidences(
+                    doc_ids=doc_ids,
+                    limit=request.top_k_evidences,
+                    per_doc_limit=2 if (normalized_route_type == US_SINGLE_STOCK_ROUTE_TYPE or has_stock_focus) else 3,
+                ),
+                "theme_meta": lambda: self._fetch_theme_metadata(story_theme_filter),
+                "indicator_meta": lambda: self._fetch_indicator_metadata(sorted(discovered_indicator_codes)),
+            },
+            defaults={"stories": [], "evidences": [], "theme_meta": {}, "indicator_meta": {}},
         )
+        stories: List[Dict[str, Any]] = expansion_results["stories"] or []
+        evidences: List[Dict[str, Any]] = expansion_results["evidences"] or []
+        theme_meta: Dict[str, Dict[str, Any]] = dict(expansion_results["theme_meta"] or {})
+        indicator_meta: Dict[str, Dict[str, Any]] = expansion_results["indicator_meta"] or {}
         for row in stories:
             theme_id = row.get("theme_id")
             if theme_id:
                 discovered_theme_ids.add(theme_id)
 
-        theme_meta = self._fetch_theme_metadata(sorted(discovered_theme_ids))
-        indicator_meta = self._fetch_indicator_metadata(sorted(discovered_indicator_codes))
-        evidences = self._fetch_evidences(
-            doc_ids=doc_ids,
-            limit=request.top_k_evidences,
-            per_doc_limit=2 if (normalized_route_type == US_SINGLE_STOCK_ROUTE_TYPE or has_stock_focus) else 3,
-        )
+        # 테마 필터가 비어 있을 때만 Story가 새 테마를 추가하므로, 누락분만 추가 조회한다.
+        missing_theme_ids = sorted(discovered_theme_ids - set(story_theme_filter))
+        if missing_theme_ids:
+            theme_meta.update(
+                executor.run_wave(
+                    "metadata",
+                    {"theme_meta": lambda: self._fetch_theme_metadata(missing_theme_ids)},
+                    defaults={"theme_meta": {}},
+                )["theme_meta"]
+                or {}
+            )
 
         nodes: Dict[str, Dict[str, Any]] = {}
         links: List[Dict[str, Any]] = []
@@ -2294,6 +2353,7 @@ class GraphRagContextBuilder:
                 "query_embedding_dimension": self.query_embedding_dimension,
                 "query_embedding_used": bool(query_embedding),
             },
+            "retrieval_timings": executor.build_meta(),
             "counts": {
                 "nodes": len(nodes),
                 "links": len(links),
@@ -2321,6 +2381,23 @@ def build_graph_rag_context(
     return builder.build_context(request)
 
 
+_question_embedder: Optional[GraphRagContextBuilder] = None
+_question_embedder_lock = threading.Lock()
+
+
+def embed_graph_rag_question(question: str) -> Optional[List[float]]:
+    """
+    context 검색과 동일한 모델/차원/캐시로 질문 임베딩을 구한다(답변 캐시 근접 매칭용).
+    임베딩 클라이언트를 재사용하도록 프로세스 공용 builder 하나를 쓴다.
+    """
+    global _question_embedder
+    if _question_embedder is None:
+        with _question_embedder_lock:
+            if _question_embedder is None:
+                _question_embedder = GraphRagContextBuilder()
+    return _question_embedder._embed_query_vector(question)
+
+
 @router.post("/context", response_model=GraphRagContextResponse)
 def graph_rag_context(request: GraphRagContextRequest):
     try:
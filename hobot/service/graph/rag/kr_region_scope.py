@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from typing import Dict, List, Optional, Set, Tuple
 
+from service.graph.nel.mention_index import REGION_NAMESPACE, get_mention_index
+
 REGION_ALL_TOKENS: Set[str] = {
     "전체",
     "전국",
@@ -334,12 +336,11 @@ def resolve_region_token_to_lawd_codes(token: str) -> List[str]:
         return [code for code in ALL_LAWD_CODES if code.startswith(prefix)]
 
     if len(normalized) >= 2:
+        # 3글자 이상 alias 중 토큰을 포함하는 것 (부분문자열 색인 조회)
+        index = get_mention_index()
         fuzzy: Set[str] = set()
-        for alias, codes in REGION_ALIAS_TO_CODES.items():
-            if len(alias) < 3:
-                continue
-            if normalized in alias:
-                fuzzy.update(codes)
+        for pattern_id in index.containing(normalized, REGION_NAMESPACE):
+            fuzzy.update(index.payload(pattern_id))
         if fuzzy:
             return sorted(fuzzy)
 
@@ -2,21 +2,26 @@
 Phase D-2: GraphRAG response generator.
 """
 
+import contextvars
 import json
 import logging
 import os
+import queue
 import re
+import threading
 import time
 import uuid
 import hashlib
 import html
 import unicodedata
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from email.utils import parsedate_to_datetime
 from datetime import date, datetime, timedelta, timezone
 from urllib.parse import quote_plus
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 import xml.etree.ElementTree as ET
+from types import SimpleNamespace
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.encoders import jsonable_encoder
@@ -29,6 +34,8 @@ from service.llm_monitoring import reset_llm_flow_context, set_llm_flow_context,
 
 from service.llm import llm_gemini_flash, llm_gemini_pro
 from service.database.db import get_db_connection
+from service.graph.cache.answer_cache import build_answer_scope_hash, get_graph_rag_answer_cache
+from service.graph.cache.data_watermark import get_graph_data_watermark
 from service.graph.monitoring import GraphRagApiCallLogger
 from service.graph.neo4j_client import get_neo4j_client
 from service.graph.normalization.country_mapping import get_country_name, normalize_country
@@ -40,6 +47,7 @@ from .context_api import (
     GraphRagContextResponse,
     SUPPORTED_QA_COUNTRY_CODES,
     build_graph_rag_context,
+    embed_graph_rag_question,
 )
 from .agents import execute_agent_stub
 from .kr_region_scope import LAWD_NAME_BY_CODE
@@ -1342,15 +1350,165 @@ def _load_json_dict(value: Any) -> Dict[str, Any]:
         return {}
 
 
+def _build_answer_cache_scope(
+    *,
+    request: GraphRagAnswerRequest,
+    effective_request: GraphRagAnswerRequest,
+    route_decision: Dict[str, Any],
+) -> Dict[str, Any]:
+    _, _, country_code = _resolve_country_filter(
+        effective_request.country,
+        effective_request.country_code,
+    )
+    return {
+        "country_code": country_code,
+        "region_code": effective_request.region_code,
+        "property_type": effective_request.property_type,
+        "time_range": effective_request.time_range,
+        "compare_mode": effective_request.compare_mode,
+        "question_id": str(route_decision.get("selected_question_id") or request.question_id or "").strip(),
+        # 명시적 기준일만 scope에 포함한다(기본값 today는 워터마크로 무효화).
+        "as_of_date": request.as_of_date.isoformat() if request.as_of_date else None,
+        "top_k": [
+            request.top_k_events,
+            request.top_k_documents,
+            request.top_k_stories,
+            request.top_k_evidences,
+            request.max_prompt_evidences,
+        ],
+    }
+
+
+def _prepare_answer_cache_state(
+    *,
+    request: GraphRagAnswerRequest,
+    effective_request: GraphRagAnswerRequest,
+    model_name: str,
+    route_decision: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """답변 캐시 조회/저장에 쓰는 키 재료. 캐시 비활성/워터마크 조회 실패 시 None."""
+    if request.include_context or not request.reuse_cached_run:
+        return None
+    if not _is_env_flag_enabled("GRAPH_RAG_ANSWER_CACHE_ENABLED", default=True):
+        return None
+    watermark = get_graph_data_watermark()
+    if not watermark:
+        return None
+
+    route_type = str(route_decision.get("selected_type") or "").strip()
+    scope_hash = build_answer_scope_hash(
+        route_type=route_type,
+        scope=_build_answer_cache_scope(
+            request=request,
+            effective_request=effective_request,
+            route_decision=route_decision,
+        ),
+        model=model_name,
+        watermark=watermark,
+    )
+    question_embedding: Optional[List[float]] = None
+    if _is_env_flag_enabled("GRAPH_RAG_ANSWER_CACHE_SEMANTIC_ENABLED", default=False):
+        try:
+            question_embedding = embed_graph_rag_question(request.question)
+        except Exception as error:
+            logger.warning("[GraphRAGAnswerCache] question embedding failed: %s", error)
+    return {
+        "question": request.question,
+        "route_type": route_type,
+        "scope_hash": scope_hash,
+        "watermark": watermark,
+        "model": model_name,
+        "question_embedding": question_embedding,
+    }
+
+
 def _load_cached_answer(
     *,
     request: GraphRagAnswerRequest,
     model_name: str,
     as_of_date: date,
+    cache_state: Optional[Dict[str, Any]] = None,
 ) -> Optional[GraphRagAnswerResponse]:
     if request.include_context or not request.reuse_cached_run:
         return None
 
+    if cache_state is not None:
+        hit = get_graph_rag_answer_cache().get(
+            question=cache_state["question"],
+            scope_hash=cache_state["scope_hash"],
+            question_embedding=cache_state.get("question_embedding"),
+        )
+        if hit is not None:
+            try:
+                payload = dict(hit["response"])
+                payload["question"] = request.question
+                context_meta = dict(payload.get("context_meta") or {})
+                context_meta.update(
+                    {
+                        "cache_hit": True,
+                        "cache_source": "graph_rag_answer_cache",
+                        "cache_match": hit.get("match"),
+                        "cache_similarity": hit.get("similarity"),
+                        "cache_tier": hit.get("tier"),
+                        "cache_watermark": cache_state.get("watermark"),
+                    }
+                )
+                payload["context_meta"] = context_meta
+                analysis_run_id = payload.get("analysis_run_id")
+                payload["persistence"] = (
+                    {"analysis_run": {"run_id": str(analysis_run_id), "reused": True}} if analysis_run_id else {}
+                )
+                payload["context"] = None
+                logger.info(
+                    "[GraphRAGAnswer] answer cache hit(match=%s, tier=%s)",
+                    hit.get("match"),
+                    hit.get("tier"),
+                )
+                return GraphRagAnswerResponse(**payload)
+            except Exception as error:
+                logger.warning("[GraphRAGAnswer] answer cache payload invalid: %s", error)
+
+    # 기존 GraphRagApiCall 스캔 기반 재사용은 명시적으로 켠 경우에만 사용한다.
+    if not _is_env_flag_enabled("GRAPH_RAG_LEGACY_RUN_CACHE_ENABLED", default=False):
+        return None
+    return _load_cached_analysis_run(
+        request=request,
+        model_name=model_name,
+        as_of_date=as_of_date,
+    )
+
+
+def _store_cached_answer(
+    cache_state: Optional[Dict[str, Any]],
+    response: GraphRagAnswerResponse,
+) -> None:
+    if cache_state is None:
+        return
+    if not response.citations and not response.structured_citations:
+        return
+    try:
+        payload = jsonable_encoder(response)
+        payload["context"] = None
+        get_graph_rag_answer_cache().put(
+            question=cache_state["question"],
+            scope_hash=cache_state["scope_hash"],
+            route_type=cache_state.get("route_type") or "",
+            model=cache_state.get("model") or response.model,
+            watermark=cache_state["watermark"],
+            payload=payload,
+            question_embedding=cache_state.get("question_embedding"),
+        )
+    except Exception as error:
+        logger.warning("[GraphRAGAnswer] answer cache store failed: %s", error)
+
+
+def _load_cached_analysis_run(
+    *,
+    request: GraphRagAnswerRequest,
+    model_name: str,
+    as_of_date: date,
+) -> Optional[GraphRagAnswerResponse]:
+
     country_input, country_name, country_code = _resolve_country_filter(
         request.country,
         request.country_code,
@@ -4929,6 +5087,185 @@ def _normalize_agent_execution_payload(raw_json: Dict[str, Any], raw_text: str)
     }
 
 
+_agent_dispatch_pool: Optional[ThreadPoolExecutor] = None
+_agent_dispatch_pool_lock = threading.Lock()
+
+
+def _get_agent_dispatch_pool() -> ThreadPoolExecutor:
+    # timeout 난 에이전트를 기다리지 않고 반환할 수 있도록 with 블록 대신 프로세스 공용 pool을 사용한다.
+    # 다른 요청이 이미 받아 간 pool에 submit할 수 있으므로 GRAPH_RAG_AGENT_MAX_WORKERS 크기로 한 번만 만들고 교체하지 않는다.
+    global _agent_dispatch_pool
+    if _agent_dispatch_pool is not None:
+        return _agent_dispatch_pool
+    with _agent_dispatch_pool_lock:
+        if _agent_dispatch_pool is None:
+            _agent_dispatch_pool = ThreadPoolExecutor(
+                max_workers=max(_safe_int(os.getenv("GRAPH_RAG_AGENT_MAX_WORKERS"), 8), 1),
+                thread_name_prefix="graph-rag-agent",
+            )
+        return _agent_dispatch_pool
+
+
+def _resolve_agent_deadline_at(request: GraphRagAnswerRequest) -> float:
+    """supervisor plan 전체(모든 branch/agent)가 공유하는 monotonic deadline."""
+    deadline_sec = max(_safe_int(os.getenv("GRAPH_RAG_AGENT_DEADLINE_SEC"), int(request.timeout_sec) + 30), 5)
+    return time.monotonic() + deadline_sec
+
+
+def _build_agent_timeout_run(
+    *,
+    agent_name: str,
+    branch_name: str,
+    agent_llm_enabled: bool,
+    configured_model: str,
+    reason: str,
+    trace_order: Optional[int],
+) -> Dict[str, Any]:
+    empty_payload = _normalize_agent_execution_payload({}, "")
+    empty_payload["domain_source"] = agent_name.replace("_agent", "").upper()
+    empty_payload["primary_trend"] = "NEUTRAL"
+    empty_payload["analytical_summary"] = "현재 데이터를 분석할 수 없습니다. (에이전트 시간 초과)"
+    empty_payload["key_drivers"] = ["에이전트 실행 시간 초과"]
+    return {
+        "agent": agent_name,
+        "branch": branch_name,
+        "status": "timeout",
+        "reason": reason,
+        "trace_order": trace_order,
+        "agent_llm": {
+            "enabled": agent_llm_enabled,
+            "status": "degraded",
+            "reason": reason,
+            "model": configured_model or DOMAIN_AGENT_MODEL,
+            "payload": empty_payload,
+        },
+    }
+
+
+def _run_branch_agent(
+    agent_name: str,
+    *,
+    branch_name: str,
+    dispatch_mode: str,
+    request: GraphRagAnswerRequest,
+    route_decision: Dict[str, Any],
+    context_meta: Dict[str, Any],
+    graph_context: Optional[Dict[str, Any]],
+    flow_type: Optional[str],
+    flow_run_id: Optional[str],
+    user_id: Optional[str],
+    agent_llm_enabled: bool,
+    agent_model_policy: Dict[str, Any],
+    trace_order: Optional[int] = None,
+    deadline_at: Optional[float] = None,
+) -> Dict[str, Any]:
+    started_at = time.time()
+    run_result = execute_agent_stub(
+        agent_name,
+        branch=branch_name,
+        request=request,
+        route_decision=route_decision,
+        context_meta=context_meta,
+    )
+    configured_model = str(agent_model_policy.get(agent_name) or "").strip()
+    if configured_model:
+        run_result.setdefault("llm_model", configured_model)
+    tool_probe = run_result.get("tool_probe") if isinstance(run_result.get("tool_probe"), dict) else {}
+
+    agent_llm_result: Dict[str, Any] = {
+        "enabled": agent_llm_enabled,
+        "status": "skipped",
+        "reason": "agent_llm_disabled",
+    }
+    if agent_llm_enabled:
+        agent_model = configured_model or DOMAIN_AGENT_MODEL
+        agent_prompt = _build_agent_execution_prompt(
+            agent_name=agent_name,
+            branch_name=branch_name,
+            request=request,
+            route_decision=route_decision,
+            tool_probe=tool_probe,
+            context_meta=context_meta,
+            graph_context=graph_context,
+        )
+        agent_llm = _resolve_agent_llm(
+            model_name=agent_model,
+            timeout_sec=request.timeout_sec,
+        )
+        metadata_json = {
+            "log_type": "agent_execution",
+            "branch": branch_name,
+            "dispatch_mode": dispatch_mode,
+            "agent": agent_name,
+            "tool": str(tool_probe.get("tool") or ""),
+            "tool_status": str(tool_probe.get("status") or ""),
+            "row_count": int(tool_probe.get("row_count") or 0),
+            "metric_value": int(tool_probe.get("metric_value") or 0),
+        }
+
+        max_retries = max(_safe_int(os.getenv("GRAPH_RAG_AGENT_MAX_RETRIES"), 2), 1)
+        for attempt in range(max_retries):
+            try:
+                with track_llm_call(
+                    model_name=agent_model,
+                    provider="Google",
+                    service_name="graph_rag_agent_execution",
+                    request_prompt=agent_prompt,
+                    user_id=user_id,
+                    flow_type=flow_type,
+                    flow_run_id=flow_run_id,
+                    agent_name=agent_name,
+                    trace_order=trace_order,
+                    metadata_json=metadata_json,
+                ) as tracker:
+                    agent_response = agent_llm.invoke(agent_prompt)
+                    tracker.set_response(agent_response)
+
+                agent_raw_text = _normalize_llm_text(getattr(agent_response, "content", None)).strip()
+                if not agent_raw_text:
+                    agent_raw_text = _normalize_llm_text(agent_response).strip()
+                agent_raw_json = _extract_json_block(agent_raw_text)
+                agent_payload = _normalize_agent_execution_payload(agent_raw_json, agent_raw_text)
+
+                # Validate if summary is valid, if not throw to trigger retry
+                if "생성하지 못했습니다" in agent_payload.get("analytical_summary", "") and attempt < max_retries - 1:
+                    raise ValueError("Agent returned empty or invalid json summary")
+
+                agent_llm_result = {
+                    "enabled": True,
+                    "status": "ok",
+                    "reason": "agent_llm_executed",
+                    "model": agent_model,
+                    "payload": agent_payload,
+                    "raw_model_output": agent_raw_json or {"raw_text": agent_raw_text},
+                }
+                break
+            except Exception as error:
+                # 공유 deadline을 넘겼다면 재시도하지 않고 바로 degraded 처리
+                deadline_exceeded = deadline_at is not None and time.monotonic() >= deadline_at
+                if attempt == max_retries - 1 or deadline_exceeded:
+                    empty_payload = _normalize_agent_execution_payload({}, "")
+                    empty_payload["domain_source"] = agent_name.replace('_agent', '').upper()
+                    empty_payload["primary_trend"] = "NEUTRAL"
+                    empty_payload["analytical_summary"] = "현재 데이터를 분석할 수 없습니다. (LLM 에러/지연)"
+                    empty_payload["key_drivers"] = ["에이전트 응답 지연/스키마 불일치 오류"]
+                    agent_llm_result = {
+                        "enabled": True,
+                        "status": "degraded",
+                        "reason": "agent_llm_failed_after_retry",
+                        "model": configured_model or DOMAIN_AGENT_MODEL,
+                        "error_type": type(error).__name__,
+                        "error": str(error),
+                        "payload": empty_payload,
+                    }
+                    break
+                time.sleep(1)
+    run_result["agent_llm"] = agent_llm_result
+    run_result["trace_order"] = trace_order
+    run_result["duration_ms"] = int((time.time() - started_at) * 1000)
+    return run_result
+
+
 def _execute_branch_agents(
     *,
     branch_name: str,
@@ -4943,7 +5280,18 @@ def _execute_branch_agents(
     flow_run_id: Optional[str] = None,
     user_id: Optional[str] = None,
     agent_llm_enabled: bool = True,
+    trace_order_start: Optional[int] = None,
+    deadline_at: Optional[float] = None,
 ) -> Dict[str, Any]:
+    """
+    branch에 배정된 에이전트를 실행한다.
+
+    에이전트 간 의존성이 없으므로 2개 이상이면 공용 pool에서 동시에 실행하고(agent_dispatch=parallel),
+    아니면 호출 스레드에서 하나씩 실행한다(agent_dispatch=serial). 병렬 실행에서는 시작 후
+    에이전트별 timeout을 넘기거나 supervisor 공유 deadline을 넘긴 에이전트를 degraded(timeout) 결과로 대체하고,
+    직렬 실행에서는 공유 deadline이 지난 뒤 남은 에이전트를 건너뛴다.
+    agent_runs 순서와 trace_order는 완료 순서와 무관하게 agents 순서를 따른다.
+    """
     started_at = time.time()
     if not enabled:
         return {
@@ -4954,8 +5302,6 @@ def _execute_branch_agents(
             "duration_ms": 0,
         }
 
-    agent_runs: List[Dict[str, Any]] = []
-
     # Phase 4 롤백 차단기: USE_STRUCTURED_HANDOFF=false 이면 DomainInsight LLM 파이프라인 우회
     use_structured_handoff = _is_env_flag_enabled("USE_STRUCTURED_HANDOFF", default=True)
     if not use_structured_handoff:
@@ -4964,112 +5310,132 @@ def _execute_branch_agents(
     agent_model_policy = route_decision.get("agent_model_policy")
     if not isinstance(agent_model_policy, dict):
         agent_model_policy = _build_agent_model_policy()
-    for agent_name in agents:
-        run_result = execute_agent_stub(
-            agent_name,
-            branch=branch_name,
-            request=request,
-            route_decision=route_decision,
-            context_meta=context_meta,
+
+    def _trace_order_for(index: int) -> Optional[int]:
+        return trace_order_start + index if trace_order_start is not None else None
+
+    def _timeout_run(index: int, agent_name: str, reason: str) -> Dict[str, Any]:
+        return _build_agent_timeout_run(
+            agent_name=agent_name,
+            branch_name=branch_name,
+            agent_llm_enabled=agent_llm_enabled,
+            configured_model=str(agent_model_policy.get(agent_name) or "").strip(),
+            reason=reason,
+            trace_order=_trace_order_for(index),
         )
-        configured_model = str(agent_model_policy.get(agent_name) or "").strip()
-        if configured_model:
-            run_result.setdefault("llm_model", configured_model)
-        tool_probe = run_result.get("tool_probe") if isinstance(run_result.get("tool_probe"), dict) else {}
 
-        agent_llm_result: Dict[str, Any] = {
-            "enabled": agent_llm_enabled,
-            "status": "skipped",
-            "reason": "agent_llm_disabled",
-        }
-        if agent_llm_enabled:
-            agent_model = configured_model or DOMAIN_AGENT_MODEL
-            agent_prompt = _build_agent_execution_prompt(
-                agent_name=agent_name,
-                branch_name=branch_name,
-                request=request,
-                route_decision=route_decision,
-                tool_probe=tool_probe,
-                context_meta=context_meta,
-                graph_context=graph_context,
-            )
-            agent_llm = _resolve_agent_llm(
-                model_name=agent_model,
-                timeout_sec=request.timeout_sec,
-            )
-            metadata_json = {
-                "log_type": "agent_execution",
-                "branch": branch_name,
-                "dispatch_mode": dispatch_mode,
-                "agent": agent_name,
-                "tool": str(tool_probe.get("tool") or ""),
-                "tool_status": str(tool_probe.get("status") or ""),
-                "row_count": int(tool_probe.get("row_count") or 0),
-                "metric_value": int(tool_probe.get("metric_value") or 0),
-            }
+    agent_kwargs: Dict[str, Any] = {
+        "branch_name": branch_name,
+        "dispatch_mode": dispatch_mode,
+        "request": request,
+        "route_decision": route_decision,
+        "context_meta": context_meta,
+        "graph_context": graph_context,
+        "flow_type": flow_type,
+        "flow_run_id": flow_run_id,
+        "user_id": user_id,
+        "agent_llm_enabled": agent_llm_enabled,
+        "agent_model_policy": agent_model_policy,
+        "deadline_at": deadline_at,
+    }
+    max_workers = max(_safe_int(os.getenv("GRAPH_RAG_AGENT_MAX_WORKERS"), 8), 1)
+    parallel_agents = (
+        len(agents) > 1
+        and max_workers > 1
+        and _is_env_flag_enabled("GRAPH_RAG_PARALLEL_AGENTS_ENABLED", default=True)
+    )
 
-            max_retries = max(_safe_int(os.getenv("GRAPH_RAG_AGENT_MAX_RETRIES"), 2), 1)
-            for attempt in range(max_retries):
-                try:
-                    with track_llm_call(
-                        model_name=agent_model,
-                        provider="Google",
-                        service_name="graph_rag_agent_execution",
-                        request_prompt=agent_prompt,
-                        user_id=user_id,
-                        flow_type=flow_type,
-                        flow_run_id=flow_run_id,
-                        agent_name=agent_name,
-                        metadata_json=metadata_json,
-                    ) as tracker:
-                        agent_response = agent_llm.invoke(agent_prompt)
-                        tracker.set_response(agent_response)
+    agent_timeout_sec = max(
+        _safe_int(os.getenv("GRAPH_RAG_AGENT_TIMEOUT_SEC"), int(request.timeout_sec) + 15),
+        1,
+    )
+    agent_runs: List[Dict[str, Any]] = []
+    timed_out_agents: List[str] = []
 
-                    agent_raw_text = _normalize_llm_text(getattr(agent_response, "content", None)).strip()
-                    if not agent_raw_text:
-                        agent_raw_text = _normalize_llm_text(agent_response).strip()
-                    agent_raw_json = _extract_json_block(agent_raw_text)
-                    agent_payload = _normalize_agent_execution_payload(agent_raw_json, agent_raw_text)
+    def _record_timeout(index: int, agent_name: str, reason: str) -> None:
+        logger.warning(
+            "[GraphRAGAgent] agent timeout(branch=%s, agent=%s, reason=%s)",
+            branch_name,
+            agent_name,
+            reason,
+        )
+        agent_runs.append(_timeout_run(index, agent_name, reason))
+        timed_out_agents.append(agent_name)
 
-                    # Validate if summary is valid, if not throw to trigger retry
-                    if "생성하지 못했습니다" in agent_payload.get("analytical_summary", "") and attempt < max_retries - 1:
-                        raise ValueError("Agent returned empty or invalid json summary")
+    def _record_failure(index: int, agent_name: str, error: Exception) -> None:
+        logger.warning("[GraphRAGAgent] agent failed(branch=%s, agent=%s): %s", branch_name, agent_name, error)
+        agent_runs.append(
+            {
+                "agent": agent_name,
+                "branch": branch_name,
+                "status": "error",
+                "reason": type(error).__name__,
+                "trace_order": _trace_order_for(index),
+                "agent_llm": {
+                    "enabled": agent_llm_enabled,
+                    "status": "degraded",
+                    "reason": "agent_execution_failed",
+                    "error_type": type(error).__name__,
+                    "error": str(error),
+                },
+            }
+        )
 
-                    agent_llm_result = {
-                        "enabled": True,
-                        "status": "ok",
-                        "reason": "agent_llm_executed",
-                        "model": agent_model,
-                        "payload": agent_payload,
-                        "raw_model_output": agent_raw_json or {"raw_text": agent_raw_text},
-                    }
-                    break
-                except Exception as error:
-                    if attempt == max_retries - 1:
-                        empty_payload = _normalize_agent_execution_payload({}, "")
-                        empty_payload["domain_source"] = agent_name.replace('_agent', '').upper()
-                        empty_payload["primary_trend"] = "NEUTRAL"
-                        empty_payload["analytical_summary"] = "현재 데이터를 분석할 수 없습니다. (LLM 에러/지연)"
-                        empty_payload["key_drivers"] = ["에이전트 응답 지연/스키마 불일치 오류"]
-                        agent_llm_result = {
-                            "enabled": True,
-                            "status": "degraded",
-                            "reason": "agent_llm_failed_after_retry",
-                            "model": configured_model or DOMAIN_AGENT_MODEL,
-                            "error_type": type(error).__name__,
-                            "error": str(error),
-                            "payload": empty_payload,
-                        }
-                    else:
-                        time.sleep(1)
-        run_result["agent_llm"] = agent_llm_result
-        agent_runs.append(run_result)
+    if not parallel_agents:
+        # 직렬 실행은 호출 스레드에서 바로 실행한다. 실행 중인 에이전트는 중단할 수 없으므로
+        # 시작 전에 supervisor 공유 deadline만 확인한다.
+        for index, agent_name in enumerate(agents):
+            if deadline_at is not None and time.monotonic() >= deadline_at:
+                _record_timeout(index, agent_name, "supervisor_deadline_exceeded")
+                continue
+            try:
+                agent_runs.append(_run_branch_agent(agent_name, trace_order=_trace_order_for(index), **agent_kwargs))
+            except Exception as error:
+                _record_failure(index, agent_name, error)
+    else:
+        pool = _get_agent_dispatch_pool()
+        # 에이전트별 timeout은 pool에서 실제로 시작된 시점부터 센다.
+        # 대기열에 있는 시간은 supervisor 공유 deadline에만 반영한다.
+        started_events = [threading.Event() for _ in agents]
+        started_at_by_index: Dict[int, float] = {}
+
+        def _run_stamped(index: int, agent_name: str) -> Dict[str, Any]:
+            started_at_by_index[index] = time.monotonic()
+            started_events[index].set()
+            return _run_branch_agent(agent_name, trace_order=_trace_order_for(index), **agent_kwargs)
+
+        futures = [
+            pool.submit(contextvars.copy_context().run, _run_stamped, index, agent_name)
+            for index, agent_name in enumerate(agents)
+        ]
+        for index, (agent_name, future) in enumerate(zip(agents, futures)):
+            queue_remaining = None if deadline_at is None else max(deadline_at - time.monotonic(), 0.0)
+            if not started_events[index].wait(timeout=queue_remaining):
+                future.cancel()
+                _record_timeout(index, agent_name, "supervisor_deadline_exceeded")
+                continue
+            agent_deadline_at = started_at_by_index[index] + agent_timeout_sec
+            if deadline_at is not None:
+                agent_deadline_at = min(agent_deadline_at, deadline_at)
+            try:
+                agent_runs.append(future.result(timeout=max(agent_deadline_at - time.monotonic(), 0.0)))
+            except FutureTimeoutError:
+                reason = (
+                    "supervisor_deadline_exceeded"
+                    if deadline_at is not None and agent_deadline_at >= deadline_at
+                    else "agent_timeout"
+                )
+                _record_timeout(index, agent_name, reason)
+            except Exception as error:
+                _record_failure(index, agent_name, error)
 
     return {
         "branch": branch_name,
         "enabled": True,
         "dispatch_mode": dispatch_mode,
+        "agent_dispatch": "parallel" if parallel_agents else "serial",
         "agent_runs": agent_runs,
+        "timed_out_agents": timed_out_agents,
         "duration_ms": int((time.time() - started_at) * 1000),
     }
 
@@ -5085,6 +5451,7 @@ def _execute_supervisor_plan(
     flow_run_id: Optional[str] = None,
     user_id: Optional[str] = None,
     agent_llm_enabled: bool = True,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     branch_plan = supervisor_execution.get("branch_plan") if isinstance(supervisor_execution.get("branch_plan"), list) else []
     if not branch_plan:
@@ -5123,6 +5490,26 @@ def _execute_supervisor_plan(
     branch_results_by_name: Dict[str, Dict[str, Any]] = {}
     fallback_used = False
     fallback_reason = ""
+    deadline_at = _resolve_agent_deadline_at(request)
+
+    # 동시 실행에서도 llm_usage_logs.trace_order가 plan 순서를 따르도록 branch별 시작 번호를 미리 배정한다.
+    trace_order_starts: Dict[str, int] = {}
+    next_trace_order = 1
+    for branch_cfg in normalized_branches:
+        trace_order_starts[branch_cfg["branch"]] = next_trace_order
+        if branch_cfg["enabled"]:
+            next_trace_order += len(branch_cfg["agents"])
+    companion_trace_order_start = next_trace_order
+
+    def _report_branch(branch_result: Any) -> None:
+        if progress_callback is None or not isinstance(branch_result, dict) or not branch_result.get("enabled"):
+            return
+        _emit_answer_progress(progress_callback, _summarize_branch_progress(branch_result))
+
+    def _report_branch_future(future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        _report_branch(future.result())
 
     def _branch_requests_companion(branch_result: Dict[str, Any], companion_branch: str) -> bool:
         if not isinstance(branch_result, dict):
@@ -5153,6 +5540,8 @@ def _execute_supervisor_plan(
                 flow_run_id=flow_run_id,
                 user_id=user_id,
                 agent_llm_enabled=agent_llm_enabled,
+                trace_order_start=trace_order_starts.get("sql"),
+                deadline_at=deadline_at,
             )
             graph_future = executor.submit(
                 _execute_branch_agents,
@@ -5168,7 +5557,11 @@ def _execute_supervisor_plan(
                 flow_run_id=flow_run_id,
                 user_id=user_id,
                 agent_llm_enabled=agent_llm_enabled,
+                trace_order_start=trace_order_starts.get("graph"),
+                deadline_at=deadline_at,
             )
+            sql_future.add_done_callback(_report_branch_future)
+            graph_future.add_done_callback(_report_branch_future)
             branch_results_by_name["sql"] = sql_future.result()
             branch_results_by_name["graph"] = graph_future.result()
     else:
@@ -5185,7 +5578,10 @@ def _execute_supervisor_plan(
             flow_run_id=flow_run_id,
             user_id=user_id,
             agent_llm_enabled=agent_llm_enabled,
+            trace_order_start=trace_order_starts.get("sql"),
+            deadline_at=deadline_at,
         )
+        _report_branch(branch_results_by_name["sql"])
         branch_results_by_name["graph"] = _execute_branch_agents(
             branch_name="graph",
             enabled=graph_cfg["enabled"],
@@ -5199,7 +5595,10 @@ def _execute_supervisor_plan(
             flow_run_id=flow_run_id,
             user_id=user_id,
             agent_llm_enabled=agent_llm_enabled,
+            trace_order_start=trace_order_starts.get("graph"),
+            deadline_at=deadline_at,
         )
+        _report_branch(branch_results_by_name["graph"])
         sql_result = branch_results_by_name.get("sql", {})
         graph_result = branch_results_by_name.get("graph", {})
 
@@ -5218,7 +5617,10 @@ def _execute_supervisor_plan(
                 flow_run_id=flow_run_id,
                 user_id=user_id,
                 agent_llm_enabled=agent_llm_enabled,
+                trace_order_start=companion_trace_order_start,
+                deadline_at=deadline_at,
             )
+            _report_branch(branch_results_by_name["graph"])
             fallback_used = True
             fallback_reason = "sql_branch_requested_graph_companion"
         elif graph_cfg["enabled"] and not sql_cfg["enabled"] and _branch_requests_companion(graph_result, "sql"):
@@ -5236,7 +5638,10 @@ def _execute_supervisor_plan(
                 flow_run_id=flow_run_id,
                 user_id=user_id,
                 agent_llm_enabled=agent_llm_enabled,
+                trace_order_start=companion_trace_order_start,
+                deadline_at=deadline_at,
             )
+            _report_branch(branch_results_by_name["sql"])
             fallback_used = True
             fallback_reason = "graph_branch_requested_sql_companion"
 
@@ -5256,7 +5661,10 @@ def _execute_supervisor_plan(
             flow_run_id=flow_run_id,
             user_id=user_id,
             agent_llm_enabled=agent_llm_enabled,
+            trace_order_start=trace_order_starts.get(branch_name),
+            deadline_at=deadline_at,
         )
+        _report_branch(branch_results_by_name[branch_name])
 
     branch_results = [
         branch_results_by_name[branch_cfg["branch"]]
@@ -5265,6 +5673,11 @@ def _execute_supervisor_plan(
     ]
 
     invoked_agent_count = sum(len(item.get("agent_runs") or []) for item in branch_results)
+    timed_out_agents = [
+        f"{item.get('branch')}:{agent_name}"
+        for item in branch_results
+        for agent_name in (item.get("timed_out_agents") or [])
+    ]
     return {
         "status": "executed",
         "dispatch_mode": "parallel" if parallel_mode else "single",
@@ -5272,6 +5685,7 @@ def _execute_supervisor_plan(
         "fallback_reason": fallback_reason,
         "branch_results": branch_results,
         "invoked_agent_count": invoked_agent_count,
+        "timed_out_agents": timed_out_agents,
     }
 
 
@@ -6493,6 +6907,157 @@ def _iter_text_chunks(text: str, chunk_size: int = 24):
         yield source[index : index + step]
 
 
+def _emit_answer_progress(
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+    payload: Dict[str, Any],
+) -> None:
+    """스트리밍 진행 이벤트 전달(콜백 오류가 답변 생성을 중단시키지 않도록 격리)."""
+    if progress_callback is None:
+        return
+    try:
+        progress_callback(payload)
+    except Exception:
+        logger.debug("[GraphRAGAnswerStream] progress callback failed", exc_info=True)
+
+
+def _summarize_branch_progress(branch_result: Dict[str, Any]) -> Dict[str, Any]:
+    agent_runs = branch_result.get("agent_runs") if isinstance(branch_result.get("agent_runs"), list) else []
+    agents: List[Dict[str, Any]] = []
+    for run in agent_runs:
+        if not isinstance(run, dict):
+            continue
+        agent_llm = run.get("agent_llm") if isinstance(run.get("agent_llm"), dict) else {}
+        agents.append(
+            {
+                "agent": str(run.get("agent") or ""),
+                "status": str(agent_llm.get("status") or run.get("status") or ""),
+            }
+        )
+    return {
+        "type": "progress",
+        "stage": "agent_branch",
+        "branch": str(branch_result.get("branch") or ""),
+        "enabled": bool(branch_result.get("enabled")),
+        "duration_ms": int(branch_result.get("duration_ms") or 0),
+        "agents": agents,
+        "message": f"{branch_result.get('branch') or 'agent'} 분석을 마쳤어요.",
+    }
+
+
+class _JsonStringFieldStreamer:
+    """
+    LLM이 생성 중인 JSON 텍스트에서 특정 문자열 필드 값을 점진적으로 디코딩한다.
+
+    최종 답변은 JSON 블록으로 생성되므로 원문 토큰 대신 conclusion 값만 사용자에게 먼저 흘려보낸다.
+    """
+
+    _ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+    def __init__(self, field_name: str):
+        self._pattern = re.compile(r'"' + re.escape(field_name) + r'"\s*:\s*"')
+        self._buffer = ""
+        self._cursor: Optional[int] = None
+        self.done = False
+
+    def feed(self, text: str) -> str:
+        if self.done or not text:
+            return ""
+        self._buffer += text
+        if self._cursor is None:
+            match = self._pattern.search(self._buffer)
+            if not match:
+                return ""
+            self._cursor = match.end()
+
+        decoded: List[str] = []
+        source = self._buffer
+        index = self._cursor
+        while index < len(source):
+            char = source[index]
+            if char == '"':
+                self.done = True
+                index += 1
+                break
+            if char != "\\":
+                decoded.append(char)
+                index += 1
+                continue
+            if index + 1 >= len(source):
+                break
+            marker = source[index + 1]
+            if marker == "u":
+                if index + 6 > len(source):
+                    break
+                try:
+                    decoded.append(chr(int(source[index + 2 : index + 6], 16)))
+                except ValueError:
+                    pass
+                index += 6
+                continue
+            decoded.append(self._ESCAPES.get(marker, marker))
+            index += 2
+        self._cursor = index
+        return "".join(decoded)
+
+
+def _invoke_llm_with_token_stream(
+    llm: Any,
+    prompt: Any,
+    *,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    stream_field: str = "conclusion",
+) -> Any:
+    """
+    progress_callback가 있고 LLM이 stream()을 지원하면 토큰을 받는 즉시 token 이벤트로 전달한다.
+
+    반환값은 invoke()와 동일하게 content/usage_metadata를 가진 응답 객체(청크 병합 결과)이다.
+    스트림 시작 전에 실패하면 invoke()로 폴백한다.
+    """
+    stream_enabled = _is_env_flag_enabled("GRAPH_RAG_STREAM_LLM_TOKENS_ENABLED", default=True)
+    if progress_callback is None or not stream_enabled or not callable(getattr(llm, "stream", None)):
+        return llm.invoke(prompt)
+
+    field_streamer = _JsonStringFieldStreamer(stream_field)
+    merged: Any = None
+    mergeable = True
+    text_parts: List[str] = []
+    received_chunk = False
+    try:
+        for chunk in llm.stream(prompt):
+            received_chunk = True
+            if merged is None:
+                merged = chunk
+            elif mergeable:
+                try:
+                    merged = merged + chunk
+                except Exception:
+                    mergeable = False
+            content = getattr(chunk, "content", chunk)
+            chunk_text = content if isinstance(content, str) else _normalize_llm_text(content)
+            if not chunk_text:
+                continue
+            text_parts.append(chunk_text)
+            visible_text = field_streamer.feed(chunk_text)
+            if visible_text:
+                _emit_answer_progress(progress_callback, {"type": "token", "text": visible_text})
+    except Exception:
+        if received_chunk:
+            raise
+        logger.warning("[GraphRAGAnswerStream] llm.stream failed before first token, fallback to invoke", exc_info=True)
+        return llm.invoke(prompt)
+
+    if merged is None:
+        return llm.invoke(prompt)
+    if mergeable and isinstance(getattr(merged, "content", None), str):
+        return merged
+    # 청크 병합이 불가하거나 content part 리스트인 경우 수신 텍스트를 그대로 이어 붙인다.
+    return SimpleNamespace(
+        content="".join(text_parts),
+        usage_metadata=getattr(merged, "usage_metadata", None),
+        response_metadata=getattr(merged, "response_metadata", None) or {},
+    )
+
+
 def generate_graph_rag_answer(
     request: GraphRagAnswerRequest,
     context_response: Optional[GraphRagContextResponse] = None,
@@ -6502,6 +7067,7 @@ def generate_graph_rag_answer(
     macro_state_generator: Optional[MacroStateGenerator] = None,
     user_id: Optional[str] = None,
     flow_run_id: Optional[str] = None,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> GraphRagAnswerResponse:
     model_name = resolve_graph_rag_model(request.model)
     effective_user_id = str(user_id or "").strip() or "system"
@@ -6519,6 +7085,15 @@ def generate_graph_rag_answer(
     if not isinstance(agent_model_policy, dict):
         agent_model_policy = _build_agent_model_policy()
     route_decision["agent_model_policy"] = agent_model_policy
+    _emit_answer_progress(
+        progress_callback,
+        {
+            "type": "progress",
+            "stage": "route",
+            "selected_type": str(route_decision.get("selected_type") or ""),
+            "message": "질문 유형을 파악했어요.",
+        },
+    )
 
     utility_llm_enabled = _is_env_flag_enabled("GRAPH_RAG_UTILITY_LLM_ENABLED", default=True)
     if llm is not None:
@@ -6627,6 +7202,10 @@ def generate_graph_rag_answer(
 
         if llm is None:
             llm = llm_gemini_flash(model=model_name, timeout=request.timeout_sec)
+        _emit_answer_progress(
+            progress_callback,
+            {"type": "progress", "stage": "synthesis", "message": "답변을 작성하고 있어요."},
+        )
 
         direct_prompt = _build_general_knowledge_prompt(effective_request)
         started_at = time.time()
@@ -6640,7 +7219,11 @@ def generate_graph_rag_answer(
             flow_run_id=effective_flow_run_id,
             agent_name="general_knowledge_agent",
         ) as tracker:
-            llm_response = llm.invoke(direct_prompt)
+            llm_response = _invoke_llm_with_token_stream(
+                llm,
+                direct_prompt,
+                progress_callback=progress_callback,
+            )
             tracker.set_response(llm_response)
 
         raw_text = _normalize_llm_text(getattr(llm_response, "content", None)).strip()
@@ -6807,13 +7390,25 @@ def generate_graph_rag_answer(
             context=None,
         )
 
+    answer_cache_state: Optional[Dict[str, Any]] = None
     if llm is None and context_response is None:
+        answer_cache_state = _prepare_answer_cache_state(
+            request=request,
+            effective_request=effective_request,
+            model_name=model_name,
+            route_decision=route_decision,
+        )
         cached_response = _load_cached_answer(
             request=request,
             model_name=model_name,
             as_of_date=as_of_date,
+            cache_state=answer_cache_state,
         )
         if cached_response:
+            _emit_answer_progress(
+                progress_callback,
+                {"type": "progress", "stage": "cache_hit", "message": "최근 답변을 재사용했어요."},
+            )
             supervisor_execution["execution_result"] = {
                 "status": "skipped",
                 "reason": "cached_response_hit",
@@ -6826,6 +7421,8 @@ def generate_graph_rag_answer(
                 cached_response.context_meta.setdefault("utility_execution", utility_execution)
                 cached_response.context_meta.setdefault("web_fallback", web_fallback_result)
                 cached_response.context_meta.setdefault("utility_llm_enabled", utility_llm_enabled)
+                cached_response.context_meta["flow_run_id"] = effective_flow_run_id
+                cached_response.context_meta["request_user_id"] = effective_user_id
                 cached_response.context_meta.setdefault(
                     "effective_request",
                     {
@@ -6860,6 +7457,16 @@ def generate_graph_rag_answer(
     context = context_response or build_graph_rag_context(
         effective_request.to_context_request(route=route_decision)
     )
+    context_counts = context.meta.get("counts", {}) if isinstance(context.meta, dict) else {}
+    _emit_answer_progress(
+        progress_callback,
+        {
+            "type": "progress",
+            "stage": "context",
+            "counts": context_counts if isinstance(context_counts, dict) else {},
+            "message": "관련 근거를 모았어요.",
+        },
+    )
     agent_graph_payload = {
         "events": [{"event_id": n.properties.get("event_id"), "summary": n.label} for n in context.nodes if n.type == "Event"][:20],
         "indicators": [{"indicator_code": n.properties.get("indicator_code"), "name": n.label} for n in context.nodes if n.type == "EconomicIndicator"][:10],
@@ -6877,6 +7484,16 @@ def generate_graph_rag_answer(
         flow_run_id=effective_flow_run_id,
         user_id=effective_user_id,
         agent_llm_enabled=agent_llm_enabled,
+        progress_callback=progress_callback,
+    )
+    _emit_answer_progress(
+        progress_callback,
+        {
+            "type": "progress",
+            "stage": "agents",
+            "invoked_agent_count": int(supervisor_execution["execution_result"].get("invoked_agent_count") or 0),
+            "message": "에이전트 분석을 마쳤어요.",
+        },
     )
     structured_citations = _build_structured_citations_from_execution(
         supervisor_execution=supervisor_execution,
@@ -6915,6 +7532,10 @@ def generate_graph_rag_answer(
         else:
             llm = llm_gemini_pro(model=model_name, timeout=request.timeout_sec)
 
+    _emit_answer_progress(
+        progress_callback,
+        {"type": "progress", "stage": "synthesis", "message": "답변을 작성하고 있어요."},
+    )
     started_at = time.time()
     
     # LLM 호출 및 모니터링 (시스템 계정 사용)
@@ -6928,11 +7549,19 @@ def generate_graph_rag_answer(
         flow_run_id=effective_flow_run_id,
         agent_name="supervisor_agent",
     ) as tracker:
-        llm_response = llm.invoke(prompt)
+        llm_response = _invoke_llm_with_token_stream(
+            llm,
+            prompt,
+            progress_callback=progress_callback,
+        )
         # 응답 설정 (토큰 사용량 자동 추출)
         tracker.set_response(llm_response)
 
     duration_ms = int((time.time() - started_at) * 1000)
+    _emit_answer_progress(
+        progress_callback,
+        {"type": "progress", "stage": "finalizing", "message": "근거와 답변을 검증하고 있어요."},
+    )
     raw_text = _normalize_llm_text(getattr(llm_response, "content", None)).strip()
     if not raw_text:
         raw_text = _normalize_llm_text(llm_response).strip()
@@ -7234,7 +7863,7 @@ def generate_graph_rag_answer(
     if required_question_schema is not None:
         raw_output_payload["required_question_schema"] = required_question_schema
 
-    return GraphRagAnswerResponse(
+    response = GraphRagAnswerResponse(
         question=request.question,
         model=model_name,
         as_of_date=as_of_date.isoformat(),
@@ -7289,6 +7918,8 @@ def generate_graph_rag_answer(
         raw_model_output=raw_output_payload,
         context=context if request.include_context else None,
     )
+    _store_cached_answer(answer_cache_state, response)
+    return response
 
 
 @router.post("/answer", response_model=GraphRagAnswerResponse)
@@ -7394,7 +8025,7 @@ def graph_rag_answer_stream(request: GraphRagAnswerRequest, http_request: Reques
     def _event_line(payload: Dict[str, Any]) -> bytes:
         return (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8")
 
-    def _stream():
+    def _run_generation(event_queue: "queue.Queue[Dict[str, Any]]") -> None:
         flow_context_token = set_llm_flow_context(
             flow_type="chatbot",
             flow_run_id=flow_run_id,
@@ -7407,18 +8038,11 @@ def graph_rag_answer_stream(request: GraphRagAnswerRequest, http_request: Reques
             },
         )
         try:
-            yield _event_line(
-                {
-                    "type": "started",
-                    "flow_run_id": flow_run_id,
-                    "message": "답변을 준비하고 있어요.",
-                }
-            )
-
             response = generate_graph_rag_answer(
                 request,
                 user_id=request_user_id,
                 flow_run_id=flow_run_id,
+                progress_callback=event_queue.put,
             )
             counts = response.context_meta.get("counts", {}) if isinstance(response.context_meta, dict) else {}
             call_logger.log_call(
@@ -7436,18 +8060,7 @@ def graph_rag_answer_stream(request: GraphRagAnswerRequest, http_request: Reques
                 response_text=response.answer.conclusion,
                 analysis_run_id=response.analysis_run_id,
             )
-
-            friendly_text = _build_friendly_chat_text(response.answer)
-            for chunk in _iter_text_chunks(friendly_text, chunk_size=22):
-                yield _event_line({"type": "delta", "text": chunk})
-
-            yield _event_line(
-                {
-                    "type": "done",
-                    "flow_run_id": flow_run_id,
-                    "response": jsonable_encoder(response),
-                }
-            )
+            event_queue.put({"type": "_result", "response": response})
         except ValueError as error:
             try:
                 call_logger.log_call(
@@ -7463,7 +8076,7 @@ def graph_rag_answer_stream(request: GraphRagAnswerRequest, http_request: Reques
                 )
             except Exception:
                 logger.warning("[GraphRAGAnswerStream] failed to log ValueError call", exc_info=True)
-            yield _event_line({"type": "error", "error": str(error), "status_code": 400})
+            event_queue.put({"type": "error", "error": str(error), "status_code": 400})
         except Exception as error:
             try:
                 call_logger.log_call(
@@ -7480,7 +8093,7 @@ def graph_rag_answer_stream(request: GraphRagAnswerRequest, http_request: Reques
             except Exception:
                 logger.warning("[GraphRAGAnswerStream] failed to log exception call", exc_info=True)
             logger.error("[GraphRAGAnswerStream] failed: %s", error, exc_info=True)
-            yield _event_line(
+            event_queue.put(
                 {
                     "type": "error",
                     "error": "답변 생성 중 오류가 발생했습니다.",
@@ -7489,6 +8102,55 @@ def graph_rag_answer_stream(request: GraphRagAnswerRequest, http_request: Reques
             )
         finally:
             reset_llm_flow_context(flow_context_token)
+            event_queue.put({"type": "_end"})
+
+    def _stream():
+        # 답변 생성은 워커 스레드에서 수행하고, 진행/토큰 이벤트를 큐로 받아 즉시 흘려보낸다.
+        event_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        yield _event_line(
+            {
+                "type": "started",
+                "flow_run_id": flow_run_id,
+                "message": "답변을 준비하고 있어요.",
+            }
+        )
+        worker = threading.Thread(
+            target=_run_generation,
+            args=(event_queue,),
+            name=f"graph-rag-stream-{flow_run_id[-8:]}",
+            daemon=True,
+        )
+        worker.start()
+
+        heartbeat_sec = max(_safe_int(os.getenv("GRAPH_RAG_STREAM_HEARTBEAT_SEC"), 10), 1)
+        while True:
+            try:
+                event = event_queue.get(timeout=heartbeat_sec)
+            except queue.Empty:
+                # 프록시 idle timeout 방지용 keep-alive
+                yield _event_line({"type": "heartbeat", "elapsed_ms": int((time.time() - started_at) * 1000)})
+                continue
+
+            event_type = event.get("type")
+            if event_type == "_end":
+                break
+            if event_type == "_result":
+                response = event["response"]
+                # 최종 답변은 가드레일/근거 검증을 거친 텍스트로 확정한다(token 이벤트는 초안).
+                friendly_text = _build_friendly_chat_text(response.answer)
+                for chunk in _iter_text_chunks(friendly_text, chunk_size=22):
+                    yield _event_line({"type": "delta", "text": chunk})
+                yield _event_line(
+                    {
+                        "type": "done",
+                        "flow_run_id": flow_run_id,
+                        "response": jsonable_encoder(response),
+                    }
+                )
+                continue
+            if event_type in {"progress", "token"}:
+                event = {**event, "elapsed_ms": int((time.time() - started_at) * 1000)}
+            yield _event_line(event)
 
     return StreamingResponse(
         _stream(),
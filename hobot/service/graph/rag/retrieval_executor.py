@@ -0,0 +1,265 @@
+"""
+Phase D-1: GraphRAG retrieval fan-out executor.
+
+서로 독립적인 Neo4j 조회/질문 임베딩 stage를 bounded thread pool에서 병렬 실행하고,
+stage별 deadline·소요 시간·상태를 수집해 context meta로 노출한다.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from service.utils.env import env_int, safe_float, safe_int, truthy_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRAPH_RAG_RETRIEVAL_MAX_WORKERS = 8
+DEFAULT_GRAPH_RAG_RETRIEVAL_STAGE_TIMEOUT_SEC = 8.0
+
+# 프로세스 공용 retrieval pool (요청마다 스레드를 새로 만들지 않도록 bounded pool을 공유)
+# 다른 스레드가 이미 받아 간 pool에 submit할 수 있으므로 한 번 만든 pool은 교체/shutdown하지 않는다.
+_retrieval_pool: Optional[ThreadPoolExecutor] = None
+_retrieval_pool_lock = threading.Lock()
+
+
+def _get_retrieval_pool() -> ThreadPoolExecutor:
+    """최초 호출 시 GRAPH_RAG_RETRIEVAL_MAX_WORKERS 크기로 한 번만 생성한다."""
+    global _retrieval_pool
+    if _retrieval_pool is not None:
+        return _retrieval_pool
+    with _retrieval_pool_lock:
+        if _retrieval_pool is None:
+            _retrieval_pool = ThreadPoolExecutor(
+                max_workers=max(env_int("GRAPH_RAG_RETRIEVAL_MAX_WORKERS", DEFAULT_GRAPH_RAG_RETRIEVAL_MAX_WORKERS), 1),
+                thread_name_prefix="graph-rag-retrieval",
+            )
+        return _retrieval_pool
+
+
+class GraphRagRetrievalExecutor:
+    """
+    build_context 한 번에 대응하는 retrieval 실행기.
+
+    - run_wave(): 의존성이 없는 stage 묶음(wave)을 병렬 실행한다.
+    - stage deadline을 넘기면 기본값으로 대체하고 status=timeout으로 기록한다.
+    - stage 예외는 타이밍을 기록한 뒤 그대로 전파한다(직렬 실행과 동일한 오류 의미).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        stage_timeout_sec: Optional[float] = None,
+        parallel_enabled: Optional[bool] = None,
+    ):
+        if max_workers is None:
+            max_workers = safe_int(
+                os.getenv("GRAPH_RAG_RETRIEVAL_MAX_WORKERS"),
+                DEFAULT_GRAPH_RAG_RETRIEVAL_MAX_WORKERS,
+            )
+        if stage_timeout_sec is None:
+            stage_timeout_sec = safe_float(
+                os.getenv("GRAPH_RAG_RETRIEVAL_STAGE_TIMEOUT_SEC"),
+                DEFAULT_GRAPH_RAG_RETRIEVAL_STAGE_TIMEOUT_SEC,
+            )
+        if parallel_enabled is None:
+            parallel_enabled = truthy_env(
+                os.getenv("GRAPH_RAG_PARALLEL_RETRIEVAL_ENABLED", "1"),
+                default=True,
+            )
+        self.max_workers = max(int(max_workers), 1)
+        self.stage_timeout_sec = max(float(stage_timeout_sec), 0.1)
+        self.parallel_enabled = bool(parallel_enabled) and self.max_workers > 1
+        self._stage_meta: Dict[str, Dict[str, Any]] = {}
+        self._waves: List[Dict[str, Any]] = []
+        self._started_at = time.perf_counter()
+
+    def resolve_stage_timeout(self, name: str, override: Optional[float] = None) -> float:
+        """stage deadline(초): 호출 인자 > GRAPH_RAG_RETRIEVAL_TIMEOUT_<STAGE>_SEC > 기본값"""
+        if override is not None:
+            return max(safe_float(override, self.stage_timeout_sec), 0.1)
+        env_name = f"GRAPH_RAG_RETRIEVAL_TIMEOUT_{name.upper()}_SEC"
+        return max(safe_float(os.getenv(env_name), self.stage_timeout_sec), 0.1)
+
+    def _record(
+        self,
+        *,
+        name: str,
+        wave: str,
+        status: str,
+        elapsed_ms: float,
+        error: Optional[str] = None,
+    ) -> None:
+        entry: Dict[str, Any] = {
+            "wave": wave,
+            "status": status,
+            "elapsed_ms": round(elapsed_ms, 2),
+        }
+        if error:
+            entry["error"] = error[:200]
+        self._stage_meta[name] = entry
+
+    def run_wave(
+        self,
+        wave: str,
+        stages: Dict[str, Callable[[], Any]],
+        *,
+        defaults: Optional[Dict[str, Any]] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        stage 묶음을 실행하고 {stage_name: result}를 반환한다.
+
+        stage 값이 None이면 실행하지 않고 default를 그대로 사용한다(status=skipped).
+        """
+        defaults = defaults or {}
+        timeouts = timeouts or {}
+        wave_started_at = time.perf_counter()
+        results: Dict[str, Any] = {}
+        runnable = {name: fn for name, fn in stages.items() if fn is not None}
+        for name, fn in stages.items():
+            if fn is None:
+                results[name] = defaults.get(name)
+                self._record(name=name, wave=wave, status="skipped", elapsed_ms=0.0)
+
+        if not self.parallel_enabled or len(runnable) <= 1:
+            for name, fn in runnable.items():
+                results[name] = self._run_inline(wave, name, fn)
+        else:
+            results.update(
+                self._run_parallel(
+                    wave,
+                    runnable,
+                    defaults=defaults,
+                    timeouts=timeouts,
+                    wave_started_at=wave_started_at,
+                )
+            )
+
+        wave_elapsed_ms = (time.perf_counter() - wave_started_at) * 1000.0
+        self._waves.append(
+            {
+                "wave": wave,
+                "stages": list(runnable.keys()),
+                "elapsed_ms": round(wave_elapsed_ms, 2),
+            }
+        )
+        return results
+
+    def _run_inline(self, wave: str, name: str, fn: Callable[[], Any]) -> Any:
+        started_at = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as exc:
+            self._record(
+                name=name,
+                wave=wave,
+                status="error",
+                elapsed_ms=(time.perf_counter() - started_at) * 1000.0,
+                error=str(exc),
+            )
+            raise
+        self._record(
+            name=name,
+            wave=wave,
+            status="ok",
+            elapsed_ms=(time.perf_counter() - started_at) * 1000.0,
+        )
+        return result
+
+    def _run_parallel(
+        self,
+        wave: str,
+        runnable: Dict[str, Callable[[], Any]],
+        *,
+        defaults: Dict[str, Any],
+        timeouts: Dict[str, float],
+        wave_started_at: float,
+    ) -> Dict[str, Any]:
+        pool = _get_retrieval_pool()
+        stage_elapsed: Dict[str, float] = {}
+
+        def _timed(stage_name: str, fn: Callable[[], Any]) -> Callable[[], Any]:
+            def _call() -> Any:
+                started_at = time.perf_counter()
+                try:
+                    return fn()
+                finally:
+                    stage_elapsed[stage_name] = (time.perf_counter() - started_at) * 1000.0
+
+            return _call
+
+        futures: Dict[str, Future] = {
+            name: pool.submit(_timed(name, fn)) for name, fn in runnable.items()
+        }
+        deadlines = {
+            name: wave_started_at + self.resolve_stage_timeout(name, timeouts.get(name))
+            for name in runnable.keys()
+        }
+
+        results: Dict[str, Any] = {}
+        first_error: Optional[BaseException] = None
+        for name in sorted(futures.keys(), key=lambda key: deadlines[key]):
+            future = futures[name]
+            remaining = max(deadlines[name] - time.perf_counter(), 0.0)
+            try:
+                results[name] = future.result(timeout=remaining)
+                self._record(
+                    name=name,
+                    wave=wave,
+                    status="ok",
+                    elapsed_ms=stage_elapsed.get(name, (time.perf_counter() - wave_started_at) * 1000.0),
+                )
+            except FutureTimeoutError:
+                future.cancel()
+                results[name] = defaults.get(name)
+                self._record(
+                    name=name,
+                    wave=wave,
+                    status="timeout",
+                    elapsed_ms=(time.perf_counter() - wave_started_at) * 1000.0,
+                )
+                logger.warning(
+                    "[GraphRAGRetrieval] stage timeout(wave=%s, stage=%s, deadline_sec=%.2f)",
+                    wave,
+                    name,
+                    deadlines[name] - wave_started_at,
+                )
+            except Exception as exc:
+                results[name] = defaults.get(name)
+                self._record(
+                    name=name,
+                    wave=wave,
+                    status="error",
+                    elapsed_ms=stage_elapsed.get(name, (time.perf_counter() - wave_started_at) * 1000.0),
+                    error=str(exc),
+                )
+                if first_error is None:
+                    first_error = exc
+
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def build_meta(self) -> Dict[str, Any]:
+        total_elapsed_ms = (time.perf_counter() - self._started_at) * 1000.0
+        stage_sum_ms = sum(
+            float(entry.get("elapsed_ms") or 0.0)
+            for entry in self._stage_meta.values()
+        )
+        return {
+            "parallel_enabled": self.parallel_enabled,
+            "max_workers": self.max_workers,
+            "stage_timeout_sec": self.stage_timeout_sec,
+            "total_elapsed_ms": round(total_elapsed_ms, 2),
+            "stage_sum_ms": round(stage_sum_ms, 2),
+            "timeout_stages": sorted(
+                name for name, entry in self._stage_meta.items() if entry.get("status") == "timeout"
+            ),
+            "waves": list(self._waves),
+            "stages": dict(self._stage_meta),
+        }
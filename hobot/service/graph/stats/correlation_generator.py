@@ -3,10 +3,10 @@ Phase C-3: Indicator ↔ Indicator 통계 엣지 생성.
 """
 
 import logging
-import math
 from datetime import date, timedelta
-from itertools import combinations
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from ..neo4j_client import get_neo4j_client
 
@@ -20,41 +20,101 @@ class CorrelationEdgeGenerator:
         self.neo4j_client = neo4j_client or get_neo4j_client()
 
     @staticmethod
-    def _pearson(values_x: List[float], values_y: List[float]) -> float:
-        if len(values_x) != len(values_y) or len(values_x) < 2:
-            return 0.0
-        mean_x = sum(values_x) / len(values_x)
-        mean_y = sum(values_y) / len(values_y)
-        numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(values_x, values_y))
-        denom_x = math.sqrt(sum((x - mean_x) ** 2 for x in values_x))
-        denom_y = math.sqrt(sum((y - mean_y) ** 2 for y in values_y))
-        if denom_x == 0 or denom_y == 0:
-            return 0.0
-        return numerator / (denom_x * denom_y)
+    def _masked_corr_matrix(matrix_a: np.ndarray, matrix_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        열 단위 Pearson 상관을 한 번에 계산한다. (NaN = 결측, 쌍별(pairwise) 마스크 적용)
+
+        matrix_a: (T, N), matrix_b: (T, M) -> (corr (N, M), 공통 관측 수 (N, M))
+        corr[i, j] = pearson(matrix_a[:, i], matrix_b[:, j]) (두 열이 모두 관측된 행만 사용)
+        """
+        mask_a = (~np.isnan(matrix_a)).astype(np.float64)
+        mask_b = (~np.isnan(matrix_b)).astype(np.float64)
+        values_a = np.where(mask_a > 0, matrix_a, 0.0)
+        values_b = np.where(mask_b > 0, matrix_b, 0.0)
+
+        counts = mask_a.T @ mask_b
+        sum_a = values_a.T @ mask_b
+        sum_b = mask_a.T @ values_b
+        sum_aa = (values_a * values_a).T @ mask_b
+        sum_bb = mask_a.T @ (values_b * values_b)
+        sum_ab = values_a.T @ values_b
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            safe_counts = np.where(counts > 0, counts, 1.0)
+            cov = sum_ab - sum_a * sum_b / safe_counts
+            var_a = sum_aa - sum_a * sum_a / safe_counts
+            var_b = sum_bb - sum_b * sum_b / safe_counts
+            var_a = np.clip(var_a, 0.0, None)
+            var_b = np.clip(var_b, 0.0, None)
+            corr = cov / np.sqrt(var_a * var_b)
+
+        # 관측 2개 미만 / 분산 0(상수열)은 기존 _pearson과 동일하게 0.0으로 본다.
+        # 분산은 제곱합 대비 상대값으로 판정해 부동소수 잔차를 상수열로 걸러낸다.
+        flat = (var_a <= 1e-12 * sum_aa) | (var_b <= 1e-12 * sum_bb)
+        invalid = (counts < 2) | flat | ~np.isfinite(corr)
+        corr = np.where(invalid, 0.0, np.clip(corr, -1.0, 1.0))
+        return corr, counts
+
+    @staticmethod
+    def _build_aligned_matrix(
+        series: Dict[str, Dict[date, float]],
+    ) -> Tuple[List[str], List[date], np.ndarray]:
+        """지표별 {date: value}를 (관측일 합집합 × 지표) 행렬로 정렬한다. 결측은 NaN."""
+        codes = sorted(series.keys())
+        dates = sorted({obs_date for values in series.values() for obs_date in values})
+        date_index = {obs_date: idx for idx, obs_date in enumerate(dates)}
+
+        matrix = np.full((len(dates), len(codes)), np.nan, dtype=np.float64)
+        for col, code in enumerate(codes):
+            values = series[code]
+            if not values:
+                continue
+            rows = np.fromiter((date_index[obs_date] for obs_date in values), dtype=np.int64, count=len(values))
+            matrix[rows, col] = np.fromiter(values.values(), dtype=np.float64, count=len(values))
+
+        # 상관은 이동 불변이므로 열 평균을 빼 두면 합/제곱합 누적 시 자릿수 손실을 줄일 수 있다.
+        if matrix.size:
+            with np.errstate(invalid="ignore"):
+                observed = ~np.isnan(matrix)
+                counts = observed.sum(axis=0)
+                means = np.where(counts > 0, np.where(observed, matrix, 0.0).sum(axis=0) / np.maximum(counts, 1), 0.0)
+            matrix = matrix - means
+        return codes, dates, matrix
 
     @classmethod
-    def _best_lead_lag(
+    def _best_lead_lag_matrix(
         cls,
-        values_x: List[float],
-        values_y: List[float],
+        matrix: np.ndarray,
         max_lag_days: int,
-    ) -> Tuple[int, float]:
-        best_lag = 0
-        best_score = 0.0
+        min_points: int = 2,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        모든 지표 쌍의 최적 선후행 lag/score를 일괄 계산한다.
+
+        반환 lag[i, j] > 0 이면 i가 j를 lag 만큼 선행, < 0 이면 j가 i를 선행한다.
+        lag 별로 겹치는 관측이 min_points 미만인 칸은 후보에서 제외한다(score 0.0).
+        탐색 순서(lag 1부터, 같은 lag에서는 i 선행 우선)와 |score| 동률 처리는 기존 루프 구현과 같다.
+        """
+        num_rows, num_cols = matrix.shape
+        best_lag = np.zeros((num_cols, num_cols), dtype=np.int64)
+        best_score = np.zeros((num_cols, num_cols), dtype=np.float64)
 
-        for lag in range(1, max_lag_days + 1):
-            if len(values_x) <= lag or len(values_y) <= lag:
+        for lag in range(1, max(int(max_lag_days), 0) + 1):
+            if num_rows <= lag:
                 break
+            # lagged[i, j] = pearson(x_i[:-lag], x_j[lag:]) -> i가 j를 lag 만큼 선행
+            lagged, lagged_counts = cls._masked_corr_matrix(matrix[:-lag], matrix[lag:])
+            lagged = np.where(lagged_counts >= min_points, lagged, 0.0)
 
-            x_leads = cls._pearson(values_x[:-lag], values_y[lag:])
-            if abs(x_leads) > abs(best_score):
-                best_lag = lag
-                best_score = x_leads
+            better = np.abs(lagged) > np.abs(best_score)
+            best_lag = np.where(better, lag, best_lag)
+            best_score = np.where(better, lagged, best_score)
 
-            y_leads = cls._pearson(values_x[lag:], values_y[:-lag])
-            if abs(y_leads) > abs(best_score):
-                best_lag = -lag
-                best_score = y_leads
+            # (i, j) 쌍에서 j가 i를 선행하는 경우는 lagged[j, i]
+            lagged_rev = lagged.T
+            better = np.abs(lagged_rev) > np.abs(best_score)
+            best_lag = np.where(better, -lag, best_lag)
+            best_score = np.where(better, lagged_rev, best_score)
 
         return best_lag, best_score
 
@@ -108,15 +168,25 @@ class CorrelationEdgeGenerator:
         all_corr_pairs: List[Dict[str, Any]] = []
         lead_candidates: List[Dict[str, Any]] = []
 
-        for code_a, code_b in combinations(sorted(series.keys()), 2):
-            common_dates = sorted(set(series[code_a]).intersection(series[code_b]))
-            if len(common_dates) < min_points:
-                continue
-
-            x = [series[code_a][d] for d in common_dates]
-            y = [series[code_b][d] for d in common_dates]
-
-            corr = self._pearson(x, y)
+        codes, _, matrix = self._build_aligned_matrix(series)
+        if len(codes) >= 2:
+            corr_matrix, count_matrix = self._masked_corr_matrix(matrix, matrix)
+            lag_matrix, lag_score_matrix = self._best_lead_lag_matrix(
+                matrix,
+                max_lag_days=max_lag_days,
+                min_points=min_points,
+            )
+            # combinations(sorted(codes), 2)와 같은 순서
+            rows, cols = np.triu_indices(len(codes), k=1)
+            eligible = count_matrix[rows, cols] >= min_points
+            rows, cols = rows[eligible], cols[eligible]
+        else:
+            rows = cols = np.zeros(0, dtype=np.int64)
+
+        for idx_a, idx_b in zip(rows.tolist(), cols.tolist()):
+            code_a = codes[idx_a]
+            code_b = codes[idx_b]
+            corr = float(corr_matrix[idx_a, idx_b])
             all_corr_pairs.append(
                 {
                     "code_a": code_a,
@@ -133,7 +203,8 @@ class CorrelationEdgeGenerator:
                     }
                 )
 
-            lag, lag_score = self._best_lead_lag(x, y, max_lag_days=max_lag_days)
+            lag = int(lag_matrix[idx_a, idx_b])
+            lag_score = float(lag_score_matrix[idx_a, idx_b])
             if lag == 0 or abs(lag_score) < lead_threshold:
                 continue
 
@@ -1,12 +1,17 @@
 """
 LLM 사용 모니터링 모듈
 LLM 호출을 추적하고 데이터베이스에 로그를 저장합니다.
+(기본은 백그라운드 싱크가 모아서 다건 INSERT, LLM_USAGE_LOG_ASYNC=0이면 호출 시 즉시 저장)
 """
+import atexit
 import logging
+import os
+import queue
+import threading
 import time
 import json
 from contextvars import ContextVar
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
 from functools import wraps
 from datetime import datetime
 
@@ -29,6 +34,7 @@ except ImportError:
             KST = timezone(timedelta(hours=9))
 
 from service.database.db import get_db_connection
+from service.utils.env import env_flag, env_float, env_int
 
 logger = logging.getLogger(__name__)
 _LLM_FLOW_CONTEXT: ContextVar[Dict[str, Any]] = ContextVar("llm_flow_context", default={})
@@ -143,42 +149,363 @@ def log_llm_usage(
             except Exception:
                 metadata_payload = json.dumps({"raw": str(metadata_json)}, ensure_ascii=False)
 
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO llm_usage_logs (
-                    model_name, provider, request_prompt, response_prompt,
-                    prompt_tokens, completion_tokens, total_tokens,
-                    service_name, duration_ms, user_id, created_at,
-                    flow_type, flow_run_id, agent_name, trace_order, metadata_json
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                model_name,
-                provider,
-                request_prompt[:10000] if request_prompt else None,  # 최대 10KB로 제한
-                response_prompt[:10000] if response_prompt else None,  # 최대 10KB로 제한
-                prompt_tokens,
-                completion_tokens,
-                total_tokens,
-                service_name,
-                duration_ms,
-                user_id,
-                now_kst_naive,  # UTC+9 시간을 naive datetime으로 저장
-                flow_type,
-                flow_run_id,
-                agent_name,
-                trace_order,
-                metadata_payload,
-            ))
-            conn.commit()
-            logger.info(f"LLM 사용 로그 DB 저장 성공: service_name={service_name}, model_name={model_name}, "
-                       f"user_id={user_id}, flow_type={flow_type}, flow_run_id={flow_run_id}, "
-                       f"agent_name={agent_name}, total_tokens={total_tokens}, created_at={now_kst_naive}")
+        record = {
+            "model_name": model_name,
+            "provider": provider,
+            "request_prompt": request_prompt[:10000] if request_prompt else None,  # 최대 10KB로 제한
+            "response_prompt": response_prompt[:10000] if response_prompt else None,  # 최대 10KB로 제한
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens,
+            "service_name": service_name,
+            "duration_ms": duration_ms,
+            "user_id": user_id,
+            "created_at": now_kst_naive,  # UTC+9 시간을 naive datetime으로 저장 (호출 시점 기준)
+            "flow_type": flow_type,
+            "flow_run_id": flow_run_id,
+            "agent_name": agent_name,
+            "trace_order": trace_order,
+            "metadata_json": metadata_payload,
+        }
+
+        # 기본은 백그라운드 싱크에 넘기고 즉시 반환 (요청 경로에서 DB 지연 제거)
+        if env_flag("LLM_USAGE_LOG_ASYNC"):
+            get_llm_usage_log_sink().submit(record)
+            return
+
+        _insert_llm_usage_records([record])
+        logger.info(f"LLM 사용 로그 DB 저장 성공: service_name={service_name}, model_name={model_name}, "
+                   f"user_id={user_id}, flow_type={flow_type}, flow_run_id={flow_run_id}, "
+                   f"agent_name={agent_name}, total_tokens={total_tokens}, created_at={now_kst_naive}")
     except Exception as e:
         logger.error(f"LLM 사용 로그 저장 실패 (service_name={service_name}, model_name={model_name}, user_id={user_id}): {e}", exc_info=True)
         # 예외를 다시 발생시키지 않음 (로그 저장 실패가 전체 프로세스를 중단시키지 않도록)
 
 
+_LLM_USAGE_LOG_COLUMNS = (
+    "model_name", "provider", "request_prompt", "response_prompt",
+    "prompt_tokens", "completion_tokens", "total_tokens",
+    "service_name", "duration_ms", "user_id", "created_at",
+    "flow_type", "flow_run_id", "agent_name", "trace_order", "metadata_json",
+)
+
+
+def _insert_llm_usage_records(records: List[Dict[str, Any]]) -> None:
+    """llm_usage_logs 다건 INSERT (pymysql executemany → multi-row INSERT 한 문장)"""
+    if not records:
+        return
+    columns = ", ".join(_LLM_USAGE_LOG_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(_LLM_USAGE_LOG_COLUMNS))
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            f"INSERT INTO llm_usage_logs ({columns}) VALUES ({placeholders})",
+            [tuple(record.get(column) for column in _LLM_USAGE_LOG_COLUMNS) for record in records],
+        )
+        conn.commit()
+
+
+class LLMUsageLogSink:
+    """
+    LLM 사용 로그 백그라운드 싱크.
+
+    - submit()은 bounded queue에 넣고 바로 반환한다. (큐가 가득 차면 파일 스풀로 보낸다)
+    - 워커 스레드가 batch_size 건 또는 flush_interval_sec 경과 시 다건 INSERT로 적재한다.
+    - MySQL 적재 실패 시 JSONL 스풀 파일에 남기고, 이후 적재가 성공하면 스풀을 재적재한다.
+      재적재는 파일 끝 batch부터 적재 후 그만큼 잘라내므로, 중간에 실패/중단되어도 이미 적재한 batch는
+      다시 넣지 않는다. 재적재 도중 죽은 프로세스가 남긴 `.replaying-<pid>` 파일은 다른 워커가 회수한다.
+    - gunicorn preload/fork 이후에는 프로세스(pid)별로 스레드를 다시 띄운다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_sec: Optional[float] = None,
+        spool_dir: Optional[str] = None,
+        writer: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ):
+        self.max_queue = max(1, max_queue if max_queue is not None else env_int("LLM_USAGE_LOG_QUEUE_MAX", 5000))
+        self.batch_size = max(1, batch_size if batch_size is not None else env_int("LLM_USAGE_LOG_BATCH_SIZE", 100))
+        self.flush_interval_sec = max(
+            0.01,
+            flush_interval_sec if flush_interval_sec is not None else env_float("LLM_USAGE_LOG_FLUSH_SEC", 2.0),
+        )
+        self.spool_dir = spool_dir or os.getenv("LLM_USAGE_LOG_SPOOL_DIR") or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "llm_usage_spool"
+        )
+        self._writer = writer or _insert_llm_usage_records
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.max_queue)
+        self._lock = threading.Lock()
+        self._spool_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._spool_pending = True  # 시작 시 이전 프로세스가 남긴 스풀도 한 번 확인
+        self._stats = {"submitted": 0, "written": 0, "batches": 0, "spooled": 0, "replayed": 0, "write_errors": 0}
+
+    def submit(self, record: Dict[str, Any]) -> None:
+        self._ensure_started()
+        self._incr("submitted")
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            logger.warning("[LLMUsageLogSink] queue full, spooling record to file")
+            self._spool([record])
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {**stats, "queued": self._queue.qsize(), "running": bool(self._thread and self._thread.is_alive())}
+
+    def _incr(self, name: str, value: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] = self._stats.get(name, 0) + value
+
+    def shutdown(self, timeout_sec: float = 5.0) -> None:
+        """남은 로그를 모두 적재하고 워커 스레드를 종료한다. (gunicorn worker_exit / FastAPI shutdown / atexit)"""
+        thread = self._thread
+        self._stopping.set()
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            thread.join(timeout=max(timeout_sec, 0.0))
+        # 스레드가 없거나 제한 시간 안에 끝나지 않았으면 호출 스레드에서 남은 큐를 비운다.
+        remaining = self._drain_nowait(limit=None)
+        for offset in range(0, len(remaining), self.batch_size):
+            self._flush(remaining[offset:offset + self.batch_size])
+
+    def _ensure_started(self) -> None:
+        pid = os.getpid()
+        thread = self._thread
+        if thread is not None and self._pid == pid and thread.is_alive() and not self._stopping.is_set():
+            return
+        with self._lock:
+            thread = self._thread
+            if thread is not None and self._pid == pid and thread.is_alive() and not self._stopping.is_set():
+                return
+            if self._pid is not None and self._pid != pid:
+                # fork된 자식: 부모의 큐/락 상태를 물려받지 않도록 새로 만든다.
+                self._queue = queue.Queue(maxsize=self.max_queue)
+                self._spool_lock = threading.Lock()
+                self._stats_lock = threading.Lock()
+            self._pid = pid
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="llm-usage-log-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            if batch:
+                self._flush(batch)
+            if self._stopping.is_set() and self._queue.empty():
+                return
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        try:
+            first = self._queue.get(timeout=self.flush_interval_sec)
+        except queue.Empty:
+            if self._spool_pending:
+                self._replay_spool()
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval_sec
+        while len(batch) < self.batch_size:
+            if self._stopping.is_set():
+                batch.extend(self._drain_nowait(limit=self.batch_size - len(batch)))
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain_nowait(self, limit: Optional[int]) -> List[Dict[str, Any]]:
+        drained: List[Dict[str, Any]] = []
+        while limit is None or len(drained) < limit:
+            try:
+                drained.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return drained
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        try:
+            self._writer(batch)
+        except Exception as e:
+            self._incr("write_errors")
+            logger.warning(f"[LLMUsageLogSink] DB 적재 실패, 스풀 파일로 보관 (records={len(batch)}): {e}")
+            self._spool(batch)
+            return
+        self._incr("written", len(batch))
+        self._incr("batches")
+        logger.info(f"[LLMUsageLogSink] LLM 사용 로그 {len(batch)}건 DB 저장")
+        if self._spool_pending:
+            self._replay_spool()
+
+    # ------------------------------------------------------------------
+    # 파일 스풀 (MySQL 장애 시)
+    # ------------------------------------------------------------------
+    def _spool_path(self) -> str:
+        return os.path.join(self.spool_dir, f"llm_usage_{os.getpid()}.jsonl")
+
+    def _spool(self, records: List[Dict[str, Any]]) -> None:
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            with self._spool_lock:
+                with open(self._spool_path(), "a", encoding="utf-8") as spool_file:
+                    for record in records:
+                        spool_file.write(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n")
+            self._incr("spooled", len(records))
+            self._spool_pending = True
+        except Exception as e:
+            logger.error(f"[LLMUsageLogSink] 스풀 파일 기록 실패 (records={len(records)}): {e}", exc_info=True)
+
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True  # 다른 사용자의 살아 있는 프로세스
+        except OSError:
+            return False
+        return True
+
+    def _orphaned_claim(self, name: str) -> bool:
+        """재적재 도중 죽은 프로세스가 남긴 `*.jsonl.replaying-<pid>` 파일인지"""
+        base, marker, pid_text = name.rpartition(".replaying-")
+        if not marker or not base.endswith(".jsonl"):
+            return False
+        try:
+            pid = int(pid_text)
+        except ValueError:
+            return False
+        return pid != os.getpid() and not self._pid_alive(pid)
+
+    def _replay_spool(self) -> None:
+        self._spool_pending = False
+        try:
+            names = sorted(
+                name for name in os.listdir(self.spool_dir)
+                if name.endswith(".jsonl") or self._orphaned_claim(name)
+            )
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"[LLMUsageLogSink] 스풀 디렉터리 조회 실패: {e}")
+            return
+
+        own_name = os.path.basename(self._spool_path())
+        stale_before = time.time() - self.flush_interval_sec * 2
+        for name in names:
+            path = os.path.join(self.spool_dir, name)
+            orphaned = not name.endswith(".jsonl")
+            try:
+                # 다른 워커가 아직 쓰고 있을 수 있는 파일은 건너뛴다.
+                if not orphaned and name != own_name and os.path.getmtime(path) > stale_before:
+                    self._spool_pending = True
+                    continue
+                original = path.rpartition(".replaying-")[0] if orphaned else path
+                claimed = f"{original}.replaying-{os.getpid()}"
+                with self._spool_lock:
+                    os.rename(path, claimed)  # 원자적 선점 (다른 워커와 중복 재적재 방지)
+                if orphaned:
+                    logger.info(f"[LLMUsageLogSink] 종료된 프로세스의 재적재 파일 회수: {name}")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"[LLMUsageLogSink] 스풀 파일 선점 실패 ({name}): {e}")
+                continue
+
+            try:
+                replayed = self._replay_claimed_file(claimed)
+                os.remove(claimed)
+                logger.info(f"[LLMUsageLogSink] 스풀 재적재 완료: {name} ({replayed}건)")
+            except Exception as e:
+                logger.warning(f"[LLMUsageLogSink] 스풀 재적재 실패 ({name}), 남은 로그는 다음 적재 때 재시도: {e}")
+                try:
+                    os.rename(claimed, original)
+                except Exception:
+                    pass
+                self._spool_pending = True
+                return
+
+    def _replay_claimed_file(self, claimed: str) -> int:
+        """
+        선점한 스풀 파일을 끝 batch부터 적재하고, 적재한 batch만큼 파일을 잘라낸다.
+        도중에 실패하면 아직 적재하지 않은 앞부분만 파일에 남는다. 반환: 적재한 건수.
+        """
+        with open(claimed, "rb") as spool_file:
+            data = spool_file.read()
+        offsets: List[int] = []
+        records: List[Dict[str, Any]] = []
+        position = 0
+        for raw_line in data.splitlines(keepends=True):
+            if raw_line.strip():
+                offsets.append(position)
+                records.append(_load_spooled_record(raw_line.decode("utf-8")))
+            position += len(raw_line)
+
+        replayed = 0
+        for start in reversed(range(0, len(records), self.batch_size)):
+            batch = records[start:start + self.batch_size]
+            self._writer(batch)
+            with open(claimed, "r+b") as spool_file:
+                spool_file.truncate(offsets[start])
+            replayed += len(batch)
+            self._incr("replayed", len(batch))
+        return replayed
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    return str(value)
+
+
+def _load_spooled_record(line: str) -> Dict[str, Any]:
+    record = json.loads(line)
+    created_at = record.get("created_at")
+    if isinstance(created_at, dict) and "__datetime__" in created_at:
+        record["created_at"] = datetime.fromisoformat(created_at["__datetime__"])
+    return record
+
+
+_log_sink: Optional[LLMUsageLogSink] = None
+_log_sink_lock = threading.Lock()
+
+
+def get_llm_usage_log_sink() -> LLMUsageLogSink:
+    """프로세스 공용 LLMUsageLogSink 싱글톤"""
+    global _log_sink
+    if _log_sink is None:
+        with _log_sink_lock:
+            if _log_sink is None:
+                _log_sink = LLMUsageLogSink()
+                atexit.register(shutdown_llm_usage_log_sink)
+    return _log_sink
+
+
+def shutdown_llm_usage_log_sink(timeout_sec: float = 5.0) -> None:
+    """남은 LLM 사용 로그를 적재한다. (gunicorn worker_exit/on_exit, FastAPI shutdown 훅에서 호출)"""
+    sink = _log_sink
+    if sink is None:
+        return
+    try:
+        sink.shutdown(timeout_sec=timeout_sec)
+    except Exception as e:
+        logger.error(f"[LLMUsageLogSink] shutdown drain 실패: {e}", exc_info=True)
+
+
 def track_llm_usage(service_name: Optional[str] = None):
     """
     LLM 호출을 추적하는 decorator
@@ -19,6 +19,9 @@ from service.macro_trading.collectors.kr_real_estate_collector import (
     MOLIT_REGION_SCOPE_CODES,
     get_kr_real_estate_collector,
 )
+from service.macro_trading.collectors.kr_real_estate_summary import (
+    KRRealEstateMonthlySummaryAggregator,
+)
 from service.macro_trading.collectors.kr_corporate_collector import (
     KRCorporateCollector,
     DEFAULT_ALLOW_BASELINE_FALLBACK,
@@ -95,6 +98,7 @@ __all__ = [
     'DEFAULT_MOLIT_REGION_SCOPE',
     'MOLIT_REGION_SCOPE_CODES',
     'get_kr_real_estate_collector',
+    'KRRealEstateMonthlySummaryAggregator',
     'KRCorporateCollector',
     'DEFAULT_ALLOW_BASELINE_FALLBACK',
     'DEFAULT_DART_CORPCODE_MAX_AGE_DAYS',
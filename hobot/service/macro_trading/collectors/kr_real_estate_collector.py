@@ -12,13 +12,21 @@ import hashlib
 import json
 import logging
 import os
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from service.database.db import get_db_connection
+from service.macro_trading.collectors.kr_real_estate_summary import (
+    KRRealEstateMonthlySummaryAggregator,
+    cells_from_records,
+)
+from service.utils.env import env_float, env_int
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +132,226 @@ MOLIT_REGION_SCOPE_CODES = {
 }
 
 
+# 상세 조회 API(fetch_rdb_transactions)의 필터/정렬/프로젝션을 인덱스로 풀기 위한 stored generated column
+# STORED 컬럼 추가는 테이블 전체 복사가 일어나므로 수집 경로가 아니라
+# scripts/apply_migration_20261016.py로 적용한다. 수집기는 적용 여부만 확인한다.
+TRANSACTION_GENERATED_COLUMNS = (
+    ("lawd_cd", "CHAR(5) GENERATED ALWAYS AS (LEFT(region_code, 5)) STORED"),
+    (
+        "apt_name",
+        "VARCHAR(255) GENERATED ALWAYS AS (LEFT(JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.aptNm')), 255)) STORED",
+    ),
+    (
+        "umd_name",
+        "VARCHAR(100) GENERATED ALWAYS AS (LEFT(JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.umdNm')), 100)) STORED",
+    ),
+    (
+        "jibun",
+        "VARCHAR(64) GENERATED ALWAYS AS (LEFT(JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.jibun')), 64)) STORED",
+    ),
+)
+# (InnoDB 보조 인덱스 끝에는 PK(id)가 붙으므로 contract_date DESC, id DESC 정렬까지 인덱스 순서로 읽힌다.)
+TRANSACTION_INDEXES = (
+    ("idx_type_lawd_contract", "(property_type, transaction_type, lawd_cd, contract_date)"),
+    ("idx_lawd_apt", "(lawd_cd, apt_name)"),
+)
+
+DEFAULT_MOLIT_COLLECT_MAX_WORKERS = 4
+DEFAULT_MOLIT_REQUEST_RATE_PER_SEC = 8.0
+# 기본 run_key에 수집일이 들어가 매일 total_pairs 행이 새로 생기므로, 끝난 런은 이 기간이 지나면 지운다.
+DEFAULT_MOLIT_TASK_RETENTION_DAYS = 7
+
+MOLIT_TASK_PENDING = "pending"
+MOLIT_TASK_RUNNING = "running"
+MOLIT_TASK_DONE = "done"
+MOLIT_TASK_FAILED = "failed"
+
+
+class MolitRequestRateLimiter:
+    """
+    MOLIT(data.go.kr) 호출 공용 속도 제한기 (예약형 토큰 버킷)
+    워커 수와 무관하게 초당 요청 수가 rate_per_sec를 넘지 않도록 각 호출의 출발 시각을 예약한다.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate_per_sec = max(float(rate_per_sec), 0.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> float:
+        if self.rate_per_sec <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate_per_sec
+        wait = slot - now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class MolitTaskCheckpointStore:
+    """
+    (run_key, deal_ym, lawd_cd) 단위 수집 태스크 상태를 MySQL에 기록한다.
+    태스크마다 다음에 받을 페이지를 남기므로 중단된 백필은 그 페이지부터 이어서 받는다.
+    """
+
+    TABLE_NAME = "kr_real_estate_collection_tasks"
+
+    def __init__(self, db_connection_factory=None):
+        self._db_connection_factory = db_connection_factory or get_db_connection
+        self._table_ready = False
+
+    def ensure_table(self):
+        if self._table_ready:
+            return
+        with self._db_connection_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    id BIGINT PRIMARY KEY AUTO_INCREMENT,
+                    run_key VARCHAR(128) NOT NULL,
+                    deal_ym CHAR(6) NOT NULL,
+                    lawd_cd CHAR(5) NOT NULL,
+                    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+                    next_page_no INT NOT NULL DEFAULT 1,
+                    api_requests INT NOT NULL DEFAULT 0,
+                    fetched_rows INT NOT NULL DEFAULT 0,
+                    db_affected INT NOT NULL DEFAULT 0,
+                    attempts INT NOT NULL DEFAULT 0,
+                    last_error TEXT NULL,
+                    started_at DATETIME NULL,
+                    finished_at DATETIME NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    UNIQUE KEY uniq_run_task (run_key, deal_ym, lawd_cd),
+                    INDEX idx_run_status (run_key, status)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                """
+            )
+        self._table_ready = True
+
+    def load_tasks(
+        self,
+        run_key: str,
+        pairs: List[Tuple[str, str]],
+        *,
+        reset: bool = False,
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """run_key의 태스크 행을 (없으면 pending으로 생성 후) 조회한다."""
+        self.ensure_table()
+        with self._db_connection_factory() as conn:
+            cursor = conn.cursor()
+            if reset:
+                cursor.execute(f"DELETE FROM {self.TABLE_NAME} WHERE run_key = %s", (run_key,))
+            if pairs:
+                cursor.executemany(
+                    f"INSERT IGNORE INTO {self.TABLE_NAME} (run_key, deal_ym, lawd_cd, status) VALUES (%s, %s, %s, %s)",
+                    [(run_key, deal_ym, lawd_cd, MOLIT_TASK_PENDING) for deal_ym, lawd_cd in pairs],
+                )
+            cursor.execute(
+                f"""
+                SELECT deal_ym, lawd_cd, status, next_page_no, api_requests, fetched_rows, db_affected, attempts
+                FROM {self.TABLE_NAME}
+                WHERE run_key = %s
+                """,
+                (run_key,),
+            )
+            rows = cursor.fetchall() or []
+        return {(str(row["deal_ym"]), str(row["lawd_cd"])): dict(row) for row in rows}
+
+    def mark_running(self, run_key: str, deal_ym: str, lawd_cd: str) -> None:
+        self._execute(
+            f"""
+            UPDATE {self.TABLE_NAME}
+            SET status = %s, attempts = attempts + 1, last_error = NULL,
+                started_at = COALESCE(started_at, UTC_TIMESTAMP())
+            WHERE run_key = %s AND deal_ym = %s AND lawd_cd = %s
+            """,
+            (MOLIT_TASK_RUNNING, run_key, deal_ym, lawd_cd),
+        )
+
+    def record_page(
+        self,
+        run_key: str,
+        deal_ym: str,
+        lawd_cd: str,
+        *,
+        next_page_no: int,
+        fetched_rows: int,
+        db_affected: int,
+    ) -> None:
+        self._execute(
+            f"""
+            UPDATE {self.TABLE_NAME}
+            SET next_page_no = %s,
+                api_requests = api_requests + 1,
+                fetched_rows = fetched_rows + %s,
+                db_affected = db_affected + %s
+            WHERE run_key = %s AND deal_ym = %s AND lawd_cd = %s
+            """,
+            (next_page_no, fetched_rows, db_affected, run_key, deal_ym, lawd_cd),
+        )
+
+    def mark_done(self, run_key: str, deal_ym: str, lawd_cd: str, *, empty_page_requests: int = 0) -> None:
+        self._execute(
+            f"""
+            UPDATE {self.TABLE_NAME}
+            SET status = %s, api_requests = api_requests + %s, finished_at = UTC_TIMESTAMP()
+            WHERE run_key = %s AND deal_ym = %s AND lawd_cd = %s
+            """,
+            (MOLIT_TASK_DONE, empty_page_requests, run_key, deal_ym, lawd_cd),
+        )
+
+    def mark_failed(self, run_key: str, deal_ym: str, lawd_cd: str, *, error: str) -> None:
+        self._execute(
+            f"""
+            UPDATE {self.TABLE_NAME}
+            SET status = %s, last_error = %s
+            WHERE run_key = %s AND deal_ym = %s AND lawd_cd = %s
+            """,
+            (MOLIT_TASK_FAILED, str(error)[:2000], run_key, deal_ym, lawd_cd),
+        )
+
+    def prune_finished_runs(self, *, keep_run_key: str, retention_days: int) -> int:
+        """
+        모든 태스크가 done/failed이고 마지막 갱신이 retention_days보다 오래된 런의 행을 삭제한다.
+        pending/running 태스크가 남은 런(중단된 백필)과 현재 런은 재개할 수 있도록 남긴다.
+        """
+        self.ensure_table()
+        with self._db_connection_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                DELETE t FROM {self.TABLE_NAME} t
+                JOIN (
+                    SELECT run_key
+                    FROM {self.TABLE_NAME}
+                    GROUP BY run_key
+                    HAVING MAX(updated_at) < NOW() - INTERVAL %s DAY
+                       AND SUM(status NOT IN (%s, %s)) = 0
+                ) finished_runs ON finished_runs.run_key = t.run_key
+                WHERE t.run_key <> %s
+                """,
+                (int(retention_days), MOLIT_TASK_DONE, MOLIT_TASK_FAILED, keep_run_key),
+            )
+            return int(cursor.rowcount or 0)
+
+    def _execute(self, query: str, params: Tuple[Any, ...]) -> None:
+        with self._db_connection_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+
+
 def _to_int(value: Any) -> Optional[int]:
     if value is None:
         return None
@@ -164,8 +392,16 @@ def _molit_manwon_to_krw(value: Optional[int]) -> Optional[int]:
 class KRRealEstateCollector:
     """KR real-estate ingestion with canonical schema."""
 
-    def __init__(self, db_connection_factory=None):
+    def __init__(
+        self,
+        db_connection_factory=None,
+        checkpoint_store: Optional[MolitTaskCheckpointStore] = None,
+        summary_aggregator: Optional[KRRealEstateMonthlySummaryAggregator] = None,
+    ):
         self._db_connection_factory = db_connection_factory or get_db_connection
+        self._checkpoint_store = checkpoint_store or MolitTaskCheckpointStore(self._db_connection_factory)
+        self._summary_aggregator = summary_aggregator or KRRealEstateMonthlySummaryAggregator(self._db_connection_factory)
+        self._transactions_table_ready = False
 
     def _get_db_connection(self):
         return self._db_connection_factory()
@@ -384,6 +620,9 @@ class KRRealEstateCollector:
         return normalized
 
     def ensure_table(self):
+        # 병렬 수집 시 페이지마다 DDL을 반복하지 않도록 인스턴스당 1회만 확인한다.
+        if self._transactions_table_ready:
+            return
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -415,6 +654,28 @@ class KRRealEstateCollector:
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
                 """
             )
+            self._check_transaction_columns(cursor)
+        self._transactions_table_ready = True
+
+    @staticmethod
+    def _check_transaction_columns(cursor) -> bool:
+        """generated column 마이그레이션 적용 여부 확인 (DDL은 실행하지 않는다)"""
+        cursor.execute(
+            """
+            SELECT COLUMN_NAME
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'kr_real_estate_transactions'
+            """
+        )
+        existing_columns = {str(row.get("COLUMN_NAME") or "").lower() for row in (cursor.fetchall() or [])}
+        missing = [column for column, _ in TRANSACTION_GENERATED_COLUMNS if column not in existing_columns]
+        if missing:
+            logger.warning(
+                "kr_real_estate_transactions generated column 미적용(%s): "
+                "scripts/apply_migration_20261016.py 실행 필요 (조회 API는 JSON 추출로 대체)",
+                ", ".join(missing),
+            )
+        return not missing
 
     def save_transactions(self, records: List[Dict[str, Any]]) -> int:
         if not records:
@@ -450,11 +711,14 @@ class KRRealEstateCollector:
             ON DUPLICATE KEY UPDATE {updates}
         """
         payload = [tuple(record.get(column) for column in columns) for record in records]
+        dirty_cells = cells_from_records(records)
 
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.executemany(query, payload)
             affected = int(cursor.rowcount or 0)
+            # 같은 커밋으로 월×지역 요약의 dirty 셀을 남긴다. (증분 집계 대상)
+            self._summary_aggregator.mark_dirty_cells(dirty_cells, cursor=cursor)
         return affected
 
     def ingest_transactions(
@@ -525,6 +789,108 @@ class KRRealEstateCollector:
             items.append(row)
         return items
 
+    @staticmethod
+    def build_molit_run_key(
+        *,
+        start_ym: str,
+        end_ym: str,
+        lawd_codes: List[str],
+        num_of_rows: int,
+        as_of_date: date,
+    ) -> str:
+        """
+        체크포인트 run_key 기본값.
+        같은 날 같은 범위를 다시 돌리면 이어받고, 다음 날에는 지연 신고분을 위해 새로 수집한다.
+        """
+        digest = hashlib.sha1(",".join(lawd_codes).encode("utf-8")).hexdigest()[:12]
+        return f"molit_apt:{start_ym}-{end_ym}:{digest}:{num_of_rows}:{as_of_date.isoformat()}"
+
+    def _collect_molit_task(
+        self,
+        *,
+        run_key: str,
+        deal_ym: str,
+        lawd_cd: str,
+        start_page_no: int,
+        num_of_rows: int,
+        max_pages: int,
+        as_of_date: date,
+        rate_limiter: MolitRequestRateLimiter,
+    ) -> Dict[str, Any]:
+        """(월, LAWD_CD) 태스크 하나를 start_page_no부터 수집하고 페이지마다 체크포인트를 남긴다."""
+        store = self._checkpoint_store
+        result = {
+            "deal_ym": deal_ym,
+            "lawd_cd": lawd_cd,
+            "start_page_no": start_page_no,
+            "api_requests": 0,
+            "fetched_rows": 0,
+            "normalized_rows": 0,
+            "skipped_rows": 0,
+            "db_affected": 0,
+            "failed": False,
+        }
+        store.mark_running(run_key, deal_ym, lawd_cd)
+
+        page_no = start_page_no
+        empty_page_requests = 0
+        while page_no <= max_pages:
+            rate_limiter.acquire()
+            try:
+                rows = self.fetch_molit_trade_rows(
+                    lawd_cd=lawd_cd,
+                    deal_ym=deal_ym,
+                    num_of_rows=num_of_rows,
+                    page_no=page_no,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "MOLIT 수집 실패: lawd_cd=%s deal_ym=%s page=%s err=%s",
+                    lawd_cd,
+                    deal_ym,
+                    page_no,
+                    exc,
+                )
+                store.mark_failed(run_key, deal_ym, lawd_cd, error=f"page={page_no}: {exc}")
+                result["failed"] = True
+                return result
+
+            result["api_requests"] += 1
+            if not rows:
+                empty_page_requests += 1
+                break
+
+            for row in rows:
+                row.setdefault("LAWD_CD", lawd_cd)
+                row.setdefault("DEAL_YMD", deal_ym)
+
+            ingest_result = self.ingest_transactions(
+                rows,
+                source="MOLIT",
+                as_of_date=as_of_date,
+            )
+            affected = int(ingest_result.get("db_affected", 0))
+            result["fetched_rows"] += len(rows)
+            result["normalized_rows"] += int(ingest_result.get("normalized_rows", 0))
+            result["skipped_rows"] += int(ingest_result.get("skipped_rows", 0))
+            result["db_affected"] += affected
+            # 적재가 끝난 페이지까지만 전진시킨다. (중단 시 다음 페이지부터 재개)
+            store.record_page(
+                run_key,
+                deal_ym,
+                lawd_cd,
+                next_page_no=page_no + 1,
+                fetched_rows=len(rows),
+                db_affected=affected,
+            )
+
+            if len(rows) < num_of_rows:
+                break
+            page_no += 1
+
+        store.mark_done(run_key, deal_ym, lawd_cd, empty_page_requests=empty_page_requests)
+        return result
+
     def collect_molit_apartment_trades(
         self,
         *,
@@ -537,6 +903,10 @@ class KRRealEstateCollector:
         as_of_date: Optional[date] = None,
         progress_file: Optional[str] = None,
         progress_log_interval: int = 100,
+        max_workers: Optional[int] = None,
+        requests_per_sec: Optional[float] = None,
+        run_key: Optional[str] = None,
+        resume: bool = True,
     ) -> Dict[str, Any]:
         """
         월/지역 단위로 MOLIT 아파트 실거래를 수집/적재합니다.
@@ -545,6 +915,13 @@ class KRRealEstateCollector:
         - 서울 전 지역
         - 경기 전 지역
         - 지방 주요 도시
+
+        (월, LAWD_CD) 격자를 태스크로 나눠 bounded worker pool에서 병렬 수집하고,
+        공용 rate limiter로 전체 호출 속도를 제한합니다.
+        태스크 상태/다음 페이지는 kr_real_estate_collection_tasks 테이블에 기록되며,
+        같은 run_key로 다시 실행하면 완료된 태스크는 건너뛰고 중단된 페이지부터 재개합니다.
+        모든 태스크가 끝난 런의 체크포인트 행은 MOLIT_TASK_RETENTION_DAYS(기본 7일)가 지나면 정리합니다.
+        progress_file은 사람이 보는 진행 현황 스냅샷으로만 사용합니다.
         """
         if num_of_rows <= 0:
             raise ValueError("num_of_rows must be > 0")
@@ -558,18 +935,45 @@ class KRRealEstateCollector:
         target_months = self.iter_deal_months(start_ym, end_ym)
         run_as_of_date = as_of_date or date.today()
         started_at = datetime.utcnow()
-        total_pairs = len(target_months) * len(target_lawd_codes)
+        pairs = [(deal_ym, lawd_cd) for deal_ym in target_months for lawd_cd in target_lawd_codes]
+        total_pairs = len(pairs)
+
+        resolved_workers = max(
+            int(max_workers or env_int("MOLIT_COLLECT_MAX_WORKERS", DEFAULT_MOLIT_COLLECT_MAX_WORKERS)),
+            1,
+        )
+        resolved_rate = (
+            float(requests_per_sec)
+            if requests_per_sec is not None
+            else env_float("MOLIT_API_REQUESTS_PER_SEC", DEFAULT_MOLIT_REQUEST_RATE_PER_SEC)
+        )
+        resolved_run_key = run_key or self.build_molit_run_key(
+            start_ym=start_ym,
+            end_ym=end_ym,
+            lawd_codes=target_lawd_codes,
+            num_of_rows=num_of_rows,
+            as_of_date=run_as_of_date,
+        )
+
+        task_states = self._checkpoint_store.load_tasks(resolved_run_key, pairs, reset=not resume)
+        resumed_done = [pair for pair in pairs if (task_states.get(pair) or {}).get("status") == MOLIT_TASK_DONE]
+        todo = [pair for pair in pairs if (task_states.get(pair) or {}).get("status") != MOLIT_TASK_DONE]
 
         summary: Dict[str, Any] = {
             "scope": scope or os.getenv("MOLIT_REGION_SCOPE") or DEFAULT_MOLIT_REGION_SCOPE,
             "start_ym": start_ym,
             "end_ym": end_ym,
+            "run_key": resolved_run_key,
+            "max_workers": resolved_workers,
+            "requests_per_sec": resolved_rate,
             "target_month_count": len(target_months),
             "target_region_count": len(target_lawd_codes),
             "target_lawd_codes": target_lawd_codes,
             "total_pairs": total_pairs,
-            "completed_pairs": 0,
-            "remaining_pairs": total_pairs,
+            "resumed_completed_pairs": len(resumed_done),
+            "completed_pairs": len(resumed_done),
+            "remaining_pairs": len(todo),
+            "failed_pairs": 0,
             "progress_pct": 0.0,
             "api_requests": 0,
             "fetched_rows": 0,
@@ -580,6 +984,13 @@ class KRRealEstateCollector:
             "started_at": started_at.isoformat() + "Z",
             "updated_at": started_at.isoformat() + "Z",
         }
+        if resumed_done:
+            logger.info(
+                "MOLIT 체크포인트 재개: run_key=%s, 완료 %s/%s 태스크 건너뜀",
+                resolved_run_key,
+                len(resumed_done),
+                total_pairs,
+            )
 
         def emit_progress(last_pair: Optional[Dict[str, Any]], *, force: bool = False, status: str = "running"):
             completed = int(summary["completed_pairs"])
@@ -593,17 +1004,18 @@ class KRRealEstateCollector:
             should_log = force
             if not should_log and progress_log_interval > 0:
                 should_log = (completed == 1) or (completed == total_pairs) or (completed % progress_log_interval == 0)
-            if should_log:
-                logger.info(
-                    "MOLIT 적재 진행률: %s/%s (%.2f%%), fetched_rows=%s, db_affected=%s, failed_requests=%s, current=%s",
-                    completed,
-                    total_pairs,
-                    summary["progress_pct"],
-                    summary["fetched_rows"],
-                    summary["db_affected"],
-                    summary["failed_requests"],
-                    last_pair,
-                )
+            if not should_log:
+                return
+            logger.info(
+                "MOLIT 적재 진행률: %s/%s (%.2f%%), fetched_rows=%s, db_affected=%s, failed_requests=%s, current=%s",
+                completed,
+                total_pairs,
+                summary["progress_pct"],
+                summary["fetched_rows"],
+                summary["db_affected"],
+                summary["failed_requests"],
+                last_pair,
+            )
 
             if progress_file:
                 payload = {
@@ -616,69 +1028,66 @@ class KRRealEstateCollector:
                 except Exception as exc:
                     logger.warning("progress file 기록 실패(%s): %s", progress_file, exc)
 
-        for deal_ym in target_months:
-            for lawd_cd in target_lawd_codes:
-                page_no = 1
-                pair_fetched_rows = 0
-                pair_api_requests = 0
-                pair_failed = False
-                while page_no <= max_pages:
-                    try:
-                        rows = self.fetch_molit_trade_rows(
-                            lawd_cd=lawd_cd,
-                            deal_ym=deal_ym,
-                            num_of_rows=num_of_rows,
-                            page_no=page_no,
-                        )
-                    except Exception as exc:
-                        summary["failed_requests"] += 1
-                        logger.warning(
-                            "MOLIT 수집 실패: lawd_cd=%s deal_ym=%s page=%s err=%s",
-                            lawd_cd,
-                            deal_ym,
-                            page_no,
-                            exc,
-                        )
-                        pair_failed = True
-                        break
-
-                    summary["api_requests"] += 1
-                    pair_api_requests += 1
-                    if not rows:
-                        break
-
-                    for row in rows:
-                        row.setdefault("LAWD_CD", lawd_cd)
-                        row.setdefault("DEAL_YMD", deal_ym)
-
-                    ingest_result = self.ingest_transactions(
-                        rows,
-                        source="MOLIT",
-                        as_of_date=run_as_of_date,
-                    )
-                    summary["fetched_rows"] += len(rows)
-                    pair_fetched_rows += len(rows)
-                    summary["normalized_rows"] += int(ingest_result.get("normalized_rows", 0))
-                    summary["skipped_rows"] += int(ingest_result.get("skipped_rows", 0))
-                    summary["db_affected"] += int(ingest_result.get("db_affected", 0))
-
-                    if len(rows) < num_of_rows:
-                        break
-                    page_no += 1
-
+        rate_limiter = MolitRequestRateLimiter(resolved_rate)
+        with ThreadPoolExecutor(max_workers=resolved_workers, thread_name_prefix="molit-collect") as pool:
+            futures = [
+                pool.submit(
+                    self._collect_molit_task,
+                    run_key=resolved_run_key,
+                    deal_ym=deal_ym,
+                    lawd_cd=lawd_cd,
+                    start_page_no=max(int((task_states.get((deal_ym, lawd_cd)) or {}).get("next_page_no") or 1), 1),
+                    num_of_rows=num_of_rows,
+                    max_pages=max_pages,
+                    as_of_date=run_as_of_date,
+                    rate_limiter=rate_limiter,
+                )
+                for deal_ym, lawd_cd in todo
+            ]
+            # 집계/진행 로그는 호출 스레드에서만 갱신한다.
+            for future in as_completed(futures):
+                try:
+                    task_result = future.result()
+                except Exception:
+                    # DB 장애 등은 런 전체를 중단하고, 남은 태스크는 다음 실행에서 체크포인트로 재개한다.
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                summary["api_requests"] += task_result["api_requests"]
+                summary["fetched_rows"] += task_result["fetched_rows"]
+                summary["normalized_rows"] += task_result["normalized_rows"]
+                summary["skipped_rows"] += task_result["skipped_rows"]
+                summary["db_affected"] += task_result["db_affected"]
+                if task_result["failed"]:
+                    summary["failed_requests"] += 1
+                    summary["failed_pairs"] += 1
                 summary["completed_pairs"] += 1
                 emit_progress(
                     {
-                        "deal_ym": deal_ym,
-                        "lawd_cd": lawd_cd,
-                        "pair_api_requests": pair_api_requests,
-                        "pair_fetched_rows": pair_fetched_rows,
-                        "pair_failed": pair_failed,
+                        "deal_ym": task_result["deal_ym"],
+                        "lawd_cd": task_result["lawd_cd"],
+                        "pair_start_page_no": task_result["start_page_no"],
+                        "pair_api_requests": task_result["api_requests"],
+                        "pair_fetched_rows": task_result["fetched_rows"],
+                        "pair_failed": task_result["failed"],
                     },
                     force=False,
                     status="running",
                 )
 
+        retention_days = max(
+            env_int("MOLIT_TASK_RETENTION_DAYS", DEFAULT_MOLIT_TASK_RETENTION_DAYS),
+            1,
+        )
+        try:
+            summary["pruned_checkpoint_rows"] = self._checkpoint_store.prune_finished_runs(
+                keep_run_key=resolved_run_key,
+                retention_days=retention_days,
+            )
+        except Exception as exc:
+            logger.warning("MOLIT 체크포인트 정리 실패(run_key=%s): %s", resolved_run_key, exc)
+            summary["pruned_checkpoint_rows"] = 0
+
         duration_seconds = int((datetime.utcnow() - started_at).total_seconds())
         summary["duration_seconds"] = duration_seconds
         emit_progress(last_pair=None, force=True, status="completed")
@@ -689,33 +1098,9 @@ class KRRealEstateCollector:
         """
         월×지역(시군구 5자리) 집계 테이블 생성.
         서울 구별/경기 시군구별 조회를 빠르게 하기 위한 서빙 테이블이다.
+        (분포 통계 컬럼 마이그레이션과 dirty-cell 로그 테이블 포함)
         """
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS kr_real_estate_monthly_summary (
-                    id BIGINT PRIMARY KEY AUTO_INCREMENT,
-                    stat_ym CHAR(6) NOT NULL,
-                    lawd_cd CHAR(5) NOT NULL,
-                    country_code VARCHAR(8) NOT NULL DEFAULT 'KR',
-                    property_type VARCHAR(32) NOT NULL,
-                    transaction_type VARCHAR(32) NOT NULL,
-                    tx_count INT NOT NULL,
-                    avg_price DECIMAL(16, 2) NULL,
-                    avg_price_per_m2 DECIMAL(18, 4) NULL,
-                    avg_area_m2 DECIMAL(14, 4) NULL,
-                    min_price BIGINT NULL,
-                    max_price BIGINT NULL,
-                    total_price BIGINT NULL,
-                    as_of_date DATE NOT NULL,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    UNIQUE KEY uniq_month_region_type (stat_ym, lawd_cd, property_type, transaction_type),
-                    INDEX idx_lawd_month (lawd_cd, stat_ym),
-                    INDEX idx_month_type (stat_ym, property_type, transaction_type)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """
-            )
+        self._summary_aggregator.ensure_tables()
 
     def aggregate_monthly_region_summary(
         self,
@@ -725,6 +1110,7 @@ class KRRealEstateCollector:
         property_type: str = "apartment",
         transaction_type: str = "sale",
         as_of_date: Optional[date] = None,
+        rebuild: bool = False,
     ) -> Dict[str, Any]:
         """
         원천 실거래 row를 월×지역 요약으로 집계하여 upsert.
@@ -733,6 +1119,9 @@ class KRRealEstateCollector:
         - month: contract_date -> YYYYMM
         - region: LEFT(region_code, 5) (LAWD_CD)
         - type: property_type + transaction_type
+
+        save_transactions가 남긴 dirty 셀만 다시 계산한다.
+        rebuild=True면 기간 내 모든 셀을 dirty로 표시한 뒤 계산한다. (초기 백필/분포 통계 채우기)
         """
         run_as_of = as_of_date or date.today()
         normalized_property_type = self.normalize_property_type(property_type)
@@ -745,70 +1134,23 @@ class KRRealEstateCollector:
             end_month_exclusive = end_month.replace(month=end_month.month + 1)
         self.ensure_monthly_summary_table()
 
-        query = """
-            INSERT INTO kr_real_estate_monthly_summary (
-                stat_ym,
-                lawd_cd,
-                country_code,
-                property_type,
-                transaction_type,
-                tx_count,
-                avg_price,
-                avg_price_per_m2,
-                avg_area_m2,
-                min_price,
-                max_price,
-                total_price,
-                as_of_date
+        if rebuild:
+            self._summary_aggregator.mark_range_dirty(
+                start_month=start_month,
+                end_month_exclusive=end_month_exclusive,
+                property_type=normalized_property_type,
+                transaction_type=normalized_transaction_type,
             )
-            SELECT
-                DATE_FORMAT(contract_date, '%%Y%%m') AS stat_ym,
-                LEFT(region_code, 5) AS lawd_cd,
-                'KR' AS country_code,
-                property_type,
-                transaction_type,
-                COUNT(*) AS tx_count,
-                AVG(price) AS avg_price,
-                AVG(CASE WHEN area_m2 IS NOT NULL AND area_m2 > 0 THEN (price / area_m2) END) AS avg_price_per_m2,
-                AVG(area_m2) AS avg_area_m2,
-                MIN(price) AS min_price,
-                MAX(price) AS max_price,
-                SUM(price) AS total_price,
-                %s AS as_of_date
-            FROM kr_real_estate_transactions
-            WHERE contract_date IS NOT NULL
-              AND contract_date >= %s
-              AND contract_date < %s
-              AND property_type = %s
-              AND transaction_type = %s
-              AND price IS NOT NULL
-            GROUP BY DATE_FORMAT(contract_date, '%%Y%%m'), LEFT(region_code, 5), property_type, transaction_type
-            ON DUPLICATE KEY UPDATE
-                tx_count = VALUES(tx_count),
-                avg_price = VALUES(avg_price),
-                avg_price_per_m2 = VALUES(avg_price_per_m2),
-                avg_area_m2 = VALUES(avg_area_m2),
-                min_price = VALUES(min_price),
-                max_price = VALUES(max_price),
-                total_price = VALUES(total_price),
-                as_of_date = VALUES(as_of_date),
-                updated_at = CURRENT_TIMESTAMP
-        """
+        refresh_result = self._summary_aggregator.refresh_dirty_cells(
+            start_ym=start_ym,
+            end_ym=end_ym,
+            property_type=normalized_property_type,
+            transaction_type=normalized_transaction_type,
+            as_of_date=run_as_of,
+        )
 
         with self._get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                query,
-                (
-                    run_as_of,
-                    start_month,
-                    end_month_exclusive,
-                    normalized_property_type,
-                    normalized_transaction_type,
-                ),
-            )
-            affected = int(cursor.rowcount or 0)
-
             cursor.execute(
                 """
                 SELECT
@@ -830,7 +1172,10 @@ class KRRealEstateCollector:
             "end_ym": end_ym,
             "property_type": normalized_property_type,
             "transaction_type": normalized_transaction_type,
-            "db_affected": affected,
+            "rebuild": rebuild,
+            "refreshed_cells": refresh_result["refreshed_cells"],
+            "removed_cells": refresh_result["removed_cells"],
+            "db_affected": refresh_result["db_affected"],
             "summary_rows": int(stats.get("summary_rows", 0)),
             "month_count": int(stats.get("month_count", 0)),
             "region_count": int(stats.get("region_count", 0)),
@@ -0,0 +1,469 @@
+"""
+KR real-estate monthly summary (incremental).
+
+- 적재 시점에 (월, LAWD_CD, property_type, transaction_type) 셀을 dirty-cell 로그에 기록한다.
+- 집계는 dirty 셀만 원천 row로 다시 계산해 kr_real_estate_monthly_summary에 upsert한다.
+- 셀 단위로 Python에서 계산하므로 중앙값/사분위(p25/p75) 같은 분포 통계도 함께 저장한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from service.database.db import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_TABLE = "kr_real_estate_monthly_summary"
+DIRTY_CELL_TABLE = "kr_real_estate_summary_dirty_cells"
+DEFAULT_DIRTY_BATCH_SIZE = 500
+
+# 기존 설치본에 추가되는 분포 통계 컬럼 (scripts/apply_migration_20261016_summary.py)
+DISTRIBUTION_COLUMNS = (
+    ("median_price", "BIGINT NULL"),
+    ("p25_price_per_m2", "DECIMAL(18, 4) NULL"),
+    ("median_price_per_m2", "DECIMAL(18, 4) NULL"),
+    ("p75_price_per_m2", "DECIMAL(18, 4) NULL"),
+    ("area_tx_count", "INT NULL"),
+)
+
+Cell = Tuple[str, str, str, str]  # (stat_ym, lawd_cd, property_type, transaction_type)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> Optional[float]:
+    """선형 보간 백분위 (numpy.percentile 기본 method="linear"와 동일)"""
+    if not sorted_values:
+        return None
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    rank = (len(sorted_values) - 1) * q
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(sorted_values[int(rank)])
+    weight = rank - lower
+    return float(sorted_values[lower]) * (1.0 - weight) + float(sorted_values[upper]) * weight
+
+
+def compute_cell_statistics(rows: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """셀 하나의 원천 row(price, area_m2)로 요약 통계를 계산한다. 거래가 없으면 None."""
+    prices: List[int] = []
+    areas: List[float] = []
+    prices_per_m2: List[float] = []
+    for row in rows:
+        price = row.get("price")
+        if price is None:
+            continue
+        price = int(price)
+        prices.append(price)
+        area = row.get("area_m2")
+        if area is None:
+            continue
+        area = float(area)
+        areas.append(area)
+        if area > 0:
+            prices_per_m2.append(price / area)
+
+    if not prices:
+        return None
+
+    prices.sort()
+    prices_per_m2.sort()
+    total_price = sum(prices)
+    median_price = percentile(prices, 0.5)
+    return {
+        "tx_count": len(prices),
+        "avg_price": total_price / len(prices),
+        "avg_price_per_m2": (sum(prices_per_m2) / len(prices_per_m2)) if prices_per_m2 else None,
+        "avg_area_m2": (sum(areas) / len(areas)) if areas else None,
+        "min_price": prices[0],
+        "max_price": prices[-1],
+        "total_price": total_price,
+        "median_price": int(round(median_price)) if median_price is not None else None,
+        "p25_price_per_m2": percentile(prices_per_m2, 0.25),
+        "median_price_per_m2": percentile(prices_per_m2, 0.5),
+        "p75_price_per_m2": percentile(prices_per_m2, 0.75),
+        "area_tx_count": len(prices_per_m2),
+    }
+
+
+def cells_from_records(records: Iterable[Dict[str, Any]]) -> List[Cell]:
+    """정규화된 거래 record 목록에서 영향받는 요약 셀을 뽑는다."""
+    cells = set()
+    for record in records:
+        contract_date = record.get("contract_date")
+        region_code = str(record.get("region_code") or "")
+        if contract_date is None or len(region_code) < 5:
+            continue
+        if isinstance(contract_date, str):
+            contract_date = datetime.strptime(contract_date[:10], "%Y-%m-%d").date()
+        cells.add(
+            (
+                contract_date.strftime("%Y%m"),
+                region_code[:5],
+                str(record.get("property_type") or "unknown"),
+                str(record.get("transaction_type") or "unknown"),
+            )
+        )
+    return sorted(cells)
+
+
+def _month_bounds(stat_ym: str) -> Tuple[date, date]:
+    start = datetime.strptime(stat_ym, "%Y%m").date().replace(day=1)
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+    return start, start.replace(month=start.month + 1)
+
+
+class KRRealEstateMonthlySummaryAggregator:
+    """dirty-cell 로그 기반 월×지역 요약 증분 집계기"""
+
+    SUMMARY_COLUMNS = (
+        "tx_count",
+        "avg_price",
+        "avg_price_per_m2",
+        "avg_area_m2",
+        "min_price",
+        "max_price",
+        "total_price",
+        "median_price",
+        "p25_price_per_m2",
+        "median_price_per_m2",
+        "p75_price_per_m2",
+        "area_tx_count",
+    )
+
+    def __init__(self, db_connection_factory=None):
+        self._db_connection_factory = db_connection_factory or get_db_connection
+        self._tables_ready = False
+        self._transactions_lawd_cd_ready = False
+        self._summary_columns = self.SUMMARY_COLUMNS
+
+    def _get_db_connection(self):
+        return self._db_connection_factory()
+
+    def ensure_tables(self):
+        if self._tables_ready:
+            return
+        with self._get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {SUMMARY_TABLE} (
+                    id BIGINT PRIMARY KEY AUTO_INCREMENT,
+                    stat_ym CHAR(6) NOT NULL,
+                    lawd_cd CHAR(5) NOT NULL,
+                    country_code VARCHAR(8) NOT NULL DEFAULT 'KR',
+                    property_type VARCHAR(32) NOT NULL,
+                    transaction_type VARCHAR(32) NOT NULL,
+                    tx_count INT NOT NULL,
+                    avg_price DECIMAL(16, 2) NULL,
+                    avg_price_per_m2 DECIMAL(18, 4) NULL,
+                    avg_area_m2 DECIMAL(14, 4) NULL,
+                    min_price BIGINT NULL,
+                    max_price BIGINT NULL,
+                    total_price BIGINT NULL,
+                    median_price BIGINT NULL,
+                    p25_price_per_m2 DECIMAL(18, 4) NULL,
+                    median_price_per_m2 DECIMAL(18, 4) NULL,
+                    p75_price_per_m2 DECIMAL(18, 4) NULL,
+                    area_tx_count INT NULL,
+                    as_of_date DATE NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    UNIQUE KEY uniq_month_region_type (stat_ym, lawd_cd, property_type, transaction_type),
+                    INDEX idx_lawd_month (lawd_cd, stat_ym),
+                    INDEX idx_month_type (stat_ym, property_type, transaction_type)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                """
+            )
+            cursor.execute(
+                f"""
+                SELECT COLUMN_NAME
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+                """,
+                (SUMMARY_TABLE,),
+            )
+            existing = {str(row.get("COLUMN_NAME") or "").lower() for row in (cursor.fetchall() or [])}
+            missing = [column for column, _ in DISTRIBUTION_COLUMNS if column not in existing]
+            if missing:
+                logger.warning(
+                    "%s 분포 통계 컬럼 미적용(%s): scripts/apply_migration_20261016_summary.py 실행 필요 "
+                    "(적용 전까지 기존 컬럼만 집계)",
+                    SUMMARY_TABLE,
+                    ", ".join(missing),
+                )
+            self._summary_columns = tuple(column for column in self.SUMMARY_COLUMNS if column not in missing)
+
+            # version은 셀이 다시 더럽혀질 때마다 증가한다. 집계 중 들어온 신규 거래를 놓치지 않기 위해
+            # 처리 시점에 읽은 version과 같을 때만 로그에서 지운다.
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {DIRTY_CELL_TABLE} (
+                    stat_ym CHAR(6) NOT NULL,
+                    lawd_cd CHAR(5) NOT NULL,
+                    property_type VARCHAR(32) NOT NULL,
+                    transaction_type VARCHAR(32) NOT NULL,
+                    version BIGINT NOT NULL DEFAULT 1,
+                    marked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    PRIMARY KEY (stat_ym, lawd_cd, property_type, transaction_type),
+                    INDEX idx_type_month (property_type, transaction_type, stat_ym)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                """
+            )
+        self._tables_ready = True
+
+    def mark_dirty_cells(self, cells: Sequence[Cell], cursor: Any = None) -> int:
+        """셀을 dirty로 기록한다. cursor를 주면 호출자의 트랜잭션(거래 upsert와 같은 커밋)에 묶인다."""
+        if not cells:
+            return 0
+        self.ensure_tables()
+        query = f"""
+            INSERT INTO {DIRTY_CELL_TABLE} (stat_ym, lawd_cd, property_type, transaction_type)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE version = version + 1
+        """
+        payload = [tuple(cell) for cell in cells]
+        if cursor is not None:
+            cursor.executemany(query, payload)
+            return len(payload)
+        with self._get_db_connection() as conn:
+            conn.cursor().executemany(query, payload)
+        return len(payload)
+
+    def mark_range_dirty(
+        self,
+        *,
+        start_month: date,
+        end_month_exclusive: date,
+        property_type: str,
+        transaction_type: str,
+    ) -> int:
+        """기간 내 원천 거래가 있는 모든 셀을 dirty로 기록 (초기 백필/전체 재계산용)"""
+        self.ensure_tables()
+        with self._get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                INSERT INTO {DIRTY_CELL_TABLE} (stat_ym, lawd_cd, property_type, transaction_type)
+                SELECT DISTINCT DATE_FORMAT(contract_date, '%%Y%%m'), LEFT(region_code, 5), property_type, transaction_type
+                FROM kr_real_estate_transactions
+                WHERE contract_date >= %s
+                  AND contract_date < %s
+                  AND property_type = %s
+                  AND transaction_type = %s
+                ON DUPLICATE KEY UPDATE version = version + 1
+                """,
+                (start_month, end_month_exclusive, property_type, transaction_type),
+            )
+            # 원천 거래가 모두 사라진 셀도 요약에서 지울 수 있도록 기존 요약 셀도 포함한다.
+            cursor.execute(
+                f"""
+                INSERT INTO {DIRTY_CELL_TABLE} (stat_ym, lawd_cd, property_type, transaction_type)
+                SELECT stat_ym, lawd_cd, property_type, transaction_type
+                FROM {SUMMARY_TABLE}
+                WHERE stat_ym >= %s
+                  AND stat_ym < %s
+                  AND property_type = %s
+                  AND transaction_type = %s
+                ON DUPLICATE KEY UPDATE version = version + 1
+                """,
+                (
+                    start_month.strftime("%Y%m"),
+                    end_month_exclusive.strftime("%Y%m"),
+                    property_type,
+                    transaction_type,
+                ),
+            )
+            return int(cursor.rowcount or 0)
+
+    def _fetch_dirty_batch(
+        self,
+        cursor: Any,
+        *,
+        start_ym: str,
+        end_ym: str,
+        property_type: str,
+        transaction_type: str,
+        batch_size: int,
+        after: Tuple[str, str],
+    ) -> List[Dict[str, Any]]:
+        # (stat_ym, lawd_cd) keyset 페이지: 처리 중 다시 더럽혀진 셀은 이번 실행에서 재방문하지 않는다.
+        cursor.execute(
+            f"""
+            SELECT stat_ym, lawd_cd, property_type, transaction_type, version
+            FROM {DIRTY_CELL_TABLE}
+            WHERE property_type = %s
+              AND transaction_type = %s
+              AND stat_ym >= %s
+              AND stat_ym <= %s
+              AND (stat_ym, lawd_cd) > (%s, %s)
+            ORDER BY stat_ym, lawd_cd
+            LIMIT %s
+            """,
+            (property_type, transaction_type, start_ym, end_ym, after[0], after[1], batch_size),
+        )
+        return list(cursor.fetchall() or [])
+
+    def _transactions_have_lawd_cd(self, cursor: Any) -> bool:
+        """kr_real_estate_transactions.lawd_cd(generated column) 마이그레이션 적용 여부"""
+        if self._transactions_lawd_cd_ready:
+            return True
+        cursor.execute(
+            """
+            SELECT COUNT(*) AS column_count
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+              AND TABLE_NAME = 'kr_real_estate_transactions'
+              AND COLUMN_NAME = 'lawd_cd'
+            """
+        )
+        row = cursor.fetchone() or {}
+        self._transactions_lawd_cd_ready = int(row.get("column_count", 0) or 0) > 0
+        return self._transactions_lawd_cd_ready
+
+    def _fetch_cell_rows(self, cursor: Any, cell: Dict[str, Any], use_lawd_cd: bool = False) -> List[Dict[str, Any]]:
+        month_start, month_end = _month_bounds(str(cell["stat_ym"]))
+        if use_lawd_cd:
+            # idx_type_lawd_contract(property_type, transaction_type, lawd_cd, contract_date):
+            # 앞 세 컬럼 동등 조건 + contract_date 범위로 한 달치 셀만 인덱스 범위 스캔한다.
+            cursor.execute(
+                """
+                SELECT price, area_m2
+                FROM kr_real_estate_transactions
+                WHERE property_type = %s
+                  AND transaction_type = %s
+                  AND lawd_cd = %s
+                  AND contract_date >= %s
+                  AND contract_date < %s
+                  AND price IS NOT NULL
+                """,
+                (
+                    cell["property_type"],
+                    cell["transaction_type"],
+                    cell["lawd_cd"],
+                    month_start,
+                    month_end,
+                ),
+            )
+            return list(cursor.fetchall() or [])
+
+        # generated column 적용 전: LIKE 'xxxxx%'는 idx_region_contract(region_code, contract_date)의
+        # region_code 범위 스캔으로만 풀리고 contract_date로는 범위를 좁히지 못한다.
+        cursor.execute(
+            """
+            SELECT price, area_m2
+            FROM kr_real_estate_transactions
+            WHERE region_code LIKE %s
+              AND contract_date >= %s
+              AND contract_date < %s
+              AND property_type = %s
+              AND transaction_type = %s
+              AND price IS NOT NULL
+            """,
+            (
+                f"{cell['lawd_cd']}%",
+                month_start,
+                month_end,
+                cell["property_type"],
+                cell["transaction_type"],
+            ),
+        )
+        return list(cursor.fetchall() or [])
+
+    def refresh_dirty_cells(
+        self,
+        *,
+        start_ym: str,
+        end_ym: str,
+        property_type: str,
+        transaction_type: str,
+        as_of_date: Optional[date] = None,
+        batch_size: int = DEFAULT_DIRTY_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """기간/유형에 해당하는 dirty 셀만 원천 row로 재계산해 요약 테이블에 반영한다."""
+        self.ensure_tables()
+        run_as_of = as_of_date or date.today()
+        columns = list(self._summary_columns)
+        upsert_query = f"""
+            INSERT INTO {SUMMARY_TABLE} (
+                stat_ym, lawd_cd, country_code, property_type, transaction_type,
+                {", ".join(columns)}, as_of_date
+            )
+            VALUES (%s, %s, 'KR', %s, %s, {", ".join(["%s"] * len(columns))}, %s)
+            ON DUPLICATE KEY UPDATE
+                {", ".join(f"{column} = VALUES({column})" for column in columns)},
+                as_of_date = VALUES(as_of_date),
+                updated_at = CURRENT_TIMESTAMP
+        """
+        delete_summary_query = f"""
+            DELETE FROM {SUMMARY_TABLE}
+            WHERE stat_ym = %s AND lawd_cd = %s AND property_type = %s AND transaction_type = %s
+        """
+        clear_dirty_query = f"""
+            DELETE FROM {DIRTY_CELL_TABLE}
+            WHERE stat_ym = %s AND lawd_cd = %s AND property_type = %s AND transaction_type = %s
+              AND version = %s
+        """
+
+        refreshed = 0
+        removed = 0
+        db_affected = 0
+        after = ("", "")
+        while True:
+            with self._get_db_connection() as conn:
+                cursor = conn.cursor()
+                batch = self._fetch_dirty_batch(
+                    cursor,
+                    start_ym=start_ym,
+                    end_ym=end_ym,
+                    property_type=property_type,
+                    transaction_type=transaction_type,
+                    batch_size=batch_size,
+                    after=after,
+                )
+                if not batch:
+                    break
+                after = (batch[-1]["stat_ym"], batch[-1]["lawd_cd"])
+                use_lawd_cd = self._transactions_have_lawd_cd(cursor)
+
+                for cell in batch:
+                    key = (cell["stat_ym"], cell["lawd_cd"], cell["property_type"], cell["transaction_type"])
+                    stats = compute_cell_statistics(self._fetch_cell_rows(cursor, cell, use_lawd_cd))
+                    if stats is None:
+                        cursor.execute(delete_summary_query, key)
+                        removed += 1
+                    else:
+                        cursor.execute(
+                            upsert_query,
+                            (
+                                cell["stat_ym"],
+                                cell["lawd_cd"],
+                                cell["property_type"],
+                                cell["transaction_type"],
+                                *[stats[column] for column in columns],
+                                run_as_of,
+                            ),
+                        )
+                        refreshed += 1
+                    db_affected += int(cursor.rowcount or 0)
+                    cursor.execute(clear_dirty_query, (*key, cell["version"]))
+
+        if refreshed or removed:
+            logger.info(
+                "KR 부동산 요약 증분 집계: refreshed=%s removed=%s (%s~%s %s/%s)",
+                refreshed,
+                removed,
+                start_ym,
+                end_ym,
+                property_type,
+                transaction_type,
+            )
+        return {
+            "refreshed_cells": refreshed,
+            "removed_cells": removed,
+            "db_affected": db_affected,
+        }
@@ -0,0 +1,320 @@
+"""
+스케줄러 작업 실행기 (고정 크기 워커 풀)
+
+- schedule 라이브러리가 트리거한 작업을 우선순위 큐에 넣고, SCHEDULER_JOB_WORKERS개(기본 4)의 워커 스레드가 꺼내 실행한다.
+- 작업별 동시 실행 한도(max_concurrency)와 실행/대기 중이면 건너뛰는 잠금(skip_if_running)을 둔다.
+- 우선순위 클래스: 트레이딩 > 수집 > 그래프 > 백필/배치 (숫자가 작을수록 먼저 실행)
+- 워커 중 SCHEDULER_TRADING_RESERVED_WORKERS개(기본 1)는 트레이딩 클래스 전용으로 남겨 둔다.
+  우선순위는 큐 순서만 바꾸므로, 예약이 없으면 장시간 배치가 워커를 모두 점유했을 때 트레이딩 작업이 그 뒤에서 기다린다.
+- depends_on은 "선행 작업과 겹쳐 실행하지 않는다"는 순서 제약이다. 선행 작업이 대기/실행 중인 동안에는 후행 작업을 꺼내지 않지만,
+  선행 작업이 이번 주기에 실행됐는지·성공했는지는 보장하지 않는다 (선행 작업이 실패했거나 아직 트리거되지 않았어도 후행 작업은 실행된다).
+- 큐 대기 시간과 실행 시간은 report_fn(수집 실행 리포트)으로 기록한다.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from service.utils.env import env_int
+
+logger = logging.getLogger(__name__)
+
+JOB_PRIORITY_TRADING = 0
+JOB_PRIORITY_COLLECTION = 10
+JOB_PRIORITY_GRAPH = 20
+JOB_PRIORITY_BACKFILL = 30
+
+DEFAULT_SCHEDULER_JOB_WORKERS = 4
+DEFAULT_SCHEDULER_TRADING_RESERVED_WORKERS = 1
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """
+    스케줄러 작업 실행 정책
+
+    depends_on: 대기/실행 중이면 이 작업을 꺼내지 않을 선행 작업 이름 (성공 여부는 보지 않는 겹침 방지 제약)
+    """
+    name: str
+    priority: int = JOB_PRIORITY_COLLECTION
+    max_concurrency: int = 1
+    skip_if_running: bool = True
+    depends_on: Tuple[str, ...] = ()
+    report_job_code: Optional[str] = None
+    record_report: bool = True
+
+    @property
+    def job_code(self) -> str:
+        return (self.report_job_code or f"SCHEDULER_{self.name.upper()}")[:64]
+
+
+@dataclass(order=True)
+class _QueuedRun:
+    priority: int
+    seq: int
+    spec: JobSpec = field(compare=False)
+    func: Callable[..., Any] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False, default=())
+    kwargs: Dict[str, Any] = field(compare=False, default_factory=dict)
+    enqueued_at: float = field(compare=False, default=0.0)
+
+
+class SchedulerJobRunner:
+    """고정 워커 풀 기반 작업 실행기"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        trading_reserved_workers: Optional[int] = None,
+        report_fn: Optional[Callable[..., None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_workers is None:
+            max_workers = env_int("SCHEDULER_JOB_WORKERS", DEFAULT_SCHEDULER_JOB_WORKERS)
+        self.max_workers = max(int(max_workers), 1)
+        if trading_reserved_workers is None:
+            trading_reserved_workers = env_int(
+                "SCHEDULER_TRADING_RESERVED_WORKERS",
+                DEFAULT_SCHEDULER_TRADING_RESERVED_WORKERS,
+            )
+        # 워커가 하나뿐이면 예약하지 않는다 (비트레이딩 작업이 영원히 못 도는 것을 방지)
+        self.trading_reserved_workers = min(max(int(trading_reserved_workers), 0), self.max_workers - 1)
+        self.report_fn = report_fn
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queue: List[_QueuedRun] = []
+        self._seq = itertools.count()
+        self._specs: Dict[str, JobSpec] = {}
+        self._running: Dict[str, int] = {}
+        self._running_general = 0
+        self._queued: Dict[str, int] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._workers: List[threading.Thread] = []
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+    def register(self, spec: JobSpec) -> JobSpec:
+        """작업 정책 등록 (같은 이름이면 교체). 순환 의존성은 ValueError."""
+        with self._cond:
+            specs = dict(self._specs)
+            specs[spec.name] = spec
+            self._check_acyclic(specs, spec.name)
+            self._specs = specs
+        return spec
+
+    @staticmethod
+    def _check_acyclic(specs: Dict[str, JobSpec], start: str) -> None:
+        stack = [(start, (start,))]
+        while stack:
+            name, path = stack.pop()
+            for dep in specs.get(name, JobSpec(name)).depends_on:
+                if dep == start:
+                    raise ValueError(f"순환 작업 의존성: {' -> '.join(path + (dep,))}")
+                if dep not in path:
+                    stack.append((dep, path + (dep,)))
+
+    def spec_for(self, name: str) -> JobSpec:
+        with self._cond:
+            return self._specs.get(name) or JobSpec(name)
+
+    # ------------------------------------------------------------------
+    # 제출 / 실행
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        with self._cond:
+            if self._workers:
+                return
+            self._stopping = False
+            for idx in range(self.max_workers):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"SchedulerJobWorker-{idx + 1}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+        logger.info(
+            "스케줄러 작업 워커 풀 시작: workers=%s, trading_reserved=%s",
+            self.max_workers,
+            self.trading_reserved_workers,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            workers, self._workers = self._workers, []
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def submit(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+        """
+        작업을 큐에 넣는다.
+
+        Returns:
+            "queued" 또는 "skipped" (skip_if_running 정책으로 건너뜀)
+        """
+        self.start()
+        with self._cond:
+            spec = self._specs.get(name) or JobSpec(name)
+            in_flight = self._running.get(name, 0) + self._queued.get(name, 0)
+            stats = self._stats.setdefault(name, {"queued": 0, "skipped": 0, "succeeded": 0, "failed": 0})
+            if spec.skip_if_running and in_flight >= max(spec.max_concurrency, 1):
+                stats["skipped"] += 1
+                logger.warning(
+                    "스케줄러 작업 건너뜀(이미 실행/대기 중): %s (running=%s, queued=%s)",
+                    name,
+                    self._running.get(name, 0),
+                    self._queued.get(name, 0),
+                )
+                return "skipped"
+            heapq.heappush(
+                self._queue,
+                _QueuedRun(
+                    priority=spec.priority,
+                    seq=next(self._seq),
+                    spec=spec,
+                    func=func,
+                    args=args,
+                    kwargs=kwargs,
+                    enqueued_at=self._clock(),
+                ),
+            )
+            self._queued[name] = self._queued.get(name, 0) + 1
+            stats["queued"] += 1
+            self._cond.notify_all()
+        return "queued"
+
+    def _is_runnable_locked(self, item: _QueuedRun) -> bool:
+        spec = item.spec
+        if self._running.get(spec.name, 0) >= max(spec.max_concurrency, 1):
+            return False
+        if (
+            spec.priority > JOB_PRIORITY_TRADING
+            and self._running_general >= self.max_workers - self.trading_reserved_workers
+        ):
+            return False
+        for dep in spec.depends_on:
+            if self._running.get(dep, 0) or self._queued.get(dep, 0):
+                return False
+        return True
+
+    def _take_runnable_locked(self) -> Optional[_QueuedRun]:
+        for item in sorted(self._queue):
+            if self._is_runnable_locked(item):
+                self._queue.remove(item)
+                heapq.heapify(self._queue)
+                name = item.spec.name
+                self._queued[name] -= 1
+                self._running[name] = self._running.get(name, 0) + 1
+                if item.spec.priority > JOB_PRIORITY_TRADING:
+                    self._running_general += 1
+                return item
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                item = None
+                while not self._stopping:
+                    item = self._take_runnable_locked()
+                    if item is not None:
+                        break
+                    self._cond.wait()
+                if item is None:
+                    return
+            try:
+                self._execute(item)
+            finally:
+                with self._cond:
+                    self._running[item.spec.name] -= 1
+                    if item.spec.priority > JOB_PRIORITY_TRADING:
+                        self._running_general -= 1
+                    self._cond.notify_all()
+
+    def _execute(self, item: _QueuedRun) -> None:
+        spec = item.spec
+        queue_wait_sec = max(self._clock() - item.enqueued_at, 0.0)
+        started_at = datetime.now()
+        run_started = self._clock()
+        error: Optional[BaseException] = None
+        try:
+            item.func(*item.args, **item.kwargs)
+        except Exception as exc:
+            error = exc
+            logger.error("스케줄러 작업 실패: %s: %s", spec.name, exc, exc_info=True)
+        run_time_sec = max(self._clock() - run_started, 0.0)
+        finished_at = datetime.now()
+
+        with self._cond:
+            stats = self._stats.setdefault(spec.name, {"queued": 0, "skipped": 0, "succeeded": 0, "failed": 0})
+            stats["failed" if error else "succeeded"] += 1
+            stats["last_queue_wait_sec"] = round(queue_wait_sec, 3)
+            stats["last_run_time_sec"] = round(run_time_sec, 3)
+            skipped_count = stats["skipped"]
+
+        logger.info(
+            "스케줄러 작업 완료: %s (priority=%s, queue_wait=%.1fs, run_time=%.1fs, success=%s)",
+            spec.name,
+            spec.priority,
+            queue_wait_sec,
+            run_time_sec,
+            error is None,
+        )
+        if not spec.record_report or self.report_fn is None:
+            return
+        try:
+            self.report_fn(
+                job_code=spec.job_code,
+                success_count=0 if error else 1,
+                failure_count=1 if error else 0,
+                run_success=error is None,
+                started_at=started_at,
+                finished_at=finished_at,
+                details={
+                    "scheduler": {
+                        "job_name": spec.name,
+                        "priority": spec.priority,
+                        "queue_wait_sec": round(queue_wait_sec, 3),
+                        "run_time_sec": round(run_time_sec, 3),
+                        "depends_on": list(spec.depends_on),
+                        "skipped_overlaps": skipped_count,
+                        "workers": self.max_workers,
+                        "trading_reserved_workers": self.trading_reserved_workers,
+                    }
+                },
+                error_message=str(error) if error else None,
+            )
+        except Exception as exc:
+            logger.warning("스케줄러 작업 리포트 기록 실패(%s): %s", spec.name, exc)
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "workers": self.max_workers,
+                "trading_reserved_workers": self.trading_reserved_workers,
+                "queued": sum(self._queued.values()),
+                "running": {name: count for name, count in self._running.items() if count},
+                "jobs": {name: dict(stats) for name, stats in self._stats.items()},
+            }
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """큐와 실행 중 작업이 모두 비면 True (테스트/종료용)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or any(self._running.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
@@ -1,6 +1,6 @@
 # KIS (한국투자증권) API 모듈
-from .kis_api import KISAPI
+from .kis_api import KISAPI, get_kis_client
 from .kis import health_check, get_balance_info_api
 
-__all__ = ['KISAPI', 'health_check', 'get_balance_info_api']
+__all__ = ['KISAPI', 'get_kis_client', 'health_check', 'get_balance_info_api']
 
@@ -12,7 +12,7 @@ from typing import Dict, List, Optional
 load_dotenv(override=True)
 
 # 내부 모듈 임포트
-from .kis_api import KISAPI
+from .kis_api import get_kis_client
 from .kis_utils import (
     calculate_rsi, write_current_strategy, get_balance_info, 
     current_time, read_current_strategy, get_buy_info, get_sell_info, calculate_atr
@@ -66,7 +66,7 @@ def health_check(user_id: Optional[str] = None):
                 "message": "KIS API 인증 정보가 등록되지 않았습니다."
             }
         
-        api = KISAPI(
+        api = get_kis_client(
             credentials['app_key'], 
             credentials['app_secret'], 
             credentials['account_no'],
@@ -257,7 +257,7 @@ def get_balance_info_api(user_id: Optional[str] = None):
                 "message": "KIS API 인증 정보가 등록되지 않았습니다. 프로필에서 인증 정보를 등록해주세요."
             }
         logging.info(f"Credential 조회 성공 - account_no: {credentials.get('account_no', 'N/A')[:4]}****")
-        api = KISAPI(
+        api = get_kis_client(
             credentials['app_key'], 
             credentials['app_secret'], 
             credentials['account_no'],
@@ -408,7 +408,7 @@ def get_current_price_api(user_id: str, ticker: str) -> Optional[int]:
             logging.error(f"No credentials found for user {user_id}")
             return None
             
-        api = KISAPI(
+        api = get_kis_client(
             credentials['app_key'], 
             credentials['app_secret'], 
             credentials['account_no'],
@@ -7,9 +7,15 @@ import os
 import logging
 import hashlib
 import tempfile
-from datetime import datetime
+import threading
+from collections import OrderedDict
+
+from service.utils.env import env_float, env_int
+
+from .kis_transport import get_kis_rate_limiter, get_kis_session, get_kis_token_store
 
 KIS_REQUEST_TIMEOUT_SECONDS = 30
+KIS_RATE_LIMIT_RETRIES = 2
 _EXTRA_CA_ENV_KEYS = ("REQUESTS_CA_BUNDLE", "SSL_CERT_FILE")
 
 
@@ -82,6 +88,17 @@ def _build_kis_verify_bundle_path():
 
     return merged_bundle_path
 
+_verify_bundle_cache = {}
+
+
+def _get_kis_verify_bundle_path():
+    """verify 번들 경로를 (CA 환경변수 값별로) 프로세스 내에서 한 번만 계산"""
+    cache_key = tuple(os.getenv(env_key, "") for env_key in _EXTRA_CA_ENV_KEYS)
+    if cache_key not in _verify_bundle_cache:
+        _verify_bundle_cache[cache_key] = _build_kis_verify_bundle_path()
+    return _verify_bundle_cache[cache_key]
+
+
 class KISAPI:
     # 토큰 파일 경로
     _token_file_path = os.path.join(
@@ -94,77 +111,25 @@ class KISAPI:
         self.app_secret = app_secret
         self.account_no = account_no
         self.is_simulation = is_simulation
-        self._session = requests.Session()
         
         # base_url이 제공되지 않으면 모의투자 여부에 따라 자동 설정
         if base_url:
             self.base_url = base_url
         else:
             self.base_url = "https://openapivts.koreainvestment.com:29443" if is_simulation else "https://openapi.koreainvestment.com:9443"
-        self._verify_bundle_path = _build_kis_verify_bundle_path()
-            
-        self.access_token = self._get_access_token()
-
-    def _ensure_data_directory(self):
-        """data 디렉토리가 존재하는지 확인하고 없으면 생성"""
-        data_dir = os.path.dirname(self._token_file_path)
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir, exist_ok=True)
+        self._verify_bundle_path = _get_kis_verify_bundle_path()
 
-    def _load_token_from_file(self):
-        """JSON 파일에서 토큰 정보 로드"""
-        try:
-            if not os.path.exists(self._token_file_path):
-                return None
+        # 프로세스 공용 전송 계층 (커넥션 풀 세션 / 앱키별 TPS 제한 / 토큰 저장소)
+        self._session = get_kis_session(self.base_url)
+        self._rate_limiter = get_kis_rate_limiter(app_key, is_simulation=is_simulation)
+        self._token_store = get_kis_token_store(self._token_file_path)
             
-            with open(self._token_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('access_token'), data.get('issued_date')
-        except Exception as e:
-            print(f"Error loading token from file: {e}")
-            return None
-
-    def _save_token_to_file(self, token, issued_date):
-        """토큰 정보를 JSON 파일에 저장 (보안: 파일 권한 제한)"""
-        try:
-            self._ensure_data_directory()
-            data = {
-                'access_token': token,
-                'issued_date': issued_date
-            }
-            # 파일 쓰기 (임시 파일로 먼저 쓰고 이동하여 원자성 보장)
-            temp_path = self._token_file_path + '.tmp'
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # 파일 권한 제한 (소유자만 읽기/쓰기 가능: 0o600)
-            os.chmod(temp_path, 0o600)
-            # 원자적으로 이동
-            os.replace(temp_path, self._token_file_path)
-            # 최종 파일 권한도 제한
-            os.chmod(self._token_file_path, 0o600)
-        except Exception as e:
-            print(f"Error saving token to file: {e}")
-
-    def _is_token_valid(self):
-        """파일에서 로드한 토큰이 아직 유효한지 확인 (하루 이내)"""
-        token_data = self._load_token_from_file()
-        if token_data is None or token_data[0] is None or token_data[1] is None:
-            return False
-        
-        token, issued_date_str = token_data
-        try:
-            issued_date = datetime.fromisoformat(issued_date_str)
-            # 발급일이 오늘과 같은 날인지 확인
-            today = datetime.now().date()
-            issued_date_only = issued_date.date()
-            return issued_date_only == today
-        except Exception as e:
-            print(f"Error parsing issued_date: {e}")
-            return False
+        self.access_token = self._get_access_token()
 
-    def _send_request(self, method, url, headers=None, params=None, data=None):
-        """KIS API 요청 공통 helper"""
+    def _send_request(self, method, url, headers=None, params=None, data=None, rate_limited=True):
+        """KIS API 요청 공통 helper (앱키별 TPS 제한 적용)"""
+        if rate_limited:
+            self._rate_limiter.acquire()
         return self._session.request(
             method=method.upper(),
             url=url,
@@ -176,14 +141,15 @@ class KISAPI:
         )
 
     def _get_access_token(self):
-        """접근 토큰 발급 (파일에 저장된 토큰이 있으면 재사용)"""
-        # 파일에서 토큰 로드 시도
-        if self._is_token_valid():
-            token_data = self._load_token_from_file()
-            if token_data and token_data[0]:
-                return token_data[0]
-        
-        # 새 토큰 발급
+        """접근 토큰 조회 (메모리/파일에 유효한 토큰이 있으면 재사용, 만료 임박 시 선제 재발급)"""
+        return self._token_store.get_token(self.app_key, self.base_url, self._issue_access_token)
+
+    def _issue_access_token(self):
+        """접근 토큰 신규 발급 (발급 빈도 제한 EGW00133 시 60초 대기 후 1회 재시도)
+
+        Returns:
+            tuple: (access_token, 유효기간 초)
+        """
         headers = {"content-type": "application/json"}
         body = {
             "grant_type": "client_credentials",
@@ -192,18 +158,29 @@ class KISAPI:
         }
         path = "/oauth2/tokenP"
         url = f"{self.base_url}{path}"
-        res = self._send_request("POST", url, headers=headers, data=json.dumps(body))
+        # 토큰 발급은 거래 TPS가 아니라 별도 제한(1분 1회)을 받는다.
+        res = self._send_request("POST", url, headers=headers, data=json.dumps(body), rate_limited=False)
+
+        if res.status_code != 200:
+            err_resp = {}
+            try:
+                err_resp = res.json()
+            except Exception:
+                pass
+            if err_resp.get('error_code') == 'EGW00133':
+                logging.warning("토큰 발급 빈도 제한(1분) 감지. 60초 대기 후 재시도합니다...")
+                time.sleep(60)
+                res = self._send_request("POST", url, headers=headers, data=json.dumps(body), rate_limited=False)
+
         if res.status_code == 200:
-            token = res.json()["access_token"]
-            issued_date = datetime.now().isoformat()
-            # 토큰과 발급 시간을 파일에 저장
-            self._save_token_to_file(token, issued_date)
-            return token
-        else:
-            raise Exception(f"Error getting access token: {res.text}")
+            payload = res.json()
+            logging.info("KIS 접근 토큰 발급 성공")
+            return payload["access_token"], payload.get("expires_in")
+        raise Exception(f"Error getting access token: {res.text}")
 
     def _get_common_headers(self, tr_id):
         """공통 헤더 생성"""
+        self.access_token = self._get_access_token()
         return {
             "content-type": "application/json",
             "authorization": f"Bearer {self.access_token}",
@@ -214,92 +191,63 @@ class KISAPI:
         }
 
     def _refresh_access_token(self):
-        """접근 토큰 강제 재발급 (Rate Limit Handling 포함)"""
+        """접근 토큰 강제 재발급 (다른 스레드/워커가 이미 갱신했으면 그 토큰을 재사용)"""
         logging.info("토큰 만료 감지 - 재발급 로직 시작")
-
-        # 1. 다른 프로세스/스레드가 이미 갱신했는지 파일 확인
-        token_data = self._load_token_from_file()
-        if token_data and token_data[1]:
-            try:
-                last_issued = datetime.fromisoformat(token_data[1])
-                elapsed = (datetime.now() - last_issued).total_seconds()
-                # 60초 이내에 발급된 토큰이 있다면 재사용 (KIS API 제한: 1분당 1회)
-                if elapsed < 65: # Buffer 5s
-                    logging.info(f"최근({elapsed:.1f}초 전) 발급된 토큰이 있어 재사용합니다.")
-                    self.access_token = token_data[0]
-                    return self.access_token
-            except Exception:
-                pass
-        
-        logging.info("최신 토큰이 없거나 만료됨 - 신규 발급 요청")
-        
-        headers = {"content-type": "application/json"}
-        body = {
-            "grant_type": "client_credentials",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret
-        }
-        path = "/oauth2/tokenP"
-        url = f"{self.base_url}{path}"
-        
         try:
-            res = self._send_request("POST", url, headers=headers, data=json.dumps(body))
-            
-            # Rate Limit (EGW00133) check
-            if res.status_code != 200:
-                err_resp = {}
-                try: 
-                    err_resp = res.json() 
-                except: 
-                    pass
-                    
-                if err_resp.get('error_code') == 'EGW00133':
-                    logging.warning("토큰 발급 빈도 제한(1분) 감지. 60초 대기 후 재시도합니다...")
-                    time.sleep(60)
-                    # Retry once
-                    res = self._send_request("POST", url, headers=headers, data=json.dumps(body))
-
-            if res.status_code == 200:
-                token = res.json()["access_token"]
-                issued_date = datetime.now().isoformat()
-                # 토큰과 발급 시간을 파일에 저장
-                self._save_token_to_file(token, issued_date)
-                self.access_token = token
-                logging.info("토큰 재발급 성공")
-                return token
-            else:
-                logging.error(f"Error refreshing access token: {res.text}")
-                raise Exception(f"Error refreshing access token: {res.text}")
+            self.access_token = self._token_store.get_token(
+                self.app_key,
+                self.base_url,
+                self._issue_access_token,
+                stale_token=self.access_token,
+            )
+            logging.info("토큰 재발급 성공")
+            return self.access_token
         except Exception as e:
             logging.error(f"Exception during token refresh: {e}")
             raise
 
+    @staticmethod
+    def _response_msg_cd(res):
+        """오류 응답의 msg_cd (정상 응답은 본문을 두 번 파싱하지 않도록 건너뜀)"""
+        if res.status_code == 200:
+            return None
+        try:
+            return (res.json() or {}).get('msg_cd')
+        except Exception:
+            return None
+
     def _request_with_token_refresh(self, method, url, headers, params=None, data=None):
-        """토큰 만료 시 자동 갱신하여 요청 재시도"""
+        """토큰 만료 시 자동 갱신, 초당 거래건수 초과(EGW00201) 시 한 간격 쉬고 재시도"""
         try:
             res = self._send_request(method, url, headers=headers, params=params, data=data)
+
+            for _ in range(KIS_RATE_LIMIT_RETRIES):
+                if self._response_msg_cd(res) != 'EGW00201':
+                    break
+                # 같은 앱키를 외부(HTS/다른 서버)에서 함께 쓰는 경우 등 버킷 밖에서 초과한 경우
+                logging.warning("KIS 초당 거래건수 초과(EGW00201) - 재시도")
+                time.sleep(self._rate_limiter.interval_sec)
+                res = self._send_request(method, url, headers=headers, params=params, data=data)
             
             # 토큰 만료 체크 (HTTP 500 또는 API 응답 코드 확인)
             # KIS API는 토큰 만료 시 500 에러와 함께 msg_cd: EGW00123 반환
-            if res.status_code == 500:
+            if res.status_code == 500 and self._response_msg_cd(res) == 'EGW00123':
                 try:
-                    error_resp = res.json()
-                    if error_resp.get('msg_cd') == 'EGW00123':
-                        # 토큰 갱신
-                        self._refresh_access_token()
-                        
-                        # 헤더의 토큰 업데이트
-                        headers['authorization'] = f"Bearer {self.access_token}"
-                        
-                        # 재시도
-                        logging.info("토큰 갱신 후 요청 재시도")
-                        return self._send_request(
-                            method,
-                            url,
-                            headers=headers,
-                            params=params,
-                            data=data,
-                        )
+                    # 토큰 갱신
+                    self._refresh_access_token()
+                    
+                    # 헤더의 토큰 업데이트
+                    headers['authorization'] = f"Bearer {self.access_token}"
+                    
+                    # 재시도
+                    logging.info("토큰 갱신 후 요청 재시도")
+                    return self._send_request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=params,
+                        data=data,
+                    )
                 except Exception:
                     pass
             
@@ -363,7 +311,6 @@ class KISAPI:
 
     def fetch_ohlcv(self, ticker, interval='D', count=250):
         """일/주/월봉 데이터 조회 (현재가 일자별)"""
-        time.sleep(0.1) # 단기과열종목 지정 회피
         path = "/uapi/domestic-stock/v1/quotations/inquire-daily-price"
         url = f"{self.base_url}{path}"
         headers = self._get_common_headers("FHKST01010400")
@@ -413,7 +360,6 @@ class KISAPI:
                 "msg1": str(e)
             }
         
-        time.sleep(0.1)
         path = "/uapi/domestic-stock/v1/trading/inquire-balance"
         url = f"{self.base_url}{path}"
         
@@ -467,7 +413,6 @@ class KISAPI:
         except ValueError as e:
             return {"rt_cd": "1", "msg1": str(e)}
             
-        time.sleep(0.1)
         path = "/uapi/domestic-stock/v1/trading/inquire-invest-deposit-withdrawal-list"
         url = f"{self.base_url}{path}"
         
@@ -503,7 +448,6 @@ class KISAPI:
         except ValueError as e:
             return {"rt_cd": "1", "msg1": str(e)}
             
-        time.sleep(0.1)
         path = "/uapi/domestic-stock/v1/trading/inquire-psbl-order"
         url = f"{self.base_url}{path}"
         
@@ -538,7 +482,6 @@ class KISAPI:
         except ValueError as e:
             return {"rt_cd": "1", "msg1": str(e)}
         
-        time.sleep(0.1)
         path = "/uapi/domestic-stock/v1/trading/order-cash"
         url = f"{self.base_url}{path}"
         headers = self._get_common_headers(tr_id)
@@ -583,9 +526,52 @@ class KISAPI:
         tr_id = "VTTC0801U" if self.is_simulation else "TTTC0801U"
         return self._place_order(ticker, quantity, "sell", tr_id, price=price, order_dvsn="00")
 
+    def get_order_executions(self, order_no="", ticker="", start_date=None, end_date=None, side_code="00"):
+        """
+        주식일별주문체결조회 (주문별 체결 수량/금액)
+
+        Args:
+            order_no: 주문번호(ODNO). 빈 값이면 기간 내 전체
+            ticker: 종목코드. 빈 값이면 전체
+            start_date/end_date: 'YYYYMMDD' (기본값: 오늘)
+            side_code: 00 전체, 01 매도, 02 매수
+        """
+        try:
+            cano, acnt_prdt_cd = self._parse_account_no()
+        except ValueError as e:
+            return {"rt_cd": "1", "msg1": str(e)}
+
+        today = time.strftime("%Y%m%d")
+        path = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+        url = f"{self.base_url}{path}"
+        tr_id = "VTTC8001R" if self.is_simulation else "TTTC8001R"
+        headers = self._get_common_headers(tr_id)
+
+        params = {
+            "CANO": cano,
+            "ACNT_PRDT_CD": acnt_prdt_cd,
+            "INQR_STRT_DT": start_date or today,
+            "INQR_END_DT": end_date or today,
+            "SLL_BUY_DVSN_CD": side_code,
+            "INQR_DVSN": "00",
+            "PDNO": ticker,
+            "CCLD_DVSN": "00",
+            "ORD_GNO_BRNO": "",
+            "ODNO": order_no,
+            "INQR_DVSN_3": "00",
+            "INQR_DVSN_1": "",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+
+        res = self._request_with_token_refresh('GET', url, headers=headers, params=params)
+        if res.status_code == 200:
+            return res.json()
+        logging.error(f"KIS API 주문체결조회 실패 - status: {res.status_code}, response: {res.text}")
+        return None
+
     def get_current_price(self, ticker):
         """현재가 조회"""
-        time.sleep(0.5) # Rate Limit: 2 req/sec
         path = "/uapi/domestic-stock/v1/quotations/inquire-price"
         url = f"{self.base_url}{path}"
         headers = self._get_common_headers("FHKST01010100")
@@ -614,7 +600,6 @@ class KISAPI:
         Returns:
             List[Dict]: 검색 결과 리스트 [{"ticker": "005930", "stock_name": "삼성전자"}, ...]
         """
-        time.sleep(0.1)
         path = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
         url = f"{self.base_url}{path}"
         headers = self._get_common_headers("CTCA0903R")
@@ -669,3 +654,75 @@ class KISAPI:
         # 임시 구현: 빈 리스트 반환
         # 실제로는 KIS API 문서를 참고하여 구현 필요
         return []
+
+
+DEFAULT_KIS_CLIENT_CACHE_SIZE = 64
+DEFAULT_KIS_CLIENT_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+_clients = OrderedDict()  # key -> (expires_at, KISAPI), LRU 순서
+_client_locks = {}
+_clients_lock = threading.Lock()
+
+
+def _client_cache_limits():
+    max_size = env_int("KIS_CLIENT_CACHE_SIZE", DEFAULT_KIS_CLIENT_CACHE_SIZE)
+    ttl_seconds = env_float("KIS_CLIENT_CACHE_TTL_SECONDS", DEFAULT_KIS_CLIENT_CACHE_TTL_SECONDS)
+    return max(max_size, 1), max(ttl_seconds, 1.0)
+
+
+def _get_cached_client(key):
+    """전역 락 아래에서 캐시 조회만 수행 (만료 항목은 제거)"""
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is None:
+            return None
+        expires_at, client = entry
+        if expires_at <= time.monotonic():
+            del _clients[key]
+            return None
+        _clients.move_to_end(key)
+        return client
+
+
+def get_kis_client(app_key, app_secret, account_no, is_simulation=False):
+    """
+    자격증명별 KISAPI 인스턴스 재사용 (잔고 조회/리밸런싱 등 반복 호출용)
+
+    세션/TPS 제한/토큰은 전송 계층에서 공유되므로 인스턴스 생성 비용만 줄인다.
+    자격증명이 바뀌면 키가 달라져 새 인스턴스를 만든다.
+
+    KISAPI 생성은 토큰 발급(EGW00133 시 최대 60초 대기)을 포함하므로 전역 락이 아닌
+    키별 락 아래에서 수행한다. 한 사용자의 지연이 다른 사용자의 조회를 막지 않는다.
+    캐시는 KIS_CLIENT_CACHE_SIZE 개수(LRU)와 KIS_CLIENT_CACHE_TTL_SECONDS 로 제한된다.
+    """
+    key = (
+        hashlib.sha256(f"{app_key}|{app_secret}".encode("utf-8")).hexdigest(),
+        str(account_no or ""),
+        bool(is_simulation),
+    )
+    client = _get_cached_client(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        key_lock = _client_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        client = _get_cached_client(key)
+        if client is not None:
+            return client
+        try:
+            client = KISAPI(app_key, app_secret, account_no, is_simulation=is_simulation)
+        except Exception:
+            with _clients_lock:
+                if key not in _clients:
+                    _client_locks.pop(key, None)
+            raise
+        max_size, ttl_seconds = _client_cache_limits()
+        with _clients_lock:
+            _clients[key] = (time.monotonic() + ttl_seconds, client)
+            _clients.move_to_end(key)
+            while len(_clients) > max_size:
+                evicted_key, _ = _clients.popitem(last=False)
+                _client_locks.pop(evicted_key, None)
+    return client
@@ -0,0 +1,344 @@
+# service/macro_trading/kis/kis_transport.py
+"""
+KIS API 전송 계층
+
+- 앱키별 토큰 버킷: 증권사 공지 TPS(실전 20건/초, 모의 2건/초)에 맞춰 요청 간격을 조절한다.
+  같은 앱키를 쓰는 스레드는 물론 gunicorn 워커/스케줄러 프로세스끼리도 파일 잠금 상태를 공유한다.
+- keep-alive 커넥션 풀 세션: base_url별로 프로세스당 하나를 재사용한다. (fork 이후 재생성)
+- 접근 토큰 저장소: 메모리에 보관하고 만료 전에 선제 갱신한다.
+  발급 결과는 앱키별로 파일에 저장해 다른 워커가 재사용한다. (발급 빈도 제한: 1분 1회)
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from service.utils.env import env_flag, env_float
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows 등
+    fcntl = None
+
+DEFAULT_TPS_REAL = 20.0
+DEFAULT_TPS_SIMULATION = 2.0
+DEFAULT_HTTP_POOL_MAXSIZE = 16
+DEFAULT_TOKEN_TTL_SEC = 24 * 60 * 60
+DEFAULT_TOKEN_REFRESH_MARGIN_SEC = 30 * 60
+TOKEN_REISSUE_COOLDOWN_SEC = 65  # KIS 토큰 발급 제한(1분 1회) + 여유 5초
+
+_STATE_RECORD_SIZE = 64
+
+
+def _key_digest(*parts: str) -> str:
+    """앱키 등 민감정보를 파일명/키에 직접 쓰지 않도록 해시한다."""
+    return hashlib.sha256("|".join(str(part or "") for part in parts).encode("utf-8")).hexdigest()[:32]
+
+
+@contextmanager
+def _file_lock(path: str):
+    """프로세스 간 배타 잠금 (fcntl 미지원 환경에서는 잠금 없이 진행)"""
+    if fcntl is None:
+        yield None
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield fd
+    finally:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+# ===============================================
+# Rate limiter
+# ===============================================
+class KISRateLimiter:
+    """
+    예약형 토큰 버킷
+
+    acquire()는 슬롯을 먼저 예약하고 자기 차례까지 남은 시간만큼 잠든다.
+    burst=1이면 1/TPS 간격으로 균등하게 요청이 나간다.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        *,
+        burst: float = 1.0,
+        state_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate_per_sec = max(float(rate_per_sec), 0.01)
+        self.burst = max(float(burst), 1.0)
+        self.state_path = state_path if fcntl is not None else None
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._stats = {"acquired": 0, "waited": 0, "wait_sec": 0.0, "shared_state_errors": 0}
+
+    @property
+    def interval_sec(self) -> float:
+        return 1.0 / self.rate_per_sec
+
+    def acquire(self) -> float:
+        """슬롯 1개를 예약하고 대기한 시간(초)을 반환한다."""
+        with self._lock:
+            wait_sec = self._reserve_shared() if self.state_path else None
+            if wait_sec is None:
+                wait_sec = self._reserve_local()
+            self._stats["acquired"] += 1
+            if wait_sec > 0:
+                self._stats["waited"] += 1
+                self._stats["wait_sec"] += wait_sec
+        if wait_sec > 0:
+            self._sleep(wait_sec)
+        return wait_sec
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {**self._stats, "rate_per_sec": self.rate_per_sec, "shared": bool(self.state_path)}
+
+    def _consume(self, tokens: float, updated_at: float, now: float) -> Tuple[float, float, float]:
+        tokens = min(self.burst, tokens + max(now - updated_at, 0.0) * self.rate_per_sec) - 1.0
+        wait_sec = -tokens / self.rate_per_sec if tokens < 0 else 0.0
+        return tokens, now, wait_sec
+
+    def _reserve_local(self) -> float:
+        self._tokens, self._updated_at, wait_sec = self._consume(self._tokens, self._updated_at, self._clock())
+        return wait_sec
+
+    def _reserve_shared(self) -> Optional[float]:
+        try:
+            with _file_lock(self.state_path) as fd:
+                raw = os.pread(fd, _STATE_RECORD_SIZE, 0).decode("ascii", "ignore").split()
+                now = self._clock()
+                tokens, updated_at = (float(raw[0]), float(raw[1])) if len(raw) == 2 else (self.burst, now)
+                tokens, updated_at, wait_sec = self._consume(tokens, updated_at, now)
+                record = f"{tokens:.6f} {updated_at:.6f}".ljust(_STATE_RECORD_SIZE)
+                os.pwrite(fd, record.encode("ascii"), 0)
+                return wait_sec
+        except Exception as e:
+            # 공유 상태를 쓸 수 없으면 프로세스 내 버킷으로 계속 진행한다.
+            self._stats["shared_state_errors"] += 1
+            logging.warning(f"KIS rate limiter 공유 상태 사용 실패 - 프로세스 내 제한으로 대체: {e}")
+            self.state_path = None
+            return None
+
+
+_rate_limiters: Dict[Tuple[int, str, bool], KISRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_kis_rate_limiter(app_key: str, is_simulation: bool = False) -> KISRateLimiter:
+    """앱키별 공유 토큰 버킷 (프로세스 간 공유는 KIS_RATE_LIMIT_SHARED=0으로 끌 수 있음)"""
+    key = (os.getpid(), _key_digest(app_key), bool(is_simulation))
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(key)
+            if limiter is None:
+                if is_simulation:
+                    rate = env_float("KIS_RATE_LIMIT_TPS_SIMULATION", DEFAULT_TPS_SIMULATION)
+                else:
+                    rate = env_float("KIS_RATE_LIMIT_TPS", DEFAULT_TPS_REAL)
+                state_path = None
+                if env_flag("KIS_RATE_LIMIT_SHARED"):
+                    state_dir = os.getenv("KIS_RATE_LIMIT_STATE_DIR") or tempfile.gettempdir()
+                    suffix = "sim" if is_simulation else "real"
+                    state_path = os.path.join(state_dir, f"hobot_kis_rate_{key[1][:16]}_{suffix}.state")
+                limiter = KISRateLimiter(rate, state_path=state_path)
+                _rate_limiters[key] = limiter
+    return limiter
+
+
+# ===============================================
+# HTTP session pool
+# ===============================================
+_sessions: Dict[Tuple[int, str], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_kis_session(base_url: str) -> requests.Session:
+    """base_url별 keep-alive 커넥션 풀 세션 (프로세스당 1개)"""
+    key = (os.getpid(), str(base_url or ""))
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                pool_size = max(int(env_float("KIS_HTTP_POOL_MAXSIZE", DEFAULT_HTTP_POOL_MAXSIZE)), 1)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _sessions[key] = session
+    return session
+
+
+# ===============================================
+# Access token store
+# ===============================================
+class KISTokenStore:
+    """
+    앱키별 접근 토큰 저장소
+
+    - 메모리 캐시에서 바로 반환하고, 만료 refresh_margin_sec 전부터는 새로 발급한다.
+    - 발급은 파일 잠금 안에서 수행해 여러 워커가 동시에 토큰을 발급하지 않도록 한다.
+    """
+
+    def __init__(
+        self,
+        token_file_path: str,
+        *,
+        refresh_margin_sec: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if refresh_margin_sec is None:
+            refresh_margin_sec = env_float("KIS_TOKEN_REFRESH_MARGIN_SEC", DEFAULT_TOKEN_REFRESH_MARGIN_SEC)
+        self.token_file_path = token_file_path
+        self.refresh_margin_sec = max(float(refresh_margin_sec), 0.0)
+        self._clock = clock
+        self._tokens: Dict[str, Dict[str, float]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._stats = {"hits": 0, "file_hits": 0, "issued": 0}
+
+    def get_token(
+        self,
+        app_key: str,
+        base_url: str,
+        issue_fn: Callable[[], Tuple[str, float]],
+        *,
+        stale_token: Optional[str] = None,
+    ) -> str:
+        """
+        유효한 접근 토큰을 반환한다.
+
+        Args:
+            issue_fn: 신규 발급 함수. (access_token, 유효기간 초)를 반환
+            stale_token: 서버가 만료로 거절한 토큰. 이 토큰은 더 이상 재사용하지 않는다.
+        """
+        key = _key_digest(base_url, app_key)
+        with self._key_lock(key):
+            entry = self._tokens.get(key)
+            if self._is_usable(entry, stale_token):
+                self._stats["hits"] += 1
+                return entry["access_token"]
+
+            with _file_lock(self.token_file_path + ".lock"):
+                entries = self._read_file()
+                file_entry = entries.get(key)
+                if self._is_usable(file_entry, stale_token):
+                    self._stats["file_hits"] += 1
+                    self._tokens[key] = file_entry
+                    return file_entry["access_token"]
+                if (
+                    stale_token
+                    and file_entry
+                    and file_entry.get("access_token") != stale_token
+                    and self._clock() - float(file_entry.get("issued_at") or 0) < TOKEN_REISSUE_COOLDOWN_SEC
+                ):
+                    # 다른 워커가 방금 재발급한 토큰 (KIS 발급 제한 1분 1회)
+                    logging.info("최근 발급된 KIS 토큰이 있어 재사용합니다.")
+                    self._tokens[key] = file_entry
+                    return file_entry["access_token"]
+
+                token, ttl_sec = issue_fn()
+                now = self._clock()
+                new_entry = {
+                    "access_token": token,
+                    "issued_at": now,
+                    "expires_at": now + max(float(ttl_sec or DEFAULT_TOKEN_TTL_SEC), 1.0),
+                }
+                entries[key] = new_entry
+                self._write_file(entries)
+                self._tokens[key] = new_entry
+                self._stats["issued"] += 1
+                return token
+
+    def invalidate(self, app_key: Optional[str] = None, base_url: Optional[str] = None) -> None:
+        if app_key is None:
+            self._tokens.clear()
+        else:
+            self._tokens.pop(_key_digest(base_url, app_key), None)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self._stats, "tokens": len(self._tokens)}
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _is_usable(self, entry: Optional[Dict[str, float]], stale_token: Optional[str]) -> bool:
+        if not entry or not entry.get("access_token"):
+            return False
+        if stale_token and entry["access_token"] == stale_token:
+            return False
+        return self._clock() < float(entry.get("expires_at") or 0) - self.refresh_margin_sec
+
+    def _read_file(self) -> Dict[str, Dict[str, float]]:
+        try:
+            if not os.path.exists(self.token_file_path):
+                return {}
+            with open(self.token_file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            tokens = data.get("tokens") if isinstance(data, dict) else None
+            return dict(tokens) if isinstance(tokens, dict) else {}
+        except Exception as e:
+            logging.warning(f"KIS 토큰 파일 로드 실패: {e}")
+            return {}
+
+    def _write_file(self, entries: Dict[str, Dict[str, float]]) -> None:
+        """토큰 파일 저장 (보안: 파일 권한 0o600, 임시 파일 후 원자적 이동)"""
+        try:
+            os.makedirs(os.path.dirname(self.token_file_path), exist_ok=True)
+            now = self._clock()
+            payload = {
+                "tokens": {
+                    key: {
+                        **entry,
+                        "issued_date": datetime.fromtimestamp(float(entry["issued_at"])).isoformat(),
+                    }
+                    for key, entry in entries.items()
+                    if float(entry.get("expires_at") or 0) > now
+                }
+            }
+            temp_path = f"{self.token_file_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.token_file_path)
+        except Exception as e:
+            logging.warning(f"KIS 토큰 파일 저장 실패: {e}")
+
+
+_token_stores: Dict[str, KISTokenStore] = {}
+_token_stores_lock = threading.Lock()
+
+
+def get_kis_token_store(token_file_path: str) -> KISTokenStore:
+    """토큰 파일 경로별 공용 KISTokenStore"""
+    store = _token_stores.get(token_file_path)
+    if store is None:
+        with _token_stores_lock:
+            store = _token_stores.get(token_file_path)
+            if store is None:
+                store = KISTokenStore(token_file_path)
+                _token_stores[token_file_path] = store
+    return store
@@ -1,12 +1,47 @@
 """
 사용자별 KIS API 인증 정보 조회 모듈
+
+복호화 결과는 CredentialStore에 짧은 TTL로 캐시되며,
+/user/kis-credentials 저장 및 사용자 삭제/ID 변경 시 invalidate_user_credentials로 즉시 제거된다.
 """
 from typing import Optional, Dict
 from service.database.db import get_db_connection
+from service.utils.credential_store import PROVIDER_KIS, get_credential_store
 from service.utils.encryption import decrypt_data
 import logging
 
 
+def _load_user_kis_credentials(user_id: str) -> Optional[Dict[str, str]]:
+    """DB 조회 + 복호화 (미등록이면 None, 조회/복호화 오류는 예외)"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT kis_id, account_no, app_key_encrypted, app_secret_encrypted, is_simulation
+            FROM user_kis_credentials
+            WHERE user_id = %s
+        """, (user_id,))
+        row = cursor.fetchone()
+
+    if not row:
+        return None
+
+    # 복호화
+    try:
+        app_key = decrypt_data(row["app_key_encrypted"])
+        app_secret = decrypt_data(row["app_secret_encrypted"])
+    except Exception as e:
+        logging.error(f"Error decrypting credentials for user {user_id}: {e}")
+        raise
+
+    return {
+        'kis_id': row["kis_id"],
+        'account_no': row["account_no"],
+        'app_key': app_key,
+        'app_secret': app_secret,
+        'is_simulation': bool(row["is_simulation"])
+    }
+
+
 def get_user_kis_credentials(user_id: str) -> Optional[Dict[str, str]]:
     """
     사용자별 KIS API 인증 정보 조회 및 복호화
@@ -23,34 +58,9 @@ def get_user_kis_credentials(user_id: str) -> Optional[Dict[str, str]]:
         } 또는 None (인증 정보가 없는 경우)
     """
     try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT kis_id, account_no, app_key_encrypted, app_secret_encrypted, is_simulation
-                FROM user_kis_credentials
-                WHERE user_id = %s
-            """, (user_id,))
-            row = cursor.fetchone()
-            
-            if not row:
-                return None
-            
-            # 복호화
-            try:
-                app_key = decrypt_data(row["app_key_encrypted"])
-                app_secret = decrypt_data(row["app_secret_encrypted"])
-            except Exception as e:
-                logging.error(f"Error decrypting credentials for user {user_id}: {e}")
-                return None
-            
-            return {
-                'kis_id': row["kis_id"],
-                'account_no': row["account_no"],
-                'app_key': app_key,
-                'app_secret': app_secret,
-                'is_simulation': bool(row["is_simulation"])
-            }
+        return get_credential_store().get(
+            PROVIDER_KIS, user_id, lambda: _load_user_kis_credentials(user_id)
+        )
     except Exception as e:
         logging.error(f"Error getting KIS credentials for user {user_id}: {e}")
         return None
-
@@ -9,8 +9,11 @@ Real-estate query API.
 
 from __future__ import annotations
 
+import base64
 import json
 import logging
+import threading
+import time
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
@@ -26,6 +29,13 @@ logger = logging.getLogger(__name__)
 DEFAULT_PROPERTY_TYPE = "apartment"
 DEFAULT_TRANSACTION_TYPE = "sale"
 
+# kr_real_estate_transactions의 stored generated column (scripts/apply_migration_20261016.py로 추가)
+TRANSACTION_GENERATED_COLUMNS = ("lawd_cd", "apt_name", "umd_name", "jibun")
+GENERATED_COLUMNS_RECHECK_SEC = 300.0
+# kr_real_estate_monthly_summary의 분포 통계 컬럼 (scripts/apply_migration_20261016_summary.py로 추가)
+SUMMARY_DISTRIBUTION_COLUMNS = ("median_price", "p25_price_per_m2", "median_price_per_m2", "p75_price_per_m2")
+COUNT_MODES = ("exact", "approximate")
+
 router = APIRouter(prefix="/macro/real-estate", tags=["macro-real-estate"])
 
 
@@ -42,6 +52,7 @@ class RealEstateQueryResponse(BaseModel):
     total: int
     rows: List[Dict[str, Any]] = Field(default_factory=list)
     fallback_used: bool = False
+    next_cursor: Optional[str] = None
     meta: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -101,6 +112,93 @@ def _build_lawd_filter_sql(column_expr: str, lawd_codes: List[str]) -> Tuple[str
     return f" AND {column_expr} IN ({placeholders}) ", list(lawd_codes)
 
 
+_generated_columns_lock = threading.Lock()
+_generated_columns_state: Dict[str, Any] = {"ready": False, "checked_at": None}
+
+
+def _transactions_have_generated_columns(cursor: Any) -> bool:
+    """
+    generated column 마이그레이션 적용 여부.
+    적용 전(수집기가 아직 ensure_table을 돌리지 않은 DB)에는 기존 식(LEFT/JSON_EXTRACT)으로 조회한다.
+    """
+    with _generated_columns_lock:
+        if _generated_columns_state["ready"]:
+            return True
+        checked_at = _generated_columns_state["checked_at"]
+        if checked_at is not None and time.monotonic() - checked_at < GENERATED_COLUMNS_RECHECK_SEC:
+            return False
+    placeholders = ", ".join(["%s"] * len(TRANSACTION_GENERATED_COLUMNS))
+    cursor.execute(
+        f"""
+        SELECT COUNT(*) AS column_count
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'kr_real_estate_transactions'
+          AND COLUMN_NAME IN ({placeholders})
+        """,
+        TRANSACTION_GENERATED_COLUMNS,
+    )
+    row = cursor.fetchone() or {}
+    ready = int(row.get("column_count", 0) or 0) >= len(TRANSACTION_GENERATED_COLUMNS)
+    with _generated_columns_lock:
+        _generated_columns_state["ready"] = ready
+        _generated_columns_state["checked_at"] = time.monotonic()
+    return ready
+
+
+_summary_columns_lock = threading.Lock()
+_summary_columns_state: Dict[str, Any] = {"columns": (), "checked_at": None}
+
+
+def _summary_distribution_columns(cursor: Any) -> Tuple[str, ...]:
+    """
+    kr_real_estate_monthly_summary에 존재하는 분포 통계 컬럼.
+    마이그레이션 적용 전에는 빈 튜플이며, 이 경우 기존 컬럼만 조회한다.
+    """
+    with _summary_columns_lock:
+        columns = _summary_columns_state["columns"]
+        if len(columns) == len(SUMMARY_DISTRIBUTION_COLUMNS):
+            return columns
+        checked_at = _summary_columns_state["checked_at"]
+        if checked_at is not None and time.monotonic() - checked_at < GENERATED_COLUMNS_RECHECK_SEC:
+            return columns
+    placeholders = ", ".join(["%s"] * len(SUMMARY_DISTRIBUTION_COLUMNS))
+    cursor.execute(
+        f"""
+        SELECT COLUMN_NAME
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'kr_real_estate_monthly_summary'
+          AND COLUMN_NAME IN ({placeholders})
+        """,
+        SUMMARY_DISTRIBUTION_COLUMNS,
+    )
+    existing = {str(row.get("COLUMN_NAME") or "").lower() for row in (cursor.fetchall() or [])}
+    columns = tuple(column for column in SUMMARY_DISTRIBUTION_COLUMNS if column in existing)
+    with _summary_columns_lock:
+        _summary_columns_state["columns"] = columns
+        _summary_columns_state["checked_at"] = time.monotonic()
+    return columns
+
+
+def encode_transaction_cursor(contract_date: Any, row_id: Any) -> str:
+    """(contract_date, id) 정렬 키를 불투명한 keyset cursor 문자열로 인코딩"""
+    payload = json.dumps(
+        {"d": _serialize_value(contract_date), "i": int(row_id)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_transaction_cursor(cursor_token: str) -> Tuple[date, int]:
+    try:
+        padded = cursor_token + "=" * (-len(cursor_token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        return datetime.strptime(str(payload["d"])[:10], "%Y-%m-%d").date(), int(payload["i"])
+    except Exception as err:
+        raise ValueError(f"Invalid cursor: {cursor_token}") from err
+
+
 def fetch_rdb_transactions(
     *,
     start_ym: str,
@@ -111,73 +209,111 @@ def fetch_rdb_transactions(
     limit: int,
     offset: int,
     include_metadata: bool,
-) -> Tuple[List[Dict[str, Any]], int]:
-    start_month, end_month_exclusive = _validate_ym_range(start_ym, end_ym)
-    where_lawd, lawd_params = _build_lawd_filter_sql("LEFT(region_code, 5)", lawd_codes)
-    base_params: List[Any] = [
-        start_month,
-        end_month_exclusive,
-        property_type,
-        transaction_type,
-    ]
-    base_params.extend(lawd_params)
-
-    count_query = f"""
-        SELECT COUNT(*) AS total
-        FROM kr_real_estate_transactions
-        WHERE contract_date IS NOT NULL
-          AND contract_date >= %s
-          AND contract_date < %s
-          AND property_type = %s
-          AND transaction_type = %s
-          {where_lawd}
+    cursor: Optional[str] = None,
+    count_mode: str = "exact",
+) -> Tuple[List[Dict[str, Any]], int, Dict[str, Any]]:
     """
+    상세 거래 조회.
 
-    metadata_column = ", metadata_json" if include_metadata else ""
-    data_query = f"""
-        SELECT
-          id,
-          source,
-          source_record_id,
-          country_code,
-          region_code,
-          LEFT(region_code, 5) AS lawd_cd,
-          property_type,
-          transaction_type,
-          contract_date,
-          effective_date,
-          published_at,
-          as_of_date,
-          price,
-          deposit,
-          monthly_rent,
-          area_m2,
-          floor_no,
-          build_year,
-          JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.aptNm')) AS apt_name,
-          JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.umdNm')) AS umd_name,
-          JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.jibun')) AS jibun
-          {metadata_column}
-        FROM kr_real_estate_transactions
-        WHERE contract_date IS NOT NULL
-          AND contract_date >= %s
-          AND contract_date < %s
-          AND property_type = %s
-          AND transaction_type = %s
-          {where_lawd}
-        ORDER BY contract_date DESC, id DESC
-        LIMIT %s OFFSET %s
+    - cursor가 있으면 (contract_date DESC, id DESC) keyset 페이지로 읽는다. (offset 무시)
+      인덱스에서 바로 시작 위치를 찾으므로 깊은 페이지도 첫 페이지와 비용이 같다.
+    - count_mode=approximate면 COUNT(*) 대신 옵티마이저 추정 행 수(EXPLAIN)를 total로 쓴다.
+    - 반환: (rows, total, page_meta{next_cursor, count_mode, total_is_estimate})
     """
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"Invalid count_mode: {count_mode} (expected one of {', '.join(COUNT_MODES)})")
+    start_month, end_month_exclusive = _validate_ym_range(start_ym, end_ym)
+    after = decode_transaction_cursor(cursor) if cursor else None
 
     with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(count_query, tuple(base_params))
-        count_row = cursor.fetchone() or {"total": 0}
-        total = int(count_row.get("total", 0))
+        db_cursor = conn.cursor()
+        use_generated = _transactions_have_generated_columns(db_cursor)
+        if use_generated:
+            lawd_expr = "lawd_cd"
+            projection = "lawd_cd, apt_name, umd_name, jibun"
+        else:
+            lawd_expr = "LEFT(region_code, 5)"
+            projection = (
+                "LEFT(region_code, 5) AS lawd_cd, "
+                "JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.aptNm')) AS apt_name, "
+                "JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.umdNm')) AS umd_name, "
+                "JSON_UNQUOTE(JSON_EXTRACT(metadata_json, '$.jibun')) AS jibun"
+            )
 
-        data_params = list(base_params) + [limit, offset]
-        cursor.execute(data_query, tuple(data_params))
-        rows = cursor.fetchall() or []
+        where_lawd, lawd_params = _build_lawd_filter_sql(lawd_expr, lawd_codes)
+        base_params: List[Any] = [
+            start_month,
+            end_month_exclusive,
+            property_type,
+            transaction_type,
+        ]
+        base_params.extend(lawd_params)
+        where_sql = f"""
+            WHERE contract_date IS NOT NULL
+              AND contract_date >= %s
+              AND contract_date < %s
+              AND property_type = %s
+              AND transaction_type = %s
+              {where_lawd}
+        """
+
+        if count_mode == "approximate":
+            db_cursor.execute(f"EXPLAIN SELECT id FROM kr_real_estate_transactions {where_sql}", tuple(base_params))
+            plan = db_cursor.fetchone() or {}
+            estimated_rows = float(plan.get("rows") or 0) * float(plan.get("filtered") or 100.0) / 100.0
+            total = int(round(estimated_rows))
+        else:
+            db_cursor.execute(
+                f"SELECT COUNT(*) AS total FROM kr_real_estate_transactions {where_sql}",
+                tuple(base_params),
+            )
+            count_row = db_cursor.fetchone() or {"total": 0}
+            total = int(count_row.get("total", 0))
+
+        keyset_sql = ""
+        data_params = list(base_params)
+        if after is not None:
+            keyset_sql = " AND (contract_date < %s OR (contract_date = %s AND id < %s)) "
+            data_params.extend([after[0], after[0], after[1]])
+
+        metadata_column = ", metadata_json" if include_metadata else ""
+        # 다음 페이지 존재 여부 확인용으로 1건 더 읽는다.
+        data_query = f"""
+            SELECT
+              id,
+              source,
+              source_record_id,
+              country_code,
+              region_code,
+              property_type,
+              transaction_type,
+              contract_date,
+              effective_date,
+              published_at,
+              as_of_date,
+              price,
+              deposit,
+              monthly_rent,
+              area_m2,
+              floor_no,
+              build_year,
+              {projection}
+              {metadata_column}
+            FROM kr_real_estate_transactions
+            {where_sql}
+              {keyset_sql}
+            ORDER BY contract_date DESC, id DESC
+            LIMIT %s{"" if after is not None else " OFFSET %s"}
+        """
+        data_params.append(limit + 1)
+        if after is None:
+            data_params.append(offset)
+        db_cursor.execute(data_query, tuple(data_params))
+        rows = list(db_cursor.fetchall() or [])
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_transaction_cursor(rows[-1]["contract_date"], rows[-1]["id"]) if has_more and rows else None
 
     if include_metadata:
         for row in rows:
@@ -188,7 +324,13 @@ def fetch_rdb_transactions(
                 except json.JSONDecodeError:
                     row["metadata_json"] = payload
 
-    return _serialize_rows(rows), total
+    page_meta = {
+        "next_cursor": next_cursor,
+        "count_mode": count_mode,
+        "total_is_estimate": count_mode == "approximate",
+        "pagination": "keyset" if after is not None else "offset",
+    }
+    return _serialize_rows(rows), total, page_meta
 
 
 def _build_summary_where_sql(
@@ -268,7 +410,13 @@ def _fetch_mysql_monthly_summary(
             FROM kr_real_estate_monthly_summary
             WHERE {where_sql}
         """
-        data_query = f"""
+        data_query = None
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        if data_query is None:
+            distribution_sql = "".join(f"              {column},\n" for column in _summary_distribution_columns(cursor))
+            data_query = f"""
             SELECT
               stat_ym,
               lawd_cd,
@@ -282,15 +430,12 @@ def _fetch_mysql_monthly_summary(
               min_price,
               max_price,
               total_price,
-              as_of_date
+{distribution_sql}              as_of_date
             FROM kr_real_estate_monthly_summary
             WHERE {where_sql}
             ORDER BY stat_ym DESC, lawd_cd ASC
             LIMIT %s OFFSET %s
-        """
-
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+            """
         cursor.execute(count_query, tuple(params))
         count_row = cursor.fetchone() or {"total": 0}
         total = int(count_row.get("total", 0))
@@ -510,6 +655,8 @@ def execute_real_estate_query(
     limit: int,
     offset: int,
     include_metadata: bool,
+    cursor: Optional[str] = None,
+    count_mode: str = "exact",
 ) -> RealEstateQueryResponse:
     _validate_ym_range(start_ym, end_ym)
     lawd_codes = _parse_lawd_codes(lawd_codes_csv)
@@ -518,7 +665,7 @@ def execute_real_estate_query(
     normalized_transaction_type = (transaction_type or DEFAULT_TRANSACTION_TYPE).strip().lower()
 
     if view == "detail":
-        rows, total = fetch_rdb_transactions(
+        rows, total, page_meta = fetch_rdb_transactions(
             start_ym=start_ym,
             end_ym=end_ym,
             property_type=normalized_property_type,
@@ -527,6 +674,8 @@ def execute_real_estate_query(
             limit=limit,
             offset=offset,
             include_metadata=include_metadata,
+            cursor=cursor,
+            count_mode=count_mode,
         )
         return RealEstateQueryResponse(
             view=view,
@@ -540,6 +689,8 @@ def execute_real_estate_query(
             offset=offset,
             total=total,
             rows=rows,
+            next_cursor=page_meta.get("next_cursor"),
+            meta=page_meta,
         )
 
     aggregate_by_region = view == "region"
@@ -584,6 +735,11 @@ async def query_real_estate(
     limit: int = Query(default=500, ge=1, le=5000),
     offset: int = Query(default=0, ge=0),
     include_metadata: bool = Query(default=False, description="view=detail일 때 metadata_json 포함"),
+    cursor: Optional[str] = Query(default=None, description="view=detail keyset cursor (이전 응답의 next_cursor, offset 무시)"),
+    count_mode: Literal["exact", "approximate"] = Query(
+        default="exact",
+        description="view=detail total 계산 방식 (approximate=옵티마이저 추정치)",
+    ),
 ):
     try:
         return execute_real_estate_query(
@@ -596,6 +752,8 @@ async def query_real_estate(
             limit=limit,
             offset=offset,
             include_metadata=include_metadata,
+            cursor=cursor,
+            count_mode=count_mode,
         )
     except ValueError as err:
         raise HTTPException(status_code=400, detail=str(err)) from err
@@ -616,6 +774,8 @@ async def query_real_estate_detail(
     limit: int = Query(default=200, ge=1, le=2000),
     offset: int = Query(default=0, ge=0),
     include_metadata: bool = Query(default=False, description="metadata_json 포함"),
+    cursor: Optional[str] = Query(default=None, description="keyset cursor (이전 응답의 next_cursor, offset 무시)"),
+    count_mode: Literal["exact", "approximate"] = Query(default="exact", description="total 계산 방식"),
 ):
     return await query_real_estate(
         view="detail",
@@ -627,6 +787,8 @@ async def query_real_estate_detail(
         limit=limit,
         offset=offset,
         include_metadata=include_metadata,
+        cursor=cursor,
+        count_mode=count_mode,
     )
 
 
@@ -650,6 +812,8 @@ async def query_real_estate_monthly(
         limit=limit,
         offset=offset,
         include_metadata=False,
+        cursor=None,
+        count_mode="exact",
     )
 
 
@@ -673,4 +837,6 @@ async def query_real_estate_regions(
         limit=limit,
         offset=offset,
         include_metadata=False,
+        cursor=None,
+        count_mode="exact",
     )
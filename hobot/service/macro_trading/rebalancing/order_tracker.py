@@ -0,0 +1,313 @@
+"""
+Order lifecycle tracking for rebalancing execution.
+
+- Orders of a phase are submitted concurrently; the KIS transport's per-app-key
+  token bucket keeps the burst within the broker TPS limit.
+- Each placed order is followed through the order-inquiry endpoint. A poll that sees
+  new fills resets that order's interval; otherwise the interval backs off geometrically.
+- CashLedger turns actual sell fills into buying power so buys can be released as soon
+  as the proceeds exist, instead of after a fixed-interval balance poll.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+
+from service.utils.env import env_float
+
+logger = logging.getLogger("rebalancing")
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_FILL_TIMEOUT_SEC = 60.0
+DEFAULT_POLL_INITIAL_SEC = 0.5
+DEFAULT_POLL_MAX_SEC = 4.0
+DEFAULT_POLL_BACKOFF = 1.6
+
+# "untrackable": accepted by the broker but no order number came back, so fills cannot be
+# attributed. Terminal (never polled) and, unlike "failed", its buying power is not refunded.
+TERMINAL_STATUSES = {"filled", "failed", "cancelled", "timeout", "skipped", "untrackable"}
+
+
+class OrderGateway(Protocol):
+    """Minimal broker surface the tracker needs (KIS or simulated)."""
+
+    def place_order(self, side: str, ticker: str, quantity: int, price: int) -> Dict[str, Any]:
+        ...
+
+    def inquire_order(self, order_no: str, ticker: str, side: str) -> Optional[Dict[str, Any]]:
+        """Returns {'filled_qty', 'filled_amount', 'remaining_qty', 'cancelled'} or None if unknown yet."""
+        ...
+
+    def get_cash_balance(self) -> Optional[float]:
+        """Settled cash available for buys, or None when the account cannot be read."""
+        ...
+
+
+@dataclass
+class TrackedOrder:
+    side: str
+    ticker: str
+    quantity: int
+    limit_price: int
+    order_no: Optional[str] = None
+    status: str = "pending"
+    filled_qty: int = 0
+    filled_amount: float = 0.0
+    response: Dict[str, Any] = field(default_factory=dict)
+    polls: int = 0
+    poll_interval: float = 0.0
+    next_poll_at: float = 0.0
+    submitted_at: Optional[float] = None
+    completed_at: Optional[float] = None
+
+    @property
+    def remaining_qty(self) -> int:
+        return max(int(self.quantity) - int(self.filled_qty), 0)
+
+    @property
+    def notional(self) -> float:
+        return float(self.quantity) * float(self.limit_price)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_result(self) -> Dict[str, Any]:
+        result = {
+            "ticker": self.ticker,
+            "status": self.status,
+            "response": self.response,
+            "order_no": self.order_no,
+            "quantity": self.quantity,
+            "filled_qty": self.filled_qty,
+            "limit_price": self.limit_price,
+        }
+        if self.filled_qty:
+            result["avg_fill_price"] = round(self.filled_amount / self.filled_qty, 4)
+        if self.submitted_at is not None and self.completed_at is not None:
+            result["fill_latency_sec"] = round(self.completed_at - self.submitted_at, 3)
+        return result
+
+
+class CashLedger:
+    """Buying power = starting cash + filled sell proceeds (after haircut) - committed buys."""
+
+    def __init__(self, available: float, proceeds_haircut: float = 0.0):
+        self._available = float(available or 0)
+        self.proceeds_haircut = min(max(float(proceeds_haircut), 0.0), 1.0)
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            return self._available
+
+    def credit_fill(self, amount: float) -> None:
+        with self._lock:
+            self._available += float(amount) * (1.0 - self.proceeds_haircut)
+
+    def refund(self, amount: float) -> None:
+        with self._lock:
+            self._available += float(amount)
+
+    def try_commit(self, amount: float) -> bool:
+        with self._lock:
+            if float(amount) > self._available:
+                return False
+            self._available -= float(amount)
+            return True
+
+
+class OrderLifecycleTracker:
+    def __init__(
+        self,
+        gateway: OrderGateway,
+        *,
+        max_workers: Optional[int] = None,
+        timeout_sec: Optional[float] = None,
+        poll_initial_sec: Optional[float] = None,
+        poll_max_sec: Optional[float] = None,
+        poll_backoff: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.gateway = gateway
+        self.max_workers = max(int(max_workers or env_float("REBALANCING_ORDER_MAX_WORKERS", DEFAULT_MAX_WORKERS)), 1)
+        self.timeout_sec = float(timeout_sec if timeout_sec is not None else env_float("REBALANCING_FILL_TIMEOUT_SEC", DEFAULT_FILL_TIMEOUT_SEC))
+        self.poll_initial_sec = float(poll_initial_sec if poll_initial_sec is not None else env_float("REBALANCING_FILL_POLL_INITIAL_SEC", DEFAULT_POLL_INITIAL_SEC))
+        self.poll_max_sec = max(float(poll_max_sec if poll_max_sec is not None else env_float("REBALANCING_FILL_POLL_MAX_SEC", DEFAULT_POLL_MAX_SEC)), self.poll_initial_sec)
+        self.poll_backoff = max(float(poll_backoff if poll_backoff is not None else env_float("REBALANCING_FILL_POLL_BACKOFF", DEFAULT_POLL_BACKOFF)), 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="order-tracker")
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # submission
+    # ------------------------------------------------------------------
+    def submit(self, orders: Iterable[TrackedOrder]) -> List[TrackedOrder]:
+        """Place orders concurrently; returns the same objects with status placed/failed."""
+        batch = [order for order in orders if order.status == "pending"]
+        for _ in self._pool.map(self._place, batch):
+            pass
+        return batch
+
+    def _place(self, order: TrackedOrder) -> None:
+        logger.info(f"Placing {order.side.upper()} Limit Order: {order.ticker}, Qty: {order.quantity}, Price: {order.limit_price}")
+        try:
+            resp = self.gateway.place_order(order.side, order.ticker, order.quantity, order.limit_price) or {}
+        except Exception as e:
+            resp = {"rt_cd": "1", "msg1": str(e)}
+        order.response = resp
+        order.submitted_at = self._clock()
+        if resp.get("rt_cd") != "0":
+            logger.error(f"{order.side.capitalize()} Order Failed for {order.ticker}: {resp.get('msg1')}")
+            order.status = "failed"
+            order.completed_at = order.submitted_at
+            return
+        output = resp.get("output") or {}
+        order.order_no = str(output.get("ODNO") or output.get("odno") or "").strip() or None
+        if order.order_no is None:
+            logger.error(f"{order.side.capitalize()} Order accepted without order number: {order.ticker}; fills cannot be tracked")
+            order.status = "untrackable"
+            order.completed_at = order.submitted_at
+            return
+        order.status = "placed"
+        order.poll_interval = self.poll_initial_sec
+        order.next_poll_at = order.submitted_at + self.poll_initial_sec
+        logger.info(f"{order.side.capitalize()} Order Placed: {order.ticker} (order_no={order.order_no})")
+
+    # ------------------------------------------------------------------
+    # fill tracking
+    # ------------------------------------------------------------------
+    def wait_for_fills(
+        self,
+        orders: List[TrackedOrder],
+        on_fill: Optional[Callable[[TrackedOrder, int, float], None]] = None,
+    ) -> bool:
+        """
+        Poll open orders until every order is terminal or the timeout expires.
+
+        on_fill(order, new_qty, new_amount) is called from this thread for every observed
+        fill increment. Returns True when all orders ended filled.
+        """
+        deadline = self._clock() + self.timeout_sec
+        while True:
+            open_orders = [order for order in orders if not order.is_terminal]
+            if not open_orders:
+                break
+            now = self._clock()
+            if now >= deadline:
+                for order in open_orders:
+                    logger.warning(f"{order.side.capitalize()} Order Timeout: {order.ticker} (filled {order.filled_qty}/{order.quantity})")
+                    order.status = "timeout"
+                break
+
+            due = [order for order in open_orders if order.next_poll_at <= now]
+            if not due:
+                next_at = min(order.next_poll_at for order in open_orders)
+                self._sleep(max(min(next_at, deadline) - now, 0.0))
+                continue
+
+            for order, increment in zip(due, self._pool.map(self._poll, due)):
+                if increment and on_fill is not None:
+                    on_fill(order, increment[0], increment[1])
+
+        return all(order.status == "filled" for order in orders)
+
+    def _poll(self, order: TrackedOrder):
+        if not order.order_no:
+            # An empty order number would match any same-day order of the ticker.
+            order.status = "untrackable"
+            order.completed_at = self._clock()
+            return None
+        order.polls += 1
+        try:
+            state = self.gateway.inquire_order(order.order_no, order.ticker, order.side)
+        except Exception as e:
+            logger.warning(f"Order inquiry failed for {order.ticker}: {e}")
+            state = None
+
+        now = self._clock()
+        increment = None
+        if state:
+            filled_qty = min(int(state.get("filled_qty") or 0), int(order.quantity))
+            filled_amount = float(state.get("filled_amount") or 0.0)
+            if filled_qty > order.filled_qty:
+                increment = (filled_qty - order.filled_qty, max(filled_amount - order.filled_amount, 0.0))
+                order.filled_qty = filled_qty
+                order.filled_amount = filled_amount
+            if order.filled_qty >= order.quantity:
+                order.status = "filled"
+                order.completed_at = now
+                logger.info(f"{order.side.capitalize()} Order Filled: {order.ticker} ({order.filled_qty}/{order.quantity})")
+                return increment
+            if state.get("cancelled"):
+                order.status = "cancelled"
+                order.completed_at = now
+                return increment
+            if order.filled_qty:
+                order.status = "partially_filled"
+
+        # Activity resets the cadence; silence backs off.
+        if increment:
+            order.poll_interval = self.poll_initial_sec
+        else:
+            order.poll_interval = min(order.poll_interval * self.poll_backoff, self.poll_max_sec)
+        order.next_poll_at = now + order.poll_interval
+        return increment
+
+
+class KISOrderGateway:
+    """OrderGateway over KISAPI limit orders and the daily order-execution inquiry."""
+
+    def __init__(self, api: Any, user_id: Optional[str] = None):
+        self.api = api
+        self.user_id = user_id
+
+    def get_cash_balance(self) -> Optional[float]:
+        from service.macro_trading.kis.kis import get_balance_info_api
+
+        balance = get_balance_info_api(self.user_id)
+        if not balance or balance.get("status") != "success":
+            logger.error(f"Failed to fetch initial balance: {(balance or {}).get('message')}")
+            return None
+        return float(balance.get("cash_balance") or 0)
+
+    def place_order(self, side: str, ticker: str, quantity: int, price: int) -> Dict[str, Any]:
+        if side == "sell":
+            return self.api.sell_limit_order(ticker, quantity, price)
+        return self.api.buy_limit_order(ticker, quantity, price)
+
+    def inquire_order(self, order_no: str, ticker: str, side: str) -> Optional[Dict[str, Any]]:
+        if not order_no:
+            return None
+        resp = self.api.get_order_executions(
+            order_no=order_no,
+            ticker=ticker,
+            side_code="01" if side == "sell" else "02",
+        )
+        if not resp or resp.get("rt_cd") != "0":
+            return None
+        rows = resp.get("output1") or []
+        for row in rows:
+            if str(row.get("odno") or "").lstrip("0") != str(order_no).lstrip("0"):
+                continue
+            filled_qty = int(float(row.get("tot_ccld_qty") or 0))
+            return {
+                "filled_qty": filled_qty,
+                "filled_amount": float(row.get("tot_ccld_amt") or 0) or filled_qty * float(row.get("avg_prvs") or 0),
+                "remaining_qty": int(float(row.get("rmn_qty") or 0)),
+                "cancelled": str(row.get("cncl_yn") or "").upper() == "Y" or int(float(row.get("rjct_qty") or 0)) > 0,
+            }
+        return None
@@ -1,6 +1,10 @@
+import itertools
 import logging
+import random
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
 from service.macro_trading.kis.kis import get_balance_info_api
@@ -77,3 +81,90 @@ class PaperTradingBrokerAdapter:
             microsecond=0,
         )
         return market_open <= eastern_now <= market_close
+
+
+class SimulatedOrderGateway:
+    """
+    Offline OrderGateway stand-in for OrderLifecycleTracker.
+
+    fill_plan maps ticker -> [(seconds_after_placement, qty), ...] cumulative fill steps.
+    Tickers without a plan fill completely after default_fill_latency_sec, or in a few
+    seeded random partial steps when random_partial_fills is set.
+    """
+
+    def __init__(
+        self,
+        cash_balance: Optional[float] = 0.0,
+        fill_plan: Optional[Dict[str, Sequence[Tuple[float, int]]]] = None,
+        default_fill_latency_sec: float = 1.0,
+        submit_latency_sec: float = 0.0,
+        reject_tickers: Iterable[str] = (),
+        random_partial_fills: bool = False,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.cash_balance = cash_balance
+        self.fill_plan = {ticker: list(steps) for ticker, steps in (fill_plan or {}).items()}
+        self.default_fill_latency_sec = float(default_fill_latency_sec)
+        self.submit_latency_sec = float(submit_latency_sec)
+        self.reject_tickers = set(reject_tickers)
+        self.random_partial_fills = random_partial_fills
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._order_seq = itertools.count(1)
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.placed: List[Tuple[str, str, int, int]] = []
+        self.inquiries = 0
+
+    def get_cash_balance(self) -> Optional[float]:
+        return self.cash_balance
+
+    def _schedule(self, ticker: str, quantity: int) -> List[Tuple[float, int]]:
+        if ticker in self.fill_plan:
+            return self.fill_plan[ticker]
+        if not self.random_partial_fills or quantity <= 1:
+            return [(self.default_fill_latency_sec, quantity)]
+        cuts = sorted(self._rng.sample(range(1, quantity), min(2, quantity - 1)))
+        delays = sorted(self._rng.uniform(0.1, self.default_fill_latency_sec * 2) for _ in cuts)
+        steps = [(delay, cut) for delay, cut in zip(delays, cuts)]
+        steps.append((delays[-1] + self._rng.uniform(0.1, self.default_fill_latency_sec), quantity))
+        return steps
+
+    def place_order(self, side: str, ticker: str, quantity: int, price: int) -> Dict[str, Any]:
+        if self.submit_latency_sec:
+            self._sleep(self.submit_latency_sec)
+        with self._lock:
+            self.placed.append((side, ticker, int(quantity), int(price)))
+            if ticker in self.reject_tickers:
+                return {"rt_cd": "1", "msg1": f"simulated rejection for {ticker}"}
+            order_no = f"{next(self._order_seq):010d}"
+            self.orders[order_no] = {
+                "side": side,
+                "ticker": ticker,
+                "quantity": int(quantity),
+                "price": int(price),
+                "placed_at": self._clock(),
+                "steps": self._schedule(ticker, int(quantity)),
+            }
+        return {"rt_cd": "0", "msg1": "simulated order accepted", "output": {"ODNO": order_no}}
+
+    def inquire_order(self, order_no: str, ticker: str, side: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self.inquiries += 1
+            order = self.orders.get(order_no)
+            if order is None:
+                return None
+            elapsed = self._clock() - order["placed_at"]
+            filled_qty = 0
+            for delay, cumulative_qty in order["steps"]:
+                if elapsed >= delay:
+                    filled_qty = max(filled_qty, min(int(cumulative_qty), order["quantity"]))
+            return {
+                "filled_qty": filled_qty,
+                "filled_amount": float(filled_qty * order["price"]),
+                "remaining_qty": order["quantity"] - filled_qty,
+                "cancelled": False,
+            }
@@ -1,10 +1,9 @@
 import logging
-import time
 from datetime import date, datetime
 from typing import Any, Dict, Optional, Tuple
 
 from service.core.time_provider import TimeProvider
-from service.macro_trading.kis.kis_api import KISAPI
+from service.macro_trading.kis.kis_api import get_kis_client
 from service.macro_trading.kis.user_credentials import get_user_kis_credentials
 from service.macro_trading.rebalancing.asset_retriever import get_current_portfolio_state
 from service.macro_trading.rebalancing.config_retriever import get_rebalancing_config
@@ -138,7 +137,7 @@ async def execute_rebalancing_for_user(
     if not user_cred:
         return {"status": "error", "message": "User credentials not found"}
 
-    kis = KISAPI(
+    kis = get_kis_client(
         user_cred["app_key"],
         user_cred["app_secret"],
         user_cred["account_no"],
@@ -153,7 +152,6 @@ async def execute_rebalancing_for_user(
             current_prices[ticker] = price
         else:
             logger.warning("Failed to fetch price for %s", ticker)
-        time.sleep(0.5)
 
     missing_tickers = [ticker for ticker in relevant_tickers if ticker not in current_prices]
     if missing_tickers:
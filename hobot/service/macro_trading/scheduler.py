@@ -70,6 +70,14 @@ from service.macro_trading.collectors.corporate_event_collector import (
     get_corporate_event_collector,
 )
 from service.macro_trading.config.config_loader import get_config
+from service.macro_trading.job_runner import (
+    JOB_PRIORITY_BACKFILL,
+    JOB_PRIORITY_COLLECTION,
+    JOB_PRIORITY_GRAPH,
+    JOB_PRIORITY_TRADING,
+    JobSpec,
+    SchedulerJobRunner,
+)
 from service.macro_trading.ai_strategist import run_ai_analysis
 from service.macro_trading.account_service import save_daily_account_snapshot
 from service.graph.scheduler import (
@@ -2826,9 +2834,13 @@ def collect_kr_real_estate_data(
     max_pages: int = 100,
     progress_file: Optional[str] = None,
     progress_log_interval: int = 100,
+    max_workers: Optional[int] = None,
+    run_key: Optional[str] = None,
+    resume: bool = True,
 ) -> Dict[str, Any]:
     """
     KR 아파트 실거래(MOLIT) 수집/적재를 수행합니다.
+    같은 run_key(기본: 범위+수집일)로 재시도되면 MySQL 체크포인트에서 이어서 수집합니다.
 
     기본 범위:
     - 서울 전 지역
@@ -2862,6 +2874,9 @@ def collect_kr_real_estate_data(
         max_pages=max_pages,
         progress_file=progress_file,
         progress_log_interval=progress_log_interval,
+        max_workers=max_workers,
+        run_key=run_key,
+        resume=resume,
     )
     logger.info("KR 부동산 수집 완료: %s", result)
     return result
@@ -2873,9 +2888,11 @@ def aggregate_kr_real_estate_monthly_summary(
     end_ym: str,
     property_type: str = "apartment",
     transaction_type: str = "sale",
+    rebuild: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """
     KR 실거래 row를 월×지역(5자리 LAWD_CD) 요약으로 집계합니다.
+    적재 시 기록된 dirty 셀만 재계산하며, rebuild(기본: KR_REAL_ESTATE_SUMMARY_REBUILD)면 기간 전체를 다시 계산합니다.
     """
     collector = get_kr_real_estate_collector()
     logger.info("=" * 60)
@@ -2887,11 +2904,14 @@ def aggregate_kr_real_estate_monthly_summary(
         transaction_type,
     )
     logger.info("=" * 60)
+    if rebuild is None:
+        rebuild = _truthy_env(os.getenv("KR_REAL_ESTATE_SUMMARY_REBUILD", "0"), default=False)
     result = collector.aggregate_monthly_region_summary(
         start_ym=start_ym,
         end_ym=end_ym,
         property_type=property_type,
         transaction_type=transaction_type,
+        rebuild=rebuild,
     )
     logger.info("KR 부동산 월별 집계 완료: %s", result)
     return result
@@ -3256,13 +3276,76 @@ def collect_kr_housing_policy_documents():
         raise
 
 
-def run_threaded(job_func):
+# 스케줄 작업 실행 정책 (작업 함수 이름 기준, 미등록 작업은 수집 우선순위/중복 실행 건너뜀 기본값)
+# depends_on은 겹침 방지 제약이다: 선행 작업이 대기/실행 중이면 기다리지만, 선행 작업의 성공은 확인하지 않는다.
+SCHEDULER_JOB_SPECS = (
+    JobSpec("run_ai_strategy_analysis", priority=JOB_PRIORITY_TRADING, depends_on=("collect_all_fred_data", "collect_recent_news")),
+    JobSpec("save_daily_account_snapshot", priority=JOB_PRIORITY_TRADING),
+    JobSpec("collect_all_fred_data", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("collect_recent_news", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("collect_policy_documents", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("collect_kr_housing_policy_documents", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("run_kr_macro_collection_from_env", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("run_kr_top50_earnings_hotpath_from_env", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("run_us_top50_earnings_hotpath_from_env", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("run_us_top50_financials_hotpath_from_env", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("run_kr_top50_ohlcv_hotpath_from_env", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec("run_us_top50_ohlcv_hotpath_from_env", priority=JOB_PRIORITY_COLLECTION),
+    JobSpec(
+        "run_graph_news_extraction_sync",
+        priority=JOB_PRIORITY_GRAPH,
+        depends_on=("collect_recent_news", "collect_policy_documents", "collect_kr_housing_policy_documents"),
+    ),
+    JobSpec(
+        "sync_tier1_corporate_events_from_env",
+        priority=JOB_PRIORITY_GRAPH,
+        depends_on=("run_kr_top50_earnings_hotpath_from_env", "run_us_top50_earnings_hotpath_from_env"),
+    ),
+    JobSpec("sync_uskr_tier_state_from_env", priority=JOB_PRIORITY_GRAPH),
+    JobSpec(
+        "sync_uskr_corporate_entity_registry_from_env",
+        priority=JOB_PRIORITY_GRAPH,
+        depends_on=("sync_uskr_tier_state_from_env",),
+    ),
+    JobSpec("run_kr_real_estate_pipeline_from_env", priority=JOB_PRIORITY_BACKFILL),
+    JobSpec("run_phase_c_weekly_batch", priority=JOB_PRIORITY_BACKFILL, depends_on=("run_graph_news_extraction_sync",)),
+    JobSpec("run_graph_rag_phase5_regression", priority=JOB_PRIORITY_BACKFILL),
+    JobSpec(
+        "run_graph_rag_phase5_weekly_report",
+        priority=JOB_PRIORITY_BACKFILL,
+        depends_on=("run_graph_rag_phase5_regression",),
+    ),
+    JobSpec("run_us_top50_monthly_snapshot_job_from_env", priority=JOB_PRIORITY_BACKFILL),
+    JobSpec("run_kr_top50_monthly_snapshot_job_from_env", priority=JOB_PRIORITY_BACKFILL),
+    JobSpec("validate_kr_top50_corp_code_mapping_from_env", priority=JOB_PRIORITY_BACKFILL),
+    JobSpec("validate_kr_dart_disclosure_dplus1_sla_from_env", priority=JOB_PRIORITY_BACKFILL),
+    JobSpec("run_extraction_cache_cleanup", priority=JOB_PRIORITY_BACKFILL),
+)
+
+_job_runner: Optional[SchedulerJobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_scheduler_job_runner() -> SchedulerJobRunner:
+    """스케줄러 작업 실행기 싱글톤 (SCHEDULER_JOB_WORKERS 기본 4, 그중 SCHEDULER_TRADING_RESERVED_WORKERS 기본 1은 트레이딩 전용)"""
+    global _job_runner
+    if _job_runner is None:
+        with _job_runner_lock:
+            if _job_runner is None:
+                runner = SchedulerJobRunner(report_fn=_record_collection_run_report)
+                for spec in SCHEDULER_JOB_SPECS:
+                    runner.register(spec)
+                _job_runner = runner
+    return _job_runner
+
+
+def run_threaded(job_func, *args, **kwargs):
     """
-    작업을 별도 스레드에서 실행하는 래퍼 함수
-    스케줄러의 블로킹을 방지합니다.
+    작업을 스케줄러 워커 풀에 제출하는 래퍼 함수
+    스케줄러의 블로킹을 방지하고, 작업별 중복 실행/우선순위/선행 작업 정책을 적용합니다.
     """
-    job_thread = threading.Thread(target=job_func)
-    job_thread.start()
+    job_name = getattr(job_func, "__name__", str(job_func))
+    return get_scheduler_job_runner().submit(job_name, job_func, *args, **kwargs)
 
 
 def setup_fred_scheduler():
@@ -3321,7 +3404,9 @@ def run_scheduler():
     while True:
         try:
             schedule.run_pending()
-            time.sleep(60)  # 1분마다 체크
+            # 다음 예정 작업까지 대기 (최대 60초, 최소 1초)
+            idle_seconds = schedule.idle_seconds()
+            time.sleep(60 if idle_seconds is None else min(max(idle_seconds, 1), 60))
         except Exception as e:
             logger.error(f"스케줄러 실행 중 오류: {e}", exc_info=True)
             time.sleep(60)
@@ -0,0 +1,371 @@
+"""
+FRED 시계열 인메모리 저장소
+
+- fred_data를 지표별 (날짜 datetime64, 값 float64) 배열로 프로세스 내에 보관한다.
+- 최초 조회 시 요청 지표 + 사전 등록(preload) 지표를 한 번의 벌크 쿼리로 적재한다.
+- 이후에는 (변경 시각, id) 워터마크 이후에 신규/정정된 행만 주기적으로 병합한다.
+  KR 수집기는 ON DUPLICATE KEY UPDATE로 기존 날짜 값을 정정하므로 id가 아니라
+  fred_data.updated_at(없으면 created_at)을 변경 시각으로 쓴다. 같은 초에 늦게 커밋되는 행을
+  놓치지 않도록 DB 시각 기준 2초 이전까지만 읽는다 (IndicatorLoader 증분 동기화와 같은 규칙).
+- DB 조회는 저장소 lock 밖에서 수행하고, 결과 병합만 lock 안에서 한다.
+- get_latest_data()는 FREDCollector.get_latest_data와 같은 시그니처/반환 형식(pd.Series)을 유지하며,
+  내부 배열의 슬라이스(view)를 감싸 복사 없이 반환한다. (배열은 읽기 전용)
+"""
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from service.macro_trading.collectors.fred_collector import DataInsufficientError, FREDAPIError, get_fred_collector
+from service.utils.env import env_flag, safe_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SEC = 60
+DEFAULT_FULL_RELOAD_SEC = 6 * 60 * 60
+DEFAULT_HISTORY_DAYS = 800
+DEFAULT_DELTA_BATCH_ROWS = 50000
+# 같은 초에 늦게 커밋되는 행을 놓치지 않도록 DB 시각 기준 이 시간 이전까지만 델타로 읽는다.
+DELTA_SAFETY_LAG_SEC = 2
+
+_SeriesArrays = Tuple[np.ndarray, np.ndarray]
+# (변경 시각, id) keyset 워터마크
+_Watermark = Tuple[datetime, int]
+
+
+def _default_connection():
+    from service.database.db import get_db_connection
+
+    return get_db_connection()
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+def _merge_arrays(base: Optional[_SeriesArrays], dates: np.ndarray, values: np.ndarray) -> _SeriesArrays:
+    """날짜 기준 정렬/중복 제거(나중 값 우선) 후 읽기 전용 배열로 만든다."""
+    if base is not None and len(base[0]):
+        dates = np.concatenate([base[0], dates])
+        values = np.concatenate([base[1], values])
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    values = values[order]
+    if len(dates) > 1:
+        keep = np.ones(len(dates), dtype=bool)
+        keep[:-1] = dates[1:] != dates[:-1]
+        dates = dates[keep]
+        values = values[keep]
+    return _readonly(np.ascontiguousarray(dates)), _readonly(np.ascontiguousarray(values, dtype=np.float64))
+
+
+class FredSeriesStore:
+    """프로세스 공용 FRED 시계열 저장소"""
+
+    def __init__(
+        self,
+        *,
+        refresh_sec: Optional[int] = None,
+        full_reload_sec: Optional[int] = None,
+        history_days: Optional[int] = None,
+        preload_codes: Optional[Iterable[str]] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if refresh_sec is None:
+            refresh_sec = safe_int(os.getenv("FRED_SERIES_STORE_REFRESH_SEC"), DEFAULT_REFRESH_SEC)
+        if full_reload_sec is None:
+            full_reload_sec = safe_int(os.getenv("FRED_SERIES_STORE_FULL_RELOAD_SEC"), DEFAULT_FULL_RELOAD_SEC)
+        if history_days is None:
+            history_days = safe_int(os.getenv("FRED_SERIES_STORE_HISTORY_DAYS"), DEFAULT_HISTORY_DAYS)
+        self.refresh_sec = max(int(refresh_sec), 0)
+        self.full_reload_sec = max(int(full_reload_sec), 0)
+        self.history_days = max(int(history_days), 1)
+        self.delta_batch_rows = max(safe_int(os.getenv("FRED_SERIES_STORE_DELTA_BATCH_ROWS"), DEFAULT_DELTA_BATCH_ROWS), 1)
+        self._connection_factory = connection_factory or _default_connection
+
+        # _lock: 메모리 상태 보호 (짧게만 잡음), _load_lock: DB 적재를 한 번에 하나만 수행
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._series: Dict[str, _SeriesArrays] = {}
+        self._loaded_since: Dict[str, date] = {}
+        self._preload_codes: Set[str] = {str(code) for code in (preload_codes or [])}
+        self._watermark: Optional[_Watermark] = None
+        self._change_column: Optional[str] = None
+        self._checked_at = 0.0
+        self._cycle_started_at = 0.0
+        self._stats = {"bulk_loads": 0, "delta_refreshes": 0, "delta_rows": 0, "reads": 0}
+
+    def register_codes(self, codes: Iterable[str]) -> None:
+        """다음 벌크 적재 때 함께 읽을 지표 코드를 등록한다."""
+        with self._lock:
+            self._preload_codes.update(str(code) for code in codes if code)
+
+    def get_latest_data(
+        self,
+        indicator_code: str,
+        days: int = 30,
+        min_data_points: Optional[int] = None,
+    ) -> pd.Series:
+        """FREDCollector.get_latest_data와 동일한 의미의 최근 N일 시계열 (DB 대신 메모리)"""
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
+        try:
+            arrays = self._get_arrays(indicator_code, start_date)
+        except Exception as e:
+            logger.error(f"{indicator_code} 시계열 저장소 조회 실패: {e}")
+            raise FREDAPIError(f"데이터 조회 실패: {e}") from e
+
+        series = self._slice(arrays, start_date, end_date)
+        if len(series) == 0:
+            if min_data_points is not None and min_data_points > 0:
+                raise DataInsufficientError(
+                    f"{indicator_code}: 요청한 기간({days}일) 동안 데이터가 없습니다."
+                )
+            return pd.Series(dtype=float)
+        if min_data_points is not None and len(series) < min_data_points:
+            raise DataInsufficientError(
+                f"{indicator_code}: 데이터가 부족합니다. "
+                f"요청: {min_data_points}개, 실제: {len(series)}개"
+            )
+        return series
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._loaded_since.clear()
+            self._watermark = None
+            self._checked_at = 0.0
+            self._cycle_started_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            watermark = self._watermark
+            return {
+                **self._stats,
+                "indicators": len(self._series),
+                "points": int(sum(len(dates) for dates, _ in self._series.values())),
+                "change_column": self._change_column,
+                "watermark_ts": watermark[0].isoformat() if watermark else None,
+                "watermark_id": watermark[1] if watermark else 0,
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _slice(arrays: Optional[_SeriesArrays], start_date: date, end_date: date) -> pd.Series:
+        if arrays is None or not len(arrays[0]):
+            return pd.Series(dtype=float)
+        dates, values = arrays
+        lo = int(np.searchsorted(dates, np.datetime64(start_date, "ns"), side="left"))
+        hi = int(np.searchsorted(dates, np.datetime64(end_date, "ns"), side="right"))
+        index = pd.DatetimeIndex(dates[lo:hi], name="date", copy=False)
+        return pd.Series(values[lo:hi], index=index, name="value", copy=False)
+
+    def _pending_action(self, code: str, start_date: date) -> Optional[str]:
+        """lock 보유 상태에서 호출. "full" | "bulk" | "delta" | None"""
+        now = time.monotonic()
+        # 삭제 등 델타로 따라잡을 수 없는 변경을 위해 주기적으로 전체 재적재한다.
+        if self._series and self.full_reload_sec and now - self._cycle_started_at >= self.full_reload_sec:
+            return "full"
+        loaded_since = self._loaded_since.get(code)
+        if loaded_since is None or loaded_since > start_date:
+            return "bulk"
+        if now - self._checked_at >= self.refresh_sec:
+            return "delta"
+        return None
+
+    def _get_arrays(self, indicator_code: str, start_date: date) -> Optional[_SeriesArrays]:
+        code = str(indicator_code)
+        with self._lock:
+            self._stats["reads"] += 1
+            action = self._pending_action(code, start_date)
+            if action is None:
+                return self._series.get(code)
+
+        if action == "delta":
+            # 다른 스레드가 적재 중이면 델타 갱신은 기다리지 않고 현재 배열을 반환한다.
+            if not self._load_lock.acquire(blocking=False):
+                with self._lock:
+                    return self._series.get(code)
+        else:
+            self._load_lock.acquire()
+        try:
+            with self._lock:
+                action = self._pending_action(code, start_date)
+                history_since = date.today() - timedelta(days=self.history_days)
+                if action == "full":
+                    codes = set(self._loaded_since) | set(self._preload_codes) | {code}
+                    since = min([start_date, history_since, *self._loaded_since.values()])
+                elif action == "bulk":
+                    codes = {code} | {other for other in self._preload_codes if other not in self._loaded_since}
+                    since = min(start_date, history_since)
+            if action in ("full", "bulk"):
+                self._bulk_load(sorted(codes), since, replace_all=action == "full")
+            elif action == "delta":
+                self._refresh_delta()
+        finally:
+            self._load_lock.release()
+
+        with self._lock:
+            return self._series.get(code)
+
+    def _resolve_change_column(self, cursor) -> str:
+        if self._change_column is None:
+            cursor.execute(
+                """
+                SELECT COLUMN_NAME
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = 'fred_data'
+                  AND COLUMN_NAME IN ('updated_at', 'created_at')
+                """
+            )
+            columns = {str(row.get("COLUMN_NAME")) for row in cursor.fetchall() or []}
+            if "updated_at" not in columns:
+                logger.warning("fred_data.updated_at 없음: created_at 기준 델타 (정정 값은 전체 재적재 때 반영)")
+            self._change_column = "updated_at" if "updated_at" in columns else "created_at"
+        return self._change_column
+
+    def _bulk_load(self, codes: List[str], since: date, replace_all: bool = False) -> None:
+        """_load_lock 보유 상태에서 호출. DB 조회는 self._lock 밖에서 한다."""
+        started_at = time.monotonic()
+        placeholders = ", ".join(["%s"] * len(codes))
+        with self._connection_factory() as conn:
+            cursor = conn.cursor()
+            self._resolve_change_column(cursor)
+            # 벌크 조회 전에 잡은 상한: 이 시각 이후 변경은 다음 델타에서 다시 읽는다 (중복 병합은 무해).
+            cursor.execute(f"SELECT NOW() - INTERVAL {DELTA_SAFETY_LAG_SEC} SECOND AS cap")
+            cap = (cursor.fetchone() or {}).get("cap")
+            cursor.execute(
+                f"""
+                SELECT indicator_code, date, value
+                FROM fred_data
+                WHERE indicator_code IN ({placeholders})
+                AND date >= %s
+                ORDER BY indicator_code ASC, date ASC
+                """,
+                (*codes, since),
+            )
+            rows = cursor.fetchall() or []
+
+        grouped = self._group_rows(rows)
+        with self._lock:
+            if replace_all or not self._series:
+                self._cycle_started_at = started_at
+            if replace_all:
+                self._series.clear()
+                self._loaded_since.clear()
+            for code in codes:
+                dates, values = grouped.get(code, (np.empty(0, dtype="datetime64[ns]"), np.empty(0, dtype=np.float64)))
+                self._series[code] = _merge_arrays(None, dates, values)
+                self._loaded_since[code] = since
+            catch_up = self._watermark is not None and not replace_all
+            if not catch_up and cap is not None:
+                self._watermark = (cap, 0)
+            self._checked_at = time.monotonic()
+            self._stats["bulk_loads"] += 1
+
+        # 이미 적재된 다른 지표는 워터마크 이후 변경을 델타로 따라잡게 한다.
+        if catch_up:
+            self._refresh_delta()
+
+    def _refresh_delta(self) -> None:
+        """_load_lock 보유 상태에서 호출. (변경 시각, id) keyset으로 배치 단위로 읽는다."""
+        with self._lock:
+            watermark = self._watermark
+        if watermark is None:
+            return
+        batches: List[List[Dict[str, Any]]] = []
+        with self._connection_factory() as conn:
+            cursor = conn.cursor()
+            column = self._resolve_change_column(cursor)
+            cursor.execute(f"SELECT NOW() - INTERVAL {DELTA_SAFETY_LAG_SEC} SECOND AS cap")
+            cap = (cursor.fetchone() or {}).get("cap")
+            while cap is not None:
+                cursor.execute(
+                    f"""
+                    SELECT id, indicator_code, date, value, {column} AS change_ts
+                    FROM fred_data
+                    WHERE ({column} > %s OR ({column} = %s AND id > %s))
+                    AND {column} <= %s
+                    ORDER BY {column} ASC, id ASC
+                    LIMIT %s
+                    """,
+                    (watermark[0], watermark[0], watermark[1], cap, self.delta_batch_rows),
+                )
+                rows = cursor.fetchall() or []
+                if not rows:
+                    break
+                batches.append(rows)
+                watermark = (rows[-1]["change_ts"], safe_int(rows[-1].get("id"), 0))
+                if len(rows) < self.delta_batch_rows:
+                    break
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._stats["delta_refreshes"] += 1
+            if not batches:
+                return
+            self._watermark = watermark
+            relevant = [row for rows in batches for row in rows if row.get("indicator_code") in self._series]
+            self._stats["delta_rows"] += len(relevant)
+            for code, (dates, values) in self._group_rows(relevant).items():
+                self._series[code] = _merge_arrays(self._series.get(code), dates, values)
+
+    @staticmethod
+    def _group_rows(rows: List[Dict[str, Any]]) -> Dict[str, _SeriesArrays]:
+        buckets: Dict[str, Tuple[List[Any], List[float]]] = {}
+        for row in rows:
+            code = row.get("indicator_code")
+            value = row.get("value")
+            if code is None or value is None:
+                continue
+            dates, values = buckets.setdefault(str(code), ([], []))
+            dates.append(row.get("date"))
+            values.append(float(value))
+        return {
+            code: (
+                pd.to_datetime(pd.Index(dates)).values.astype("datetime64[ns]"),
+                np.asarray(values, dtype=np.float64),
+            )
+            for code, (dates, values) in buckets.items()
+        }
+
+
+_store: Optional[FredSeriesStore] = None
+_store_lock = threading.Lock()
+
+
+def is_fred_series_store_enabled() -> bool:
+    """FRED_SERIES_STORE_ENABLED=0 이면 저장소를 쓰지 않고 FREDCollector로 직접 조회한다."""
+    return env_flag("FRED_SERIES_STORE_ENABLED")
+
+
+def get_fred_series_reader():
+    """get_latest_data() 조회 대상: 저장소가 켜져 있으면 공용 저장소, 꺼져 있으면 FREDCollector"""
+    if is_fred_series_store_enabled():
+        return get_fred_series_store()
+    return get_fred_collector()
+
+
+def get_fred_series_store() -> FredSeriesStore:
+    """프로세스 공용 FredSeriesStore 싱글톤"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = FredSeriesStore()
+    return _store
+
+
+def reset_fred_series_store() -> None:
+    global _store
+    with _store_lock:
+        _store = None
@@ -8,6 +8,11 @@ from typing import Dict, Optional, Tuple, Any
 import logging
 
 from service.macro_trading.collectors.fred_collector import FREDCollector, get_fred_collector
+from service.macro_trading.signals.fred_series_store import (
+    FredSeriesStore,
+    get_fred_series_store,
+    is_fred_series_store_enabled,
+)
 from service.macro_trading.config.config_loader import get_config
 from service.database.db import get_db_connection
 
@@ -17,12 +22,36 @@ logger = logging.getLogger(__name__)
 class QuantSignalCalculator:
     """정량 시그널 계산 클래스"""
     
-    def __init__(self, fred_collector: Optional[FREDCollector] = None):
+    # 대시보드 1회 구성에 쓰이는 지표 (첫 조회 때 한 번의 벌크 쿼리로 함께 적재)
+    SERIES_STORE_CODES = (
+        "DGS10", "DGS2", "DFII10", "FEDFUNDS", "PCEPI", "PCEPILFE", "CPIAUCSL",
+        "WALCL", "WTREGEN", "RRPONTSYD", "BAMLH0A0HYM2", "UNRATE", "PAYEMS",
+        "GACDFSA066MSFRBPHI", "NOCDFSA066MSFRBPHI", "GAFDFSA066MSFRBPHI",
+        "GDPNOW", "T10YIE", "VIXCLS", "STLFSI4",
+    )
+
+    def __init__(
+        self,
+        fred_collector: Optional[FREDCollector] = None,
+        series_store: Optional[FredSeriesStore] = None,
+    ):
         """
         Args:
             fred_collector: FRED 수집기 인스턴스 (None이면 새로 생성)
+            series_store: 시계열 저장소 (None이면 프로세스 공용 저장소,
+                fred_collector를 직접 주입한 경우에는 수집기로 조회)
         """
         self.fred_collector = fred_collector or get_fred_collector()
+        if series_store is None and fred_collector is None and is_fred_series_store_enabled():
+            series_store = get_fred_series_store()
+        self.series_store = series_store
+        if self.series_store is not None:
+            self.series_store.register_codes(self.SERIES_STORE_CODES)
+
+    def _get_latest_data(self, indicator_code: str, days: int = 30) -> pd.Series:
+        if self.series_store is not None:
+            return self.series_store.get_latest_data(indicator_code, days)
+        return self.fred_collector.get_latest_data(indicator_code, days)
     
     def get_yield_curve_spread_trend_following(
         self,
@@ -60,8 +89,8 @@ class QuantSignalCalculator:
         """
         try:
             # 충분한 일별 데이터 조회 (최소 250일, 여유를 두고)
-            dgs10 = self.fred_collector.get_latest_data("DGS10", min_days)
-            dgs2 = self.fred_collector.get_latest_data("DGS2", min_days)
+            dgs10 = self._get_latest_data("DGS10", min_days)
+            dgs2 = self._get_latest_data("DGS2", min_days)
             
             if len(dgs10) == 0 or len(dgs2) == 0:
                 logger.warning("장단기 금리 데이터가 부족합니다")
@@ -176,7 +205,7 @@ class QuantSignalCalculator:
         """
         try:
             # DFII10 (10-Year Treasury Inflation-Indexed Security, Constant Maturity)
-            dfii10 = self.fred_collector.get_latest_data("DFII10", days)
+            dfii10 = self._get_latest_data("DFII10", days)
             if len(dfii10) == 0:
                 logger.warning("DFII10 데이터가 부족합니다")
                 return None
@@ -220,7 +249,7 @@ class QuantSignalCalculator:
         try:
             # FEDFUNDS (현재 연준 금리 - 월별 데이터)
             # 월별 데이터이므로 최신 값만 필요, 안전하게 최근 90일(약 3개월) 조회
-            fedfunds = self.fred_collector.get_latest_data("FEDFUNDS", days=90)
+            fedfunds = self._get_latest_data("FEDFUNDS", days=90)
             if len(fedfunds) == 0:
                 logger.warning("FEDFUNDS 데이터가 부족합니다.")
                 return None
@@ -230,7 +259,7 @@ class QuantSignalCalculator:
             # PCE 인플레이션율 (월별 데이터)
             # PCEPI는 최신 데이터가 3개월 전 것일 수 있으므로 충분한 기간 조회 필요
             # 최소 6개월(180일) 데이터 조회하여 최소 2개월치 데이터 확보
-            pce_data = self.fred_collector.get_latest_data("PCEPI", days=180)
+            pce_data = self._get_latest_data("PCEPI", days=180)
             if len(pce_data) < 2:
                 logger.warning("PCE 데이터가 부족합니다 (최소 2개월치 필요)")
                 return None
@@ -307,9 +336,9 @@ class QuantSignalCalculator:
         """
         try:
             # 각 지표 데이터 수집
-            walcl = self.fred_collector.get_latest_data("WALCL", days)
-            tga = self.fred_collector.get_latest_data("WTREGEN", days)
-            rrp = self.fred_collector.get_latest_data("RRPONTSYD", days)
+            walcl = self._get_latest_data("WALCL", days)
+            tga = self._get_latest_data("WTREGEN", days)
+            rrp = self._get_latest_data("RRPONTSYD", days)
             
             if len(walcl) == 0 or len(tga) == 0 or len(rrp) == 0:
                 logger.warning("유동성 지표 데이터가 부족합니다")
@@ -398,7 +427,7 @@ class QuantSignalCalculator:
         """
         try:
             # 하이일드 스프레드 데이터 수집
-            spread_data = self.fred_collector.get_latest_data("BAMLH0A0HYM2", days)
+            spread_data = self._get_latest_data("BAMLH0A0HYM2", days)
             
             if len(spread_data) == 0:
                 logger.warning("하이일드 스프레드 데이터가 부족합니다")
@@ -502,7 +531,7 @@ class QuantSignalCalculator:
         
         # 실업률
         try:
-            unrate = self.fred_collector.get_latest_data("UNRATE", days=30)
+            unrate = self._get_latest_data("UNRATE", days=30)
             if len(unrate) > 0:
                 indicators["unemployment_rate"] = float(unrate.iloc[-1])
         except Exception as e:
@@ -511,7 +540,7 @@ class QuantSignalCalculator:
         
         # 비농업 고용 지표
         try:
-            payems = self.fred_collector.get_latest_data("PAYEMS", days=60)
+            payems = self._get_latest_data("PAYEMS", days=60)
             if len(payems) >= 2:
                 # 전월 대비 증가율
                 latest = payems.iloc[-1]
@@ -536,7 +565,7 @@ class QuantSignalCalculator:
         """
         try:
             # DFII10 (10-Year Treasury Inflation-Indexed Security, Constant Maturity)
-            dfii10 = self.fred_collector.get_latest_data("DFII10", days=days)
+            dfii10 = self._get_latest_data("DFII10", days=days)
             if len(dfii10) == 0:
                 logger.warning("DFII10 데이터가 부족합니다")
                 return None
@@ -560,9 +589,9 @@ class QuantSignalCalculator:
         """
         try:
             # 각 지표 데이터 수집
-            walcl = self.fred_collector.get_latest_data("WALCL", days=days)
-            tga = self.fred_collector.get_latest_data("WTREGEN", days=days)
-            rrp = self.fred_collector.get_latest_data("RRPONTSYD", days=days)
+            walcl = self._get_latest_data("WALCL", days=days)
+            tga = self._get_latest_data("WTREGEN", days=days)
+            rrp = self._get_latest_data("RRPONTSYD", days=days)
             
             if len(walcl) == 0 or len(tga) == 0 or len(rrp) == 0:
                 logger.warning("유동성 지표 데이터가 부족합니다")
@@ -612,7 +641,7 @@ class QuantSignalCalculator:
         # 1. Growth (경기 성장 & 선행 지표)
         try:
             # Philly Fed Current Activity (GACDFSA066MSFRBPHI) - ISM PMI 대체
-            philly_curr = self.fred_collector.get_latest_data("GACDFSA066MSFRBPHI", days=90)
+            philly_curr = self._get_latest_data("GACDFSA066MSFRBPHI", days=90)
             if len(philly_curr) > 0:
                 latest_curr = philly_curr.iloc[-1]
                 dashboard_data["growth"]["philly_current"] = {
@@ -621,22 +650,22 @@ class QuantSignalCalculator:
                 }
 
             # Philly Fed New Orders (NOCDFSA066MSFRBPHI) - ISM New Orders 대체
-            philly_new = self.fred_collector.get_latest_data("NOCDFSA066MSFRBPHI", days=90)
+            philly_new = self._get_latest_data("NOCDFSA066MSFRBPHI", days=90)
             if len(philly_new) > 0:
                 dashboard_data["growth"]["philly_new_orders"] = float(philly_new.iloc[-1])
 
             # Philly Fed Future Activity (GAFDFSA066MSFRBPHI)
-            philly_future = self.fred_collector.get_latest_data("GAFDFSA066MSFRBPHI", days=90)
+            philly_future = self._get_latest_data("GAFDFSA066MSFRBPHI", days=90)
             if len(philly_future) > 0:
                 dashboard_data["growth"]["philly_future"] = float(philly_future.iloc[-1])
             
             # GDPNow (GDPNOW)
-            gdpnow = self.fred_collector.get_latest_data("GDPNOW", days=365)
+            gdpnow = self._get_latest_data("GDPNOW", days=365)
             if len(gdpnow) > 0:
                 dashboard_data["growth"]["gdp_now"] = float(gdpnow.iloc[-1])
                 
             # 실업률 (UNRATE)
-            unrate = self.fred_collector.get_latest_data("UNRATE", days=365)
+            unrate = self._get_latest_data("UNRATE", days=365)
             if len(unrate) > 0:
                 current_unrate = unrate.iloc[-1]
                 # 3개월 전 (대략 3번째 뒤의 값, or 날짜 비교)
@@ -657,7 +686,7 @@ class QuantSignalCalculator:
             
             # 비농업 고용 (PAYEMS) - NFP Change
             # 1년 전 데이터 비교를 위해 충분한 기간 수집 (500일)
-            payems = self.fred_collector.get_latest_data("PAYEMS", days=500)
+            payems = self._get_latest_data("PAYEMS", days=500)
             if len(payems) >= 13:
                 latest_nfp = payems.iloc[-1]
                 prev_nfp = payems.iloc[-2]
@@ -699,7 +728,7 @@ class QuantSignalCalculator:
         # 2. Inflation (물가 압력)
         try:
             # Core PCE (PCEPILFE) - YoY
-            pce_core = self.fred_collector.get_latest_data("PCEPILFE", days=730)
+            pce_core = self._get_latest_data("PCEPILFE", days=730)
             if len(pce_core) >= 13:
                 curr = pce_core.iloc[-1]
                 year_ago = pce_core.iloc[-13] # 1년 전
@@ -710,7 +739,7 @@ class QuantSignalCalculator:
                 }
             
             # Headline CPI (CPIAUCSL) - YoY
-            cpi = self.fred_collector.get_latest_data("CPIAUCSL", days=730)
+            cpi = self._get_latest_data("CPIAUCSL", days=730)
             if len(cpi) >= 13:
                 curr = cpi.iloc[-1]
                 year_ago = cpi.iloc[-13]
@@ -726,7 +755,7 @@ class QuantSignalCalculator:
                 }
             
             # 기대 인플레이션 (T10YIE or BEI 10Y)
-            bei = self.fred_collector.get_latest_data("T10YIE", days=30)
+            bei = self._get_latest_data("T10YIE", days=30)
             if len(bei) > 0:
                 dashboard_data["inflation"]["expected_inflation"] = float(bei.iloc[-1])
                 
@@ -736,8 +765,8 @@ class QuantSignalCalculator:
         # 3. Liquidity & Fed Policy
         try:
             # 금리 커브 (10Y-2Y)
-            dgs10 = self.fred_collector.get_latest_data("DGS10", days=30)
-            dgs2 = self.fred_collector.get_latest_data("DGS2", days=30)
+            dgs10 = self._get_latest_data("DGS10", days=30)
+            dgs2 = self._get_latest_data("DGS2", days=30)
             if len(dgs10) > 0 and len(dgs2) > 0:
                 spread = dgs10.iloc[-1] - dgs2.iloc[-1]
                 # 상태 판단 (단순화)
@@ -753,7 +782,7 @@ class QuantSignalCalculator:
                 }
             
             # SOMA (WALCL)
-            walcl = self.fred_collector.get_latest_data("WALCL", days=90)
+            walcl = self._get_latest_data("WALCL", days=90)
             if len(walcl) > 0:
                 latest_walcl = walcl.iloc[-1] / 1000 # B unit
                 # QT 속도 (최근 4주 변화)
@@ -792,12 +821,12 @@ class QuantSignalCalculator:
         # 4. Sentiment
         try:
             # VIX
-            vix = self.fred_collector.get_latest_data("VIXCLS", days=30)
+            vix = self._get_latest_data("VIXCLS", days=30)
             if len(vix) > 0:
                 dashboard_data["sentiment"]["vix"] = float(vix.iloc[-1])
             
             # 금융 스트레스 지수 (STLFSI4) - MOVE 대체
-            stlfsi = self.fred_collector.get_latest_data("STLFSI4", days=90)
+            stlfsi = self._get_latest_data("STLFSI4", days=90)
             if len(stlfsi) > 0:
                 latest_stlfsi = stlfsi.iloc[-1]
                 dashboard_data["sentiment"]["stlfsi4"] = {
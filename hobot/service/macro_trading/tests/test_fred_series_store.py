@@ -0,0 +1,175 @@
+import os
+import unittest
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from service.macro_trading.collectors.fred_collector import DataInsufficientError
+from service.macro_trading.signals import fred_series_store
+from service.macro_trading.signals.fred_series_store import FredSeriesStore
+from service.macro_trading.signals.quant_signals import QuantSignalCalculator
+
+
+class _FakeFredDb:
+    def __init__(self):
+        self.rows = []
+        self.queries = []
+        self.now = datetime(2026, 1, 1, 9, 0, 0)
+
+    def tick(self, seconds=10):
+        self.now += timedelta(seconds=seconds)
+
+    def add(self, code, obs_date, value):
+        """INSERT ... ON DUPLICATE KEY UPDATE (같은 지표/날짜면 값 정정 + updated_at 갱신)"""
+        for row in self.rows:
+            if row["indicator_code"] == code and row["date"] == obs_date:
+                row["value"] = Decimal(str(value))
+                row["updated_at"] = self.now
+                return
+        self.rows.append(
+            {
+                "id": len(self.rows) + 1,
+                "indicator_code": code,
+                "date": obs_date,
+                "value": Decimal(str(value)),
+                "updated_at": self.now,
+            }
+        )
+
+    @contextmanager
+    def connection(self):
+        db = self
+
+        class _Cursor:
+            def __init__(self):
+                self._rows = []
+
+            def execute(self, query, params=None):
+                db.queries.append(query)
+                if "INFORMATION_SCHEMA.COLUMNS" in query:
+                    self._rows = [{"COLUMN_NAME": "updated_at"}, {"COLUMN_NAME": "created_at"}]
+                elif "AS cap" in query:
+                    self._rows = [{"cap": db.now - timedelta(seconds=2)}]
+                elif "LIMIT %s" in query:
+                    ts, same_ts, last_id, cap, limit = params
+                    matched = sorted(
+                        (
+                            row
+                            for row in db.rows
+                            if (row["updated_at"] > ts or (row["updated_at"] == same_ts and row["id"] > last_id))
+                            and row["updated_at"] <= cap
+                        ),
+                        key=lambda row: (row["updated_at"], row["id"]),
+                    )
+                    self._rows = [dict(row, change_ts=row["updated_at"]) for row in matched[:limit]]
+                else:
+                    codes = set(params[:-1])
+                    since = params[-1]
+                    self._rows = [row for row in db.rows if row["indicator_code"] in codes and row["date"] >= since]
+
+            def fetchone(self):
+                return self._rows[0] if self._rows else None
+
+            def fetchall(self):
+                return list(self._rows)
+
+        class _Conn:
+            def cursor(self):
+                return _Cursor()
+
+        yield _Conn()
+
+
+class TestFredSeriesStore(unittest.TestCase):
+    def setUp(self):
+        self.db = _FakeFredDb()
+        today = date.today()
+        for offset in range(10, 0, -1):
+            self.db.add("DGS10", today - timedelta(days=offset), 4.0 + offset / 100)
+            self.db.add("DGS2", today - timedelta(days=offset), 3.5)
+        self.db.tick()
+
+    def _store(self, **kwargs):
+        kwargs.setdefault("refresh_sec", 0)
+        return FredSeriesStore(connection_factory=self.db.connection, preload_codes=["DGS2"], **kwargs)
+
+    def test_bulk_loads_preload_codes_once_and_slices_by_days(self):
+        store = self._store(refresh_sec=3600)
+        dgs10 = store.get_latest_data("DGS10", days=5)
+        dgs2 = store.get_latest_data("DGS2", days=30)
+
+        self.assertEqual(len(dgs10), 5)
+        self.assertEqual(len(dgs2), 10)
+        self.assertEqual(dgs10.index[-1].date(), date.today() - timedelta(days=1))
+        self.assertAlmostEqual(float(dgs10.iloc[-1]), 4.01)
+        self.assertEqual(store.get_stats()["bulk_loads"], 1)
+        self.assertEqual(sum("indicator_code IN (" in query for query in self.db.queries), 1)
+        with self.assertRaises(ValueError):
+            dgs10.values[0] = 0.0
+
+    def test_delta_refresh_merges_rows_after_watermark(self):
+        store = self._store()
+        self.assertEqual(len(store.get_latest_data("DGS10", days=30)), 10)
+
+        self.db.tick()
+        self.db.add("DGS10", date.today(), 4.5)
+        self.db.add("UNRATE", date.today(), 4.1)
+        self.db.tick()
+        refreshed = store.get_latest_data("DGS10", days=30)
+
+        self.assertEqual(len(refreshed), 11)
+        self.assertAlmostEqual(float(refreshed.iloc[-1]), 4.5)
+        stats = store.get_stats()
+        self.assertEqual(stats["bulk_loads"], 1)
+        self.assertEqual(stats["delta_rows"], 1)
+        self.assertEqual(stats["change_column"], "updated_at")
+        self.assertEqual(stats["watermark_id"], len(self.db.rows))
+
+    def test_delta_refresh_picks_up_revised_values_in_batches(self):
+        store = self._store(full_reload_sec=0)
+        store.delta_batch_rows = 1
+        self.assertAlmostEqual(float(store.get_latest_data("DGS10", days=30).iloc[-1]), 4.01)
+
+        # 기존 날짜 값 정정 (id는 그대로, updated_at만 바뀜)
+        self.db.tick()
+        self.db.add("DGS10", date.today() - timedelta(days=1), 4.2)
+        self.db.add("DGS2", date.today() - timedelta(days=1), 3.6)
+        self.db.tick()
+        revised = store.get_latest_data("DGS10", days=30)
+        self.assertEqual(len(revised), 10)
+        self.assertAlmostEqual(float(revised.iloc[-1]), 4.2)
+        self.assertAlmostEqual(float(store.get_latest_data("DGS2", days=30).iloc[-1]), 3.6)
+        self.assertEqual(store.get_stats()["delta_rows"], 2)
+
+        # 상한(DB 시각 - 2초) 이후 변경은 다음 갱신 때 반영된다.
+        self.db.add("DGS10", date.today() - timedelta(days=1), 4.3)
+        self.assertAlmostEqual(float(store.get_latest_data("DGS10", days=30).iloc[-1]), 4.2)
+        self.db.tick()
+        self.assertAlmostEqual(float(store.get_latest_data("DGS10", days=30).iloc[-1]), 4.3)
+
+    def test_min_data_points_and_unknown_code(self):
+        store = self._store()
+        self.assertTrue(store.get_latest_data("UNKNOWN", days=30).empty)
+        with self.assertRaises(DataInsufficientError):
+            store.get_latest_data("DGS10", days=30, min_data_points=50)
+
+    def test_quant_calculator_reads_through_store(self):
+        store = self._store()
+        calculator = QuantSignalCalculator(fred_collector=object(), series_store=store)
+        self.assertEqual(len(calculator._get_latest_data("DGS2", days=30)), 10)
+        self.assertIn("WALCL", store._preload_codes)
+
+
+    def test_reader_falls_back_to_collector_when_store_disabled(self):
+        collector = object()
+        with mock.patch.object(fred_series_store, "get_fred_collector", return_value=collector), \
+                mock.patch.object(fred_series_store, "get_fred_series_store") as get_store:
+            with mock.patch.dict(os.environ, {"FRED_SERIES_STORE_ENABLED": "0"}):
+                self.assertIs(fred_series_store.get_fred_series_reader(), collector)
+            get_store.assert_not_called()
+            with mock.patch.dict(os.environ, {"FRED_SERIES_STORE_ENABLED": "1"}):
+                self.assertIs(fred_series_store.get_fred_series_reader(), get_store.return_value)
+
+if __name__ == "__main__":
+    unittest.main()
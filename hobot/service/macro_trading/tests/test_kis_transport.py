@@ -0,0 +1,154 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from service.macro_trading.kis import kis_api
+from service.macro_trading.kis.kis_transport import KISRateLimiter, KISTokenStore
+
+
+class _FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+class TestKISRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp(prefix="kis_rate_")
+        self.addCleanup(shutil.rmtree, self.state_dir, True)
+
+    def test_paces_requests_at_configured_tps(self):
+        clock = _FakeClock()
+        limiter = KISRateLimiter(20, clock=clock, sleep=clock.sleep)
+        started = clock.now
+        waits = [limiter.acquire() for _ in range(21)]
+
+        self.assertEqual(waits[0], 0.0)
+        self.assertAlmostEqual(clock.now - started, 1.0, places=6)
+        self.assertEqual(limiter.get_stats()["acquired"], 21)
+
+    def test_shared_state_spans_limiter_instances(self):
+        clock = _FakeClock()
+        state_path = os.path.join(self.state_dir, "app.state")
+        # 같은 상태 파일을 쓰는 두 인스턴스 = 같은 앱키를 쓰는 두 워커
+        worker_a = KISRateLimiter(2, state_path=state_path, clock=clock, sleep=lambda _: None)
+        worker_b = KISRateLimiter(2, state_path=state_path, clock=clock, sleep=lambda _: None)
+
+        self.assertEqual(worker_a.acquire(), 0.0)
+        self.assertAlmostEqual(worker_b.acquire(), 0.5)
+        self.assertAlmostEqual(worker_a.acquire(), 1.0)
+        self.assertTrue(worker_b.get_stats()["shared"])
+
+
+class TestKISTokenStore(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="kis_token_")
+        self.addCleanup(shutil.rmtree, self.data_dir, True)
+        self.token_path = os.path.join(self.data_dir, "access_token.json")
+        self.clock = _FakeClock()
+        self.issued = []
+
+    def _issue(self):
+        token = f"token-{len(self.issued) + 1}"
+        self.issued.append(token)
+        return token, 86400
+
+    def _store(self):
+        return KISTokenStore(self.token_path, refresh_margin_sec=1800, clock=self.clock)
+
+    def test_reuses_token_in_memory_and_across_workers(self):
+        store = self._store()
+        self.assertEqual(store.get_token("app", "https://kis", self._issue), "token-1")
+        self.assertEqual(store.get_token("app", "https://kis", self._issue), "token-1")
+        self.assertEqual(store.get_stats()["hits"], 1)
+
+        other_worker = self._store()
+        self.assertEqual(other_worker.get_token("app", "https://kis", self._issue), "token-1")
+        self.assertEqual(other_worker.get_token("other-app", "https://kis", self._issue), "token-2")
+        self.assertEqual(self.issued, ["token-1", "token-2"])
+        with open(self.token_path, encoding="utf-8") as f:
+            saved_keys = list(json.load(f)["tokens"])
+        self.assertEqual(len(saved_keys), 2)
+        self.assertNotIn("app", saved_keys)
+
+    def test_refreshes_before_expiry_and_after_rejection(self):
+        store = self._store()
+        store.get_token("app", "https://kis", self._issue)
+
+        self.clock.now += 86400 - 1700  # 만료 30분 전 이내 -> 선제 재발급
+        self.assertEqual(store.get_token("app", "https://kis", self._issue), "token-2")
+
+        other_worker = self._store()
+        other_worker.get_token("app", "https://kis", self._issue)
+        self.assertEqual(store.get_token("app", "https://kis", self._issue, stale_token="token-2"), "token-3")
+        # 방금 다른 워커가 재발급했다면 거절된 토큰을 들고 있어도 새로 발급하지 않는다.
+        self.assertEqual(other_worker.get_token("app", "https://kis", self._issue, stale_token="token-2"), "token-3")
+        self.assertEqual(self.issued, ["token-1", "token-2", "token-3"])
+
+
+class TestGetKISClient(unittest.TestCase):
+    def setUp(self):
+        kis_api._clients.clear()
+        kis_api._client_locks.clear()
+        self.addCleanup(kis_api._clients.clear)
+        self.addCleanup(kis_api._client_locks.clear)
+
+    def test_slow_construction_does_not_block_other_credentials(self):
+        slow_entered = threading.Event()
+        release_slow = threading.Event()
+
+        class _FakeKISAPI:
+            def __init__(self, app_key, app_secret, account_no, is_simulation=False):
+                self.app_key = app_key
+                if app_key == "slow":
+                    slow_entered.set()
+                    release_slow.wait(5)
+
+        with mock.patch.object(kis_api, "KISAPI", _FakeKISAPI):
+            slow_thread = threading.Thread(target=kis_api.get_kis_client, args=("slow", "s", "1"))
+            slow_thread.start()
+            self.assertTrue(slow_entered.wait(5))
+            try:
+                fast_client = kis_api.get_kis_client("fast", "s", "2")
+                self.assertEqual(fast_client.app_key, "fast")
+                self.assertFalse(release_slow.is_set())
+            finally:
+                release_slow.set()
+                slow_thread.join(5)
+
+            self.assertIs(kis_api.get_kis_client("fast", "s", "2"), fast_client)
+
+    def test_cache_is_bounded_lru(self):
+        created = []
+
+        class _FakeKISAPI:
+            def __init__(self, app_key, app_secret, account_no, is_simulation=False):
+                created.append(app_key)
+
+        with mock.patch.object(kis_api, "KISAPI", _FakeKISAPI), \
+                mock.patch.dict(os.environ, {"KIS_CLIENT_CACHE_SIZE": "2"}):
+            kis_api.get_kis_client("a", "s", "1")
+            kis_api.get_kis_client("b", "s", "1")
+            kis_api.get_kis_client("a", "s", "1")
+            kis_api.get_kis_client("c", "s", "1")
+            kis_api.get_kis_client("a", "s", "1")
+            kis_api.get_kis_client("b", "s", "1")
+
+        self.assertEqual(created, ["a", "b", "c", "b"])
+        self.assertEqual(len(kis_api._clients), 2)
+        self.assertLessEqual(len(kis_api._client_locks), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from datetime import date
 from unittest.mock import patch
@@ -5,7 +6,138 @@ from unittest.mock import patch
 import pandas as pd
 
 from service.macro_trading.collectors.kr_macro_collector import KRMacroCollector
-from service.macro_trading.collectors.kr_real_estate_collector import KRRealEstateCollector
+from service.macro_trading.collectors.kr_real_estate_collector import (
+    KRRealEstateCollector,
+    MolitRequestRateLimiter,
+)
+from service.macro_trading.collectors.kr_real_estate_summary import (
+    KRRealEstateMonthlySummaryAggregator,
+    cells_from_records,
+    compute_cell_statistics,
+)
+
+
+class _InMemoryMolitCheckpointStore:
+    def __init__(self):
+        self.tasks = {}
+        self.expired_runs = set()
+        self.lock = threading.Lock()
+
+    def load_tasks(self, run_key, pairs, *, reset=False):
+        with self.lock:
+            if reset:
+                self.tasks = {key: row for key, row in self.tasks.items() if key[0] != run_key}
+            for deal_ym, lawd_cd in pairs:
+                self.tasks.setdefault((run_key, deal_ym, lawd_cd), {"status": "pending", "next_page_no": 1})
+            return {(key[1], key[2]): dict(row) for key, row in self.tasks.items() if key[0] == run_key}
+
+    def mark_running(self, run_key, deal_ym, lawd_cd):
+        with self.lock:
+            self.tasks[(run_key, deal_ym, lawd_cd)]["status"] = "running"
+
+    def record_page(self, run_key, deal_ym, lawd_cd, *, next_page_no, fetched_rows, db_affected):
+        with self.lock:
+            self.tasks[(run_key, deal_ym, lawd_cd)]["next_page_no"] = next_page_no
+
+    def mark_done(self, run_key, deal_ym, lawd_cd, *, empty_page_requests=0):
+        with self.lock:
+            self.tasks[(run_key, deal_ym, lawd_cd)]["status"] = "done"
+
+    def mark_failed(self, run_key, deal_ym, lawd_cd, *, error):
+        with self.lock:
+            self.tasks[(run_key, deal_ym, lawd_cd)]["status"] = "failed"
+
+    def prune_finished_runs(self, *, keep_run_key, retention_days):
+        # 보존 기간 판정 대신 expired_runs에 넣은 런을 오래된 런으로 본다.
+        with self.lock:
+            finished = {
+                key[0]
+                for key in self.tasks
+                if key[0] in self.expired_runs
+                and key[0] != keep_run_key
+                and all(row["status"] in {"done", "failed"} for k, row in self.tasks.items() if k[0] == key[0])
+            }
+            pruned = [key for key in self.tasks if key[0] in finished]
+            for key in pruned:
+                del self.tasks[key]
+            return len(pruned)
+
+
+class _SummarySQLCursor:
+    """dirty-cell / 원천 거래 / 요약 upsert SQL만 흉내 내는 커서"""
+
+    def __init__(self, dirty, transactions, lawd_cd_column=True):
+        self.dirty = dirty
+        self.transactions = transactions
+        self.lawd_cd_column = lawd_cd_column
+        self.summary = {}
+        self.executed = []
+        self.rowcount = 0
+        self._result = []
+
+    def execute(self, query, params=None):
+        sql = " ".join(query.split())
+        self.executed.append(sql)
+        self.rowcount = 1
+        self._result = []
+        if sql.startswith("SELECT stat_ym, lawd_cd, property_type, transaction_type, version"):
+            property_type, transaction_type, start_ym, end_ym, after_ym, after_lawd, limit = params
+            rows = [
+                {"stat_ym": ym, "lawd_cd": lawd, "property_type": pt, "transaction_type": tt, "version": version}
+                for (ym, lawd, pt, tt), version in sorted(self.dirty.items())
+                if pt == property_type and tt == transaction_type and start_ym <= ym <= end_ym and (ym, lawd) > (after_ym, after_lawd)
+            ]
+            self._result = rows[:limit]
+        elif sql.startswith("SELECT COUNT(*) AS column_count FROM information_schema.COLUMNS"):
+            self._result = [{"column_count": 1 if self.lawd_cd_column else 0}]
+        elif sql.startswith("SELECT price, area_m2") and "lawd_cd = %s" in sql:
+            property_type, transaction_type, lawd_cd, month_start, _ = params
+            self._result = [
+                row
+                for row in self.transactions
+                if row["region_code"][:5] == lawd_cd
+                and row["contract_date"].strftime("%Y%m") == month_start.strftime("%Y%m")
+                and row["property_type"] == property_type
+                and row["transaction_type"] == transaction_type
+            ]
+        elif sql.startswith("SELECT price, area_m2"):
+            prefix, month_start, _, property_type, transaction_type = params
+            self._result = [
+                row
+                for row in self.transactions
+                if row["region_code"].startswith(prefix[:-1])
+                and row["contract_date"].strftime("%Y%m") == month_start.strftime("%Y%m")
+                and row["property_type"] == property_type
+                and row["transaction_type"] == transaction_type
+            ]
+        elif sql.startswith("INSERT INTO kr_real_estate_monthly_summary"):
+            self.summary[tuple(params[:4])] = params
+        elif sql.startswith("DELETE FROM kr_real_estate_monthly_summary"):
+            self.summary.pop(tuple(params), None)
+        elif sql.startswith("DELETE FROM kr_real_estate_summary_dirty_cells"):
+            key, version = tuple(params[:4]), params[4]
+            if self.dirty.get(key) == version:
+                del self.dirty[key]
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+
+class _CursorConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self._cursor
 
 
 class _FakeFREDCollector:
@@ -346,6 +478,152 @@ class TestKRRealEstateCollector(unittest.TestCase):
         with self.assertRaises(ValueError):
             collector.iter_deal_months("202603", "202602")
 
+    def test_molit_collection_resumes_from_checkpointed_page(self):
+        store = _InMemoryMolitCheckpointStore()
+        collector = KRRealEstateCollector(checkpoint_store=store)
+        requests = []
+        failing = {("202601", "11680", 2)}
+        lock = threading.Lock()
+
+        def fake_fetch(*, lawd_cd, deal_ym, num_of_rows, page_no):
+            with lock:
+                requests.append((deal_ym, lawd_cd, page_no))
+                if (deal_ym, lawd_cd, page_no) in failing:
+                    raise RuntimeError("temporary MOLIT error")
+            # 11680은 2페이지(2건 + 1건), 나머지는 1페이지(1건)
+            if lawd_cd == "11680" and page_no == 1:
+                return [{"page": 1}, {"page": 1}]
+            return [{"page": page_no}]
+
+        collector.fetch_molit_trade_rows = fake_fetch
+        collector.ingest_transactions = lambda rows, **_: {
+            "normalized_rows": len(rows),
+            "skipped_rows": 0,
+            "db_affected": len(rows),
+        }
+        kwargs = dict(
+            start_ym="202601",
+            end_ym="202602",
+            lawd_codes=["11110", "11680"],
+            num_of_rows=2,
+            max_workers=3,
+            requests_per_sec=0,
+            run_key="test-run",
+        )
+
+        first = collector.collect_molit_apartment_trades(**kwargs)
+        self.assertEqual(first["failed_pairs"], 1)
+        self.assertEqual(store.tasks[("test-run", "202601", "11680")], {"status": "failed", "next_page_no": 2})
+
+        failing.clear()
+        requests.clear()
+        second = collector.collect_molit_apartment_trades(**kwargs)
+
+        self.assertEqual(requests, [("202601", "11680", 2)])
+        self.assertEqual(second["resumed_completed_pairs"], 3)
+        self.assertEqual(second["failed_pairs"], 0)
+        self.assertEqual(second["fetched_rows"], 1)
+        self.assertTrue(all(row["status"] == "done" for row in store.tasks.values()))
+
+    def test_molit_collection_prunes_finished_expired_runs(self):
+        store = _InMemoryMolitCheckpointStore()
+        store.tasks = {
+            ("old-done", "202501", "11110"): {"status": "done", "next_page_no": 2},
+            ("old-interrupted", "202501", "11110"): {"status": "running", "next_page_no": 3},
+            ("recent-done", "202501", "11110"): {"status": "done", "next_page_no": 2},
+        }
+        store.expired_runs = {"old-done", "old-interrupted", "today"}
+        collector = KRRealEstateCollector(checkpoint_store=store)
+        collector.fetch_molit_trade_rows = lambda **_: [{"page": 1}]
+        collector.ingest_transactions = lambda rows, **_: {
+            "normalized_rows": len(rows),
+            "skipped_rows": 0,
+            "db_affected": len(rows),
+        }
+
+        result = collector.collect_molit_apartment_trades(
+            start_ym="202601",
+            end_ym="202601",
+            lawd_codes=["11110"],
+            num_of_rows=2,
+            requests_per_sec=0,
+            run_key="today",
+        )
+
+        self.assertEqual(result["pruned_checkpoint_rows"], 1)
+        self.assertEqual(
+            sorted({key[0] for key in store.tasks}),
+            ["old-interrupted", "recent-done", "today"],
+        )
+
+    def test_cell_statistics_include_distribution(self):
+        rows = [
+            {"price": 100_000_000, "area_m2": 50},
+            {"price": 300_000_000, "area_m2": 100},
+            {"price": 200_000_000, "area_m2": 40},
+            {"price": 400_000_000, "area_m2": None},
+        ]
+
+        stats = compute_cell_statistics(rows)
+
+        self.assertEqual(stats["tx_count"], 4)
+        self.assertEqual(stats["median_price"], 250_000_000)
+        self.assertEqual(stats["area_tx_count"], 3)
+        # price/m2 = [2,000,000, 3,000,000, 5,000,000]
+        self.assertAlmostEqual(stats["p25_price_per_m2"], 2_500_000)
+        self.assertAlmostEqual(stats["median_price_per_m2"], 3_000_000)
+        self.assertAlmostEqual(stats["p75_price_per_m2"], 4_000_000)
+        self.assertIsNone(compute_cell_statistics([{"price": None}]))
+
+    def test_summary_refresh_only_recomputes_dirty_cells(self):
+        transactions = [
+            {"region_code": "1168010100", "contract_date": date(2026, 1, 5), "property_type": "apartment", "transaction_type": "sale", "price": 10, "area_m2": 1},
+            {"region_code": "1168010300", "contract_date": date(2026, 1, 20), "property_type": "apartment", "transaction_type": "sale", "price": 30, "area_m2": 1},
+            {"region_code": "1111000000", "contract_date": date(2026, 1, 9), "property_type": "apartment", "transaction_type": "sale", "price": 99, "area_m2": 1},
+        ]
+        self.assertEqual(
+            cells_from_records(transactions[:2]),
+            [("202601", "11680", "apartment", "sale")],
+        )
+        for lawd_cd_column in (True, False):
+            with self.subTest(lawd_cd_column=lawd_cd_column):
+                dirty = {
+                    ("202601", "11680", "apartment", "sale"): 2,
+                    ("202602", "11680", "apartment", "sale"): 1,  # 원천 거래가 사라진 셀
+                    ("202601", "11680", "apartment", "jeonse"): 1,  # 다른 유형은 이번 집계 대상 아님
+                }
+                cursor = _SummarySQLCursor(dirty, transactions, lawd_cd_column=lawd_cd_column)
+                aggregator = KRRealEstateMonthlySummaryAggregator(lambda: _CursorConnection(cursor))
+                aggregator._tables_ready = True
+
+                result = aggregator.refresh_dirty_cells(
+                    start_ym="202601",
+                    end_ym="202602",
+                    property_type="apartment",
+                    transaction_type="sale",
+                    as_of_date=date(2026, 3, 1),
+                    batch_size=1,
+                )
+
+                self.assertEqual(result["refreshed_cells"], 1)
+                self.assertEqual(result["removed_cells"], 1)
+                self.assertEqual(list(cursor.summary), [("202601", "11680", "apartment", "sale")])
+                row = cursor.summary[("202601", "11680", "apartment", "sale")]
+                self.assertEqual(row[4], 2)  # tx_count: 11110 거래는 재계산에 포함되지 않음
+                self.assertEqual(row[11], 20)  # median_price
+                self.assertEqual(list(dirty), [("202601", "11680", "apartment", "jeonse")])
+                self.assertEqual(
+                    any("lawd_cd = %s AND contract_date" in sql for sql in cursor.executed),
+                    lawd_cd_column,
+                )
+
+    def test_molit_rate_limiter_spaces_requests(self):
+        now = [0.0]
+        limiter = MolitRequestRateLimiter(4, clock=lambda: now[0], sleep=lambda sec: now.__setitem__(0, now[0] + sec))
+        for _ in range(5):
+            limiter.acquire()
+        self.assertAlmostEqual(now[0], 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
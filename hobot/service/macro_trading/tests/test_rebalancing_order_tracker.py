@@ -0,0 +1,204 @@
+import threading
+import unittest
+
+from service.macro_trading.rebalancing.order_executor import OrderExecutor
+from service.macro_trading.rebalancing.order_tracker import CashLedger, KISOrderGateway, OrderLifecycleTracker, TrackedOrder
+from service.macro_trading.rebalancing.paper_broker_adapter import SimulatedOrderGateway
+
+
+class _FakeClock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def _plan(sell_orders, buy_orders):
+    return {
+        "status": "success",
+        "sell_orders": sell_orders,
+        "buy_orders": buy_orders,
+        "validation_result": {"is_valid": True},
+    }
+
+
+class TestOrderLifecycleTracker(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _tracker(self, gateway, timeout_sec=30.0):
+        tracker = OrderLifecycleTracker(
+            gateway,
+            max_workers=2,
+            timeout_sec=timeout_sec,
+            poll_initial_sec=0.5,
+            poll_max_sec=4.0,
+            poll_backoff=2.0,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        self.addCleanup(tracker.close)
+        return tracker
+
+    def test_tracks_partial_fills_until_complete(self):
+        gateway = SimulatedOrderGateway(
+            fill_plan={"069500": [(1.0, 4), (3.0, 10)], "360750": [(0.5, 5)]},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        tracker = self._tracker(gateway)
+        orders = [TrackedOrder("sell", "069500", 10, 1000), TrackedOrder("sell", "360750", 5, 2000)]
+        increments = []
+
+        tracker.submit(orders)
+        all_filled = tracker.wait_for_fills(orders, on_fill=lambda o, qty, amount: increments.append((o.ticker, qty, amount)))
+
+        self.assertTrue(all_filled)
+        self.assertEqual([o.status for o in orders], ["filled", "filled"])
+        self.assertEqual(sorted(increments), [("069500", 4, 4000.0), ("069500", 6, 6000.0), ("360750", 5, 10000.0)])
+        self.assertEqual(orders[0].to_result()["avg_fill_price"], 1000.0)
+        # 체결이 없으면 조회 간격이 늘어나므로 고정 2초 폴링보다 조회 수가 적다.
+        self.assertLessEqual(gateway.inquiries, 6)
+
+    def test_rejection_and_timeout_are_terminal(self):
+        gateway = SimulatedOrderGateway(
+            fill_plan={"069500": [(100.0, 10)]},
+            reject_tickers={"360750"},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        tracker = self._tracker(gateway, timeout_sec=10.0)
+        orders = [TrackedOrder("sell", "069500", 10, 1000), TrackedOrder("sell", "360750", 5, 2000)]
+
+        tracker.submit(orders)
+
+        self.assertFalse(tracker.wait_for_fills(orders))
+        self.assertEqual([o.status for o in orders], ["timeout", "failed"])
+        self.assertAlmostEqual(self.clock.now, 1_010.0)
+
+    def test_accepted_order_without_order_number_is_untrackable(self):
+        gateway = SimulatedOrderGateway(fill_plan={"069500": [(0.5, 10)]}, clock=self.clock, sleep=self.clock.sleep)
+        place_order = gateway.place_order
+
+        def place_without_odno(side, ticker, quantity, price):
+            resp = place_order(side, ticker, quantity, price)
+            return {"rt_cd": resp["rt_cd"], "msg1": resp["msg1"], "output": {}}
+
+        gateway.place_order = place_without_odno
+        tracker = self._tracker(gateway, timeout_sec=10.0)
+        orders = [TrackedOrder("sell", "069500", 10, 1000)]
+
+        tracker.submit(orders)
+
+        self.assertEqual(orders[0].status, "untrackable")
+        self.assertFalse(tracker.wait_for_fills(orders))
+        self.assertEqual(gateway.inquiries, 0)
+        self.assertEqual(orders[0].filled_qty, 0)
+
+    def test_kis_gateway_never_inquires_without_order_number(self):
+        class _FakeApi:
+            calls = 0
+
+            def get_order_executions(self, **kwargs):
+                _FakeApi.calls += 1
+                return {"rt_cd": "0", "output1": [{"odno": "0000000123", "tot_ccld_qty": "5"}]}
+
+        gateway = KISOrderGateway(_FakeApi())
+
+        self.assertIsNone(gateway.inquire_order("", "069500", "sell"))
+        self.assertEqual(_FakeApi.calls, 0)
+        self.assertEqual(gateway.inquire_order("123", "069500", "sell")["filled_qty"], 5)
+
+    def test_cash_ledger_applies_haircut_to_proceeds(self):
+        ledger = CashLedger(1000, proceeds_haircut=0.01)
+        ledger.credit_fill(10000)
+        self.assertFalse(ledger.try_commit(11000))
+        self.assertTrue(ledger.try_commit(10900))
+        self.assertAlmostEqual(ledger.available, 0.0)
+
+
+class TestOrderExecutorFillTracking(unittest.TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _executor(self, gateway):
+        tracker = OrderLifecycleTracker(
+            gateway,
+            max_workers=2,
+            timeout_sec=20.0,
+            poll_initial_sec=0.5,
+            poll_max_sec=2.0,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        self.addCleanup(tracker.close)
+        executor = OrderExecutor("paper-user", gateway=gateway, tracker=tracker)
+        executor.sell_proceeds_haircut = 0.0
+        return executor
+
+    def test_buys_are_released_as_sell_proceeds_fill(self):
+        gateway = SimulatedOrderGateway(
+            cash_balance=0,
+            fill_plan={"069500": [(1.0, 5), (2.0, 10)], "360750": [(5.0, 10)]},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        executor = self._executor(gateway)
+
+        result = executor.execute_rebalancing_trades(
+            _plan(
+                [{"ticker": "069500", "quantity": 10, "limit_price": 1000}, {"ticker": "360750", "quantity": 10, "limit_price": 1000}],
+                [{"ticker": "133690", "quantity": 5, "limit_price": 1000}, {"ticker": "411060", "quantity": 15, "limit_price": 1000}],
+            )
+        )
+
+        self.assertEqual(result["status"], "success")
+        self.assertTrue(result["sell_results"]["all_filled"])
+        sides = [side for side, *_ in gateway.placed]
+        # 첫 매도 부분체결 대금으로 첫 매수가 두 번째 매도 체결 전에 나간다.
+        self.assertEqual(sides, ["sell", "sell", "buy", "buy"])
+        first_buy = next(order for order in gateway.orders.values() if order["ticker"] == "133690")
+        self.assertLess(first_buy["placed_at"], 1_005.0)
+        self.assertEqual([o["status"] for o in result["buy_results"]["orders"]], ["placed", "placed"])
+
+    def test_unfunded_buys_are_skipped_when_sells_time_out(self):
+        gateway = SimulatedOrderGateway(
+            cash_balance=2000,
+            fill_plan={"069500": [(1.0, 10)], "360750": [(100.0, 10)]},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        executor = self._executor(gateway)
+
+        result = executor.execute_rebalancing_trades(
+            _plan(
+                [{"ticker": "069500", "quantity": 10, "limit_price": 1000}, {"ticker": "360750", "quantity": 10, "limit_price": 1000}],
+                [{"ticker": "133690", "quantity": 12, "limit_price": 1000}, {"ticker": "411060", "quantity": 5, "limit_price": 1000}],
+            )
+        )
+
+        self.assertEqual(result["status"], "stopped")
+        self.assertFalse(result["sell_results"]["all_filled"])
+        self.assertEqual([o["status"] for o in result["sell_results"]["orders"]], ["filled", "timeout"])
+        self.assertEqual([o["status"] for o in result["buy_results"]["orders"]], ["placed", "skipped"])
+
+    def test_balance_failure_aborts_before_any_order(self):
+        gateway = SimulatedOrderGateway(cash_balance=None, clock=self.clock, sleep=self.clock.sleep)
+        executor = self._executor(gateway)
+
+        result = executor.execute_rebalancing_trades(
+            _plan([{"ticker": "069500", "quantity": 1, "limit_price": 1000}], [{"ticker": "133690", "quantity": 1, "limit_price": 1000}])
+        )
+
+        self.assertEqual(result["status"], "stopped")
+        self.assertEqual(gateway.placed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
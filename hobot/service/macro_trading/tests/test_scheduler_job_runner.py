@@ -0,0 +1,140 @@
+import threading
+import time
+import unittest
+
+from service.macro_trading import scheduler
+from service.macro_trading.job_runner import (
+    JOB_PRIORITY_BACKFILL,
+    JOB_PRIORITY_TRADING,
+    JobSpec,
+    SchedulerJobRunner,
+)
+
+
+class TestSchedulerJobRunner(unittest.TestCase):
+    def _runner(self, max_workers=1, reports=None):
+        runner = SchedulerJobRunner(
+            max_workers=max_workers,
+            report_fn=(lambda **kwargs: reports.append(kwargs)) if reports is not None else None,
+        )
+        self.addCleanup(runner.shutdown)
+        return runner
+
+    def _block_worker(self, runner):
+        """단일 워커를 점유해 이후 제출 작업이 큐에 쌓이도록 한다."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(5)
+
+        runner.submit("blocker", blocker)
+        self.assertTrue(started.wait(5))
+        return release
+
+    def test_skip_if_running_drops_overlapping_trigger(self):
+        runner = self._runner(max_workers=2)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_job():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+
+        self.assertEqual(runner.submit("slow_job", slow_job), "queued")
+        self.assertTrue(started.wait(5))
+        self.assertEqual(runner.submit("slow_job", slow_job), "skipped")
+        release.set()
+
+        self.assertTrue(runner.wait_idle(5))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(runner.snapshot()["jobs"]["slow_job"]["skipped"], 1)
+
+    def test_priority_and_dependencies_order_queued_jobs(self):
+        runner = self._runner(max_workers=1)
+        runner.register(JobSpec("backfill", priority=JOB_PRIORITY_BACKFILL))
+        runner.register(JobSpec("trade", priority=JOB_PRIORITY_TRADING, depends_on=("collect",)))
+        order = []
+
+        release = self._block_worker(runner)
+        runner.submit("backfill", lambda: order.append("backfill"))
+        runner.submit("collect", lambda: order.append("collect"))
+        runner.submit("trade", lambda: order.append("trade"))
+        release.set()
+
+        self.assertTrue(runner.wait_idle(5))
+        # trade가 가장 높은 우선순위지만 선행 작업(collect)이 끝난 뒤에 실행된다.
+        self.assertEqual(order, ["collect", "trade", "backfill"])
+
+    def test_trading_worker_is_reserved_while_batches_hold_the_pool(self):
+        runner = self._runner(max_workers=2)
+        runner.register(JobSpec("batch_a", priority=JOB_PRIORITY_BACKFILL))
+        runner.register(JobSpec("batch_b", priority=JOB_PRIORITY_BACKFILL))
+        runner.register(JobSpec("trade", priority=JOB_PRIORITY_TRADING))
+        release = threading.Event()
+        batch_started = threading.Event()
+        traded = threading.Event()
+        order = []
+
+        def batch(name):
+            order.append(name)
+            batch_started.set()
+            release.wait(5)
+
+        runner.submit("batch_a", batch, "batch_a")
+        self.assertTrue(batch_started.wait(5))
+        runner.submit("batch_b", batch, "batch_b")
+        runner.submit("trade", traded.set)
+
+        # 워커 2개 중 1개는 트레이딩 전용: batch_b는 대기하고 trade는 바로 실행된다.
+        self.assertTrue(traded.wait(5))
+        self.assertEqual(order, ["batch_a"])
+        self.assertEqual(runner.snapshot()["trading_reserved_workers"], 1)
+        release.set()
+
+        self.assertTrue(runner.wait_idle(5))
+        self.assertEqual(order, ["batch_a", "batch_b"])
+
+    def test_single_worker_does_not_reserve_trading_slot(self):
+        runner = self._runner(max_workers=1)
+        self.assertEqual(runner.trading_reserved_workers, 0)
+
+    def test_register_rejects_dependency_cycle(self):
+        runner = self._runner()
+        runner.register(JobSpec("a", depends_on=("b",)))
+        with self.assertRaises(ValueError):
+            runner.register(JobSpec("b", depends_on=("a",)))
+
+    def test_reports_queue_wait_and_run_time(self):
+        reports = []
+        runner = self._runner(max_workers=1, reports=reports)
+
+        def failing_job(days):
+            raise RuntimeError(f"boom {days}")
+
+        release = self._block_worker(runner)
+        runner.submit("failing_job", failing_job, days=7)
+        time.sleep(0.05)
+        release.set()
+        self.assertTrue(runner.wait_idle(5))
+
+        report = next(item for item in reports if item["job_code"] == "SCHEDULER_FAILING_JOB")
+        self.assertFalse(report["run_success"])
+        self.assertEqual(report["error_message"], "boom 7")
+        timing = report["details"]["scheduler"]
+        self.assertGreaterEqual(timing["queue_wait_sec"], 0.04)
+        self.assertGreaterEqual(timing["run_time_sec"], 0.0)
+
+    def test_scheduler_job_specs_form_valid_registry(self):
+        runner = SchedulerJobRunner(max_workers=1)
+        for spec in scheduler.SCHEDULER_JOB_SPECS:
+            runner.register(spec)
+        self.assertEqual(runner.spec_for("run_ai_strategy_analysis").priority, JOB_PRIORITY_TRADING)
+        self.assertEqual(runner.spec_for("unknown_job").max_concurrency, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
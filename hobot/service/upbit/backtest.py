@@ -0,0 +1,191 @@
+"""
+BBRSI 전략 벡터 백테스트
+
+- OHLCV 파티션 저장소(1m/5m/1h/1d)의 봉을 읽어 지표를 한 번에 계산하고(compute_indicator_frame),
+  실거래와 같은 조건식(strategy_signals.bbrsi_signals)으로 모든 봉의 매수/매도 신호를 배열로 구한다.
+- 포지션 상태(NULL → OVER/UNDER → NULL)는 신호가 있는 봉만 이진 탐색으로 건너뛰며 따라가므로
+  봉 수가 아니라 거래 수에 비례한다.
+- 봉 t의 평가는 봉 t 종가를 '현재가'로 보고, 체결도 그 종가로 가정한다.
+- 실거래의 EMA/EMA2 전략 우선 평가는 재현하지 않는다 (BBRSI 단독 성과).
+"""
+import itertools
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from service.upbit.indicator_engine import IndicatorParams, compute_indicator_frame
+from service.upbit.strategy_signals import (
+    BBRSIParams,
+    bbrsi_features_from_frame,
+    bbrsi_signals,
+)
+
+# 업비트 KRW 마켓 거래 수수료 (매수/매도 각각)
+DEFAULT_FEE_RATE = 0.0005
+
+
+@dataclass
+class BacktestResult:
+    params: BBRSIParams
+    trades: pd.DataFrame
+    equity: pd.Series
+    stats: Dict[str, Any]
+
+
+def load_candles(
+    ticker: str = "KRW-BTC",
+    interval: str = "1d",
+    start: Any = None,
+    end: Any = None,
+    store: Any = None,
+) -> pd.DataFrame:
+    """OHLCV 파티션 저장소에서 백테스트 구간 봉 조회"""
+    if store is None:
+        from service.utils.ohlcv_store import get_ohlcv_store
+
+        store = get_ohlcv_store(ticker)
+    return store.read_range(start, end, interval=interval, columns=["open", "high", "low", "close", "volume"])
+
+
+def _simulate_trades(signals: Mapping[str, np.ndarray]) -> List[Dict[str, Any]]:
+    entry_over = np.asarray(signals["entry_over"], dtype=bool)
+    entry_under = np.asarray(signals["entry_under"], dtype=bool)
+    entries = np.flatnonzero(entry_over | entry_under)
+    exits = {
+        "STRATEGY_BBRSI_OVER": np.flatnonzero(np.asarray(signals["sell_over"], dtype=bool)),
+        "STRATEGY_BBRSI_UNDER": np.flatnonzero(np.asarray(signals["sell_under"], dtype=bool)),
+    }
+
+    trades = []
+    position = 0
+    while True:
+        k = np.searchsorted(entries, position)
+        if k >= len(entries):
+            break
+        entry = int(entries[k])
+        strategy = "STRATEGY_BBRSI_OVER" if entry_over[entry] else "STRATEGY_BBRSI_UNDER"
+        candidates = exits[strategy]
+        j = np.searchsorted(candidates, entry + 1)
+        exit_ = int(candidates[j]) if j < len(candidates) else None
+        trades.append({"entry": entry, "exit": exit_, "strategy": strategy})
+        if exit_ is None:
+            break
+        position = exit_ + 1
+    return trades
+
+
+def run_bbrsi_backtest(
+    candles: pd.DataFrame,
+    params: Optional[BBRSIParams] = None,
+    fee_rate: float = DEFAULT_FEE_RATE,
+    indicator_frame: Optional[pd.DataFrame] = None,
+) -> BacktestResult:
+    """
+    Args:
+        candles: open/high/low/close 봉 (시간순)
+        indicator_frame: 같은 지표 파라미터로 미리 계산한 프레임 (파라미터 스윕 재사용)
+    """
+    params = params or BBRSIParams()
+    if indicator_frame is None:
+        indicator_frame = compute_indicator_frame(candles, params.indicator_params())
+    signals = bbrsi_signals(bbrsi_features_from_frame(indicator_frame), params)
+    trades = _simulate_trades(signals)
+
+    close = indicator_frame["close"].to_numpy(dtype=np.float64)
+    index = indicator_frame.index
+    n = len(close)
+    last = n - 1
+
+    # 보유 구간: 진입 봉 다음 봉 ~ 청산 봉 (종가 체결 기준)
+    marks = np.zeros(n + 1, dtype=np.int64)
+    fee_events = np.zeros(n, dtype=np.int64)
+    rows = []
+    for trade in trades:
+        entry, exit_ = trade["entry"], trade["exit"]
+        end = last if exit_ is None else exit_
+        marks[entry + 1] += 1
+        marks[end + 1] -= 1
+        fee_events[entry] += 1
+        if exit_ is not None:
+            fee_events[exit_] += 1
+        exit_price = close[end]
+        rows.append(
+            {
+                "strategy": trade["strategy"],
+                "entry_time": index[entry],
+                "exit_time": index[exit_] if exit_ is not None else None,
+                "entry_price": close[entry],
+                "exit_price": exit_price if exit_ is not None else None,
+                "return_pct": ((exit_price / close[entry]) * (1 - fee_rate) ** 2 - 1) * 100,
+                "bars_held": end - entry,
+                "open": exit_ is None,
+            }
+        )
+    held = np.cumsum(marks[:n]) > 0
+
+    returns = np.zeros(n, dtype=np.float64)
+    if n > 1:
+        returns[1:] = close[1:] / close[:-1] - 1
+    log_growth = np.log1p(np.where(held, returns, 0.0)) + fee_events * np.log1p(-fee_rate)
+    equity = pd.Series(np.exp(np.cumsum(log_growth)), index=index, name="equity")
+
+    trades_df = pd.DataFrame(
+        rows,
+        columns=["strategy", "entry_time", "exit_time", "entry_price", "exit_price", "return_pct", "bars_held", "open"],
+    )
+    closed = trades_df[~trades_df["open"]] if not trades_df.empty else trades_df
+    drawdown = equity / equity.cummax() - 1 if n else equity
+    stats = {
+        "bars": n,
+        "trade_count": int(len(trades_df)),
+        "total_return_pct": float((equity.iloc[-1] - 1) * 100) if n else 0.0,
+        "buy_and_hold_return_pct": float((close[-1] / close[0] - 1) * 100) if n else 0.0,
+        "max_drawdown_pct": float(drawdown.min() * 100) if n else 0.0,
+        "win_rate": float((closed["return_pct"] > 0).mean()) if len(closed) else None,
+        "exposure": float(held.mean()) if n else 0.0,
+    }
+    return BacktestResult(params=params, trades=trades_df, equity=equity, stats=stats)
+
+
+def run_bbrsi_parameter_sweep(
+    candles: pd.DataFrame,
+    grid: Mapping[str, Iterable[Any]],
+    base_params: Optional[BBRSIParams] = None,
+    fee_rate: float = DEFAULT_FEE_RATE,
+) -> pd.DataFrame:
+    """
+    파라미터 조합별 백테스트. 지표 파라미터가 같은 조합끼리는 지표 프레임을 한 번만 계산한다.
+
+    Args:
+        grid: {"rsi_threshold": [1.5, 1.8], "bb_window": [20, 30], ...} (BBRSIParams 필드명)
+
+    Returns:
+        조합별 파라미터 + stats (total_return_pct 내림차순)
+    """
+    base_params = base_params or BBRSIParams()
+    valid = {f.name for f in fields(BBRSIParams)}
+    unknown = sorted(set(grid) - valid)
+    if unknown:
+        raise ValueError(f"알 수 없는 BBRSI 파라미터: {unknown}")
+
+    names = list(grid)
+    # 지표 파라미터별로 조합을 묶어 한 번에 지표 프레임 하나만 메모리에 둔다 (긴 분봉 구간에서 프레임이 크다).
+    groups: Dict[IndicatorParams, List[Tuple[Tuple[Any, ...], BBRSIParams]]] = {}
+    for values in itertools.product(*(list(grid[name]) for name in names)):
+        params = replace(base_params, **dict(zip(names, values)))
+        groups.setdefault(params.indicator_params(), []).append((values, params))
+
+    results = []
+    for indicator_params, combos in groups.items():
+        frame = compute_indicator_frame(candles, indicator_params)
+        for values, params in combos:
+            result = run_bbrsi_backtest(candles, params, fee_rate=fee_rate, indicator_frame=frame)
+            results.append({**dict(zip(names, values)), **result.stats})
+        del frame
+
+    summary = pd.DataFrame(results)
+    if summary.empty:
+        return summary
+    return summary.sort_values("total_return_pct", ascending=False, ignore_index=True)
@@ -0,0 +1,370 @@
+"""
+스트리밍 지표 엔진 (심볼/주기별 O(1) 갱신)
+
+- 새 봉이 확정될 때마다 RSI / EMA / 볼린저밴드 / ATR 상태를 한 번씩만 갱신한다.
+- 진행 중인 봉은 상태를 바꾸지 않고 미리보기(preview)로만 계산한다.
+- 값은 upbit_utils 헬퍼(pandas ewm/rolling)로 같은 구간을 계산한 결과와 일치한다.
+    RSI          : calculate_rsi (ewm(alpha=1/period), adjust=True)
+    RSI 이평/EMA : ewm(span, adjust=False)
+    볼린저밴드   : rolling(window).mean / std(ddof=0)
+    ATR          : calculate_atr(atr_type="rma") (ewm(alpha=1/period), adjust=False)
+- compute_indicator_frame은 같은 지표를 전체 봉에 대해 벡터 연산으로 계산한다 (백테스트용).
+"""
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from service.upbit.upbit_utils import calculate_atr, calculate_rsi
+
+NAN = float("nan")
+
+INDICATOR_COLUMNS = (
+    "close",
+    "high",
+    "low",
+    "rsi",
+    "rsi_fast",
+    "rsi_slow",
+    "ema",
+    "bb_middle",
+    "bb_upper",
+    "bb_lower",
+    "bb_upper_outer",
+    "bb_lower_outer",
+    "atr",
+)
+
+DEFAULT_HISTORY = 8
+DEFAULT_SYNC_OVERLAP = 8
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """지표 파라미터 (기본값은 strategy_bbrsi 기존 상수)"""
+    rsi_period: int = 14
+    rsi_fast_span: int = 2
+    rsi_slow_span: int = 4
+    ema_span: int = 7
+    bb_window: int = 20
+    bb_k_inner: float = 1.0
+    bb_k_outer: float = 2.0
+    atr_period: int = 20
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value != value
+
+
+# ----------------------------------------------------------------------
+# 지표별 상태 (step(commit=False)는 상태를 바꾸지 않고 값만 계산)
+# ----------------------------------------------------------------------
+class EMAState:
+    """ewm(adjust=False).mean()의 O(1) 갱신. 선행 결측치는 건너뛰고, 중간 결측치는 직전 값을 유지한다."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, alpha: float):
+        self.alpha = float(alpha)
+        self.value: Optional[float] = None
+
+    @classmethod
+    def from_span(cls, span: int) -> "EMAState":
+        return cls(2.0 / (span + 1.0))
+
+    def step(self, x: float, commit: bool = True) -> float:
+        if _is_missing(x):
+            return NAN if self.value is None else self.value
+        value = x if self.value is None else (1.0 - self.alpha) * self.value + self.alpha * x
+        if commit:
+            self.value = value
+        return value
+
+
+class AdjustedEMAState:
+    """ewm(adjust=True).mean()의 O(1) 갱신 (가중합/가중치합을 누적)"""
+
+    __slots__ = ("alpha", "numerator", "denominator")
+
+    def __init__(self, alpha: float):
+        self.alpha = float(alpha)
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def step(self, x: float, commit: bool = True) -> float:
+        decay = 1.0 - self.alpha
+        numerator = x + decay * self.numerator
+        denominator = 1.0 + decay * self.denominator
+        if commit:
+            self.numerator, self.denominator = numerator, denominator
+        return numerator / denominator
+
+
+class RSIState:
+    """calculate_rsi와 같은 RSI (상승/하락분 ewm(alpha=1/period))"""
+
+    __slots__ = ("prev_close", "gain", "loss")
+
+    def __init__(self, period: int = 14):
+        self.prev_close: Optional[float] = None
+        self.gain = AdjustedEMAState(1.0 / period)
+        self.loss = AdjustedEMAState(1.0 / period)
+
+    def step(self, close: float, commit: bool = True) -> float:
+        if self.prev_close is None:
+            if commit:
+                self.prev_close = close
+            return NAN
+        delta = close - self.prev_close
+        avg_gain = self.gain.step(max(delta, 0.0), commit)
+        avg_loss = self.loss.step(max(-delta, 0.0), commit)
+        if commit:
+            self.prev_close = close
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else NAN
+        return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+
+class RollingBandState:
+    """rolling(window).mean() / std(ddof=0)의 O(1) 갱신 (기준값을 뺀 합/제곱합 누적)"""
+
+    __slots__ = ("window", "values", "shift", "sum", "sum_sq", "_since_resum")
+
+    # 누적 오차가 쌓이지 않도록 이 횟수마다 창 안의 값으로 합계를 다시 구한다.
+    RESUM_EVERY = 1024
+
+    def __init__(self, window: int = 20):
+        self.window = int(window)
+        self.values: Deque[float] = deque()
+        self.shift: Optional[float] = None
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self._since_resum = 0
+
+    def _resum(self) -> None:
+        self.shift = self.values[0] if self.values else None
+        shifted = [value - self.shift for value in self.values] if self.values else []
+        self.sum = math.fsum(shifted)
+        self.sum_sq = math.fsum(value * value for value in shifted)
+        self._since_resum = 0
+
+    def step(self, x: float, commit: bool = True) -> Tuple[float, float]:
+        shift = x if self.shift is None else self.shift
+        total = self.sum + (x - shift)
+        total_sq = self.sum_sq + (x - shift) ** 2
+        count = len(self.values) + 1
+        if count > self.window:
+            oldest = self.values[0] - shift
+            total -= oldest
+            total_sq -= oldest * oldest
+            count -= 1
+        if commit:
+            self.shift = shift
+            self.values.append(x)
+            if len(self.values) > self.window:
+                self.values.popleft()
+            self.sum, self.sum_sq = total, total_sq
+            self._since_resum += 1
+            if self._since_resum >= self.RESUM_EVERY:
+                self._resum()
+        if count < self.window:
+            return NAN, NAN
+        mean = total / count
+        variance = max(total_sq / count - mean * mean, 0.0)
+        return shift + mean, math.sqrt(variance)
+
+
+class ATRState:
+    """calculate_atr(atr_type="rma")와 같은 ATR"""
+
+    __slots__ = ("prev_close", "ema")
+
+    def __init__(self, period: int = 14):
+        self.prev_close: Optional[float] = None
+        self.ema = EMAState(1.0 / period)
+
+    def step(self, high: float, low: float, close: float, commit: bool = True) -> float:
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        value = self.ema.step(true_range, commit)
+        if commit:
+            self.prev_close = close
+        return value
+
+
+# ----------------------------------------------------------------------
+# 심볼/주기 하나의 지표 상태
+# ----------------------------------------------------------------------
+class IndicatorState:
+    """확정 봉으로 갱신되는 지표 묶음 + 최근 history개 확정 봉의 지표 행"""
+
+    def __init__(self, params: Optional[IndicatorParams] = None, history: int = DEFAULT_HISTORY):
+        self.params = params or IndicatorParams()
+        self.rsi = RSIState(self.params.rsi_period)
+        self.rsi_fast = EMAState.from_span(self.params.rsi_fast_span)
+        self.rsi_slow = EMAState.from_span(self.params.rsi_slow_span)
+        self.ema = EMAState.from_span(self.params.ema_span)
+        self.bands = RollingBandState(self.params.bb_window)
+        self.atr = ATRState(self.params.atr_period)
+        self.history: Deque[Dict[str, float]] = deque(maxlen=max(int(history), 1))
+        self.last_timestamp: Optional[pd.Timestamp] = None
+        self.count = 0
+
+    def step(self, candle: Mapping[str, Any], commit: bool = True) -> Dict[str, float]:
+        close = float(candle["close"])
+        high = float(candle["high"])
+        low = float(candle["low"])
+        rsi = self.rsi.step(close, commit)
+        middle, std = self.bands.step(close, commit)
+        row = {
+            "close": close,
+            "high": high,
+            "low": low,
+            "rsi": rsi,
+            "rsi_fast": self.rsi_fast.step(rsi, commit),
+            "rsi_slow": self.rsi_slow.step(rsi, commit),
+            "ema": self.ema.step(close, commit),
+            "bb_middle": middle,
+            "bb_upper": middle + self.params.bb_k_inner * std,
+            "bb_lower": middle - self.params.bb_k_inner * std,
+            "bb_upper_outer": middle + self.params.bb_k_outer * std,
+            "bb_lower_outer": middle - self.params.bb_k_outer * std,
+            "atr": self.atr.step(high, low, close, commit),
+        }
+        if commit:
+            self.history.append(row)
+            self.count += 1
+        return row
+
+    def update(self, timestamp: Any, candle: Mapping[str, Any]) -> Dict[str, float]:
+        """확정 봉 반영"""
+        row = self.step(candle, commit=True)
+        self.last_timestamp = pd.Timestamp(timestamp)
+        return row
+
+    def preview(self, candle: Mapping[str, Any]) -> Dict[str, float]:
+        """진행 중인 봉의 지표 (상태 변경 없음)"""
+        return self.step(candle, commit=False)
+
+
+# ----------------------------------------------------------------------
+# 엔진
+# ----------------------------------------------------------------------
+class IndicatorEngine:
+    """(심볼, 주기)별 IndicatorState 관리"""
+
+    def __init__(
+        self,
+        params: Optional[IndicatorParams] = None,
+        history: int = DEFAULT_HISTORY,
+        sync_overlap: int = DEFAULT_SYNC_OVERLAP,
+    ):
+        self.params = params or IndicatorParams()
+        self.history = history
+        self.sync_overlap = max(int(sync_overlap), 1)
+        self._states: Dict[Tuple[str, str], IndicatorState] = {}
+        self._lock = threading.Lock()
+
+    def reset(self, symbol: Optional[str] = None, interval: Optional[str] = None) -> None:
+        with self._lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                self._states.pop((symbol, interval), None)
+
+    def is_warm(self, symbol: str, interval: str) -> bool:
+        with self._lock:
+            return (symbol, interval) in self._states
+
+    def candles_needed(self, symbol: str, interval: str, full_count: int) -> int:
+        """다음 sync에 필요한 봉 수: 상태가 있으면 겹침 구간만, 없으면 full_count"""
+        if self.is_warm(symbol, interval):
+            return min(self.sync_overlap + 2, full_count)
+        return full_count
+
+    def sync(self, symbol: str, interval: str, candles: pd.DataFrame) -> bool:
+        """
+        candles(마지막 행은 진행 중인 봉)의 확정 봉 중 아직 반영하지 않은 봉만 상태에 반영한다.
+
+        Returns:
+            False: 기존 상태 이후로 빠진 봉이 있어 이어 붙일 수 없음 (reset 후 전체 구간으로 다시 sync)
+        """
+        closed = candles.iloc[:-1]
+        key = (symbol, interval)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = IndicatorState(self.params, self.history)
+                for timestamp, candle in zip(closed.index, closed.to_dict("records")):
+                    state.update(timestamp, candle)
+                self._states[key] = state
+                return True
+            if state.last_timestamp is None or closed.empty:
+                return True
+            if closed.index[0] > state.last_timestamp:
+                return False
+            pending = closed[closed.index > state.last_timestamp]
+            for timestamp, candle in zip(pending.index, pending.to_dict("records")):
+                state.update(timestamp, candle)
+            return True
+
+    def rows(self, symbol: str, interval: str, current_candle: Optional[Mapping[str, Any]] = None) -> List[Dict[str, float]]:
+        """최근 확정 봉 지표 행 (+ current_candle이 있으면 마지막에 진행 중인 봉 미리보기)"""
+        with self._lock:
+            state = self._states.get((symbol, interval))
+            if state is None:
+                return []
+            rows = list(state.history)
+            if current_candle is not None:
+                rows.append(state.preview(current_candle))
+            return rows
+
+
+_engine: Optional[IndicatorEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """프로세스 공용 IndicatorEngine 싱글톤"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = IndicatorEngine()
+        return _engine
+
+
+# ----------------------------------------------------------------------
+# 벡터 연산 (백테스트/검증용)
+# ----------------------------------------------------------------------
+def compute_indicator_frame(candles: pd.DataFrame, params: Optional[IndicatorParams] = None) -> pd.DataFrame:
+    """전체 봉에 대해 INDICATOR_COLUMNS를 한 번에 계산 (IndicatorState를 순서대로 갱신한 값과 같다)"""
+    params = params or IndicatorParams()
+    ohlc = candles[["high", "low", "close"]].astype("float64")
+    close = ohlc["close"]
+
+    frame = pd.DataFrame(index=candles.index)
+    frame["close"] = close
+    frame["high"] = ohlc["high"]
+    frame["low"] = ohlc["low"]
+
+    rsi = calculate_rsi(ohlc, period=params.rsi_period)
+    frame["rsi"] = rsi
+    frame["rsi_fast"] = rsi.ewm(span=params.rsi_fast_span, adjust=False).mean()
+    frame["rsi_slow"] = rsi.ewm(span=params.rsi_slow_span, adjust=False).mean()
+    frame["ema"] = close.ewm(span=params.ema_span, adjust=False).mean()
+
+    middle = close.rolling(window=params.bb_window).mean()
+    std = close.rolling(params.bb_window).std(ddof=0)
+    frame["bb_middle"] = middle
+    frame["bb_upper"] = middle + params.bb_k_inner * std
+    frame["bb_lower"] = middle - params.bb_k_inner * std
+    frame["bb_upper_outer"] = middle + params.bb_k_outer * std
+    frame["bb_lower_outer"] = middle - params.bb_k_outer * std
+
+    frame["atr"] = calculate_atr(ohlc.copy(), period=params.atr_period, atr_type="rma")
+    return frame.astype(np.float64)
@@ -0,0 +1,160 @@
+"""
+BBRSI 전략 조건 계산 (실거래/백테스트 공용)
+
+- 조건식은 스칼라(실시간 평가)와 numpy 배열(백테스트) 모두에 그대로 동작하도록 &, | 와 np 함수만 쓴다.
+- 피처는 (이름, 지표 컬럼, lag) 정의 하나로 지표 행 목록과 지표 프레임 양쪽에서 뽑는다.
+  lag 0 = 현재(진행 중) 봉, lag 1 = 직전 확정 봉, ...
+"""
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from service.upbit.indicator_engine import IndicatorParams
+
+BBRSI_FEATURES = (
+    ("rsi_ma1", "rsi", 1),
+    ("rsi_ma2", "rsi_fast", 1),
+    ("rsi_ma4", "rsi_slow", 1),
+    ("rsi_ma1_2before", "rsi", 2),
+    ("rsi_ma2_2before", "rsi_fast", 2),
+    ("rsi_ma4_2before", "rsi_slow", 2),
+    ("rsi_ma1_3before", "rsi", 3),
+    ("rsi_ma2_3before", "rsi_fast", 3),
+    ("rsi_ma4_3before", "rsi_slow", 3),
+    ("ma7", "ema", 1),
+    ("ma7_2before", "ema", 2),
+    ("bb_low1", "bb_lower", 1),
+    ("bb_low2", "bb_lower", 2),
+    ("bb_low3", "bb_lower", 3),
+    ("bb_low4", "bb_lower", 4),
+    ("bb_low1_k2", "bb_lower_outer", 1),
+    ("bb_upper1", "bb_upper", 1),
+    ("bb_upper2", "bb_upper", 2),
+    ("close", "close", 0),
+    ("close1", "close", 1),
+    ("close2", "close", 2),
+    ("close3", "close", 3),
+    ("close4", "close", 4),
+    ("high1", "high", 1),
+    ("low1", "low", 1),
+    ("low2", "low", 2),
+    ("low3", "low", 3),
+    ("low4", "low", 4),
+    ("atr1", "atr", 0),
+)
+
+BBRSI_MAX_LAG = max(lag for _, _, lag in BBRSI_FEATURES)
+
+
+@dataclass(frozen=True)
+class BBRSIParams(IndicatorParams):
+    """BBRSI 전략 파라미터 (지표 파라미터 + 조건 임계값)"""
+    rsi_threshold: float = 1.8
+    stop_close_ratio: float = 0.88
+    atr_stop_mult: float = 1.0
+    atr_limit_mult: float = 4.0
+
+    def indicator_params(self) -> IndicatorParams:
+        return IndicatorParams(**{f.name: getattr(self, f.name) for f in fields(IndicatorParams)})
+
+
+def bbrsi_features_from_rows(rows: List[Mapping[str, float]]) -> Dict[str, float]:
+    """지표 행 목록(마지막 = 현재 봉)에서 피처 추출. 행이 모자라면 NaN."""
+    features = {}
+    for name, column, lag in BBRSI_FEATURES:
+        position = len(rows) - 1 - lag
+        features[name] = float(rows[position][column]) if position >= 0 else float("nan")
+    return features
+
+
+def bbrsi_features_from_frame(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """지표 프레임의 모든 봉을 '현재 봉'으로 보는 피처 배열"""
+    shifted: Dict[tuple, np.ndarray] = {}
+    features = {}
+    for name, column, lag in BBRSI_FEATURES:
+        key = (column, lag)
+        if key not in shifted:
+            shifted[key] = frame[column].shift(lag).to_numpy(dtype=np.float64)
+        features[name] = shifted[key]
+    return features
+
+
+def bbrsi_signals(f: Mapping[str, Any], params: BBRSIParams = BBRSIParams()) -> Dict[str, Any]:
+    """
+    BBRSI 매수/매도 조건 (strategy_bbrsi 주석의 조건 번호 기준)
+
+    Returns:
+        entry_over / entry_under: STRATEGY_NULL에서 각 상태로 매수
+        sell_over / sell_under: 각 상태 보유 중 매도
+    """
+    threshold = params.rsi_threshold
+    rsi_ma1, rsi_ma2, rsi_ma4 = f["rsi_ma1"], f["rsi_ma2"], f["rsi_ma4"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 매수조건1) 직전 종가 > ema (= over 상태)
+        is_over = f["close1"] > f["ma7"]
+
+        # 매수조건 1-2) RSI 1,2,4 이평끼리 서로 간격이 좁을 때
+        condition1_2 = (
+            (np.abs(rsi_ma1 - rsi_ma2) * 100 / rsi_ma1 < threshold)
+            | (np.abs(rsi_ma1 - rsi_ma2) * 100 / rsi_ma2 < threshold)
+            | (np.abs(rsi_ma2 - rsi_ma4) * 100 / rsi_ma4 < threshold)
+        )
+
+    # 매수조건2) 2봉 전 or 3봉 전의 rsi의 1, 2, 4 이평이 역배열 상태였었는가?
+    c1 = (f["rsi_ma1_2before"] < f["rsi_ma2_2before"]) & (f["rsi_ma2_2before"] < f["rsi_ma4_2before"])
+    c2 = (f["rsi_ma1_3before"] < f["rsi_ma2_3before"]) & (f["rsi_ma2_3before"] < f["rsi_ma4_3before"])
+    condition2 = c1 | c2
+
+    # 매수조건3) 직전 4개봉 저가가 BB 하단에 위치
+    condition3 = (
+        (f["bb_low1"] > f["low1"])
+        | (f["bb_low2"] > f["low2"])
+        | (f["bb_low3"] > f["low3"])
+        | (f["bb_low4"] > f["low4"])
+    )
+
+    buy = (is_over | condition1_2) & condition2 & condition3
+
+    # 공통 매도조건1) 직전 저가가 bbLower(k=2) 하단에 위치
+    sell_condition1 = f["low1"] < f["bb_low1_k2"]
+    # OVER 매도조건2) 직전 종가가 bbUpper(k=1) Crossover
+    sell_condition1_over = (f["bb_upper1"] < f["close1"]) & (f["bb_upper2"] > f["close2"])
+    # OVER 매도조건3) StopLoss: 직전봉 저가 - atr*1 > 현재가
+    stop_condition_under = (f["low1"] - f["atr1"] * params.atr_stop_mult) > f["close"]
+    # OVER 매도조건4) limit: 직전봉 고가 + atr*4 < 현재가
+    limit_condition_under = (f["high1"] + f["atr1"] * params.atr_limit_mult) < f["close"]
+    # UNDER 매도조건2) 직전 종가가 ema Crossover
+    sell_condition1_under = (f["ma7"] < f["close1"]) & (f["ma7_2before"] > f["close2"])
+    # UNDER 매도조건3) StopLoss: 직전봉 종가 * 0.88 > 현재가
+    stop_condition_over = (f["close1"] * params.stop_close_ratio) > f["close"]
+
+    sell_over = sell_condition1_over | sell_condition1 | stop_condition_under | limit_condition_under
+    sell_under = sell_condition1_under | sell_condition1 | stop_condition_over
+
+    return {
+        "is_over": is_over,
+        "buy": buy,
+        "entry_over": buy & is_over & np.logical_not(sell_over),
+        "entry_under": buy & np.logical_not(is_over) & np.logical_not(sell_under),
+        "sell_over": sell_over,
+        "sell_under": sell_under,
+    }
+
+
+def resolve_bbrsi_action(current_strategy: str, signals: Mapping[str, Any]) -> str:
+    """현재 전략 상태 + 조건 → strategy_bbrsi 반환 문자열"""
+    if current_strategy == "STRATEGY_NULL":
+        if signals["entry_over"]:
+            return "buyCondition_bbrsi_over"
+        if signals["entry_under"]:
+            return "buyCondition_bbrsi_under"
+    elif current_strategy == "STRATEGY_BBRSI_OVER":
+        if signals["sell_over"]:
+            return "sellCondition_bbrsi_over"
+    elif current_strategy == "STRATEGY_BBRSI_UNDER":
+        if signals["sell_under"]:
+            return "sellCondition_bbrsi_under"
+    return "noCondition_bbrsi"
@@ -3,6 +3,8 @@ import os
 import pyupbit
 import pandas as pd
 from service.upbit.upbit_utils import calculate_rsi, write_current_strategy, get_balance_info, current_time, read_current_strategy, get_buy_info, get_sell_info, calculate_atr
+from service.upbit.indicator_engine import get_indicator_engine
+from service.upbit.strategy_signals import bbrsi_features_from_rows, bbrsi_signals, resolve_bbrsi_action
 from service.slack_bot import post_message
 import traceback
 
@@ -171,154 +173,44 @@ def strategy_ema2(current_strategy):
 # 3) StopLoss 매도조건: 직전봉 저가 - atr*1 > 현재가
 # 4) limit 매도조건: 직전봉 고가 + atr*4 < 현재가
 # ===============================================
-def strategy_bbrsi(current_strategy):
-    df = fetch_candle_data(target_ticker, interval, 250)
-
-    close = df["close"]
-
-    #rsi
-    rsi = calculate_rsi(df)
-    rsi_ma1 = calculate_rsi(df).iloc[-2]
-    rsi_ma2 = rsi.ewm(span=2, adjust=False).mean().iloc[-2]
-    rsi_ma4 = rsi.ewm(span=4, adjust=False).mean().iloc[-2]
-
-    rsi_ma1_2before = calculate_rsi(df).iloc[-3]
-    rsi_ma2_2before = rsi.ewm(span=2, adjust=False).mean().iloc[-3]
-    rsi_ma4_2before = rsi.ewm(span=4, adjust=False).mean().iloc[-3]
-
-    rsi_ma1_3before = calculate_rsi(df).iloc[-4]
-    rsi_ma2_3before = rsi.ewm(span=2, adjust=False).mean().iloc[-4]
-    rsi_ma4_3before = rsi.ewm(span=4, adjust=False).mean().iloc[-4]
-
-    # 이평
-    ma7 = close.ewm(span=7, adjust=False).mean().iloc[-2]
-    ma7_2before = close.ewm(span=7, adjust=False).mean().iloc[-3]
-
-
-    # 볼밴
-    pd.set_option('display.float_format', lambda x: '%.2f' % x)
-
-    # Bollinger Bands (K=1)
-    df['middle'] = df['close'].rolling(window=20).mean()
-    std = df['close'].rolling(20).std(ddof=0)
-    df['upper'] = df['middle'] + 1 * std
-    df['lower'] = df['middle'] - 1 * std
-
-    df[['upper', 'middle', 'lower']].tail(n=10)
-
-    # Bollinger Bands (K=2)
-    df['middle_k2'] = df['close'].rolling(window=20).mean()
-    std_k2 = df['close'].rolling(20).std(ddof=0)
-    df['upper_k2'] = df['middle_k2'] + 2 * std_k2
-    df['lower_k2'] = df['middle_k2'] - 2 * std_k2
-
-    df[['upper_k2', 'middle_k2', 'lower_k2']].tail(n=10)
-
-    
-
-    # 볼린저밴드 직전 하단
-    bb_low1 = df.iloc[-2]['lower']
-    bb_low2 = df.iloc[-3]['lower']
-    bb_low3 = df.iloc[-4]['lower']
-    bb_low4 = df.iloc[-5]['lower']
+def _bbrsi_indicator_rows(ticker, candle_interval, full_count=250):
+    """지표 엔진을 최신 확정 봉까지 맞추고, 최근 확정 봉 + 진행 중인 봉의 지표 행을 반환"""
+    engine = get_indicator_engine()
 
-    bb_low1_k2 = df.iloc[-2]['lower_k2']
+    # 상태가 있으면 겹치는 최근 몇 개 봉만 받아서 새로 확정된 봉만 반영한다.
+    df = fetch_candle_data(ticker, candle_interval, engine.candles_needed(ticker, candle_interval, full_count))
+    if df is None:
+        return None
 
-    bb_upper1 = df.iloc[-2]['upper']
-    bb_upper2 = df.iloc[-3]['upper']
+    if not engine.sync(ticker, candle_interval, df):
+        # 마지막 평가 이후 봉이 비어 있으면 전체 구간으로 다시 워밍업
+        engine.reset(ticker, candle_interval)
+        df = fetch_candle_data(ticker, candle_interval, full_count)
+        if df is None:
+            return None
+        engine.sync(ticker, candle_interval, df)
 
-    close_curr = df.iloc[-1]["close"]
-    close1 = df.iloc[-2]["close"]
-    close2 = df.iloc[-3]["close"]
-    close3 = df.iloc[-4]["close"]
-    close4 = df.iloc[-5]["close"]
+    return engine.rows(ticker, candle_interval, df.iloc[-1])
 
-    high1 = df.iloc[-2]["high"]
+def strategy_bbrsi(current_strategy):
+    rows = _bbrsi_indicator_rows(target_ticker, interval)
+    if not rows:
+        print("strategy_bbrsi: 캔들 데이터를 가져오지 못했습니다.")
+        return "noCondition_bbrsi"
 
-    low1 = df.iloc[-2]["low"]
-    low2 = df.iloc[-3]["low"]
-    low3 = df.iloc[-4]["low"]
-    low4 = df.iloc[-5]["low"]
+    # 지표는 엔진 상태에서 봉당 한 번씩만 갱신된 값을 사용 (조건식은 백테스트와 공용)
+    features = bbrsi_features_from_rows(rows)
 
-    bbrsi_dict = {"ma7": ma7, "rsi":rsi_ma1, "rsi_ma2":rsi_ma2, "rsi_ma4":rsi_ma4, "bb_low1":bb_low1, "bb_low2":bb_low2, "bb_low3":bb_low3, "bb_low4":bb_low4, "bb_low1_k2": bb_low1_k2,"close":close_curr, "close1":close1, "close2":close2, "close3":close3, "close4":close4, "low1":low1, "low2":low2, "low3":low3, "low4":low4}
+    bbrsi_dict = {key: features[key] for key in ("ma7", "bb_low1", "bb_low2", "bb_low3", "bb_low4", "bb_low1_k2", "close", "close1", "close2", "close3", "close4", "low1", "low2", "low3", "low4")}
+    bbrsi_dict.update({"rsi": features["rsi_ma1"], "rsi_ma2": features["rsi_ma2"], "rsi_ma4": features["rsi_ma4"]})
     print("bbrsi_dict =============")
     print(bbrsi_dict)
 
-    atr_df = calculate_atr(df, period=20, atr_type="rma")
-    atr1 = atr_df.iloc[-1]
     print("atr1 - bbrsi_under=============")
-    print(atr1)
-
-    # -----------------------------------------------
-    # 매수조건 Setting
-    # -----------------------------------------------
-    # 매수조건1) rsi의 2이평 > 4이평
-    condition1 = close1 > ma7
-
-    # 매수조건 1-2) RSI 1,2,4 이평끼리 서로 간격이 좁을 때 (rsi_threshold default 1.8%)
-    rsi_threshold = 1.8
-    condition1_2 = abs(rsi_ma1 - rsi_ma2) * 100 / rsi_ma1 < rsi_threshold or abs(rsi_ma1 - rsi_ma2) * 100 / rsi_ma2 < rsi_threshold or abs(rsi_ma2 - rsi_ma4) * 100 / rsi_ma4 < rsi_threshold
-
-    # 매수조건2) 2봉 전 or 3봉 전의 rsi의 1, 2, 4 이평이 역배열 상태였었는가?
-    c1 = rsi_ma1_2before < rsi_ma2_2before and rsi_ma2_2before < rsi_ma4_2before
-    c2 = rsi_ma1_3before < rsi_ma2_3before and rsi_ma2_3before < rsi_ma4_3before
-    condition2 = c1 or c2
-
-    # 매수조건3) 직전 4개봉 저가가 BB 하단에 위치
-    condition3 = bb_low1 > low1 or bb_low2 > low2 or bb_low3 > low3 or bb_low4 > low4
-
-    # -----------------------------------------------
-    # 매도조건 Setting
-    # -----------------------------------------------
-    # 공통 매도조건1) 직전 종가가 bbLower(k=2) 하단에 위치
-    sell_condition1 = low1 < bb_low1_k2
-
-    # OVER 매도조건2) 직전 종가가 bbUpper(k=1) Crossover
-    sell_condition1_over =  bb_upper1 < close1 and bb_upper2 > close2 # ta.crossover(close,ma7)
-
-    # OVER 매도조건3) StopLoss 매도조건: 직전봉 저가 - atr*1 > 현재가
-    stop_condition_under = (low1 - atr1) > close_curr
-    
-    # OVER 매도조건4) limit 매도조건: 직전봉 고가 + atr*4 < 현재가
-    limit_condition_under = (high1 + atr1 * 4) < close_curr
-
-    # UNDER 매도조건2) 직전 종가가 7일 이평 Crossover
-    sell_condition1_under = ma7 < close1 and ma7_2before > close2 # ta.crossover(close,ma7)
-
-    # UNDER 매도조건3) StopLoss 매도조건: 직전봉 종가 * 0.88 > 현재가
-    stop_condition_over = (close1 * 0.88) > close_curr
+    print(features["atr1"])
 
-
-    sellCondition_bbrsi_over = sell_condition1_over or sell_condition1 or stop_condition_under or limit_condition_under
-    sellCondition_bbrsi_under = sell_condition1_under or sell_condition1 or stop_condition_over
-
-    #bbrsi_over or bbrsi_under 판단
-    is_over = close1 > ma7
-
-    result = None
-
-    if current_strategy == "STRATEGY_NULL":
-        if is_over: #over 상태일 때
-            buyCondition_bbrsi = (condition1 or condition1_2) and condition2 and condition3
-            
-            if buyCondition_bbrsi and not(sellCondition_bbrsi_over): #sell condition False일 때 buy 하도록:
-                result = "buyCondition_bbrsi_over"
-
-        else: #under 상태일 때
-            buyCondition_bbrsi = (condition1 or condition1_2) and condition2 and condition3
-
-            if buyCondition_bbrsi and not(sellCondition_bbrsi_under): #sell condition False일 때 buy 하도록:
-                result = "buyCondition_bbrsi_under"
-     
-    elif current_strategy == "STRATEGY_BBRSI_OVER":
-        if sellCondition_bbrsi_over:
-            result = "sellCondition_bbrsi_over"
-
-    elif current_strategy == "STRATEGY_BBRSI_UNDER":
-        if sellCondition_bbrsi_under:
-            result = "sellCondition_bbrsi_under"
-
-    return "noCondition_bbrsi" if result == None else result
+    signals = bbrsi_signals(features)
+    return resolve_bbrsi_action(current_strategy, signals)
 
 # ================================================
 # Entry Position
@@ -412,13 +304,14 @@ def control_tower():
 
                 return {"status": "success", "message": "EMA2 entry success", "strategy": "STRATEGY_EMA2", "system_message": entry_result}
 
-            elif strategy_bbrsi(current_strategy) == "buyCondition_bbrsi_over": 
+            bbrsi_result = strategy_bbrsi(current_strategy)
+            if bbrsi_result == "buyCondition_bbrsi_over":
                 print("BBRSI_OVER 매수 실행")
                 entry_result = entry_position(bal_krw, upbit, "STRATEGY_BBRSI_OVER")
 
                 return {"status": "success", "message": "BBRSI_OVER entry success", "strategy": "STRATEGY_BBRSI_OVER", "system_message": entry_result}
 
-            elif strategy_bbrsi(current_strategy) == "buyCondition_bbrsi_under": 
+            elif bbrsi_result == "buyCondition_bbrsi_under":
                 print("BBRSI_UNDER 매수 실행")
                 entry_result = entry_position(bal_krw, upbit, "STRATEGY_BBRSI_UNDER")
 
@@ -482,6 +375,7 @@ def health_check():
             # 잔고 조회 실패해도 헬스체크는 성공으로 처리
             return {"status": "success", "message": "Health check success (balance check failed)"}
 
+    except Exception as e:
         trace = traceback.format_exc()
         return {"status": "error", "message": str(e), "trace": trace}
 
@@ -78,10 +78,8 @@ def read_current_strategy():
         return "STRATEGY_NULL"
 
 
-def calculate_rsi(df):
+def calculate_rsi(df, period=14):
     # 업비트에서 가상화폐의 일봉 데이터를 조회
-    
-    period=14
 
     # 가격 변동을 계산
     delta = df['close'].diff()
@@ -6,6 +6,7 @@ import logging
 import os
 from typing import Optional, Dict, Any
 from slack_bot import post_message
+from service.utils.ohlcv_store import OHLCVPartitionStore, get_ohlcv_store
 
 # 로깅 설정
 logging.basicConfig(
@@ -18,21 +19,41 @@ logging.basicConfig(
 )
 
 class BitcoinCSVCollector:
-    def __init__(self, ticker: str = "KRW-BTC", csv_path: str = "data/bitcoin_1m_ohlcv.csv"):
+    def __init__(self, ticker: str = "KRW-BTC", csv_path: str = "data/bitcoin_1m_ohlcv.csv",
+                 store: Optional[OHLCVPartitionStore] = None):
         """
-        비트코인 1분봉 데이터를 CSV 파일에 저장하는 클래스
+        비트코인 1분봉 데이터를 날짜별 Parquet 파티션 저장소에 저장하는 클래스
+        (기존 단일 CSV 파일은 최초 1회 저장소로 이관)
         
         Args:
             ticker (str): 수집할 티커 (기본값: KRW-BTC)
-            csv_path (str): CSV 파일 저장 경로
+            csv_path (str): 이관할 기존 CSV 파일 경로
+            store (OHLCVPartitionStore, optional): 저장소 (기본값: BITCOIN_OHLCV_STORE_DIR 기준 싱글톤)
         """
         self.ticker = ticker
         self.csv_path = csv_path
+        self.store = store or get_ohlcv_store(ticker)
         self._ensure_data_directory()
+        self._migrate_legacy_csv()
         
     def _ensure_data_directory(self):
         """데이터 디렉토리가 존재하는지 확인하고 없으면 생성"""
-        os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
+        os.makedirs(self.store.base_dir, exist_ok=True)
+
+    def _migrate_legacy_csv(self):
+        """
+        기존 CSV를 청크 단위로 이관. 완료 마커가 없으면(최초 또는 중간 실패) 저장소의 마지막 날짜부터 재개하고,
+        청크 적재 중에는 만들지 않은 다운샘플 뷰를 마지막에 재계산한다.
+        """
+        if not os.path.exists(self.csv_path) or self.store.is_csv_imported(self.csv_path):
+            return
+        latest = self.store.latest_timestamp()
+        resume_from = latest.normalize() if latest is not None else None
+        try:
+            imported = self.store.import_csv(self.csv_path, resume_from=resume_from)
+            logging.info(f"기존 CSV 이관 완료: {imported}개 레코드 → {self.store.base_dir}")
+        except Exception as e:
+            logging.warning(f"기존 CSV 이관 실패: {e}")
         
     def fetch_historical_data_to_csv(self, start_date: Optional[str] = None, 
                                    end_date: Optional[str] = None,
@@ -61,28 +82,11 @@ class BitcoinCSVCollector:
             
             logging.info(f"CSV 데이터 수집 시작: {start_date} ~ {end_date}")
             
-            # 기존 CSV 파일 확인
-            existing_data = None
-            if os.path.exists(self.csv_path):
-                try:
-                    existing_data = pd.read_csv(self.csv_path)
-                    existing_data['timestamp'] = pd.to_datetime(existing_data['timestamp'])
-                    existing_data.set_index('timestamp', inplace=True)
-                    logging.info(f"기존 CSV 파일 발견: {len(existing_data)}개 레코드")
-                    
-                    # 이미 수집된 데이터가 있으면 그 이후부터 수집
-                    if not existing_data.empty:
-                        latest_dt = existing_data.index.max()
-                        # 타입 체크 및 변환
-                        if bool(pd.isnull(latest_dt)) or not isinstance(latest_dt, (pd.Timestamp, datetime)):
-                            logging.warning(f'latest_dt 타입 이상: {type(latest_dt)}, 값: {latest_dt}')
-                        else:
-                            if latest_dt >= pd.Timestamp(start_dt):
-                                start_dt = latest_dt + timedelta(minutes=1)
-                                logging.info(f"기존 데이터 이후부터 수집: {start_dt}")
-                except Exception as e:
-                    logging.warning(f"기존 CSV 파읽기 실패: {e}")
-                    existing_data = None
+            # 저장소의 최신 시각 이후부터 수집 (최신 파티션만 읽음)
+            latest_dt = self.store.latest_timestamp()
+            if latest_dt is not None and latest_dt >= pd.Timestamp(start_dt):
+                start_dt = latest_dt + timedelta(minutes=1)
+                logging.info(f"기존 데이터 이후부터 수집: {start_dt}")
             
             all_data = []
             current_dt = start_dt
@@ -142,36 +146,28 @@ class BitcoinCSVCollector:
             # 중복 제거 (인덱스 기준)
             combined_df = combined_df[~combined_df.index.duplicated(keep='first')]
             
-            # 기존 데이터와 합치기
-            if existing_data is not None:
-                final_df = pd.concat([existing_data, combined_df])
-                final_df = final_df[~final_df.index.duplicated(keep='first')]
-                if not isinstance(final_df, pd.DataFrame):
-                    final_df = pd.DataFrame(final_df)
-                final_df = final_df.sort_index()
-            else:
-                final_df = combined_df
-            
-            # CSV 파일로 저장
-            final_df.to_csv(self.csv_path, index=True, index_label='timestamp')
+            # 날짜 파티션에 append (기존 파일 재작성 없음) + 5m/1h/1d 뷰 갱신
+            # 전체 건수는 모든 파티션을 훑어야 하므로 이번 쓰기 결과만 보고한다 (전체 통계는 get_csv_statistics)
+            write_result = self.store.append(combined_df)
             
-            logging.info(f"CSV 파일 저장 완료: {len(final_df)}개 레코드")
+            logging.info(f"OHLCV 저장소 저장 완료: {write_result}")
             
             # Slack 알림
             message = f"비트코인 1분봉 CSV 데이터 수집 완료\n"
             message += f"수집 기간: {start_date} ~ {end_date}\n"
             message += f"새로 추가된 레코드: {len(combined_df)}개\n"
-            message += f"전체 데이터: {len(final_df)}개\n"
-            message += f"파일 경로: {self.csv_path}"
+            message += f"기록된 날짜 파티션: {write_result['partitions']}개\n"
+            message += f"저장 경로: {self.store.base_dir}"
             post_message(message, channel="#upbit-data")
             
             return {
                 "status": "success",
                 "new_records": len(combined_df),
-                "total_records": len(final_df),
+                "written_records": write_result["rows"],
+                "written_partitions": write_result["partitions"],
                 "start_date": start_date,
                 "end_date": end_date,
-                "file_path": self.csv_path
+                "file_path": self.store.base_dir
             }
             
         except Exception as e:
@@ -196,26 +192,11 @@ class BitcoinCSVCollector:
             
             logging.info(f"최근 CSV 데이터 수집: {start_dt} ~ {end_dt}")
             
-            # 기존 CSV 파일 확인
-            existing_data = None
-            if os.path.exists(self.csv_path):
-                try:
-                    existing_data = pd.read_csv(self.csv_path)
-                    existing_data['timestamp'] = pd.to_datetime(existing_data['timestamp'])
-                    existing_data.set_index('timestamp', inplace=True)
-                    
-                    # 이미 수집된 데이터가 있으면 그 이후부터 수집
-                    if not existing_data.empty:
-                        latest_dt = existing_data.index.max()
-                        # 타입 체크 및 변환
-                        if bool(pd.isnull(latest_dt)) or not isinstance(latest_dt, (pd.Timestamp, datetime)):
-                            logging.warning(f'latest_dt 타입 이상: {type(latest_dt)}, 값: {latest_dt}')
-                        else:
-                            if latest_dt >= pd.Timestamp(start_dt):
-                                start_dt = latest_dt + timedelta(minutes=1)
-                                logging.info(f"기존 데이터 이후부터 수집: {start_dt}")
-                except Exception as e:
-                    logging.warning(f"기존 CSV 파읽기 실패: {e}")
+            # 저장소의 최신 시각 이후부터 수집
+            latest_dt = self.store.latest_timestamp()
+            if latest_dt is not None and latest_dt >= pd.Timestamp(start_dt):
+                start_dt = latest_dt + timedelta(minutes=1)
+                logging.info(f"기존 데이터 이후부터 수집: {start_dt}")
             
             # 데이터 수집
             df = pyupbit.get_ohlcv(
@@ -236,26 +217,17 @@ class BitcoinCSVCollector:
                 logging.info("새로운 데이터가 없습니다")
                 return {"status": "info", "message": "새로운 데이터가 없습니다"}
             
-            # 기존 데이터와 합치기
-            if existing_data is not None:
-                final_df = pd.concat([existing_data, df])
-                final_df = final_df[~final_df.index.duplicated(keep='first')]
-                if not isinstance(final_df, pd.DataFrame):
-                    final_df = pd.DataFrame(final_df)
-                final_df = final_df.sort_index()
-            else:
-                final_df = df
-            
-            # CSV 파일로 저장
-            final_df.to_csv(self.csv_path, index=True, index_label='timestamp')
+            # 날짜 파티션에 append + 5m/1h/1d 뷰 갱신
+            write_result = self.store.append(df)
             
-            logging.info(f"최근 CSV 데이터 저장 완료: {len(df)}개 추가, 전체 {len(final_df)}개")
+            logging.info(f"최근 OHLCV 데이터 저장 완료: {len(df)}개 추가, {write_result}")
             
             return {
                 "status": "success",
                 "new_records": len(df),
-                "total_records": len(final_df),
-                "file_path": self.csv_path
+                "written_records": write_result["rows"],
+                "written_partitions": write_result["partitions"],
+                "file_path": self.store.base_dir
             }
                 
         except Exception as e:
@@ -264,9 +236,10 @@ class BitcoinCSVCollector:
             return {"status": "error", "message": error_msg}
     
     def get_csv_statistics(self) -> Dict[str, Any]:
-        """CSV 파일의 통계 정보를 조회"""
+        """저장소 통계 정보를 조회 (Parquet 메타데이터 기반)"""
         try:
-            if not os.path.exists(self.csv_path):
+            stats = self.store.statistics()
+            if not stats["partitions"]:
                 return {
                     "file_exists": False,
                     "total_records": 0,
@@ -276,10 +249,9 @@ class BitcoinCSVCollector:
                     "duration_hours": 0
                 }
             
-            df = pd.read_csv(self.csv_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            
-            if df.empty:
+            earliest_dt = stats["earliest"]
+            latest_dt = stats["latest"]
+            if earliest_dt is None or latest_dt is None:
                 return {
                     "file_exists": True,
                     "total_records": 0,
@@ -288,77 +260,52 @@ class BitcoinCSVCollector:
                     "duration_days": 0,
                     "duration_hours": 0
                 }
-            
-            earliest_dt = df['timestamp'].min()
-            latest_dt = df['timestamp'].max()
             duration = latest_dt - earliest_dt
             
             return {
                 "file_exists": True,
-                "total_records": len(df),
+                "total_records": stats["total_records"],
                 "earliest_date": earliest_dt.strftime('%Y-%m-%d %H:%M:%S'),
                 "latest_date": latest_dt.strftime('%Y-%m-%d %H:%M:%S'),
                 "duration_days": duration.days,
                 "duration_hours": duration.total_seconds() / 3600,
-                "file_size_mb": os.path.getsize(self.csv_path) / (1024 * 1024)
+                "file_size_mb": stats["size_mb"],
+                "partitions": stats["partitions"]
             }
                 
         except Exception as e:
-            logging.error(f"CSV 통계 조회 중 오류: {e}")
+            logging.error(f"저장소 통계 조회 중 오류: {e}")
             return {"error": str(e)}
     
     def read_csv_data(self, start_date: Optional[str] = None, 
                      end_date: Optional[str] = None,
-                     limit: Optional[int] = None) -> pd.DataFrame:
+                     limit: Optional[int] = None,
+                     interval: str = "1m") -> pd.DataFrame:
         """
-        CSV 파일에서 데이터를 읽어오기
+        저장소에서 데이터를 읽어오기 (요청 구간의 파티션만 읽음)
         
         Args:
             start_date (str, optional): 시작 날짜 (YYYY-MM-DD 형식)
             end_date (str, optional): 종료 날짜 (YYYY-MM-DD 형식)
-            limit (int, optional): 조회할 레코드 수 제한
+            limit (int, optional): 조회할 레코드 수 제한 (최근 limit개)
+            interval (str): "1m" / "5m" / "1h" / "1d"
             
         Returns:
             pd.DataFrame: OHLCV 데이터
         """
         try:
-            if not os.path.exists(self.csv_path):
-                logging.warning("CSV 파일이 존재하지 않습니다")
-                return pd.DataFrame()
-            
-            df = pd.read_csv(self.csv_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df.set_index('timestamp', inplace=True)
-            
-            # 날짜 필터링
-            if start_date:
-                start_dt = pd.Timestamp(start_date)
-                df = df[df.index >= start_dt]
-            
-            if end_date:
-                end_dt = pd.Timestamp(end_date)
-                df = df[df.index <= end_dt]
-            
-            # 정렬
-            if not isinstance(df, pd.DataFrame):
-                df = pd.DataFrame(df)
-            df = df.sort_index()
-            
-            # 레코드 수 제한
-            if limit:
-                df = df.tail(limit)
-            
-            if not isinstance(df, pd.DataFrame):
-                df = pd.DataFrame(df)
-            return df
+            if not start_date and limit:
+                # 시작일이 없으면 최신 파티션부터 limit개만 읽는다
+                return self.store.read_tail(limit, interval=interval, end=end_date)
+            return self.store.read_range(start_date, end_date, interval=interval, limit=limit)
             
         except Exception as e:
-            logging.error(f"CSV 데이터 읽기 중 오류: {e}")
+            logging.error(f"OHLCV 데이터 읽기 중 오류: {e}")
             return pd.DataFrame()
     
     def cleanup_old_csv_data(self, days_to_keep: int = 365) -> Dict[str, Any]:
         """
-        CSV 파일에서 오래된 데이터를 삭제
+        저장소에서 오래된 날짜 파티션을 삭제 (파일 재작성 없음)
         
         Args:
             days_to_keep (int): 보관할 일수
@@ -367,33 +314,19 @@ class BitcoinCSVCollector:
             Dict[str, Any]: 삭제 결과
         """
         try:
-            if not os.path.exists(self.csv_path):
-                return {"status": "warning", "message": "CSV 파일이 존재하지 않습니다"}
-            
-            df = pd.read_csv(self.csv_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            original_count = len(df)
-            
-            # 오래된 데이터 필터링
-            df = df[df['timestamp'] >= cutoff_date]
-            
-            # CSV 파일 다시 저장
-            df.to_csv(self.csv_path, index=False)
+            dropped = self.store.drop_before(cutoff_date.strftime('%Y-%m-%d'))
             
-            deleted_count = original_count - len(df)
-            logging.info(f"CSV 오래된 데이터 삭제 완료: {deleted_count}개 삭제")
+            logging.info(f"OHLCV 오래된 파티션 삭제 완료: {dropped}")
             
             return {
                 "status": "success",
-                "deleted_count": deleted_count,
-                "remaining_count": len(df),
+                "deleted_partitions": dropped,
                 "cutoff_date": cutoff_date.strftime('%Y-%m-%d')
             }
             
         except Exception as e:
-            error_msg = f"CSV 데이터 정리 중 오류: {e}"
+            error_msg = f"OHLCV 데이터 정리 중 오류: {e}"
             logging.error(error_msg)
             return {"status": "error", "message": error_msg}
 
@@ -0,0 +1,122 @@
+"""
+복호화된 사용자별 인증 정보 캐시
+
+- (provider, user_id)별로 DB 조회 + 복호화 결과를 짧은 TTL 동안 메모리에 보관한다. 적중 시 DB를 조회하지 않는다.
+- 인증 정보가 저장/삭제되면 invalidate()로 즉시 제거한다 (/user/kis-credentials, 사용자 삭제/ID 변경).
+  캐시는 프로세스(gunicorn 워커)별이므로 다른 워커에는 TTL(CREDENTIAL_CACHE_TTL_SECONDS) 안에 반영된다.
+- "등록되지 않음(None)"도 캐시하고, 조회/복호화 오류는 캐시하지 않는다.
+- 적중/미적중 횟수와 로드(조회+복호화) 소요 시간은 stats()로 조회한다.
+"""
+import copy
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS = 60.0
+
+PROVIDER_KIS = "kis"
+
+
+class CredentialStore:
+    """TTL 기반 복호화 인증 정보 캐시"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if ttl_seconds is None:
+            try:
+                ttl_seconds = float(os.getenv("CREDENTIAL_CACHE_TTL_SECONDS", DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS))
+            except ValueError:
+                ttl_seconds = DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS
+        self.ttl_seconds = max(float(ttl_seconds), 0.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Tuple[float, Optional[Dict[str, Any]]]] = {}
+        # 로드 중 invalidate가 들어오면 그 결과를 캐시하지 않도록 키별 세대 번호를 둔다.
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._stats: Dict[str, float] = {
+            "hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "load_failures": 0,
+            "load_ms_total": 0.0,
+            "load_ms_last": 0.0,
+            "invalidations": 0,
+        }
+
+    def get(self, provider: str, user_id: str, loader: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        캐시에 있으면 복사본을, 없거나 만료되었으면 loader()(DB 조회 + 복호화) 결과를 캐시 후 반환.
+        loader가 예외를 던지면 캐시하지 않고 그대로 전파한다.
+        """
+        key = (provider, str(user_id))
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry[1])
+            self._stats["misses"] += 1
+            generation = self._generations.setdefault(key, 0)
+
+        started = time.perf_counter()
+        try:
+            value = loader()
+        except Exception:
+            with self._lock:
+                self._stats["load_failures"] += 1
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self._lock:
+            self._stats["loads"] += 1
+            self._stats["load_ms_total"] += elapsed_ms
+            self._stats["load_ms_last"] = elapsed_ms
+            if self.ttl_seconds > 0 and self._generations.get(key, 0) == generation:
+                self._entries[key] = (self._clock() + self.ttl_seconds, copy.deepcopy(value))
+        return value
+
+    def invalidate(self, user_id: str, provider: Optional[str] = None) -> int:
+        """사용자 인증 정보 캐시 제거 (provider 미지정 시 전체 provider). 제거한 항목 수 반환."""
+        user_id = str(user_id)
+        with self._lock:
+            keys = [key for key in self._entries if key[1] == user_id and (provider is None or key[0] == provider)]
+            for key in keys:
+                del self._entries[key]
+            for key in self._generations:
+                if key[1] == user_id and (provider is None or key[0] == provider):
+                    self._generations[key] += 1
+            self._stats["invalidations"] += 1
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for key in self._generations:
+                self._generations[key] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            now = self._clock()
+            stats["entries"] = sum(1 for expires_at, _ in self._entries.values() if expires_at > now)
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["load_ms_avg"] = stats["load_ms_total"] / stats["loads"] if stats["loads"] else 0.0
+        return stats
+
+
+_store: Optional[CredentialStore] = None
+_store_lock = threading.Lock()
+
+
+def get_credential_store() -> CredentialStore:
+    """프로세스 공용 CredentialStore 싱글톤"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CredentialStore()
+        return _store
+
+
+def invalidate_user_credentials(user_id: str, provider: Optional[str] = None) -> int:
+    """인증 정보 저장/삭제 후 호출"""
+    return get_credential_store().invalidate(user_id, provider)
@@ -1,13 +1,21 @@
 """
 암호화/복호화 유틸리티 모듈
 KIS API 인증 정보를 암호화하여 저장하기 위한 모듈
+
+마스터키에서 유도한 Fernet 객체는 마스터키 값별로 프로세스당 한 번만 만든다
+(PBKDF2 100,000회 반복을 복호화마다 다시 하지 않도록). 유도/복호화 소요 시간은
+get_encryption_stats()로 조회한다.
 """
 import os
 import base64
+import hashlib
+import logging
+import threading
+import time
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Optional
+from typing import Dict, Optional
 
 
 def get_master_key() -> bytes:
@@ -50,12 +58,69 @@ def get_master_key() -> bytes:
         raise ValueError(f"마스터키 처리 실패: {str(e)}")
 
 
+_fernet_cache: Dict[str, Fernet] = {}
+_fernet_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {
+    "key_derivations": 0,
+    "key_derivation_ms_total": 0.0,
+    "key_derivation_ms_last": 0.0,
+    "encrypt_calls": 0,
+    "encrypt_ms_total": 0.0,
+    "decrypt_calls": 0,
+    "decrypt_failures": 0,
+    "decrypt_ms_total": 0.0,
+}
+
+
+def _record(**increments: float) -> None:
+    with _stats_lock:
+        for key, value in increments.items():
+            _stats[key] += value
+
+
 def get_fernet() -> Fernet:
-    """Fernet 암호화 객체 생성"""
-    master_key = get_master_key()
-    # Fernet은 32바이트 키를 base64로 인코딩한 형식을 요구
-    fernet_key = base64.urlsafe_b64encode(master_key)
-    return Fernet(fernet_key)
+    """Fernet 암호화 객체 (마스터키 값별로 캐시, 환경 변수가 바뀌면 새로 유도)"""
+    # 마스터키 원문 대신 해시를 캐시 키로 사용
+    cache_key = hashlib.sha256((os.getenv("ENCRYPTION_MASTER_KEY") or "").encode()).hexdigest()
+    fernet = _fernet_cache.get(cache_key)
+    if fernet is not None:
+        return fernet
+
+    with _fernet_lock:
+        fernet = _fernet_cache.get(cache_key)
+        if fernet is not None:
+            return fernet
+        started = time.perf_counter()
+        master_key = get_master_key()
+        # Fernet은 32바이트 키를 base64로 인코딩한 형식을 요구
+        fernet_key = base64.urlsafe_b64encode(master_key)
+        fernet = Fernet(fernet_key)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _fernet_cache.clear()  # 이전 마스터키로 만든 객체는 버린다
+        _fernet_cache[cache_key] = fernet
+
+    with _stats_lock:
+        _stats["key_derivations"] += 1
+        _stats["key_derivation_ms_total"] += elapsed_ms
+        _stats["key_derivation_ms_last"] = elapsed_ms
+    logging.info(f"암호화 키 유도 완료: {elapsed_ms:.1f}ms")
+    return fernet
+
+
+def clear_fernet_cache() -> None:
+    """캐시된 Fernet 객체 제거 (마스터키 교체/테스트용)"""
+    with _fernet_lock:
+        _fernet_cache.clear()
+
+
+def get_encryption_stats() -> Dict[str, float]:
+    """키 유도/암복호화 횟수와 누적 소요 시간(ms)"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["decrypt_ms_avg"] = stats["decrypt_ms_total"] / stats["decrypt_calls"] if stats["decrypt_calls"] else 0.0
+    stats["cached_keys"] = len(_fernet_cache)
+    return stats
 
 
 def encrypt_data(data: str) -> str:
@@ -72,7 +137,9 @@ def encrypt_data(data: str) -> str:
         return ""
     
     fernet = get_fernet()
+    started = time.perf_counter()
     encrypted = fernet.encrypt(data.encode('utf-8'))
+    _record(encrypt_calls=1, encrypt_ms_total=(time.perf_counter() - started) * 1000)
     return base64.urlsafe_b64encode(encrypted).decode('utf-8')
 
 
@@ -91,9 +158,12 @@ def decrypt_data(encrypted_data: str) -> str:
     
     try:
         fernet = get_fernet()
+        started = time.perf_counter()
         decoded = base64.urlsafe_b64decode(encrypted_data.encode('utf-8'))
         decrypted = fernet.decrypt(decoded)
+        _record(decrypt_calls=1, decrypt_ms_total=(time.perf_counter() - started) * 1000)
         return decrypted.decode('utf-8')
     except Exception as e:
+        _record(decrypt_failures=1)
         raise ValueError(f"복호화 실패: {str(e)}")
 
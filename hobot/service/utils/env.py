@@ -0,0 +1,48 @@
+"""
+환경변수/설정 값 파싱 공용 헬퍼
+
+- truthy_env: 명시적으로 켠 경우만 True (기본 꺼짐 플래그용)
+- env_flag: 명시적으로 끈 경우만 False (기본 켜짐 플래그용)
+- safe_int / safe_float: 변환 실패 시 기본값
+- env_int / env_float: 환경변수를 읽어 변환, 미설정/잘못된 값이면 기본값
+"""
+import os
+from typing import Any, Optional
+
+TRUTHY_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+FALSY_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def truthy_env(value: Optional[str], default: bool = False) -> bool:
+    if value is None:
+        return bool(default)
+    return str(value).strip().lower() in TRUTHY_VALUES
+
+
+def env_flag(name: str, default: bool = True) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return bool(default)
+    return str(value).strip().lower() not in FALSY_VALUES
+
+
+def safe_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except Exception:
+        return int(default)
+
+
+def safe_float(value: Any, default: float) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return float(default)
+
+
+def env_int(name: str, default: int) -> int:
+    return safe_int(str(os.getenv(name, default)).strip(), default)
+
+
+def env_float(name: str, default: float) -> float:
+    return safe_float(str(os.getenv(name, default)).strip(), default)
@@ -0,0 +1,482 @@
+"""
+로그 파일 조회 유틸리티 (/admin/logs)
+
+- tail: 파일 끝에서 블록 단위로 거꾸로 읽어 마지막 N줄만 가져온다 (파일 크기와 무관).
+- follow: "inode:offset" 커서 이후에 추가된 완성된 줄만 읽는다 (회전/잘림 시 처음부터).
+- search: 세그먼트 인덱스(바이트 구간별 시간 범위/레벨 집합)로 조건에 맞는 구간만 읽는다.
+
+인덱스는 로그 옆의 `.{파일명}.idx.json`에 저장되며, 마지막 세그먼트부터 이어서 갱신한다.
+파일이 회전(inode 변경)되거나 잘리면 다시 만들고, 세그먼트가 너무 많아지면 인접 구간을 합친다.
+타임스탬프가 없는 줄(Traceback 등)은 직전 레코드의 시간/레벨을 상속한다.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+DEFAULT_SEGMENT_BYTES = 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 4096
+DEFAULT_FOLLOW_MAX_BYTES = 1024 * 1024
+IDENTITY_PREFIX_BYTES = 4096
+INDEX_VERSION = 1
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_ALIASES = {"WARN": "WARNING", "FATAL": "CRITICAL"}
+_LEVEL_RANK = {name: rank for rank, name in enumerate(LOG_LEVELS)}
+
+# log.txt 형식: 2025-11-01 21:51:25,255 - INFO - ...
+_TIMESTAMP_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})(?:,(\d+))?")
+# Gunicorn error.log 형식: [2025-11-01 21:51:25 +0000] [123] [INFO] ...
+_GUNICORN_ERROR_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+# Gunicorn access.log 형식: IP - - [01/Nov/2025:21:51:25 +0000] ...
+_GUNICORN_ACCESS_PATTERN = re.compile(r"\[(\d{2}/\w+/\d{4}:\d{2}:\d{2}:\d{2})")
+_LEVEL_PATTERN = re.compile(r"(?:\s-\s|\[)(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)(?:\s-\s|\])")
+
+
+def normalize_level(level: Optional[str]) -> Optional[str]:
+    if not level:
+        return None
+    name = _LEVEL_ALIASES.get(level.upper(), level.upper())
+    if name not in _LEVEL_RANK:
+        raise ValueError(f"알 수 없는 로그 레벨: {level}")
+    return name
+
+
+def parse_log_line(line: str) -> Tuple[Optional[datetime], Optional[str]]:
+    """(타임스탬프, 레벨). 타임스탬프가 없으면 이어지는 줄(continuation)로 본다."""
+    timestamp = None
+    match = _TIMESTAMP_PATTERN.match(line)
+    try:
+        if match:
+            timestamp = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
+            if match.group(2):
+                timestamp = timestamp.replace(microsecond=int(match.group(2).ljust(6, "0")[:6]))
+        else:
+            match = _GUNICORN_ERROR_PATTERN.match(line)
+            if match:
+                timestamp = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
+            else:
+                match = _GUNICORN_ACCESS_PATTERN.search(line)
+                if match:
+                    timestamp = datetime.strptime(match.group(1), "%d/%b/%Y:%H:%M:%S")
+    except ValueError:
+        timestamp = None
+    if timestamp is None:
+        return None, None
+    level_match = _LEVEL_PATTERN.search(line, match.end())
+    level = _LEVEL_ALIASES.get(level_match.group(1), level_match.group(1)) if level_match else None
+    return timestamp, level
+
+
+def _level_at_least(level: Optional[str], min_level: Optional[str]) -> bool:
+    if min_level is None:
+        return True
+    # 레벨 표기가 없는 레코드(access log 등)는 INFO로 본다.
+    return _LEVEL_RANK.get(level or "INFO", 1) >= _LEVEL_RANK[min_level]
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="ignore").rstrip("\r")
+
+
+@dataclass
+class LogChunk:
+    """조회 결과 줄 + 바이트 구간 [start_offset, end_offset)"""
+    lines: List[str]
+    start_offset: int
+    end_offset: int
+    cursor: Optional[str] = None
+    reset: bool = False
+    scanned_bytes: int = 0
+
+
+# ----------------------------------------------------------------------
+# tail / follow (인덱스 없이 동작)
+# ----------------------------------------------------------------------
+def tail_lines(path: str, count: int, block_size: int = DEFAULT_BLOCK_SIZE, end: Optional[int] = None) -> LogChunk:
+    """
+    파일 끝(end)에서 블록 단위로 거꾸로 읽어 마지막 count개의 완성된 줄 반환.
+    쓰는 중인 마지막 미완성 줄은 제외한다 (follow 커서와 겹치지 않도록).
+    """
+    count = max(int(count), 0)
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell() if end is None else min(end, f.tell())
+        position = size
+        chunks: List[bytes] = []
+        newlines = 0
+        while position > 0 and newlines <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    parts = data.split(b"\n")
+    trailing = parts.pop()
+    if position > 0 and parts:
+        parts.pop(0)  # 블록 경계에서 잘린 첫 줄
+    kept = parts[-count:] if count else []
+    end_offset = size - len(trailing)
+    start_offset = end_offset - sum(len(part) + 1 for part in kept)
+    return LogChunk(
+        lines=[_decode(part) for part in kept],
+        start_offset=start_offset,
+        end_offset=end_offset,
+        scanned_bytes=len(data),
+    )
+
+
+def _file_inode(path: str) -> int:
+    return os.stat(path).st_ino
+
+
+def make_cursor(path: str, offset: int) -> str:
+    return f"{_file_inode(path)}:{offset}"
+
+
+def parse_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        inode, offset = cursor.split(":", 1)
+        return int(inode), int(offset)
+    except (AttributeError, ValueError):
+        raise ValueError(f"잘못된 로그 커서: {cursor}")
+
+
+def read_since(path: str, cursor: Optional[str], max_bytes: int = DEFAULT_FOLLOW_MAX_BYTES) -> LogChunk:
+    """
+    커서 이후 추가된 완성된 줄 (follow 모드). 커서가 없으면 현재 파일 끝을 커서로 돌려준다.
+    파일이 회전되었거나(inode 변경) 잘렸으면 처음부터 읽고 reset=True.
+    """
+    stat = os.stat(path)
+    if cursor is None:
+        return LogChunk(lines=[], start_offset=stat.st_size, end_offset=stat.st_size, cursor=f"{stat.st_ino}:{stat.st_size}")
+    inode, offset = parse_cursor(cursor)
+    reset = inode != stat.st_ino or offset > stat.st_size
+    if reset:
+        offset = 0
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(max(min(max_bytes, stat.st_size - offset), 0))
+    complete = data.rfind(b"\n") + 1
+    if complete == 0 and len(data) >= max_bytes:
+        complete = len(data)  # max_bytes보다 긴 한 줄은 잘라서라도 진행
+    body = data[:complete]
+    lines = [_decode(part) for part in body.split(b"\n")[:-1]] if body.endswith(b"\n") else [_decode(body)] if body else []
+    end_offset = offset + complete
+    return LogChunk(
+        lines=lines,
+        start_offset=offset,
+        end_offset=end_offset,
+        cursor=f"{stat.st_ino}:{end_offset}",
+        reset=reset,
+        scanned_bytes=len(data),
+    )
+
+
+# ----------------------------------------------------------------------
+# 세그먼트 인덱스
+# ----------------------------------------------------------------------
+@dataclass
+class LogSegment:
+    """줄 경계로 자른 바이트 구간 [start, end)의 요약"""
+    start: int
+    end: int
+    line_count: int = 0
+    first_ts: Optional[str] = None
+    last_ts: Optional[str] = None
+    levels: List[str] = field(default_factory=list)
+    # 구간 시작 시점에 이어지고 있던 레코드의 시간/레벨 (구간 첫 줄이 continuation일 때 사용)
+    carry_ts: Optional[str] = None
+    carry_level: Optional[str] = None
+    # 구간 끝 시점의 레코드 시간/레벨 (다음 구간의 carry)
+    end_ts: Optional[str] = None
+    end_level: Optional[str] = None
+
+    def overlaps(self, start: Optional[datetime], end: Optional[datetime]) -> bool:
+        stamps = [datetime.fromisoformat(ts) for ts in (self.carry_ts, self.first_ts, self.last_ts) if ts]
+        if not stamps:
+            return False
+        low, high = min(stamps), max(stamps)
+        if start is not None and high < start:
+            return False
+        if end is not None and low > end:
+            return False
+        return True
+
+    def has_level(self, min_level: Optional[str]) -> bool:
+        if min_level is None:
+            return True
+        levels = set(self.levels)
+        if self.carry_ts is not None:
+            levels.add(self.carry_level or "INFO")
+        return any(_level_at_least(level, min_level) for level in levels)
+
+
+def _within(ts: datetime, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    return (start is None or ts >= start) and (end is None or ts <= end)
+
+
+def _merge_segments(a: LogSegment, b: LogSegment) -> LogSegment:
+    stamps = [ts for ts in (a.first_ts, b.first_ts) if ts]
+    lasts = [ts for ts in (a.last_ts, b.last_ts) if ts]
+    return LogSegment(
+        start=a.start,
+        end=b.end,
+        line_count=a.line_count + b.line_count,
+        first_ts=min(stamps) if stamps else None,
+        last_ts=max(lasts) if lasts else None,
+        levels=sorted(set(a.levels) | set(b.levels), key=lambda name: _LEVEL_RANK.get(name, 1)),
+        carry_ts=a.carry_ts,
+        carry_level=a.carry_level,
+        end_ts=b.end_ts,
+        end_level=b.end_level,
+    )
+
+
+class LogFileReader:
+    """로그 파일 하나의 tail/follow/인덱스 검색"""
+
+    def __init__(
+        self,
+        path: str,
+        index_path: Optional[str] = None,
+        segment_bytes: Optional[int] = None,
+        max_segments: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        self.path = path
+        self.index_path = index_path or os.path.join(
+            os.path.dirname(os.path.abspath(path)), f".{os.path.basename(path)}.idx.json"
+        )
+        self.segment_bytes = max(int(segment_bytes or os.getenv("LOG_INDEX_SEGMENT_BYTES", DEFAULT_SEGMENT_BYTES)), 1)
+        self.max_segments = max(int(max_segments or os.getenv("LOG_INDEX_MAX_SEGMENTS", DEFAULT_MAX_SEGMENTS)), 2)
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._segments: List[LogSegment] = []
+        self._identity: Optional[Dict[str, object]] = None
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # tail / follow
+    # ------------------------------------------------------------------
+    def tail(self, count: int) -> LogChunk:
+        chunk = tail_lines(self.path, count, self.block_size)
+        chunk.cursor = make_cursor(self.path, chunk.end_offset)
+        return chunk
+
+    def follow(self, cursor: Optional[str], max_bytes: int = DEFAULT_FOLLOW_MAX_BYTES) -> LogChunk:
+        return read_since(self.path, cursor, max_bytes)
+
+    # ------------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------------
+    def _read_identity(self, f, size: int) -> Dict[str, object]:
+        f.seek(0)
+        prefix = f.read(min(size, IDENTITY_PREFIX_BYTES))
+        return {
+            "inode": os.fstat(f.fileno()).st_ino,
+            "prefix_len": len(prefix),
+            "prefix_sha1": hashlib.sha1(prefix).hexdigest(),
+        }
+
+    def _identity_matches(self, f, size: int) -> bool:
+        identity = self._identity
+        if not identity or identity.get("inode") != os.fstat(f.fileno()).st_ino:
+            return False
+        prefix_len = int(identity.get("prefix_len", 0))
+        if size < prefix_len:
+            return False
+        f.seek(0)
+        return hashlib.sha1(f.read(prefix_len)).hexdigest() == identity.get("prefix_sha1")
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != INDEX_VERSION or payload.get("segment_bytes") != self.segment_bytes:
+                return
+            self._identity = payload.get("identity")
+            self._segments = [LogSegment(**item) for item in payload.get("segments", [])]
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("로그 인덱스 로드 실패(%s): %s", self.index_path, e)
+            self._identity, self._segments = None, []
+
+    def _save(self) -> None:
+        payload = {
+            "version": INDEX_VERSION,
+            "path": os.path.abspath(self.path),
+            "segment_bytes": self.segment_bytes,
+            "identity": self._identity,
+            "segments": [asdict(segment) for segment in self._segments],
+        }
+        tmp_path = f"{self.index_path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            # 인덱스 저장 실패는 조회를 막지 않는다 (다음 프로세스에서 다시 만든다).
+            logger.warning("로그 인덱스 저장 실패(%s): %s", self.index_path, e)
+
+    def refresh_index(self) -> List[LogSegment]:
+        """마지막(미완성) 세그먼트부터 파일 끝까지 이어서 인덱싱"""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                indexed_end = self._segments[-1].end if self._segments else 0
+                if not self._segments or not self._identity_matches(f, size) or indexed_end > size:
+                    self._segments = []
+                    self._identity = None
+                elif indexed_end == size:
+                    return list(self._segments)
+                if self._identity is None or int(self._identity.get("prefix_len", 0)) < IDENTITY_PREFIX_BYTES:
+                    self._identity = self._read_identity(f, size)
+
+                carry_ts, carry_level = None, None
+                if self._segments and self._segments[-1].end - self._segments[-1].start < self.segment_bytes:
+                    reopened = self._segments.pop()
+                    carry_ts, carry_level = reopened.carry_ts, reopened.carry_level
+                    start = reopened.start
+                elif self._segments:
+                    last = self._segments[-1]
+                    carry_ts, carry_level = last.end_ts, last.end_level
+                    start = last.end
+                else:
+                    start = 0
+
+                changed = self._index_from(f, start, size, carry_ts, carry_level)
+            while len(self._segments) > self.max_segments:
+                self._segments = [
+                    _merge_segments(*self._segments[i:i + 2]) if i + 1 < len(self._segments) else self._segments[i]
+                    for i in range(0, len(self._segments), 2)
+                ]
+                changed = True
+            if changed:
+                self._save()
+            return list(self._segments)
+
+    def _index_from(self, f, start: int, size: int, carry_ts: Optional[str], carry_level: Optional[str]) -> bool:
+        f.seek(start)
+        offset = start
+        segment = LogSegment(start=start, end=start, carry_ts=carry_ts, carry_level=carry_level)
+        levels: set = set()
+        current_ts, current_level = carry_ts, carry_level
+        changed = False
+        while offset < size:
+            raw = f.readline()
+            if not raw or not raw.endswith(b"\n"):
+                break  # 쓰는 중인 마지막 줄은 다음 갱신 때 인덱싱
+            offset += len(raw)
+            timestamp, level = parse_log_line(_decode(raw[:-1]))
+            if timestamp is not None:
+                current_ts, current_level = timestamp.isoformat(), level
+                segment.first_ts = segment.first_ts or current_ts
+                segment.last_ts = max(segment.last_ts or current_ts, current_ts)
+                levels.add(level or "INFO")
+            segment.line_count += 1
+            segment.end = offset
+            segment.end_ts, segment.end_level = current_ts, current_level
+            if segment.end - segment.start >= self.segment_bytes:
+                segment.levels = sorted(levels, key=lambda name: _LEVEL_RANK.get(name, 1))
+                self._segments.append(segment)
+                changed = True
+                segment = LogSegment(start=offset, end=offset, carry_ts=current_ts, carry_level=current_level)
+                levels = set()
+        if segment.end > segment.start:
+            segment.levels = sorted(levels, key=lambda name: _LEVEL_RANK.get(name, 1))
+            self._segments.append(segment)
+            changed = True
+        return changed
+
+    def total_lines(self) -> int:
+        return sum(segment.line_count for segment in self.refresh_index())
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def _iter_segment_records(self, f, segment: LogSegment) -> Iterator[Tuple[Optional[datetime], Optional[str], str]]:
+        f.seek(segment.start)
+        data = f.read(segment.end - segment.start)
+        current_ts = datetime.fromisoformat(segment.carry_ts) if segment.carry_ts else None
+        current_level = segment.carry_level
+        for raw in data.split(b"\n")[:-1]:
+            line = _decode(raw)
+            timestamp, level = parse_log_line(line)
+            if timestamp is not None:
+                current_ts, current_level = timestamp, level
+            yield current_ts, current_level, line
+
+    def search(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_level: Optional[str] = None,
+        limit: int = 100,
+    ) -> LogChunk:
+        """
+        시간 범위/최소 레벨 조건에 맞는 마지막 limit줄.
+        조건에 걸리지 않는 세그먼트는 읽지 않고, 최신 세그먼트부터 필요한 만큼만 읽는다.
+        """
+        min_level = normalize_level(min_level)
+        segments = self.refresh_index()
+        candidates = [segment for segment in segments if segment.overlaps(start, end) and segment.has_level(min_level)]
+        collected: List[List[str]] = []
+        found = 0
+        scanned = 0
+        first_offset = candidates[-1].end if candidates else 0
+        with open(self.path, "rb") as f:
+            for segment in reversed(candidates):
+                matched = [
+                    line
+                    for timestamp, level, line in self._iter_segment_records(f, segment)
+                    if timestamp is not None
+                    and line.strip()
+                    and _within(timestamp, start, end)
+                    and _level_at_least(level, min_level)
+                ]
+                scanned += segment.end - segment.start
+                first_offset = segment.start
+                if matched:
+                    collected.append(matched)
+                    found += len(matched)
+                if found >= limit:
+                    break
+        lines = [line for block in reversed(collected) for line in block]
+        end_offset = segments[-1].end if segments else 0
+        return LogChunk(
+            lines=lines[-limit:] if limit else [],
+            start_offset=first_offset,
+            end_offset=end_offset,
+            cursor=make_cursor(self.path, end_offset),
+            scanned_bytes=scanned,
+        )
+
+
+_readers: Dict[str, LogFileReader] = {}
+_readers_lock = threading.Lock()
+
+
+def get_log_reader(path: str) -> LogFileReader:
+    """경로별 LogFileReader 싱글톤 (인덱스를 프로세스 내에서 재사용)"""
+    key = os.path.abspath(path)
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = LogFileReader(key)
+            _readers[key] = reader
+        return reader
@@ -0,0 +1,397 @@
+"""
+OHLCV 컬럼형 파티션 저장소 (Parquet)
+
+디렉토리 구조:
+    {root}/{ticker}/1m/date=YYYY-MM-DD/part-<ns>.parquet   # 원본 1분봉, 수집 시 append-only로 part 파일 추가
+    {root}/{ticker}/5m/date=YYYY-MM-DD/data.parquet        # 다운샘플 뷰 (수집된 날짜만 재계산)
+    {root}/{ticker}/1h/date=YYYY-MM-DD/data.parquet
+    {root}/{ticker}/1d/month=YYYY-MM/data.parquet          # 일봉은 월 단위 파티션
+
+- 조회는 요청 구간에 걸친 파티션만 읽는다 (전체 이력 크기와 무관).
+- 같은 timestamp가 여러 part에 있으면 나중에 쓴 값이 우선한다.
+- 정리(cleanup)는 파티션 디렉토리 삭제로 처리해 파일 재작성이 없다.
+- 시각은 수집 원본(Upbit, KST naive) 기준이며 일/월 경계도 그 시각 기준이다.
+"""
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from service.utils.env import env_int
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+    logging.warning("pyarrow 패키지가 설치되지 않았습니다. pip install pyarrow로 설치하세요.")
+
+logger = logging.getLogger(__name__)
+
+BASE_INTERVAL = "1m"
+VIEW_RULES = {"5m": "5min", "1h": "1h", "1d": "1D"}
+MONTH_PARTITIONED_INTERVALS = {"1d"}
+DEFAULT_COMPACT_MIN_PARTS = 8
+
+OHLCV_AGGREGATION = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+    "value": "sum",
+}
+
+DateLike = Union[str, date, datetime, pd.Timestamp, None]
+
+
+def _to_timestamp(value: DateLike) -> Optional[pd.Timestamp]:
+    if value is None or value == "":
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(None) if ts.tzinfo is not None else ts
+
+
+def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """1분봉 → 상위 주기 봉 (open first / high max / low min / close last / volume·value sum)"""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=list(df.columns) if df is not None else [])
+    aggregation = {column: OHLCV_AGGREGATION.get(column, "last") for column in df.columns}
+    resampled = df.resample(rule, label="left", closed="left").agg(aggregation)
+    return resampled.dropna(subset=[column for column in ("open", "close") if column in resampled.columns])
+
+
+class OHLCVPartitionStore:
+    """티커 하나의 OHLCV 파티션 저장소"""
+
+    def __init__(self, root_dir: Optional[str] = None, ticker: str = "KRW-BTC", compact_min_parts: Optional[int] = None):
+        if pq is None:
+            raise RuntimeError("OHLCVPartitionStore를 사용하려면 pyarrow가 필요합니다.")
+        self.root_dir = root_dir or os.getenv("BITCOIN_OHLCV_STORE_DIR", "data/ohlcv")
+        self.ticker = ticker
+        self.base_dir = os.path.join(self.root_dir, ticker)
+        self.compact_min_parts = max(
+            int(compact_min_parts or env_int("OHLCV_STORE_COMPACT_MIN_PARTS", DEFAULT_COMPACT_MIN_PARTS)),
+            2,
+        )
+        self._write_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 경로
+    # ------------------------------------------------------------------
+    def _interval_dir(self, interval: str) -> str:
+        return os.path.join(self.base_dir, interval)
+
+    @staticmethod
+    def _partition_name(interval: str, day: date) -> str:
+        if interval in MONTH_PARTITIONED_INTERVALS:
+            return f"month={day:%Y-%m}"
+        return f"date={day:%Y-%m-%d}"
+
+    def _partition_dir(self, interval: str, day: date) -> str:
+        return os.path.join(self._interval_dir(interval), self._partition_name(interval, day))
+
+    def _list_partitions(self, interval: str) -> List[str]:
+        """파티션 디렉토리 이름 (정렬, 'date=…'/'month=…')"""
+        path = self._interval_dir(interval)
+        if not os.path.isdir(path):
+            return []
+        return sorted(name for name in os.listdir(path) if "=" in name)
+
+    @staticmethod
+    def _partition_bounds(name: str) -> tuple:
+        key, value = name.split("=", 1)
+        if key == "month":
+            start = pd.Timestamp(f"{value}-01")
+            return start, start + pd.offsets.MonthBegin(1)
+        start = pd.Timestamp(value)
+        return start, start + pd.Timedelta(days=1)
+
+    def _select_partitions(self, interval: str, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> List[str]:
+        selected = []
+        for name in self._list_partitions(interval):
+            lower, upper = self._partition_bounds(name)
+            if start is not None and upper <= start:
+                continue
+            if end is not None and lower > end:
+                continue
+            selected.append(name)
+        return selected
+
+    def _part_files(self, interval: str, partition: str) -> List[str]:
+        path = os.path.join(self._interval_dir(interval), partition)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if name.endswith(".parquet")
+        )
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _read_files(files: Iterable[str], columns: Optional[List[str]] = None) -> pd.DataFrame:
+        frames = []
+        for path in files:
+            read_columns = None if columns is None else ["timestamp"] + [c for c in columns if c != "timestamp"]
+            frames.append(pq.read_table(path, columns=read_columns).to_pandas())
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        # part 파일은 이름(생성 시각)순이므로 마지막 값을 남기면 최신 수집값이 우선한다.
+        df = df.drop_duplicates(subset=["timestamp"], keep="last").set_index("timestamp").sort_index()
+        return df
+
+    def _read_partition(self, interval: str, partition: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return self._read_files(self._part_files(interval, partition), columns)
+
+    def read_range(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        interval: str = BASE_INTERVAL,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        [start, end] 구간 조회 (end 포함). 필요한 파티션만 읽는다.
+
+        Args:
+            interval: "1m" / "5m" / "1h" / "1d"
+            limit: 지정 시 구간 내 마지막 limit개
+        """
+        self._check_interval(interval)
+        start_ts, end_ts = _to_timestamp(start), _to_timestamp(end)
+        files: List[str] = []
+        for partition in self._select_partitions(interval, start_ts, end_ts):
+            files.extend(self._part_files(interval, partition))
+        df = self._read_files(files, columns)
+        if df.empty:
+            return df
+        if start_ts is not None:
+            df = df[df.index >= start_ts]
+        if end_ts is not None:
+            df = df[df.index <= end_ts]
+        if limit:
+            df = df.tail(int(limit))
+        return df
+
+    def read_tail(self, count: int, interval: str = BASE_INTERVAL, end: DateLike = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """end(기본: 최신) 이전 마지막 count개 봉. 최신 파티션부터 필요한 만큼만 읽는다."""
+        self._check_interval(interval)
+        end_ts = _to_timestamp(end)
+        partitions = self._select_partitions(interval, None, end_ts)
+        frames: List[pd.DataFrame] = []
+        rows = 0
+        for partition in reversed(partitions):
+            frame = self._read_partition(interval, partition, columns)
+            if end_ts is not None and not frame.empty:
+                frame = frame[frame.index <= end_ts]
+            frames.append(frame)
+            rows += len(frame)
+            if rows >= count:
+                break
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(reversed(frames)) if len(frames) > 1 else frames[0]
+        return df.tail(int(count))
+
+    def latest_timestamp(self, interval: str = BASE_INTERVAL) -> Optional[pd.Timestamp]:
+        for partition in reversed(self._list_partitions(interval)):
+            frame = self._read_partition(interval, partition, columns=["timestamp"])
+            if len(frame.index):
+                return frame.index.max()
+        return None
+
+    def statistics(self) -> Dict[str, object]:
+        """
+        저장소 통계. part 파일이 하나인 파티션은 메타데이터 행 수를 쓰고,
+        여러 part로 나뉜 파티션은 timestamp 컬럼만 읽어 중복(재수집된 분봉)을 제외하고 센다.
+        """
+        partitions = self._list_partitions(BASE_INTERVAL)
+        total_rows = 0
+        total_bytes = 0
+        for partition in partitions:
+            files = self._part_files(BASE_INTERVAL, partition)
+            total_bytes += sum(os.path.getsize(path) for path in files)
+            if len(files) == 1:
+                total_rows += pq.read_metadata(files[0]).num_rows
+            elif files:
+                total_rows += len(self._read_files(files, columns=["timestamp"]).index)
+        earliest = None
+        for partition in partitions:
+            frame = self._read_partition(BASE_INTERVAL, partition, columns=["timestamp"])
+            if len(frame.index):
+                earliest = frame.index.min()
+                break
+        latest = self.latest_timestamp()
+        return {
+            "partitions": len(partitions),
+            "total_records": total_rows,
+            "earliest": earliest,
+            "latest": latest,
+            "size_mb": total_bytes / (1024 * 1024),
+        }
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_interval(interval: str) -> None:
+        if interval != BASE_INTERVAL and interval not in VIEW_RULES:
+            raise ValueError(f"지원하지 않는 interval: {interval}")
+
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+        frame = df.copy()
+        if "timestamp" in frame.columns:
+            frame = frame.set_index("timestamp")
+        frame.index = pd.to_datetime(frame.index)
+        if frame.index.tz is not None:
+            frame.index = frame.index.tz_localize(None)
+        frame.index.name = "timestamp"
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        numeric = [column for column in frame.columns if column in OHLCV_AGGREGATION]
+        return frame[numeric].astype("float64")
+
+    def _write_file(self, path: str, frame: pd.DataFrame) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        table = pa.Table.from_pandas(frame.reset_index(), preserve_index=False)
+        tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+    def append(self, df: pd.DataFrame, update_views: bool = True) -> Dict[str, int]:
+        """
+        1분봉 append. 날짜별로 새 part 파일을 추가하고, 해당 날짜의 다운샘플 뷰만 재계산한다.
+
+        Returns:
+            {"rows": 기록 행 수, "partitions": 영향 받은 날짜 수, "compacted": 압축된 파티션 수}
+        """
+        if df is None or df.empty:
+            return {"rows": 0, "partitions": 0, "compacted": 0}
+        frame = self._normalize_frame(df)
+        compacted = 0
+        with self._write_lock:
+            days = sorted(set(frame.index.date))
+            stamp = time.time_ns()
+            for day in days:
+                day_start = pd.Timestamp(day)
+                day_frame = frame[(frame.index >= day_start) & (frame.index < day_start + pd.Timedelta(days=1))]
+                part_path = os.path.join(self._partition_dir(BASE_INTERVAL, day), f"part-{stamp:020d}.parquet")
+                self._write_file(part_path, day_frame)
+                if len(self._part_files(BASE_INTERVAL, self._partition_name(BASE_INTERVAL, day))) >= self.compact_min_parts:
+                    self._compact_partition(day)
+                    compacted += 1
+            if update_views:
+                self._refresh_views(days)
+        return {"rows": int(len(frame)), "partitions": len(days), "compacted": compacted}
+
+    def _compact_partition(self, day: date) -> None:
+        """하루치 part 파일들을 하나로 병합 (해당 날짜 파티션만 재작성)"""
+        partition = self._partition_name(BASE_INTERVAL, day)
+        files = self._part_files(BASE_INTERVAL, partition)
+        if len(files) < 2:
+            return
+        merged = self._read_files(files)
+        self._write_file(os.path.join(self._partition_dir(BASE_INTERVAL, day), "part-00000000000000000000.parquet"), merged)
+        for path in files:
+            if not path.endswith("part-00000000000000000000.parquet"):
+                os.remove(path)
+
+    def _refresh_views(self, days: Iterable[date]) -> None:
+        for day in days:
+            minute = self._read_partition(BASE_INTERVAL, self._partition_name(BASE_INTERVAL, day))
+            for interval, rule in VIEW_RULES.items():
+                if interval in MONTH_PARTITIONED_INTERVALS:
+                    continue
+                self._write_file(os.path.join(self._partition_dir(interval, day), "data.parquet"), resample_ohlcv(minute, rule))
+            self._upsert_month_view_rows(day, minute)
+
+    def _upsert_month_view_rows(self, day: date, minute: pd.DataFrame) -> None:
+        for interval in MONTH_PARTITIONED_INTERVALS:
+            bars = resample_ohlcv(minute, VIEW_RULES[interval])
+            partition = self._partition_name(interval, day)
+            existing = self._read_partition(interval, partition)
+            if not existing.empty:
+                day_start = pd.Timestamp(day)
+                existing = existing[(existing.index < day_start) | (existing.index >= day_start + pd.Timedelta(days=1))]
+                bars = pd.concat([existing, bars]).sort_index()
+            self._write_file(os.path.join(self._partition_dir(interval, day), "data.parquet"), bars)
+
+    def rebuild_views(self, start: DateLike = None, end: DateLike = None) -> int:
+        """구간의 다운샘플 뷰 재계산 (마이그레이션/복구용). 재계산한 날짜 수 반환."""
+        days = [
+            self._partition_bounds(name)[0].date()
+            for name in self._select_partitions(BASE_INTERVAL, _to_timestamp(start), _to_timestamp(end))
+        ]
+        with self._write_lock:
+            self._refresh_views(days)
+        return len(days)
+
+    def drop_before(self, cutoff: DateLike) -> Dict[str, int]:
+        """cutoff 날짜 이전 파티션 삭제 (파일 재작성 없음)"""
+        cutoff_ts = _to_timestamp(cutoff)
+        dropped = {}
+        with self._write_lock:
+            for interval in [BASE_INTERVAL] + list(VIEW_RULES):
+                count = 0
+                for name in self._list_partitions(interval):
+                    _, upper = self._partition_bounds(name)
+                    if upper <= cutoff_ts:
+                        shutil.rmtree(os.path.join(self._interval_dir(interval), name), ignore_errors=True)
+                        count += 1
+                dropped[interval] = count
+        return dropped
+
+    def _import_marker_path(self, csv_path: str) -> str:
+        return os.path.join(self.base_dir, f".imported-{os.path.basename(csv_path)}")
+
+    def is_csv_imported(self, csv_path: str) -> bool:
+        """import_csv가 뷰 재계산까지 끝까지 완료됐는지 (완료 마커 존재 여부)"""
+        return os.path.exists(self._import_marker_path(csv_path))
+
+    def import_csv(self, csv_path: str, chunksize: int = 500_000, resume_from: DateLike = None) -> int:
+        """
+        기존 단일 CSV(timestamp 컬럼)를 청크 단위로 파티션 저장소에 적재하고, 뷰를 재계산한 뒤 완료 마커를 남긴다.
+
+        Args:
+            resume_from: 지정 시 이 시각 이전 행은 건너뛴다 (중단된 이관 재개용, CSV가 시간순이라고 가정).
+                         이미 적재된 행을 다시 쓰더라도 같은 timestamp는 나중 값으로 합쳐진다.
+        """
+        resume_ts = _to_timestamp(resume_from)
+        total = 0
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            if resume_ts is not None:
+                chunk = chunk[pd.to_datetime(chunk["timestamp"]) >= resume_ts]
+            total += self.append(chunk, update_views=False)["rows"]
+        self.rebuild_views()
+        os.makedirs(self.base_dir, exist_ok=True)
+        with open(self._import_marker_path(csv_path), "w", encoding="utf-8") as marker:
+            marker.write(f"{datetime.now().isoformat()} rows={total}\n")
+        logger.info("CSV → OHLCV 파티션 저장소 적재 완료: %s (%s행, resume_from=%s)", csv_path, total, resume_ts)
+        return total
+
+
+_stores: Dict[tuple, OHLCVPartitionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ohlcv_store(ticker: str = "KRW-BTC", root_dir: Optional[str] = None) -> OHLCVPartitionStore:
+    """티커별 OHLCVPartitionStore 싱글톤"""
+    key = (root_dir or os.getenv("BITCOIN_OHLCV_STORE_DIR", "data/ohlcv"), ticker)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = OHLCVPartitionStore(root_dir=key[0], ticker=ticker)
+            _stores[key] = store
+        return store
@@ -0,0 +1,227 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from service import auth
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeCursor:
+    """users.auth_version만 흉내내는 커서 (다른 워커와 공유되는 DB 상태)"""
+
+    def __init__(self, db):
+        self.db = db
+        self.rowcount = 0
+        self._row = None
+
+    def execute(self, sql, params=None):
+        self.db.executed.append(sql)
+        params = tuple(params or ())
+        if sql.strip().startswith("DELETE FROM users"):
+            self.rowcount = 1 if self.db.versions.pop(params[0], None) is not None else 0
+        elif sql.strip().startswith("SELECT auth_version"):
+            version = self.db.versions.get(params[0])
+            self._row = None if version is None else {"auth_version": version}
+        elif "auth_version = auth_version + 1" in sql:
+            old_id = params[-1]
+            version = self.db.versions.pop(old_id) + 1
+            new_id = params[0] if "SET id = %s" in sql else old_id
+            self.db.versions[new_id] = version
+
+    def fetchone(self):
+        return self._row
+
+
+class _FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+
+class _FakeDB:
+    def __init__(self):
+        self.executed = []
+        self.versions = {"alice": 0}
+
+    def connection(self):
+        return _FakeConnection(self)
+
+
+class TestPrincipalCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.cache = auth.PrincipalCache(ttl_seconds=30, clock=self.clock)
+        self.users = {"alice": {"id": "alice", "role": "user", "mfa_enabled": False}}
+        self.loads = 0
+
+    def _loader(self, user_id):
+        self.loads += 1
+        user = self.users.get(user_id)
+        return dict(user) if user else None
+
+    def test_hits_until_ttl_and_returns_copies(self):
+        user = self.cache.get("alice", self._loader)
+        user["role"] = "admin"
+        self.assertEqual(self.cache.get("alice", self._loader)["role"], "user")
+        self.assertEqual(self.loads, 1)
+
+        self.clock.now = 31
+        self.cache.get("alice", self._loader)
+        self.assertEqual(self.loads, 2)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_invalidate_bumps_version_and_missing_user_is_not_cached(self):
+        self.cache.get("alice", self._loader)
+        self.users["alice"]["role"] = "admin"
+        self.assertEqual(self.cache.invalidate("alice"), 1)
+        self.assertEqual(self.cache.get("alice", self._loader)["role"], "admin")
+
+        self.assertIsNone(self.cache.get("bob", self._loader))
+        self.assertIsNone(self.cache.get("bob", self._loader))
+        self.assertEqual(self.loads, 4)
+
+    def test_version_change_from_another_worker_is_rechecked_periodically(self):
+        shared = {"alice": 0}
+        checks = []
+        self.users["alice"]["auth_version"] = 0
+        cache = auth.PrincipalCache(ttl_seconds=30, clock=self.clock, version_check_seconds=5)
+
+        def version_loader(user_id):
+            checks.append(user_id)
+            return shared.get(user_id)
+
+        # 확인 주기 안의 적중은 DB를 전혀 거치지 않는다.
+        for _ in range(5):
+            self.assertEqual(cache.get("alice", self._loader, version_loader)["role"], "user")
+        self.assertEqual((self.loads, len(checks)), (1, 0))
+
+        # 주기가 지나면 auth_version만 확인하고, 같으면 적중으로 처리한다.
+        self.clock.now = 5
+        cache.get("alice", self._loader, version_loader)
+        cache.get("alice", self._loader, version_loader)
+        self.assertEqual((self.loads, len(checks)), (1, 1))
+
+        # 다른 워커가 강등/변경 (이 프로세스의 invalidate()는 호출되지 않음) → 다음 확인 시점에 반영
+        self.users["alice"].update(role="admin", auth_version=1)
+        shared["alice"] = 1
+        self.assertEqual(cache.get("alice", self._loader, version_loader)["role"], "user")
+        self.clock.now = 10
+        self.assertEqual(cache.get("alice", self._loader, version_loader)["role"], "admin")
+        self.assertEqual(self.loads, 2)
+
+        # 다른 워커가 삭제
+        del self.users["alice"]
+        del shared["alice"]
+        self.clock.now = 15
+        self.assertIsNone(cache.get("alice", self._loader, version_loader))
+        self.assertEqual(cache.stats()["stale_hits"], 2)
+
+    def test_load_racing_invalidation_is_not_cached(self):
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_loader(user_id):
+            loading.set()
+            release.wait(5)
+            return {"id": user_id, "role": "user"}
+
+        worker = threading.Thread(target=lambda: self.cache.get("alice", slow_loader))
+        worker.start()
+        self.assertTrue(loading.wait(5))
+        self.cache.invalidate("alice")
+        release.set()
+        worker.join(5)
+
+        self.users["alice"]["role"] = "admin"
+        self.assertEqual(self.cache.get("alice", self._loader)["role"], "admin")
+
+
+class TestPrincipalInvalidationHooks(unittest.TestCase):
+    def setUp(self):
+        self.db = _FakeDB()
+        patches = [
+            patch.object(auth, "get_db_connection", self.db.connection),
+            patch.object(auth, "init_db", lambda: None),
+            patch.object(auth, "encrypt_data", lambda value: f"enc:{value}"),
+            patch.object(auth, "_principal_cache", auth.PrincipalCache(ttl_seconds=30, version_check_seconds=0)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.user = {
+            "id": "alice",
+            "role": "user",
+            "password_hash": auth.hash_password("pw"),
+            "mfa_enabled": True,
+            "created_at": None,
+            "updated_at": None,
+        }
+
+    def _cached_role(self):
+        row = dict(self.user, auth_version=self.db.versions.get("alice"))
+        with patch.object(auth, "get_user_by_id", return_value=row if "alice" in self.db.versions else None) as load:
+            role = auth.get_current_principal("alice")["role"]
+            return role, load.call_count
+
+    def test_mutations_invalidate_cached_principal(self):
+        self.assertEqual(self._cached_role(), ("user", 1))
+        self.assertEqual(self._cached_role(), ("user", 0))
+
+        self.user["role"] = "admin"
+        with patch.object(auth, "get_user_by_id", return_value=dict(self.user)):
+            auth.update_user("alice", role="admin")
+        self.assertEqual(self._cached_role(), ("admin", 1))
+
+        with patch.object(auth, "get_user_by_id", return_value=dict(self.user)):
+            auth.disable_mfa("alice", "pw")
+        self.assertEqual(self._cached_role()[1], 1)
+
+        with patch.object(auth, "verify_mfa_code", return_value=True):
+            auth.verify_mfa_setup("alice", "SECRET", "123456")
+        self.assertEqual(self._cached_role()[1], 1)
+
+        self.assertEqual(self.db.versions["alice"], 3)
+
+        self.assertTrue(auth.delete_user("alice"))
+        with patch.object(auth, "get_user_by_id", return_value=None):
+            self.assertIsNone(auth.get_current_principal("alice"))
+
+    def test_mutation_in_another_worker_is_seen_through_auth_version(self):
+        self.assertEqual(self._cached_role(), ("user", 1))
+
+        # 다른 워커의 update_user: 공유 DB의 auth_version만 바뀌고 이 프로세스 캐시는 invalidate되지 않는다.
+        self.user["role"] = "admin"
+        with patch.object(auth, "invalidate_principal"), \
+                patch.object(auth, "get_user_by_id", return_value=dict(self.user)):
+            auth.update_user("alice", role="admin")
+        self.assertEqual(self._cached_role(), ("admin", 1))
+        self.assertEqual(self._cached_role(), ("admin", 0))
+
+    def test_user_id_rename_invalidates_credentials_for_both_ids(self):
+        users = iter([dict(self.user), None, dict(self.user, id="alice2")])
+        with patch.object(auth, "get_user_by_id", side_effect=lambda user_id: next(users)), \
+                patch.object(auth, "invalidate_user_credentials") as invalidate:
+            auth.update_user("alice", new_user_id="alice2")
+        self.assertEqual([c.args for c in invalidate.call_args_list], [("alice",), ("alice2",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from service.utils import encryption
+from service.utils.credential_store import CredentialStore
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEncryptionKeyCache(unittest.TestCase):
+    def setUp(self):
+        encryption.clear_fernet_cache()
+        self.addCleanup(encryption.clear_fernet_cache)
+
+    def test_derived_key_is_reused_until_master_key_changes(self):
+        with patch.dict(os.environ, {"ENCRYPTION_MASTER_KEY": "not-a-fernet-key"}):
+            before = encryption.get_encryption_stats()["key_derivations"]
+            token = encryption.encrypt_data("secret")
+            self.assertEqual(encryption.decrypt_data(token), "secret")
+            self.assertIs(encryption.get_fernet(), encryption.get_fernet())
+            self.assertEqual(encryption.get_encryption_stats()["key_derivations"], before + 1)
+
+        with patch.dict(os.environ, {"ENCRYPTION_MASTER_KEY": "another-master-key"}):
+            with self.assertRaises(ValueError):
+                encryption.decrypt_data(token)
+            stats = encryption.get_encryption_stats()
+            self.assertEqual(stats["key_derivations"], before + 2)
+            self.assertEqual(stats["cached_keys"], 1)
+            self.assertGreater(stats["key_derivation_ms_last"], 0.0)
+
+
+class TestCredentialStore(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.store = CredentialStore(ttl_seconds=60, clock=self.clock)
+        self.loads = []
+
+    def _loader(self, value):
+        def load():
+            self.loads.append(value)
+            return value
+        return load
+
+    def test_cached_until_ttl_expires_and_returns_copies(self):
+        first = self.store.get("kis", "u1", self._loader({"app_key": "a"}))
+        first["app_key"] = "mutated"
+        self.assertEqual(self.store.get("kis", "u1", self._loader({"app_key": "b"})), {"app_key": "a"})
+
+        self.clock.now = 61
+        self.assertEqual(self.store.get("kis", "u1", self._loader({"app_key": "b"})), {"app_key": "b"})
+        self.assertEqual(len(self.loads), 2)
+
+        stats = self.store.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 2, 1))
+
+    def test_missing_credentials_are_cached_but_errors_are_not(self):
+        self.assertIsNone(self.store.get("upbit", "u1", self._loader(None)))
+        self.assertIsNone(self.store.get("upbit", "u1", self._loader({"access_key": "x"})))
+
+        def failing():
+            raise ValueError("복호화 실패")
+
+        with self.assertRaises(ValueError):
+            self.store.get("kis", "u1", failing)
+        self.assertEqual(self.store.get("kis", "u1", self._loader({"app_key": "a"})), {"app_key": "a"})
+        self.assertEqual(self.store.stats()["load_failures"], 1)
+
+    def test_invalidate_by_provider_and_user(self):
+        self.store.get("kis", "u1", self._loader({"app_key": "a"}))
+        self.store.get("upbit", "u1", self._loader({"access_key": "x"}))
+        self.store.get("kis", "u2", self._loader({"app_key": "c"}))
+
+        self.assertEqual(self.store.invalidate("u1", "kis"), 1)
+        self.assertEqual(self.store.get("kis", "u1", self._loader({"app_key": "new"})), {"app_key": "new"})
+        self.assertEqual(self.store.invalidate("u1"), 2)
+        self.assertEqual(self.store.stats()["entries"], 1)
+
+    def test_invalidate_during_load_discards_stale_result(self):
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_loader():
+            loading.set()
+            release.wait(5)
+            return {"app_key": "stale"}
+
+        worker = threading.Thread(target=lambda: self.store.get("kis", "u1", slow_loader))
+        worker.start()
+        self.assertTrue(loading.wait(5))
+        self.store.invalidate("u1", "kis")
+        release.set()
+        worker.join(5)
+
+        self.assertEqual(self.store.get("kis", "u1", self._loader({"app_key": "fresh"})), {"app_key": "fresh"})
+
+
+class TestKisUserCredentialsCache(unittest.TestCase):
+    def test_get_user_kis_credentials_uses_store(self):
+        from service.macro_trading.kis import user_credentials
+
+        store = CredentialStore(ttl_seconds=60)
+        row = {"kis_id": "k", "account_no": "1", "app_key": "a", "app_secret": "s", "is_simulation": False}
+        with patch.object(user_credentials, "get_credential_store", return_value=store), \
+                patch.object(user_credentials, "_load_user_kis_credentials", return_value=row) as load:
+            self.assertEqual(user_credentials.get_user_kis_credentials("u1"), row)
+            self.assertEqual(user_credentials.get_user_kis_credentials("u1"), row)
+            self.assertEqual(load.call_count, 1)
+
+            load.side_effect = RuntimeError("db down")
+            store.invalidate("u1")
+            self.assertIsNone(user_credentials.get_user_kis_credentials("u1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
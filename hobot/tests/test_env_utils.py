@@ -0,0 +1,36 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from service.utils.env import env_flag, env_float, env_int, safe_float, safe_int, truthy_env
+
+
+class TestEnvUtils(unittest.TestCase):
+    def test_truthy_env_requires_explicit_on(self):
+        self.assertTrue(truthy_env(" Yes "))
+        self.assertFalse(truthy_env("off", default=True))
+        self.assertFalse(truthy_env("anything"))
+        self.assertTrue(truthy_env(None, default=True))
+
+    def test_env_flag_is_on_unless_explicitly_off(self):
+        with patch.dict(os.environ, {"HOBOT_TEST_FLAG": "OFF"}):
+            self.assertFalse(env_flag("HOBOT_TEST_FLAG"))
+        with patch.dict(os.environ, {"HOBOT_TEST_FLAG": "anything"}):
+            self.assertTrue(env_flag("HOBOT_TEST_FLAG", default=False))
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertTrue(env_flag("HOBOT_TEST_FLAG"))
+            self.assertFalse(env_flag("HOBOT_TEST_FLAG", default=False))
+
+    def test_numeric_parsers_fall_back_to_default(self):
+        self.assertEqual(safe_int("7", 1), 7)
+        self.assertEqual(safe_int(None, 1), 1)
+        self.assertEqual(safe_float("bad", 0.5), 0.5)
+        with patch.dict(os.environ, {"HOBOT_TEST_INT": " 12 ", "HOBOT_TEST_FLOAT": "x"}):
+            self.assertEqual(env_int("HOBOT_TEST_INT", 3), 12)
+            self.assertEqual(env_float("HOBOT_TEST_FLOAT", 2.5), 2.5)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(env_int("HOBOT_TEST_INT", 3), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from service import llm_monitoring
+from service.llm_monitoring import LLMUsageLogSink
+
+
+def _record(idx):
+    return {
+        "model_name": "gemini-3-flash-preview",
+        "provider": "Google",
+        "service_name": "graph_rag_answer",
+        "total_tokens": idx,
+        "created_at": datetime(2026, 2, 10, 9, 0, idx),
+    }
+
+
+class TestLLMUsageLogSink(unittest.TestCase):
+    def setUp(self):
+        self.spool_dir = tempfile.mkdtemp(prefix="llm_usage_spool_")
+        self.addCleanup(shutil.rmtree, self.spool_dir, True)
+
+    def test_submit_returns_immediately_and_flushes_in_batches(self):
+        written = []
+        writer_entered = threading.Event()
+        release_writer = threading.Event()
+
+        def slow_writer(records):
+            writer_entered.set()
+            release_writer.wait(timeout=5)
+            written.append(list(records))
+
+        sink = LLMUsageLogSink(batch_size=3, flush_interval_sec=0.05, spool_dir=self.spool_dir, writer=slow_writer)
+        for idx in range(3):
+            sink.submit(_record(idx))
+        self.assertTrue(writer_entered.wait(timeout=5))
+        # writer가 막혀 있는 동안에도 submit은 반환된다.
+        for idx in range(3, 7):
+            sink.submit(_record(idx))
+        self.assertFalse(release_writer.is_set())
+        self.assertEqual(written, [])
+
+        release_writer.set()
+        sink.shutdown(timeout_sec=2)
+
+        self.assertEqual(sum(len(batch) for batch in written), 7)
+        self.assertTrue(all(len(batch) <= 3 for batch in written))
+        self.assertEqual(sink.get_stats()["written"], 7)
+
+    def test_spools_when_db_unavailable_and_replays_after_recovery(self):
+        db_up = {"value": False}
+        written = []
+
+        def flaky_writer(records):
+            if not db_up["value"]:
+                raise RuntimeError("mysql down")
+            written.extend(records)
+
+        sink = LLMUsageLogSink(batch_size=10, flush_interval_sec=0.05, spool_dir=self.spool_dir, writer=flaky_writer)
+        sink.submit(_record(1))
+        sink.submit(_record(2))
+        sink.shutdown(timeout_sec=2)
+
+        spooled = [name for name in os.listdir(self.spool_dir) if name.endswith(".jsonl")]
+        self.assertEqual(len(spooled), 1)
+        self.assertEqual(written, [])
+
+        db_up["value"] = True
+        sink.submit(_record(3))
+        sink.shutdown(timeout_sec=2)
+
+        self.assertEqual(sorted(record["total_tokens"] for record in written), [1, 2, 3])
+        self.assertEqual(written[0]["created_at"].__class__, datetime)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_full_queue_spools_instead_of_blocking(self):
+        gate = threading.Event()
+
+        def blocked_writer(records):
+            gate.wait(timeout=2)
+
+        sink = LLMUsageLogSink(
+            max_queue=1, batch_size=1, flush_interval_sec=0.05, spool_dir=self.spool_dir, writer=blocked_writer
+        )
+        for idx in range(5):
+            sink.submit(_record(idx))
+        self.assertGreaterEqual(sink.get_stats()["spooled"], 1)
+        gate.set()
+        sink.shutdown(timeout_sec=2)
+
+    def _write_spool(self, name, records):
+        sink = LLMUsageLogSink(spool_dir=self.spool_dir, writer=lambda records: None)
+        path = os.path.join(self.spool_dir, name)
+        with patch.object(sink, "_spool_path", return_value=path):
+            sink._spool(records)
+        return path
+
+    def test_partial_replay_failure_does_not_duplicate_written_batches(self):
+        self._write_spool("llm_usage_1.jsonl", [_record(idx) for idx in range(5)])
+        os.utime(os.path.join(self.spool_dir, "llm_usage_1.jsonl"), (0, 0))
+        written = []
+        calls = {"count": 0}
+
+        def fail_second_batch(records):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                raise RuntimeError("mysql down")
+            written.extend(records)
+
+        sink = LLMUsageLogSink(batch_size=2, flush_interval_sec=0.05, spool_dir=self.spool_dir, writer=fail_second_batch)
+        sink._replay_spool()
+        self.assertEqual(os.listdir(self.spool_dir), ["llm_usage_1.jsonl"])
+        os.utime(os.path.join(self.spool_dir, "llm_usage_1.jsonl"), (0, 0))
+        sink._replay_spool()
+
+        self.assertEqual(sorted(record["total_tokens"] for record in written), [0, 1, 2, 3, 4])
+        self.assertEqual(os.listdir(self.spool_dir), [])
+        self.assertEqual(sink.get_stats()["replayed"], 5)
+
+    def test_reclaims_replaying_file_left_by_dead_process(self):
+        orphan = self._write_spool("llm_usage_7.jsonl.replaying-999999", [_record(1), _record(2)])
+        live = self._write_spool(f"llm_usage_8.jsonl.replaying-{os.getppid()}", [_record(3)])
+        written = []
+        sink = LLMUsageLogSink(batch_size=10, spool_dir=self.spool_dir, writer=written.extend)
+
+        with patch.object(LLMUsageLogSink, "_pid_alive", side_effect=lambda pid: pid != 999999):
+            sink._replay_spool()
+
+        self.assertEqual(sorted(record["total_tokens"] for record in written), [1, 2])
+        self.assertFalse(os.path.exists(orphan))
+        self.assertTrue(os.path.exists(live))
+
+    def test_log_llm_usage_submits_to_sink_when_async(self):
+        captured = []
+
+        class _Sink:
+            def submit(self, record):
+                captured.append(record)
+
+        with patch.dict(os.environ, {"LLM_USAGE_LOG_ASYNC": "1"}), patch.object(
+            llm_monitoring, "get_llm_usage_log_sink", return_value=_Sink()
+        ), patch.object(llm_monitoring, "_insert_llm_usage_records") as insert:
+            llm_monitoring.log_llm_usage(
+                model_name="m",
+                provider="Google",
+                request_prompt="q" * 20000,
+                total_tokens=10,
+                flow_run_id="run-1",
+            )
+
+        insert.assert_not_called()
+        self.assertEqual(len(captured), 1)
+        self.assertEqual(len(captured[0]["request_prompt"]), 10000)
+        self.assertEqual(captured[0]["flow_run_id"], "run-1")
+        self.assertIsInstance(captured[0]["created_at"], datetime)
+
+
+if __name__ == "__main__":
+    unittest.main()
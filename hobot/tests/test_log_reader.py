@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from service.utils.log_reader import LogFileReader, read_since, tail_lines
+
+
+def _log_lines(count, start=datetime(2026, 1, 1, 0, 0, 0)):
+    lines = []
+    for i in range(count):
+        ts = (start + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S") + ",123"
+        level = "ERROR" if i % 50 == 0 else "INFO"
+        lines.append(f"{ts} - {level} - message {i}")
+        if level == "ERROR":
+            lines.append("Traceback (most recent call last):")
+            lines.append(f"  boom {i}")
+    return lines
+
+
+class TestLogReader(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "log.txt")
+
+    def _write(self, lines, mode="w", newline=True):
+        with open(self.path, mode, encoding="utf-8") as f:
+            f.write("\n".join(lines) + ("\n" if newline else ""))
+
+    def test_tail_reads_backwards_in_blocks_and_skips_partial_line(self):
+        lines = _log_lines(500)
+        self._write(lines)
+        self._write(["2026-01-01 09:00:00,000 - INFO - partial"], mode="a", newline=False)
+
+        chunk = tail_lines(self.path, 5, block_size=128)
+
+        self.assertEqual(chunk.lines, lines[-5:])
+        self.assertLess(chunk.scanned_bytes, 1024)
+        self.assertEqual(chunk.end_offset, os.path.getsize(self.path) - len("2026-01-01 09:00:00,000 - INFO - partial"))
+
+    def test_follow_cursor_returns_only_appended_lines_and_resets_on_truncate(self):
+        self._write(_log_lines(10))
+        cursor = read_since(self.path, None).cursor
+
+        self._write(["2026-01-01 01:00:00,000 - INFO - new line"], mode="a")
+        chunk = read_since(self.path, cursor)
+        self.assertEqual(chunk.lines, ["2026-01-01 01:00:00,000 - INFO - new line"])
+        self.assertFalse(chunk.reset)
+        self.assertEqual(read_since(self.path, chunk.cursor).lines, [])
+
+        self._write(["2026-01-02 00:00:00,000 - INFO - after truncate"])
+        truncated = read_since(self.path, chunk.cursor)
+        self.assertTrue(truncated.reset)
+        self.assertEqual(truncated.lines, ["2026-01-02 00:00:00,000 - INFO - after truncate"])
+
+    def test_search_uses_segment_index_for_time_and_level(self):
+        self._write(_log_lines(3000))
+        reader = LogFileReader(self.path, segment_bytes=4096)
+
+        start = datetime(2026, 1, 1, 0, 40, 0)
+        chunk = reader.search(start=start, end=start + timedelta(seconds=9, microseconds=999999), limit=100)
+        self.assertEqual(len(chunk.lines), 10 + 2)  # 2400번 ERROR의 Traceback 2줄 포함
+        self.assertTrue(chunk.lines[0].startswith("2026-01-01 00:40:00"))
+        self.assertLess(chunk.scanned_bytes, 3 * 4096)
+
+        errors = reader.search(min_level="ERROR", limit=6)
+        self.assertEqual(errors.lines[0], "2026-01-01 00:48:20,123 - ERROR - message 2900")
+        self.assertEqual(errors.lines[-1], "  boom 2950")
+
+        with self.assertRaises(ValueError):
+            reader.search(min_level="NOISE")
+
+    def test_index_is_persisted_extended_and_rebuilt_after_rotation(self):
+        self._write(_log_lines(200))
+        reader = LogFileReader(self.path, segment_bytes=2048)
+        total = reader.total_lines()
+        self.assertTrue(os.path.exists(reader.index_path))
+
+        self._write(_log_lines(10, start=datetime(2026, 1, 2)), mode="a")
+        reloaded = LogFileReader(self.path, segment_bytes=2048)
+        self.assertEqual(reloaded.total_lines(), total + 10 + 2)
+        self.assertEqual(len(reloaded.search(start=datetime(2026, 1, 2), limit=100).lines), 12)
+
+        os.replace(self.path, self.path + ".1")
+        self._write(_log_lines(3, start=datetime(2026, 1, 3)))
+        self.assertEqual(reloaded.total_lines(), 3 + 2)
+
+    def test_index_merges_segments_when_over_limit(self):
+        self._write(_log_lines(2000))
+        reader = LogFileReader(self.path, segment_bytes=1024, max_segments=8)
+        segments = reader.refresh_index()
+
+        self.assertLessEqual(len(segments), 8)
+        self.assertEqual(segments[-1].end, os.path.getsize(self.path))
+        self.assertEqual(len(reader.search(min_level="ERROR", limit=3).lines), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
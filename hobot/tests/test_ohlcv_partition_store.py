@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from service.utils.ohlcv_store import OHLCVPartitionStore
+
+
+def _minute_bars(start, periods, base=100.0):
+    index = pd.date_range(start, periods=periods, freq="1min", name="timestamp")
+    close = base + np.arange(periods, dtype=float)
+    return pd.DataFrame(
+        {
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.ones(periods),
+            "value": close,
+        },
+        index=index,
+    )
+
+
+class TestOHLCVPartitionStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = OHLCVPartitionStore(root_dir=self._tmp.name, ticker="KRW-BTC", compact_min_parts=3)
+
+    def _partition_files(self, interval, partition):
+        return sorted(os.listdir(os.path.join(self.store.base_dir, interval, partition)))
+
+    def test_append_is_partitioned_by_day_and_reads_only_requested_range(self):
+        result = self.store.append(_minute_bars("2026-01-01 23:50", 20))
+
+        self.assertEqual(result, {"rows": 20, "partitions": 2, "compacted": 0})
+        self.assertEqual(self.store._list_partitions("1m"), ["date=2026-01-01", "date=2026-01-02"])
+
+        df = self.store.read_range("2026-01-02", "2026-01-02 00:05")
+        self.assertEqual(len(df), 6)
+        self.assertEqual(float(df["close"].iloc[0]), 110.0)
+        self.assertEqual(self.store.latest_timestamp(), pd.Timestamp("2026-01-02 00:09"))
+
+        tail = self.store.read_tail(3)
+        self.assertEqual(list(tail["close"]), [117.0, 118.0, 119.0])
+
+    def test_later_appends_win_and_views_are_maintained(self):
+        self.store.append(_minute_bars("2026-01-01 09:00", 10))
+        # 마지막 분봉 재수집(값 보정) + 이후 분봉 추가
+        self.store.append(_minute_bars("2026-01-01 09:09", 3, base=200.0))
+
+        minute = self.store.read_range("2026-01-01")
+        self.assertEqual(len(minute), 12)
+        self.assertEqual(float(minute.loc["2026-01-01 09:09", "close"]), 200.0)
+
+        five = self.store.read_range("2026-01-01", interval="5m")
+        self.assertEqual(list(five.index.strftime("%H:%M")), ["09:00", "09:05", "09:10"])
+        self.assertEqual(float(five.loc["2026-01-01 09:05", "open"]), 104.5)
+        self.assertEqual(float(five.loc["2026-01-01 09:05", "close"]), 200.0)
+        self.assertEqual(float(five.loc["2026-01-01 09:05", "volume"]), 5.0)
+
+        daily = self.store.read_range(interval="1d")
+        self.assertEqual(len(daily), 1)
+        self.assertEqual(float(daily["high"].iloc[0]), 203.0)
+
+    def test_day_partition_is_compacted_and_old_partitions_dropped(self):
+        for hour in range(3):
+            self.store.append(_minute_bars(f"2026-01-01 0{hour}:00", 2))
+        self.store.append(_minute_bars("2026-01-03 00:00", 2))
+
+        self.assertEqual(len(self._partition_files("1m", "date=2026-01-01")), 1)
+        self.assertEqual(len(self.store.read_range("2026-01-01", "2026-01-01 23:59")), 6)
+
+        dropped = self.store.drop_before("2026-01-02")
+        self.assertEqual(dropped["1m"], 1)
+        self.assertEqual(self.store._list_partitions("1m"), ["date=2026-01-03"])
+        # 월 파티션(1d)은 월 전체가 cutoff 이전일 때만 삭제된다.
+        self.assertEqual(dropped["1d"], 0)
+        self.assertEqual(self.store.statistics()["total_records"], 2)
+
+    def test_statistics_counts_overlapping_appends_once(self):
+        self.store.append(_minute_bars("2026-01-01 09:00", 100))
+        self.store.append(_minute_bars("2026-01-01 09:50", 50, base=300.0))
+
+        self.assertEqual(len(self._partition_files("1m", "date=2026-01-01")), 2)
+        self.assertEqual(len(self.store.read_range("2026-01-01")), 100)
+        self.assertEqual(self.store.statistics()["total_records"], 100)
+
+    def test_import_csv_builds_partitions_and_views(self):
+        csv_path = os.path.join(self._tmp.name, "legacy.csv")
+        _minute_bars("2026-02-01 00:00", 90).to_csv(csv_path, index=True, index_label="timestamp")
+
+        imported = self.store.import_csv(csv_path, chunksize=40)
+
+        self.assertEqual(imported, 90)
+        hourly = self.store.read_range("2026-02-01", interval="1h")
+        self.assertEqual(list(hourly["volume"]), [60.0, 30.0])
+        self.assertTrue(self.store.is_csv_imported(csv_path))
+
+    def test_interrupted_import_csv_resumes_and_rebuilds_views(self):
+        csv_path = os.path.join(self._tmp.name, "legacy.csv")
+        _minute_bars("2026-02-01 23:00", 120).to_csv(csv_path, index=True, index_label="timestamp")
+        original_append = self.store.append
+        calls = []
+
+        def failing_append(df, update_views=True):
+            calls.append(len(df))
+            if len(calls) == 2:
+                raise OSError("disk full")
+            return original_append(df, update_views=update_views)
+
+        self.store.append = failing_append
+        with self.assertRaises(OSError):
+            self.store.import_csv(csv_path, chunksize=40)
+        del self.store.append
+
+        # 첫 청크만 적재되고 뷰/완료 마커는 없는 상태
+        self.assertFalse(self.store.is_csv_imported(csv_path))
+        self.assertTrue(self.store.read_range(interval="1h").empty)
+
+        latest = self.store.latest_timestamp()
+        self.store.import_csv(csv_path, chunksize=40, resume_from=latest.normalize())
+
+        self.assertTrue(self.store.is_csv_imported(csv_path))
+        self.assertEqual(self.store.statistics()["total_records"], 120)
+        self.assertEqual(list(self.store.read_range(interval="1h")["volume"]), [60.0, 60.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
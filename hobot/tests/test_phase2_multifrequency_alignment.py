@@ -18,7 +18,25 @@ neo4j_stub.GraphDatabase = _StubGraphDatabase
 neo4j_stub.Driver = object
 sys.modules.setdefault("neo4j", neo4j_stub)
 
-from service.graph.derived_feature_calc import DerivedFeatureCalculator
+from service.graph.derived_feature_calc import DerivedFeatureCalculator, compute_feature_panel
+
+
+class _FakeNeo4jClient:
+    def __init__(self, observations, last_dates=None):
+        self.observations = observations
+        self.last_dates = last_dates or []
+        self.read_calls = []
+        self.write_calls = []
+
+    def run_read(self, query, params=None):
+        self.read_calls.append((query, params or {}))
+        if "DerivedFeature" in query:
+            return self.last_dates
+        return self.observations
+
+    def run_write(self, query, params=None):
+        self.write_calls.append((query, params or {}))
+        return {"nodes_created": len(params["rows"]), "relationships_created": len(params["rows"]), "properties_set": 0}
 
 
 class TestPhase2MultiFrequencyAlignment(unittest.TestCase):
@@ -82,5 +100,67 @@ class TestPhase2MultiFrequencyAlignment(unittest.TestCase):
         self.assertNotIn(102.0, merged["KR_HOUSE_PRICE_INDEX"].tolist())
 
 
+class TestPhase2DerivedFeatureEngine(unittest.TestCase):
+    def _observations(self):
+        rows = []
+        for offset, value in enumerate([10.0, 12.0, 9.0, 9.0]):
+            rows.append({"indicator_code": "DGS10", "obs_date": date(2026, 1, 1 + offset), "value": value})
+        rows.append({"indicator_code": "CPIAUCSL", "obs_date": date(2025, 1, 31), "value": 300.0})
+        rows.append({"indicator_code": "CPIAUCSL", "obs_date": date(2026, 1, 31), "value": 309.0})
+        return rows
+
+    def test_compute_feature_panel_matches_per_indicator_definitions(self):
+        features = compute_feature_panel(pd.DataFrame(self._observations()), ["delta_1d", "pct_change_1d", "yoy_pct"])
+        by_key = {
+            (row.indicator_code, row.obs_date.date().isoformat(), row.feature_name): row.value
+            for row in features.itertuples()
+        }
+
+        self.assertEqual(by_key[("DGS10", "2026-01-02", "delta_1d")], 2.0)
+        self.assertEqual(by_key[("DGS10", "2026-01-03", "delta_1d")], -3.0)
+        self.assertAlmostEqual(by_key[("DGS10", "2026-01-03", "pct_change_1d")], -25.0)
+        self.assertNotIn(("DGS10", "2026-01-01", "delta_1d"), by_key)
+        # 지표 경계를 넘어 shift하지 않는다.
+        self.assertAlmostEqual(by_key[("CPIAUCSL", "2026-01-31", "delta_1d")], 9.0)
+        self.assertAlmostEqual(by_key[("CPIAUCSL", "2026-01-31", "yoy_pct")], 3.0)
+        self.assertNotIn(("DGS10", "2026-01-04", "yoy_pct"), by_key)
+
+    def test_calculate_features_reads_once_and_writes_in_batches(self):
+        client = _FakeNeo4jClient(self._observations())
+        calc = DerivedFeatureCalculator(neo4j_client=client, write_batch_size=2)
+
+        result = calc.calculate_features(["DGS10", "CPIAUCSL"], ["delta_1d"], limit=2, as_of_date=date(2026, 2, 1))
+
+        self.assertEqual(len(client.read_calls), 1)
+        self.assertEqual(result["features"], {"delta_1d": 3})
+        self.assertEqual(result["write"]["batches"], 2)
+        written = [row for _, params in client.write_calls for row in params["rows"]]
+        self.assertEqual(
+            sorted((row["indicator_code"], row["obs_date"]) for row in written),
+            [("CPIAUCSL", "2026-01-31"), ("DGS10", "2026-01-03"), ("DGS10", "2026-01-04")],
+        )
+
+    def test_incremental_run_only_writes_after_last_computed_date(self):
+        client = _FakeNeo4jClient(
+            [row for row in self._observations() if row["indicator_code"] == "DGS10"],
+            last_dates=[{"code": "DGS10", "last_date": date(2026, 1, 3)}],
+        )
+        calc = DerivedFeatureCalculator(neo4j_client=client)
+
+        result = calc.calculate_features(
+            ["DGS10"],
+            ["delta_1d", "pct_change_1d"],
+            as_of_date=date(2026, 2, 1),
+            incremental=True,
+        )
+
+        panel_params = client.read_calls[-1][1]
+        self.assertEqual(panel_params["targets"], [{"code": "DGS10", "cutoff": "2026-01-03"}])
+        self.assertEqual(panel_params["context_limit"], 1)
+        written = {(row["feature_name"], row["obs_date"]) for _, params in client.write_calls for row in params["rows"]}
+        self.assertEqual(written, {("delta_1d", "2026-01-04"), ("pct_change_1d", "2026-01-04")})
+        self.assertEqual(result["cutoffs"], {"DGS10": "2026-01-03"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,14 +16,64 @@ neo4j_stub.GraphDatabase = _StubGraphDatabase
 neo4j_stub.Driver = object
 sys.modules.setdefault("neo4j", neo4j_stub)
 
-from service.macro_trading.real_estate_api import execute_real_estate_query
+from datetime import date
+
+from service.macro_trading import real_estate_api
+from service.macro_trading.real_estate_api import (
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+    execute_real_estate_query,
+    fetch_rdb_transactions,
+)
+
+
+class _TransactionCursorStub:
+    def __init__(self, data_rows, generated_columns=True, explain_rows=1000):
+        self.data_rows = data_rows
+        self.generated_columns = generated_columns
+        self.explain_rows = explain_rows
+        self.queries = []
+        self._one = None
+        self._all = []
+
+    def execute(self, query, params=None):
+        sql = " ".join(query.split())
+        self.queries.append((sql, tuple(params or ())))
+        if "information_schema.COLUMNS" in sql:
+            self._one = {"column_count": 4 if self.generated_columns else 0}
+        elif sql.startswith("EXPLAIN"):
+            self._one = {"rows": self.explain_rows, "filtered": 50.0}
+        elif "COUNT(*)" in sql:
+            self._one = {"total": len(self.data_rows)}
+        else:
+            self._all = list(self.data_rows)
+
+    def fetchone(self):
+        return self._one
+
+    def fetchall(self):
+        return self._all
+
+
+class _ConnectionStub:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self._cursor
 
 
 class TestPhase2RealEstateQueryApi(unittest.TestCase):
     def test_detail_query_uses_rdb_source(self):
         with patch(
             "service.macro_trading.real_estate_api.fetch_rdb_transactions",
-            return_value=([{"id": 1, "lawd_cd": "11110"}], 1),
+            return_value=([{"id": 1, "lawd_cd": "11110"}], 1, {"next_cursor": None, "count_mode": "exact"}),
         ) as mock_fetch:
             response = execute_real_estate_query(
                 view="detail",
@@ -123,5 +173,126 @@ class TestPhase2RealEstateQueryApi(unittest.TestCase):
             )
 
 
+class TestRealEstateTransactionPaging(unittest.TestCase):
+    def setUp(self):
+        real_estate_api._generated_columns_state.update({"ready": False, "checked_at": None})
+        self.addCleanup(real_estate_api._generated_columns_state.update, {"ready": False, "checked_at": None})
+
+    def _fetch(self, cursor_stub, **kwargs):
+        params = dict(
+            start_ym="202501",
+            end_ym="202502",
+            property_type="apartment",
+            transaction_type="sale",
+            lawd_codes=["11680"],
+            limit=2,
+            offset=0,
+            include_metadata=False,
+        )
+        params.update(kwargs)
+        with patch("service.macro_trading.real_estate_api.get_db_connection", return_value=_ConnectionStub(cursor_stub)):
+            return fetch_rdb_transactions(**params)
+
+    def test_keyset_page_uses_generated_columns_without_offset(self):
+        rows = [
+            {"id": 30, "contract_date": date(2025, 2, 3)},
+            {"id": 21, "contract_date": date(2025, 2, 1)},
+            {"id": 20, "contract_date": date(2025, 2, 1)},
+        ]
+        stub = _TransactionCursorStub(rows)
+        token = encode_transaction_cursor(date(2025, 2, 9), 99)
+
+        page_rows, total, meta = self._fetch(stub, cursor=token, count_mode="approximate", offset=5000)
+
+        data_sql, data_params = stub.queries[-1]
+        self.assertIn("AND lawd_cd IN (%s)", data_sql)
+        self.assertNotIn("LEFT(region_code", data_sql)
+        self.assertNotIn("JSON_EXTRACT", data_sql)
+        self.assertNotIn("OFFSET", data_sql)
+        self.assertIn("(contract_date < %s OR (contract_date = %s AND id < %s))", data_sql)
+        self.assertEqual(data_params[-4:], (date(2025, 2, 9), date(2025, 2, 9), 99, 3))
+        self.assertTrue(stub.queries[1][0].startswith("EXPLAIN"))
+        self.assertEqual(total, 500)
+        self.assertTrue(meta["total_is_estimate"])
+        self.assertEqual([row["id"] for row in page_rows], [30, 21])
+        self.assertEqual(decode_transaction_cursor(meta["next_cursor"]), (date(2025, 2, 1), 21))
+
+    def test_falls_back_to_expressions_before_migration(self):
+        stub = _TransactionCursorStub([{"id": 1, "contract_date": date(2025, 1, 5)}], generated_columns=False)
+
+        page_rows, total, meta = self._fetch(stub)
+
+        data_sql, data_params = stub.queries[-1]
+        self.assertIn("LEFT(region_code, 5) IN (%s)", data_sql)
+        self.assertIn("OFFSET %s", data_sql)
+        self.assertEqual(total, 1)
+        self.assertIsNone(meta["next_cursor"])
+        with self.assertRaises(ValueError):
+            decode_transaction_cursor("not-a-cursor")
+
+
+class _SummaryCursorStub:
+    def __init__(self, distribution_columns):
+        self.distribution_columns = distribution_columns
+        self.queries = []
+        self._one = None
+        self._all = []
+
+    def execute(self, query, params=None):
+        sql = " ".join(query.split())
+        self.queries.append((sql, tuple(params or ())))
+        if "information_schema.COLUMNS" in sql:
+            self._all = [{"COLUMN_NAME": column} for column in self.distribution_columns]
+        elif "COUNT(*)" in sql:
+            self._one = {"total": 1}
+        else:
+            self._all = [{"stat_ym": "202501", "lawd_cd": "11680"}]
+
+    def fetchone(self):
+        return self._one
+
+    def fetchall(self):
+        return self._all
+
+
+class TestRealEstateMonthlySummaryFallback(unittest.TestCase):
+    def setUp(self):
+        real_estate_api._summary_columns_state.update({"columns": (), "checked_at": None})
+        self.addCleanup(real_estate_api._summary_columns_state.update, {"columns": (), "checked_at": None})
+
+    def _fetch(self, cursor_stub):
+        with patch("service.macro_trading.real_estate_api.get_db_connection", return_value=_ConnectionStub(cursor_stub)):
+            return real_estate_api._fetch_mysql_monthly_summary(
+                start_ym="202501",
+                end_ym="202502",
+                property_type="apartment",
+                transaction_type="sale",
+                lawd_codes=["11680"],
+                limit=10,
+                offset=0,
+                aggregate_by_region=False,
+            )
+
+    def test_selects_distribution_columns_after_migration(self):
+        stub = _SummaryCursorStub(real_estate_api.SUMMARY_DISTRIBUTION_COLUMNS)
+
+        rows, total = self._fetch(stub)
+
+        data_sql, _ = stub.queries[-1]
+        self.assertIn("total_price, median_price, p25_price_per_m2, median_price_per_m2, p75_price_per_m2, as_of_date", data_sql)
+        self.assertEqual(total, 1)
+        self.assertEqual(rows[0]["lawd_cd"], "11680")
+
+    def test_skips_distribution_columns_before_migration(self):
+        stub = _SummaryCursorStub(())
+
+        self._fetch(stub)
+
+        data_sql, _ = stub.queries[-1]
+        self.assertIn("total_price, as_of_date", data_sql)
+        for column in real_estate_api.SUMMARY_DISTRIBUTION_COLUMNS:
+            self.assertNotIn(column, data_sql)
+
+
 if __name__ == "__main__":
     unittest.main()
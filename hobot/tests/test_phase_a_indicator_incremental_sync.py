@@ -0,0 +1,158 @@
+import sys
+import types
+import unittest
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+neo4j_stub = types.ModuleType("neo4j")
+
+
+class _StubGraphDatabase:
+    @staticmethod
+    def driver(*args, **kwargs):
+        raise RuntimeError("Neo4j driver should not be used in unit tests")
+
+
+neo4j_stub.GraphDatabase = _StubGraphDatabase
+neo4j_stub.Driver = object
+sys.modules.setdefault("neo4j", neo4j_stub)
+
+from service.graph import indicator_loader as indicator_loader_module
+from service.graph.indicator_loader import IndicatorLoader
+
+
+class StubNeo4jClient:
+    def __init__(self):
+        self.write_calls = []
+
+    def run_write(self, query, params=None):
+        self.write_calls.append((query, params or {}))
+        return {"nodes_created": len((params or {}).get("observations", [])), "properties_set": 1}
+
+
+class _FakeFredMySql:
+    def __init__(self, db_now):
+        self.db_now = db_now
+        self.rows = []
+        self.state = {}
+
+    @contextmanager
+    def connection(self):
+        db = self
+
+        class _Cursor:
+            def __init__(self):
+                self._rows = []
+
+            def execute(self, query, params=None):
+                if "INFORMATION_SCHEMA.COLUMNS" in query:
+                    self._rows = [
+                        {"COLUMN_NAME": name}
+                        for name in ("indicator_code", "date", "value", "source", "created_at", "updated_at")
+                    ]
+                elif "SELECT NOW()" in query:
+                    self._rows = [{"db_now": db.db_now}]
+                elif "FROM graph_indicator_sync_state" in query:
+                    self._rows = [
+                        {"indicator_code": code, "high_water_mark": mark}
+                        for code, mark in db.state.items()
+                        if code in params
+                    ]
+                elif "updated_at > %s" in query:
+                    codes = set(params[1:])
+                    self._rows = [
+                        dict(row, change_ts=row["updated_at"])
+                        for row in db.rows
+                        if row["indicator_code"] in codes and row["updated_at"] > params[0]
+                    ]
+                elif "FROM fred_data" in query:
+                    codes = set(params[:-1])
+                    self._rows = [
+                        dict(row, change_ts=row["updated_at"])
+                        for row in db.rows
+                        if row["indicator_code"] in codes and row["date"] >= params[-1]
+                    ]
+
+            def executemany(self, query, rows):
+                for code, mark, _count, _lag in rows:
+                    db.state[code] = max(mark, db.state.get(code, mark))
+
+            def fetchone(self):
+                return self._rows[0] if self._rows else None
+
+            def fetchall(self):
+                return list(self._rows)
+
+        class _Conn:
+            def cursor(self):
+                return _Cursor()
+
+        yield _Conn()
+
+
+class TestPhaseAIndicatorIncrementalSync(unittest.TestCase):
+    def setUp(self):
+        self.db_now = datetime(2026, 2, 10, 9, 0, 0)
+        self.mysql = _FakeFredMySql(self.db_now)
+        for offset in range(3):
+            obs_date = date(2026, 2, 1) + timedelta(days=offset)
+            changed_at = self.db_now - timedelta(hours=10 - offset)
+            for code in ("DGS10", "DGS2"):
+                self.mysql.rows.append(
+                    {"indicator_code": code, "date": obs_date, "value": 4.0 + offset, "source": "FRED",
+                     "created_at": changed_at, "updated_at": changed_at}
+                )
+        self.client = StubNeo4jClient()
+        with patch.object(indicator_loader_module, "get_neo4j_client", return_value=self.client):
+            self.loader = IndicatorLoader()
+        self.loader._get_mysql_connection = self.mysql.connection
+
+    def _sync(self):
+        with patch.object(indicator_loader_module, "bump_graph_data_watermark") as bump:
+            result = self.loader.sync_incremental(indicator_codes=["DGS10", "DGS2"], bootstrap_days=30000)
+        return result, bump
+
+    def test_bootstrap_then_only_changed_rows(self):
+        first, _ = self._sync()
+        self.assertEqual(first["mode"], "incremental")
+        self.assertEqual(first["observations_synced"], 6)
+        self.assertEqual(first["bootstrap_indicators"], ["DGS10", "DGS2"])
+        self.assertEqual(len(self.client.write_calls), 2)
+        self.assertEqual(
+            {obs["indicator_code"] for obs in self.client.write_calls[0][1]["observations"]},
+            {"DGS10"},
+        )
+        self.assertEqual(self.mysql.state["DGS10"], self.db_now - timedelta(hours=8))
+        self.assertAlmostEqual(first["sync_lag"]["max_sec"], 36000.0, delta=5.0)
+
+        self.client.write_calls.clear()
+        second, bump = self._sync()
+        self.assertEqual(second["status"], "no_changes")
+        self.assertEqual(self.client.write_calls, [])
+        bump.assert_not_called()
+
+        revised_at = self.db_now + timedelta(minutes=5)
+        self.mysql.rows[0].update({"value": 3.9, "updated_at": revised_at})
+        self.mysql.db_now = self.db_now + timedelta(minutes=6)
+        third, bump = self._sync()
+        self.assertEqual(third["observations_synced"], 1)
+        self.assertEqual(third["changed_indicators"], ["DGS10"])
+        self.assertEqual(self.client.write_calls[0][1]["observations"][0]["value"], 3.9)
+        self.assertEqual(self.mysql.state["DGS10"], revised_at)
+        bump.assert_called_once()
+
+    def test_indicator_without_rows_in_bootstrap_window_is_not_rebootstrapped(self):
+        with patch.object(indicator_loader_module, "bump_graph_data_watermark"):
+            first = self.loader.sync_incremental(indicator_codes=["DGS10", "UNRATE"], bootstrap_days=30000)
+        self.assertEqual(first["bootstrap_indicators"], ["DGS10", "UNRATE"])
+        self.assertEqual(self.mysql.state["UNRATE"], self.db_now - timedelta(seconds=2))
+
+        with patch.object(indicator_loader_module, "bump_graph_data_watermark"):
+            second = self.loader.sync_incremental(indicator_codes=["DGS10", "UNRATE"], bootstrap_days=30000)
+        self.assertEqual(second["status"], "no_changes")
+        self.assertEqual(second["bootstrap_indicators"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -181,6 +181,84 @@ class TestPhaseBGraphIngestion(unittest.TestCase):
         self.assertEqual(result["reason"], "missing_gemini_api_key")
         self.assertEqual(len(loader.neo4j_client.write_calls), 0)
 
+    def test_extract_and_persist_coalesces_documents_into_batches(self):
+        loader = self._build_loader()
+        fake_module = types.ModuleType("service.graph.news_extractor")
+        fake_module.get_news_extractor = lambda: StubExtractor()
+        news_list = [
+            {"doc_id": f"te:{idx}", "title": "Fed", "text": "Fed keeps rates unchanged.", "country_code": "US"}
+            for idx in range(6)
+        ]
+
+        with patch.dict(sys.modules, {"service.graph.news_extractor": fake_module}):
+            result = loader.extract_and_persist(news_list, max_workers=3, write_batch_docs=10)
+
+        self.assertEqual(result["success_docs"], 6)
+        event_calls = [params for query, params in loader.neo4j_client.write_calls if "MERGE (ev:Event" in query]
+        self.assertEqual(len(event_calls), 1)
+        self.assertEqual(
+            sorted(row["doc_id"] for row in event_calls[0]["rows"]),
+            [f"te:{idx}" for idx in range(6)],
+        )
+
+    def test_extract_and_persist_retries_rate_limited_documents(self):
+        loader = self._build_loader()
+
+        class RateLimitedOnceExtractor(StubExtractor):
+            def __init__(self):
+                self.calls = 0
+
+            def extract(self, doc_id, article_text, title=""):
+                self.calls += 1
+                if self.calls == 1:
+                    return ExtractionResult(doc_id=doc_id, error_messages=["429 RESOURCE_EXHAUSTED"])
+                return super().extract(doc_id, article_text, title)
+
+        extractor = RateLimitedOnceExtractor()
+        fake_module = types.ModuleType("service.graph.news_extractor")
+        fake_module.get_news_extractor = lambda: extractor
+
+        with patch.dict(sys.modules, {"service.graph.news_extractor": fake_module}), patch.dict(
+            "os.environ", {"NEWS_EXTRACTION_RATE_LIMIT_BACKOFF_SEC": "0"}
+        ):
+            result = loader.extract_and_persist(
+                [{"doc_id": "te:1", "title": "Fed", "text": "Fed keeps rates unchanged."}],
+                max_workers=1,
+            )
+
+        self.assertEqual(extractor.calls, 2)
+        self.assertEqual(result["success_docs"], 1)
+        self.assertEqual(result["rate_limited_calls"], 1)
+
+    def test_extract_and_persist_isolates_failed_document_writes(self):
+        loader = self._build_loader()
+
+        class FailingDocNeo4jClient(StubNeo4jClient):
+            def run_write(self, query, params=None):
+                rows = (params or {}).get("rows") or []
+                if "MERGE (ev:Event" in query and any(row.get("doc_id") == "te:bad" for row in rows):
+                    raise RuntimeError("write failed")
+                return super().run_write(query, params)
+
+        loader.neo4j_client = FailingDocNeo4jClient()
+        fake_module = types.ModuleType("service.graph.news_extractor")
+        fake_module.get_news_extractor = lambda: StubExtractor()
+        news_list = [
+            {"doc_id": "te:ok", "title": "Fed", "text": "Fed keeps rates unchanged."},
+            {"doc_id": "te:bad", "title": "Fed", "text": "Fed keeps rates unchanged."},
+        ]
+
+        with patch.dict(sys.modules, {"service.graph.news_extractor": fake_module}):
+            result = loader.extract_and_persist(news_list, max_workers=2)
+
+        self.assertEqual(result["success_docs"], 1)
+        self.assertEqual(result["failed_doc_ids"], ["te:bad"])
+        failure_marks = [
+            params for query, params in loader.neo4j_client.write_calls
+            if 'extraction_status = "failed"' in query
+        ]
+        self.assertEqual(failure_marks[0]["doc_id"], "te:bad")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from service.graph.nel.alias_dictionary import AliasLookup
+from service.graph.nel.mention_index import REGION_NAMESPACE, MentionIndex, get_mention_index
+from service.graph.rag.kr_region_scope import REGION_ALIAS_TO_CODES, resolve_region_token_to_lawd_codes
+
+
+def _linear_partial_lookup(dictionary, normalized):
+    for alias, entity_info in dictionary.items():
+        if alias in normalized or normalized in alias:
+            return entity_info
+    return None
+
+
+class TestPhaseBMentionIndex(unittest.TestCase):
+    def test_automaton_finds_overlapping_mentions_in_one_pass(self):
+        index = MentionIndex()
+        for pattern in ("he", "she", "his", "hers"):
+            index.add(pattern)
+        matches = sorted((start, end, index.pattern(pid)) for start, end, pid in index.iter_matches("ushers"))
+        self.assertEqual(matches, [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")])
+        self.assertEqual(index.first_match_id("ushers"), 0)
+        self.assertEqual([index.pattern(pid) for pid in index.containing("h")], ["he", "she", "his", "hers"])
+
+    def test_alias_partial_match_keeps_dictionary_priority(self):
+        lookup = AliasLookup()
+        lookup.add_alias("reserve bank", "Institution", "ENT_RBA", "Reserve Bank of Australia")
+        for mention in ("the federal reserve said", "reserve", "bank", "powell's remarks", "s&p", "nasdaq 100"):
+            self.assertEqual(
+                lookup.lookup(mention),
+                _linear_partial_lookup(lookup.dictionary, mention.lower().strip()),
+                mention,
+            )
+        self.assertIsNone(lookup.lookup("reuters"))
+        self.assertEqual(lookup.get_unresolved_stats(), {"reuters": 1})
+
+    def test_region_fuzzy_match_uses_substring_index(self):
+        token = "해운"
+        expected = sorted(
+            {
+                code
+                for alias, codes in REGION_ALIAS_TO_CODES.items()
+                if len(alias) >= 3 and token in alias
+                for code in codes
+            }
+        )
+        index = get_mention_index()
+        self.assertTrue(index.containing(token, REGION_NAMESPACE))
+        self.assertNotIn(token, REGION_ALIAS_TO_CODES)
+        self.assertTrue(expected)
+        self.assertEqual(resolve_region_token_to_lawd_codes(token), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
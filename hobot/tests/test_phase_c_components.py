@@ -55,6 +55,32 @@ class StubNeo4jClient:
         return []
 
 
+class ImpactEngineNeo4jClient:
+    """EventImpactCalculator in-memory 엔진용 스텁 (관계/시계열 read, 배치 write 기록)"""
+
+    def __init__(self, relationships, observations, revisions=None):
+        self.relationships = relationships
+        self.observations = observations
+        self.revisions = revisions or []
+        self.clock = "2026-02-07T09:00:00Z"
+        self.read_calls = []
+        self.write_calls = []
+
+    def run_read(self, query, params=None):
+        self.read_calls.append((query, params or {}))
+        if "AS now" in query:
+            return [{"now": self.clock}]
+        if "RETURN ev.event_id AS event_id" in query:
+            return self.relationships
+        if "series_updated_at" in query:
+            return [row for row in self.revisions if row["code"] in params["codes"]]
+        return [row for row in self.observations if row["code"] in params["codes"]]
+
+    def run_write(self, query, params=None):
+        self.write_calls.append((query, params or {}))
+        return {"properties_set": len((params or {}).get("rows", []))}
+
+
 class TestPhaseCComponents(unittest.TestCase):
     def test_event_impact_runs_two_updates(self):
         client = StubNeo4jClient()
@@ -89,6 +115,32 @@ class TestPhaseCComponents(unittest.TestCase):
         self.assertGreaterEqual(result["lead_edges"], 1)
         self.assertEqual(len(client.write_calls), 2)
 
+    def test_correlation_matrix_uses_pairwise_masks_and_lead_lag(self):
+        start = date(2026, 1, 1)
+        series = {
+            "AAA": {start + timedelta(days=idx): float((idx * 7) % 11) for idx in range(40)},
+            "BBB": {start + timedelta(days=idx + 2): float((idx * 7) % 11) * 3.0 for idx in range(40)},
+            "CCC": {start + timedelta(days=idx): 1.0 for idx in range(40)},
+        }
+        series["AAA"].pop(start + timedelta(days=10))
+
+        codes, dates, matrix = CorrelationEdgeGenerator._build_aligned_matrix(series)
+        corr, counts = CorrelationEdgeGenerator._masked_corr_matrix(matrix, matrix)
+        lag, score = CorrelationEdgeGenerator._best_lead_lag_matrix(matrix, max_lag_days=3)
+
+        self.assertEqual(codes, ["AAA", "BBB", "CCC"])
+        self.assertEqual(len(dates), 42)
+        self.assertEqual(counts[0, 1], 37)
+        self.assertEqual(corr[0, 2], 0.0)
+        self.assertEqual(lag[0, 1], 2)
+        self.assertAlmostEqual(score[0, 1], 1.0, places=9)
+        self.assertEqual(lag[1, 0], -2)
+
+        # 어느 lag에서도 AAA/BBB 겹침이 40개 미만이므로 min_points=40이면 선후행 후보가 없다.
+        lag, score = CorrelationEdgeGenerator._best_lead_lag_matrix(matrix, max_lag_days=3, min_points=40)
+        self.assertEqual(lag[0, 1], 0)
+        self.assertEqual(score[0, 1], 0.0)
+
     def test_story_clusterer_creates_story(self):
         client = StubNeo4jClient()
         clusterer = StoryClusterer(neo4j_client=client)
@@ -102,6 +154,77 @@ class TestPhaseCComponents(unittest.TestCase):
         self.assertEqual(result["stories_created"], 1)
         self.assertEqual(len(client.write_calls), 2)
 
+    def _impact_engine_fixture(self):
+        start = date(2026, 1, 1)
+        observations = []
+        for idx in range(20):
+            obs_date = start + timedelta(days=idx)
+            observations.append(
+                {"code": "AAA", "obs_date": obs_date, "value": float(idx * idx), "feature_value": float(2 * idx - 1) if idx else None}
+            )
+        # BBB: 피처 없음, 월간 관측치
+        observations.append({"code": "BBB", "obs_date": date(2025, 12, 1), "value": 100.0, "feature_value": None})
+        observations.append({"code": "BBB", "obs_date": date(2026, 2, 1), "value": 104.0, "feature_value": None})
+        # CCC: 이벤트 이전 관측치만 존재
+        observations.append({"code": "CCC", "obs_date": date(2025, 1, 1), "value": 5.0, "feature_value": None})
+        observations.append({"code": "CCC", "obs_date": date(2025, 2, 1), "value": 7.0, "feature_value": None})
+        computed = datetime(2026, 2, 1, 0, 0, 0)
+        relationships = [
+            {"event_id": "e1", "indicator_code": "AAA", "event_date": date(2026, 1, 10), "event_updated_at": None, "link_updated_at": None, "computed_at": None},
+            {"event_id": "e1", "indicator_code": "BBB", "event_date": date(2026, 1, 10), "event_updated_at": None, "link_updated_at": None, "computed_at": computed},
+            {"event_id": "e2", "indicator_code": "CCC", "event_date": date(2026, 1, 10), "event_updated_at": datetime(2026, 2, 2), "link_updated_at": None, "computed_at": computed},
+            {"event_id": "e3", "indicator_code": "CCC", "event_date": None, "event_updated_at": None, "link_updated_at": None, "computed_at": computed},
+        ]
+        return relationships, observations
+
+    def test_event_impact_engine_resolves_windows_and_fallbacks_in_memory(self):
+        relationships, observations = self._impact_engine_fixture()
+        client = ImpactEngineNeo4jClient(relationships, observations)
+        calc = EventImpactCalculator(neo4j_client=client, write_batch_size=3)
+
+        result = calc.calculate_for_all_windows(windows=(3, 7), as_of_date=date(2026, 2, 7))
+
+        self.assertEqual(len(client.read_calls), 3)
+        self.assertEqual(result["write_result"]["batches"], 2)
+        # impact_computed_at은 쓰기 시각이 아니라 로드 전에 읽은 시각으로 찍는다
+        self.assertIn("AS now", client.read_calls[0][0])
+        self.assertTrue(all(params["computed_at"] == client.clock for _, params in client.write_calls))
+        self.assertTrue(all("datetime($computed_at)" in query for query, _ in client.write_calls))
+        rows = {(row["event_id"], row["indicator_code"]): row for _, params in client.write_calls for row in params["rows"]}
+        # AAA: 7일 window feature 평균 차이 (post 9..15 → 2i-1 평균 23, prev 2..8 → 9)
+        self.assertEqual(rows[("e1", "AAA")]["method"], "event_window_feature")
+        self.assertEqual(rows[("e1", "AAA")]["window_days"], 7)
+        self.assertAlmostEqual(rows[("e1", "AAA")]["observed_delta"], 14.0)
+        # BBB: window 내 관측치 없음 → nearest observation
+        self.assertEqual(rows[("e1", "BBB")]["method"], "event_nearest_obs")
+        self.assertEqual(rows[("e1", "BBB")]["observed_delta"], 4.0)
+        self.assertEqual(rows[("e1", "BBB")]["window_days"], 62)
+        self.assertEqual(rows[("e1", "BBB")]["prev_obs_date"], "2025-12-01")
+        # CCC: 이벤트 이후 관측치 없음 / event_time 없음 → latest pair proxy
+        self.assertEqual(rows[("e2", "CCC")]["method"], "event_proxy_latest_pair")
+        self.assertEqual(rows[("e3", "CCC")]["observed_delta"], 2.0)
+        self.assertEqual(result["methods"], {"event_window_feature": 1, "event_nearest_obs": 1, "event_proxy_latest_pair": 2})
+
+    def test_event_impact_engine_incremental_skips_unchanged_relationships(self):
+        relationships, observations = self._impact_engine_fixture()
+        client = ImpactEngineNeo4jClient(
+            relationships,
+            observations,
+            revisions=[
+                {"code": "BBB", "series_updated_at": datetime(2026, 1, 15)},
+                {"code": "CCC", "series_updated_at": datetime(2026, 1, 15)},
+            ],
+        )
+        calc = EventImpactCalculator(neo4j_client=client)
+
+        result = calc.calculate_for_all_windows(windows=(3, 7), as_of_date=date(2026, 2, 7), incremental=True)
+
+        written = sorted((row["event_id"], row["indicator_code"]) for _, params in client.write_calls for row in params["rows"])
+        # e1/AAA: 최초 계산, e2/CCC: 이벤트 갱신. BBB·e3은 마지막 계산 이후 변경 없음.
+        self.assertEqual(written, [("e1", "AAA"), ("e2", "CCC")])
+        self.assertEqual(client.read_calls[-1][1]["codes"], ["AAA", "CCC"])
+        self.assertEqual(result["relationships"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,240 @@
+import json
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from service.graph.cache import answer_cache, data_watermark
+from service.graph.cache.answer_cache import (
+    GraphRagAnswerCache,
+    best_cosine_match,
+    build_answer_cache_key,
+    build_answer_scope_hash,
+)
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._rows = []
+
+    def execute(self, query, params=None):
+        self.db.queries.append((query, params))
+        if "INSERT INTO graph_rag_answer_cache" in query:
+            self.db.answers[params[0]] = {
+                "cache_key": params[0],
+                "scope_hash": params[1],
+                "question_embedding": params[6],
+                "response_json": params[7],
+                "remaining_sec": params[8],
+                "watermark_generation": params[9],
+            }
+        elif "DELETE FROM graph_rag_answer_cache" in query:
+            self.db.answers = {
+                key: row for key, row in self.db.answers.items() if row["watermark_generation"] >= params[0]
+            }
+        elif "FROM graph_rag_answer_cache" in query and "WHERE cache_key" in query:
+            row = self.db.answers.get(params[0])
+            self._rows = [row] if row else []
+        elif "FROM graph_rag_answer_cache" in query and "WHERE scope_hash" in query:
+            self._rows = [row for row in self.db.answers.values() if row["scope_hash"] == params[0]]
+        elif "INSERT INTO graph_rag_data_watermark" in query:
+            self.db.watermarks[params[0]] = self.db.watermarks.get(params[0], 0) + 1
+        elif "FROM graph_rag_data_watermark" in query:
+            self._rows = [{"source": key, "version": value} for key, value in self.db.watermarks.items()]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _FakeDb:
+    def __init__(self):
+        self.answers = {}
+        self.watermarks = {}
+        self.queries = []
+
+    @contextmanager
+    def connection(self):
+        cursor = _FakeCursor(self)
+
+        class _Conn:
+            def cursor(self_inner):
+                return cursor
+
+        yield _Conn()
+
+
+def _scope_hash(watermark="document:1|indicator_observation:1", country_code="US"):
+    return build_answer_scope_hash(
+        route_type="indicator_lookup",
+        scope={"country_code": country_code, "time_range": "30d", "region_code": None},
+        model="gemini-3-flash-preview",
+        watermark=watermark,
+    )
+
+
+class TestPhaseDAnswerCache(unittest.TestCase):
+    def test_scope_hash_changes_with_watermark_and_scope(self):
+        base = _scope_hash()
+        self.assertEqual(base, _scope_hash())
+        self.assertNotEqual(base, _scope_hash(watermark="document:2|indicator_observation:1"))
+        self.assertNotEqual(base, _scope_hash(country_code="KR"))
+        self.assertEqual(
+            build_answer_cache_key(question=" 미국  금리 전망 ", scope_hash=base),
+            build_answer_cache_key(question="미국 금리 전망", scope_hash=base),
+        )
+
+    def test_best_cosine_match_ignores_zero_vectors(self):
+        self.assertIsNone(best_cosine_match([1.0, 0.0], []))
+        index, similarity = best_cosine_match([1.0, 0.0], [[0.0, 0.0], [0.6, 0.8], [2.0, 0.0]])
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(similarity, 1.0)
+        self.assertEqual(best_cosine_match([0.0, 0.0], [[1.0, 0.0]])[1], 0.0)
+
+    def test_exact_hit_from_memory_and_miss_after_new_watermark(self):
+        cache = GraphRagAnswerCache(max_entries=8, ttl_seconds=60, shared_enabled=False)
+        cache.put(
+            question="미국 금리 전망",
+            scope_hash=_scope_hash(),
+            route_type="indicator_lookup",
+            model="m",
+            watermark="document:1|indicator_observation:1",
+            payload={"question": "미국 금리 전망", "answer": {"conclusion": "동결"}},
+        )
+
+        hit = cache.get(question="미국  금리 전망", scope_hash=_scope_hash())
+        self.assertEqual(hit["match"], "exact")
+        self.assertEqual(hit["response"]["answer"]["conclusion"], "동결")
+
+        stale = cache.get(
+            question="미국 금리 전망",
+            scope_hash=_scope_hash(watermark="document:2|indicator_observation:1"),
+        )
+        self.assertIsNone(stale)
+        stats = cache.get_stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_semantic_hit_requires_threshold(self):
+        cache = GraphRagAnswerCache(max_entries=8, ttl_seconds=60, shared_enabled=False, semantic_threshold=0.95)
+        cache.put(
+            question="미국 금리 전망은?",
+            scope_hash=_scope_hash(),
+            route_type="indicator_lookup",
+            model="m",
+            watermark="w",
+            payload={"answer": {"conclusion": "동결"}},
+            question_embedding=[1.0, 0.0, 0.0],
+        )
+
+        near = cache.get(
+            question="미국 기준금리 향후 전망",
+            scope_hash=_scope_hash(),
+            question_embedding=[0.99, 0.05, 0.0],
+        )
+        self.assertEqual(near["match"], "semantic")
+        self.assertGreaterEqual(near["similarity"], 0.95)
+
+        far = cache.get(
+            question="한국 부동산 전망",
+            scope_hash=_scope_hash(),
+            question_embedding=[0.0, 1.0, 0.0],
+        )
+        self.assertIsNone(far)
+        self.assertEqual(cache.get_stats()["semantic_hits"], 1)
+
+    def test_shared_tier_serves_other_worker_process(self):
+        shared_db = _FakeDb()
+        writer = GraphRagAnswerCache(max_entries=8, ttl_seconds=60, connection_factory=shared_db.connection)
+        writer.put(
+            question="코스피 전망",
+            scope_hash=_scope_hash(),
+            route_type="market_summary",
+            model="m",
+            watermark="w",
+            payload={"answer": {"conclusion": "박스권"}},
+            question_embedding=[0.2, 0.8],
+        )
+        stored = next(iter(shared_db.answers.values()))
+        self.assertEqual(json.loads(stored["response_json"])["answer"]["conclusion"], "박스권")
+
+        reader = GraphRagAnswerCache(max_entries=8, ttl_seconds=60, connection_factory=shared_db.connection)
+        hit = reader.get(question="코스피 전망", scope_hash=_scope_hash())
+        self.assertEqual(hit["tier"], "shared")
+
+        semantic_reader = GraphRagAnswerCache(
+            max_entries=8,
+            ttl_seconds=60,
+            semantic_threshold=0.9,
+            connection_factory=shared_db.connection,
+        )
+        semantic_hit = semantic_reader.get(
+            question="코스피 지수 전망은",
+            scope_hash=_scope_hash(),
+            question_embedding=[0.21, 0.79],
+        )
+        self.assertEqual(semantic_hit["match"], "semantic")
+        self.assertEqual(semantic_hit["tier"], "shared")
+
+    def test_shared_prune_keeps_rows_from_newer_watermark_generation(self):
+        shared_db = _FakeDb()
+        fresh_worker = GraphRagAnswerCache(max_entries=8, ttl_seconds=60, connection_factory=shared_db.connection)
+        stale_worker = GraphRagAnswerCache(max_entries=8, ttl_seconds=60, connection_factory=shared_db.connection)
+        old_watermark = "document:1|indicator_observation:1"
+        new_watermark = "document:2|indicator_observation:1"
+
+        with patch.object(answer_cache, "ANSWER_CACHE_SHARED_PRUNE_EVERY_WRITES", 1):
+            stale_worker.put(
+                question="미국 금리",
+                scope_hash=_scope_hash(watermark=old_watermark),
+                route_type="indicator_lookup",
+                model="m",
+                watermark=old_watermark,
+                payload={"answer": {"conclusion": "old"}},
+            )
+            fresh_worker.put(
+                question="미국 금리",
+                scope_hash=_scope_hash(watermark=new_watermark),
+                route_type="indicator_lookup",
+                model="m",
+                watermark=new_watermark,
+                payload={"answer": {"conclusion": "new"}},
+            )
+            self.assertEqual(len(shared_db.answers), 1)
+
+            # 워터마크 스냅샷이 늦은 워커의 정리 작업은 더 새 세대의 row를 지우지 않는다.
+            stale_worker.put(
+                question="한국 금리",
+                scope_hash=_scope_hash(watermark=old_watermark),
+                route_type="indicator_lookup",
+                model="m",
+                watermark=old_watermark,
+                payload={"answer": {"conclusion": "old"}},
+            )
+        generations = sorted(row["watermark_generation"] for row in shared_db.answers.values())
+        self.assertEqual(generations, [2, 3])
+        self.assertEqual(data_watermark.graph_data_watermark_generation(new_watermark), 3)
+
+    def test_watermark_bump_changes_loaded_watermark(self):
+        shared_db = _FakeDb()
+        data_watermark.invalidate_graph_data_watermark_snapshot()
+        before = data_watermark.get_graph_data_watermark(refresh_sec=300, connection_factory=shared_db.connection)
+        self.assertEqual(before, "document:0|indicator_observation:0")
+
+        self.assertTrue(
+            data_watermark.bump_graph_data_watermark(
+                data_watermark.WATERMARK_SOURCE_DOCUMENT,
+                row_count=10,
+                connection_factory=shared_db.connection,
+            )
+        )
+        after = data_watermark.get_graph_data_watermark(refresh_sec=300, connection_factory=shared_db.connection)
+        self.assertEqual(after, "document:1|indicator_observation:0")
+        self.assertFalse(data_watermark.bump_graph_data_watermark("unknown", connection_factory=shared_db.connection))
+        data_watermark.invalidate_graph_data_watermark_snapshot()
+
+
+if __name__ == "__main__":
+    unittest.main()
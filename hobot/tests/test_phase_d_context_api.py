@@ -160,6 +160,13 @@ class TestPhaseDContextApi(unittest.TestCase):
         self.assertEqual(len(result.evidences), 1)
         self.assertEqual(result.meta["matched_theme_ids"], ["inflation"])
         self.assertEqual(result.meta["window_days"], 7)
+        timings = result.meta["retrieval_timings"]
+        self.assertEqual(
+            [wave["wave"] for wave in timings["waves"]],
+            ["seed", "anchor", "documents", "expansion"],
+        )
+        self.assertEqual(timings["stages"]["events"]["status"], "ok")
+        self.assertEqual(timings["stages"]["evidences"]["status"], "ok")
 
     def test_build_graph_context_filters_dangling_links(self):
         client = StubNeo4jClient()
@@ -0,0 +1,126 @@
+import json
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from service.graph.cache.embedding_cache import (
+    QueryEmbeddingCache,
+    build_embedding_cache_key,
+)
+
+
+class _FakeCursor:
+    def __init__(self, store):
+        self.store = store
+        self.executed = []
+        self._last_row = None
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        if "SELECT embedding" in query:
+            self._last_row = self.store.get(params[0])
+        elif "INSERT INTO graph_rag_query_embedding_cache" in query:
+            self.store[params[0]] = {"embedding": params[4], "remaining_sec": params[5]}
+
+    def fetchone(self):
+        return self._last_row
+
+
+class _FakeSharedDb:
+    def __init__(self):
+        self.store = {}
+        self.cursors = []
+
+    @contextmanager
+    def connection(self):
+        cursor = _FakeCursor(self.store)
+        self.cursors.append(cursor)
+
+        class _Conn:
+            def cursor(self_inner):
+                return cursor
+
+        yield _Conn()
+
+
+class TestPhaseDEmbeddingCache(unittest.TestCase):
+    def test_cache_key_normalizes_question_whitespace_and_case(self):
+        key_a = build_embedding_cache_key(question="  미국   금리 Outlook ", model="m", dimension=768)
+        key_b = build_embedding_cache_key(question="미국 금리 outlook", model="m", dimension=768)
+        key_c = build_embedding_cache_key(question="미국 금리 outlook", model="m", dimension=256)
+        self.assertEqual(key_a, key_b)
+        self.assertNotEqual(key_a, key_c)
+
+    def test_get_or_compute_hits_memory_after_first_call(self):
+        cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=60, shared_enabled=False)
+        calls = []
+
+        def _compute():
+            calls.append(1)
+            return [0.1, 0.2, 0.3]
+
+        first = cache.get_or_compute(question="CPI 전망", model="m", dimension=3, compute=_compute)
+        second = cache.get_or_compute(question="cpi  전망", model="m", dimension=3, compute=_compute)
+
+        self.assertEqual(first, [0.1, 0.2, 0.3])
+        self.assertEqual(second, first)
+        self.assertEqual(len(calls), 1)
+        stats = cache.get_stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["embed_calls"], 1)
+        self.assertEqual(stats["hit_rate_pct"], 50.0)
+
+    def test_failed_embedding_is_not_cached(self):
+        cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=60, shared_enabled=False)
+        result = cache.get_or_compute(question="q", model="m", dimension=3, compute=lambda: None)
+        self.assertIsNone(result)
+        self.assertIsNone(cache.get(question="q", model="m", dimension=3))
+        self.assertEqual(cache.get_stats()["embed_failures"], 1)
+
+    def test_lru_eviction_and_ttl_expiry(self):
+        cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=10, shared_enabled=False)
+        with patch("service.graph.cache.embedding_cache.time.monotonic", return_value=100.0):
+            cache.put(question="a", model="m", dimension=1, vector=[1.0])
+            cache.put(question="b", model="m", dimension=1, vector=[2.0])
+            cache.get(question="a", model="m", dimension=1)
+            cache.put(question="c", model="m", dimension=1, vector=[3.0])
+            self.assertIsNone(cache.get(question="b", model="m", dimension=1))
+            self.assertEqual(cache.get(question="a", model="m", dimension=1), [1.0])
+
+        with patch("service.graph.cache.embedding_cache.time.monotonic", return_value=200.0):
+            self.assertIsNone(cache.get(question="a", model="m", dimension=1))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["expired"], 1)
+
+    def test_shared_tier_serves_other_worker_process(self):
+        shared_db = _FakeSharedDb()
+        writer = QueryEmbeddingCache(
+            max_entries=8,
+            ttl_seconds=60,
+            shared_enabled=True,
+            connection_factory=shared_db.connection,
+        )
+        writer.put(question="환율 전망", model="m", dimension=2, vector=[0.5, 0.25])
+        stored = next(iter(shared_db.store.values()))
+        self.assertEqual(json.loads(stored["embedding"]), [0.5, 0.25])
+
+        reader = QueryEmbeddingCache(
+            max_entries=8,
+            ttl_seconds=60,
+            shared_enabled=True,
+            connection_factory=shared_db.connection,
+        )
+        vector = reader.get(question="환율 전망", model="m", dimension=2)
+        self.assertEqual(vector, [0.5, 0.25])
+        self.assertEqual(reader.get_stats()["shared_hits"], 1)
+
+        again = reader.get(question="환율 전망", model="m", dimension=2)
+        self.assertEqual(again, [0.5, 0.25])
+        self.assertEqual(reader.get_stats()["memory_hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
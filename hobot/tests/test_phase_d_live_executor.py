@@ -1,6 +1,9 @@
 import unittest
+import zlib
 from datetime import date, timedelta
 
+import pymysql
+
 from service.graph.rag.agents.live_executor import (
     _build_equity_ohlcv_analysis,
     _build_real_estate_trend_analysis,
@@ -9,6 +12,7 @@ from service.graph.rag.agents.live_executor import (
     _prioritize_sql_specs,
     _resolve_region_scope_label,
 )
+from service.graph.rag.agents.schema_catalog import SchemaCatalog, is_schema_error
 
 
 class _CursorStub:
@@ -39,6 +43,52 @@ class _SequentialCursorStub:
         return self._rows_by_call.pop(0)
 
 
+class _InformationSchemaCursorStub:
+    def __init__(self):
+        self.columns = {
+            "kr_real_estate_monthly_summary": ["stat_ym", "lawd_cd", "tx_count"],
+            "kr_real_estate_transactions": ["contract_date", "lawd_cd"],
+        }
+        self.queries = []
+        self._rows = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        if "AS table_count" in query:
+            self._rows = [
+                {
+                    "TABLE_COUNT": len(self.columns),
+                    "MAX_CREATE_TIME": None,
+                    "COLUMN_COUNT": sum(len(cols) for cols in self.columns.values()),
+                    "INDEX_COLUMN_COUNT": 1,
+                    "COLUMN_CHECKSUM": sum(
+                        zlib.crc32(f"{table}.{position}.{column}".encode("utf-8"))
+                        for table, cols in self.columns.items()
+                        for position, column in enumerate(cols, start=1)
+                    ),
+                    "INDEX_CHECKSUM": 0,
+                }
+            ]
+        elif "FROM information_schema.statistics" in query:
+            self._rows = [
+                {"TABLE_NAME": "kr_real_estate_monthly_summary", "INDEX_NAME": "PRIMARY", "COLUMN_NAME": "stat_ym", "NON_UNIQUE": 0}
+            ]
+        elif "FROM information_schema.columns" in query:
+            self._rows = [
+                {"TABLE_NAME": table, "COLUMN_NAME": column}
+                for table, cols in self.columns.items()
+                for column in cols
+            ]
+        elif "FROM information_schema.tables" in query:
+            self._rows = [{"TABLE_NAME": table} for table in self.columns]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
 class _RequestStub:
     def __init__(self, property_type="apartment"):
         self.property_type = property_type
@@ -209,5 +259,71 @@ class TestPhaseDLiveExecutor(unittest.TestCase):
         self.assertEqual(result.get("reason"), "focus_filter_missing")
 
 
+class TestSchemaCatalog(unittest.TestCase):
+    def test_loads_once_and_serves_lookups_from_memory(self):
+        cursor = _InformationSchemaCursorStub()
+        catalog = SchemaCatalog(version_check_sec=3600, ttl_sec=0)
+
+        tables = catalog.existing_tables(
+            ["kr_real_estate_transactions", "missing_table", "kr_real_estate_monthly_summary"],
+            cursor=cursor,
+        )
+        self.assertEqual(tables, ["kr_real_estate_transactions", "kr_real_estate_monthly_summary"])
+        loaded_queries = len(cursor.queries)
+
+        self.assertEqual(
+            catalog.get_columns("kr_real_estate_monthly_summary", cursor=cursor),
+            ["stat_ym", "lawd_cd", "tx_count"],
+        )
+        self.assertEqual(catalog.validate_columns("kr_real_estate_transactions", ["lawd_cd", "obs_date"]), ["obs_date"])
+        self.assertTrue(catalog.get_table("kr_real_estate_monthly_summary").is_indexed_prefix("stat_ym"))
+        self.assertEqual(len(cursor.queries), loaded_queries)
+        self.assertEqual(catalog.get_stats()["loads"], 1)
+
+    def test_reloads_only_when_fingerprint_changes(self):
+        cursor = _InformationSchemaCursorStub()
+        catalog = SchemaCatalog(version_check_sec=0, ttl_sec=0)
+        catalog.get_columns("kr_real_estate_transactions", cursor=cursor)
+        catalog.get_columns("kr_real_estate_transactions", cursor=cursor)
+        self.assertEqual(catalog.get_stats()["loads"], 1)
+        self.assertEqual(catalog.get_stats()["version_checks"], 2)
+
+        cursor.columns["kr_real_estate_transactions"].append("deal_amount")
+        self.assertEqual(
+            catalog.get_columns("kr_real_estate_transactions", cursor=cursor),
+            ["contract_date", "lawd_cd", "deal_amount"],
+        )
+        self.assertEqual(catalog.get_stats()["loads"], 2)
+
+    def test_column_rename_changes_fingerprint_without_count_change(self):
+        cursor = _InformationSchemaCursorStub()
+        catalog = SchemaCatalog(version_check_sec=0, ttl_sec=0)
+        catalog.get_columns("kr_real_estate_transactions", cursor=cursor)
+
+        cursor.columns["kr_real_estate_transactions"][1] = "region_code"
+        self.assertEqual(
+            catalog.get_columns("kr_real_estate_transactions", cursor=cursor),
+            ["contract_date", "region_code"],
+        )
+        self.assertEqual(catalog.get_stats()["loads"], 2)
+
+    def test_invalidate_forces_full_reload(self):
+        cursor = _InformationSchemaCursorStub()
+        catalog = SchemaCatalog(version_check_sec=3600, ttl_sec=0)
+        catalog.get_columns("kr_real_estate_transactions", cursor=cursor)
+
+        catalog.invalidate()
+        catalog.get_columns("kr_real_estate_transactions", cursor=cursor)
+        catalog.get_columns("kr_real_estate_transactions", cursor=cursor)
+        self.assertEqual(catalog.get_stats()["loads"], 2)
+
+
+    def test_only_unknown_column_or_table_errors_are_schema_errors(self):
+        self.assertTrue(is_schema_error(pymysql.err.OperationalError(1054, "Unknown column 'x' in 'field list'")))
+        self.assertTrue(is_schema_error(pymysql.err.ProgrammingError(1146, "Table 'db.t' doesn't exist")))
+        self.assertFalse(is_schema_error(pymysql.err.OperationalError(2013, "Lost connection to MySQL server")))
+        self.assertFalse(is_schema_error(pymysql.err.OperationalError(1205, "Lock wait timeout exceeded")))
+        self.assertFalse(is_schema_error(ValueError(1054)))
+
 if __name__ == "__main__":
     unittest.main()
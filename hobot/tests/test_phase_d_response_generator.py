@@ -1,8 +1,14 @@
 import unittest
+import shutil
 import sys
+import tempfile
+import time
+import threading
 import types
+from unittest.mock import patch
 from datetime import date
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pymysql
 try:
@@ -39,6 +45,27 @@ from service.graph.rag.response_generator import (
 )
 from service.graph.rag.agents.tool_probe import run_sql_probe
 import service.graph.rag.response_generator as response_generator_module
+from service import llm_monitoring
+
+_original_llm_usage_log_sink = None
+_llm_usage_spool_dir = None
+
+
+def setUpModule():
+    # LLM 사용 로그는 MySQL/레포 내 logs 스풀 대신 임시 디렉터리의 no-op 싱크로 받는다.
+    global _original_llm_usage_log_sink, _llm_usage_spool_dir
+    _llm_usage_spool_dir = tempfile.mkdtemp(prefix="llm_usage_spool_")
+    _original_llm_usage_log_sink = llm_monitoring._log_sink
+    llm_monitoring._log_sink = llm_monitoring.LLMUsageLogSink(
+        spool_dir=_llm_usage_spool_dir,
+        writer=lambda records: None,
+    )
+
+
+def tearDownModule():
+    llm_monitoring._log_sink.shutdown(timeout_sec=1)
+    llm_monitoring._log_sink = _original_llm_usage_log_sink
+    shutil.rmtree(_llm_usage_spool_dir, ignore_errors=True)
 
 
 def _detect_db_ready():
@@ -100,6 +127,19 @@ class _StubLLM:
         return _StubLLMResponse(self._content)
 
 
+class _StreamingStubLLM(_StubLLM):
+    def __init__(self, content, chunk_size: int = 7):
+        super().__init__(content)
+        self._chunk_size = chunk_size
+        self.stream_called = False
+
+    def stream(self, prompt: str):
+        self.stream_called = True
+        self.last_prompt = prompt
+        for index in range(0, len(self._content), self._chunk_size):
+            yield _StubLLMResponse(self._content[index : index + self._chunk_size])
+
+
 class _FailingLLM:
     def invoke(self, prompt: str):
         raise AssertionError("LLM should not be called when Top50 scope guard is triggered")
@@ -2474,6 +2514,249 @@ class TestPhaseDResponseGenerator(unittest.TestCase):
         self.assertTrue(web_fallback.get("applied"))
         self.assertEqual(web_fallback.get("search_provider"), "google_news_rss")
 
+    def test_json_string_field_streamer_decodes_split_escapes(self):
+        streamer = response_generator_module._JsonStringFieldStreamer("conclusion")
+        chunks = ['{"concl', 'usion": "금리 \\', 'u0031\\n차 ', '\\"인하\\"', '", "key_points": []}']
+        decoded = "".join(streamer.feed(chunk) for chunk in chunks)
+        self.assertEqual(decoded, '금리 1\n차 "인하"')
+        self.assertTrue(streamer.done)
+
+    def test_generate_answer_streams_progress_and_conclusion_tokens(self):
+        request = GraphRagAnswerRequest(
+            question="최근 인플레이션 리스크는?",
+            model="gemini-3.1-pro-preview",
+            persist_macro_state=False,
+            persist_analysis_run=False,
+        )
+        llm = _StreamingStubLLM(
+            """
+            {
+              "conclusion": "인플레이션 압력이 단기적으로 높아졌습니다.",
+              "uncertainty": "표본 기간이 짧습니다.",
+              "key_points": ["CPI 서프라이즈 발생"],
+              "impact_pathways": [],
+              "cited_evidence_ids": ["EVID_1"]
+            }
+            """
+        )
+        events = []
+
+        response = generate_graph_rag_answer(
+            request=request,
+            context_response=self._sample_context(),
+            llm=llm,
+            progress_callback=events.append,
+        )
+
+        self.assertTrue(llm.stream_called)
+        stages = [event.get("stage") for event in events if event.get("type") == "progress"]
+        self.assertEqual(stages[0], "route")
+        for stage in ("context", "agents", "synthesis", "finalizing"):
+            self.assertIn(stage, stages)
+        self.assertLess(stages.index("synthesis"), stages.index("finalizing"))
+        streamed_text = "".join(event["text"] for event in events if event.get("type") == "token")
+        self.assertEqual(streamed_text, "인플레이션 압력이 단기적으로 높아졌습니다.")
+        self.assertEqual(response.answer.conclusion, "인플레이션 압력이 단기적으로 높아졌습니다.")
+
+    def test_generate_answer_without_progress_callback_keeps_invoke(self):
+        request = GraphRagAnswerRequest(
+            question="최근 인플레이션 리스크는?",
+            model="gemini-3.1-pro-preview",
+            persist_macro_state=False,
+            persist_analysis_run=False,
+        )
+        llm = _StreamingStubLLM('{"conclusion": "요약", "uncertainty": "", "key_points": [], "impact_pathways": []}')
+
+        generate_graph_rag_answer(
+            request=request,
+            context_response=self._sample_context(),
+            llm=llm,
+        )
+
+        self.assertFalse(llm.stream_called)
+
+    def test_execute_branch_agents_parallel_keeps_plan_order_and_trace_order(self):
+        original_execute_agent_stub = response_generator_module.execute_agent_stub
+        delays = {"macro_economy_agent": 0.3, "equity_analyst_agent": 0.05, "real_estate_agent": 0.15}
+        # 세 에이전트가 모두 동시에 실행 중이어야 barrier를 통과한다 (직렬이면 BrokenBarrierError).
+        all_running = threading.Barrier(len(delays), timeout=5)
+
+        def _slow_execute_agent_stub(agent_name, **kwargs):
+            all_running.wait()
+            time.sleep(delays[agent_name])
+            return {"agent": agent_name, "branch": kwargs.get("branch"), "status": "executed"}
+
+        response_generator_module.execute_agent_stub = _slow_execute_agent_stub
+        try:
+            result = response_generator_module._execute_branch_agents(
+                branch_name="sql",
+                enabled=True,
+                dispatch_mode="single",
+                agents=list(delays.keys()),
+                request=GraphRagAnswerRequest(question="거시/주식/부동산 종합 전망"),
+                route_decision={"selected_type": "market_summary"},
+                context_meta={},
+                agent_llm_enabled=False,
+                trace_order_start=4,
+            )
+        finally:
+            response_generator_module.execute_agent_stub = original_execute_agent_stub
+
+        self.assertEqual(result.get("agent_dispatch"), "parallel")
+        runs = result.get("agent_runs") or []
+        self.assertEqual([run.get("status") for run in runs], ["executed"] * len(delays))
+        self.assertEqual([run.get("agent") for run in runs], list(delays.keys()))
+        self.assertEqual([run.get("trace_order") for run in runs], [4, 5, 6])
+
+    def test_execute_branch_agents_parallel_times_out_slow_agent(self):
+        original_execute_agent_stub = response_generator_module.execute_agent_stub
+
+        def _execute_agent_stub(agent_name, **kwargs):
+            if agent_name == "ontology_master_agent":
+                time.sleep(1.5)
+            return {"agent": agent_name, "branch": kwargs.get("branch"), "status": "executed"}
+
+        response_generator_module.execute_agent_stub = _execute_agent_stub
+        try:
+            with patch.dict(os.environ, {"GRAPH_RAG_AGENT_TIMEOUT_SEC": "1"}):
+                result = response_generator_module._execute_branch_agents(
+                    branch_name="graph",
+                    enabled=True,
+                    dispatch_mode="parallel",
+                    agents=["macro_economy_agent", "ontology_master_agent"],
+                    request=GraphRagAnswerRequest(question="금리와 이벤트 연결 구조"),
+                    route_decision={"selected_type": "market_summary"},
+                    context_meta={},
+                    agent_llm_enabled=False,
+                )
+        finally:
+            response_generator_module.execute_agent_stub = original_execute_agent_stub
+
+        runs = result.get("agent_runs") or []
+        self.assertEqual(runs[0].get("status"), "executed")
+        self.assertEqual(runs[1].get("status"), "timeout")
+        self.assertEqual((runs[1].get("agent_llm") or {}).get("status"), "degraded")
+        self.assertEqual(result.get("timed_out_agents"), ["ontology_master_agent"])
+
+    def test_execute_branch_agents_serial_runs_inline(self):
+        original_execute_agent_stub = response_generator_module.execute_agent_stub
+        thread_names = []
+
+        def _execute_agent_stub(agent_name, **kwargs):
+            thread_names.append(threading.current_thread().name)
+            return {"agent": agent_name, "branch": kwargs.get("branch"), "status": "executed"}
+
+        response_generator_module.execute_agent_stub = _execute_agent_stub
+        try:
+            with patch.dict(os.environ, {"GRAPH_RAG_PARALLEL_AGENTS_ENABLED": "false"}):
+                result = response_generator_module._execute_branch_agents(
+                    branch_name="sql",
+                    enabled=True,
+                    dispatch_mode="single",
+                    agents=["macro_economy_agent", "equity_analyst_agent"],
+                    request=GraphRagAnswerRequest(question="미국 금리 전망"),
+                    route_decision={"selected_type": "indicator_lookup"},
+                    context_meta={},
+                    agent_llm_enabled=False,
+                    trace_order_start=1,
+                )
+        finally:
+            response_generator_module.execute_agent_stub = original_execute_agent_stub
+
+        runs = result.get("agent_runs") or []
+        self.assertEqual(result.get("agent_dispatch"), "serial")
+        self.assertEqual([run.get("trace_order") for run in runs], [1, 2])
+        self.assertEqual(thread_names, [threading.current_thread().name] * 2)
+
+    def test_execute_branch_agents_parallel_timeout_starts_when_agent_runs(self):
+        original_execute_agent_stub = response_generator_module.execute_agent_stub
+
+        def _execute_agent_stub(agent_name, **kwargs):
+            time.sleep(0.7)
+            return {"agent": agent_name, "branch": kwargs.get("branch"), "status": "executed"}
+
+        # 단일 worker에서 세 번째 에이전트는 약 1.4초 대기열에 있다.
+        # 대기 시간이 에이전트별 timeout(1초)을 넘어도 시작 후 timeout 안에 끝나면 정상 결과다.
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-rag-agent-test")
+        self.addCleanup(pool.shutdown, wait=True)
+        response_generator_module.execute_agent_stub = _execute_agent_stub
+        try:
+            with patch.dict(os.environ, {"GRAPH_RAG_AGENT_TIMEOUT_SEC": "1"}), patch.object(
+                response_generator_module, "_get_agent_dispatch_pool", return_value=pool
+            ):
+                result = response_generator_module._execute_branch_agents(
+                    branch_name="sql",
+                    enabled=True,
+                    dispatch_mode="parallel",
+                    agents=["macro_economy_agent", "equity_analyst_agent", "real_estate_agent"],
+                    request=GraphRagAnswerRequest(question="미국 금리 전망"),
+                    route_decision={"selected_type": "indicator_lookup"},
+                    context_meta={},
+                    agent_llm_enabled=False,
+                )
+        finally:
+            response_generator_module.execute_agent_stub = original_execute_agent_stub
+
+        runs = result.get("agent_runs") or []
+        self.assertEqual(result.get("agent_dispatch"), "parallel")
+        self.assertEqual([run.get("status") for run in runs], ["executed"] * 3)
+        self.assertEqual(result.get("timed_out_agents"), [])
+
+    def test_execute_branch_agents_parallel_queued_agent_uses_supervisor_deadline(self):
+        original_execute_agent_stub = response_generator_module.execute_agent_stub
+        release_first = threading.Event()
+        self.addCleanup(release_first.set)
+        started = []
+
+        def _execute_agent_stub(agent_name, **kwargs):
+            started.append(agent_name)
+            if agent_name == "macro_economy_agent":
+                release_first.wait(timeout=5)
+            return {"agent": agent_name, "branch": kwargs.get("branch"), "status": "executed"}
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-rag-agent-test")
+        self.addCleanup(pool.shutdown, wait=True)
+        response_generator_module.execute_agent_stub = _execute_agent_stub
+        try:
+            with patch.object(response_generator_module, "_get_agent_dispatch_pool", return_value=pool):
+                result = response_generator_module._execute_branch_agents(
+                    branch_name="sql",
+                    enabled=True,
+                    dispatch_mode="parallel",
+                    agents=["macro_economy_agent", "equity_analyst_agent"],
+                    request=GraphRagAnswerRequest(question="미국 금리 전망"),
+                    route_decision={"selected_type": "indicator_lookup"},
+                    context_meta={},
+                    agent_llm_enabled=False,
+                    deadline_at=time.monotonic() + 0.5,
+                )
+        finally:
+            response_generator_module.execute_agent_stub = original_execute_agent_stub
+            release_first.set()
+
+        runs = result.get("agent_runs") or []
+        self.assertEqual([run.get("reason") for run in runs], ["supervisor_deadline_exceeded"] * 2)
+        self.assertEqual(result.get("timed_out_agents"), ["macro_economy_agent", "equity_analyst_agent"])
+        pool.shutdown(wait=True)
+        self.assertEqual(started, ["macro_economy_agent"])
+
+    def test_execute_branch_agents_serial_respects_expired_deadline(self):
+        result = response_generator_module._execute_branch_agents(
+            branch_name="sql",
+            enabled=True,
+            dispatch_mode="single",
+            agents=["macro_economy_agent"],
+            request=GraphRagAnswerRequest(question="미국 금리 전망"),
+            route_decision={"selected_type": "indicator_lookup"},
+            context_meta={},
+            agent_llm_enabled=False,
+            deadline_at=time.monotonic() - 1,
+        )
+
+        runs = result.get("agent_runs") or []
+        self.assertEqual(result.get("agent_dispatch"), "serial")
+        self.assertEqual(runs[0].get("reason"), "supervisor_deadline_exceeded")
+
 
 @unittest.skipUnless(_DB_READY, f"DB integration skipped: {_DB_READY_REASON}")
 class TestPhaseDResponseGeneratorDBIntegration(unittest.TestCase):
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+
+from service.graph.rag.retrieval_executor import GraphRagRetrievalExecutor
+
+
+class TestPhaseDRetrievalExecutor(unittest.TestCase):
+    def test_run_wave_executes_stages_concurrently(self):
+        executor = GraphRagRetrievalExecutor(max_workers=4, stage_timeout_sec=5.0, parallel_enabled=True)
+
+        # 세 stage가 동시에 실행 중이어야 barrier를 통과한다 (순차 실행이면 BrokenBarrierError).
+        barrier = threading.Barrier(3, timeout=2.0)
+
+        def _overlapping(value):
+            def _call():
+                barrier.wait()
+                time.sleep(0.05)
+                return value
+
+            return _call
+
+        results = executor.run_wave(
+            "seed",
+            {"a": _overlapping(1), "b": _overlapping(2), "c": _overlapping(3)},
+        )
+
+        self.assertEqual(results, {"a": 1, "b": 2, "c": 3})
+        meta = executor.build_meta()
+        self.assertEqual(meta["stages"]["a"]["status"], "ok")
+        self.assertEqual(meta["waves"][0]["wave"], "seed")
+        self.assertGreaterEqual(meta["stage_sum_ms"], meta["waves"][0]["elapsed_ms"])
+
+    def test_stage_timeout_falls_back_to_default(self):
+        executor = GraphRagRetrievalExecutor(max_workers=2, stage_timeout_sec=5.0, parallel_enabled=True)
+
+        results = executor.run_wave(
+            "seed",
+            {
+                "fast": lambda: ["doc"],
+                "slow": lambda: time.sleep(0.5) or ["late"],
+            },
+            defaults={"slow": []},
+            timeouts={"slow": 0.1},
+        )
+
+        self.assertEqual(results["fast"], ["doc"])
+        self.assertEqual(results["slow"], [])
+        meta = executor.build_meta()
+        self.assertEqual(meta["stages"]["slow"]["status"], "timeout")
+        self.assertEqual(meta["timeout_stages"], ["slow"])
+
+    def test_skipped_stage_and_error_propagation(self):
+        executor = GraphRagRetrievalExecutor(max_workers=2, parallel_enabled=True)
+
+        def _boom():
+            raise RuntimeError("neo4j unavailable")
+
+        with self.assertRaises(RuntimeError):
+            executor.run_wave(
+                "anchor",
+                {"events": _boom, "fallback": lambda: [], "vector": None},
+                defaults={"vector": (None, [])},
+            )
+        meta = executor.build_meta()
+        self.assertEqual(meta["stages"]["events"]["status"], "error")
+        self.assertEqual(meta["stages"]["vector"]["status"], "skipped")
+
+    def test_serial_mode_runs_inline(self):
+        executor = GraphRagRetrievalExecutor(max_workers=4, parallel_enabled=False)
+        order = []
+        executor.run_wave(
+            "seed",
+            {
+                "first": lambda: order.append("first"),
+                "second": lambda: order.append("second"),
+            },
+        )
+        self.assertEqual(order, ["first", "second"])
+        self.assertFalse(executor.build_meta()["parallel_enabled"])
+
+
+if __name__ == "__main__":
+    unittest.main()
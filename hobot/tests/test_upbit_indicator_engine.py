@@ -0,0 +1,225 @@
+import importlib
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from service.upbit.backtest import run_bbrsi_backtest, run_bbrsi_parameter_sweep
+from service.upbit.indicator_engine import (
+    INDICATOR_COLUMNS,
+    IndicatorEngine,
+    IndicatorState,
+    compute_indicator_frame,
+)
+from service.upbit.strategy_signals import (
+    BBRSIParams,
+    bbrsi_features_from_frame,
+    bbrsi_features_from_rows,
+    bbrsi_signals,
+    resolve_bbrsi_action,
+)
+from service.upbit.upbit_utils import calculate_atr, calculate_rsi
+
+
+def _random_candles(periods=400, seed=7, freq="1D"):
+    rng = np.random.default_rng(seed)
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.03, periods)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.02, periods)) * close
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.uniform(1, 10, periods),
+        },
+        index=pd.date_range("2024-01-01", periods=periods, freq=freq),
+    )
+
+
+def _legacy_full_window_bbrsi(df, current_strategy):
+    """엔진 도입 전 strategy_bbrsi (250봉 전체를 매번 다시 계산) 판단 로직"""
+    df = df.copy()
+    close = df["close"]
+    rsi = calculate_rsi(df)
+    rsi_ma2_series = rsi.ewm(span=2, adjust=False).mean()
+    rsi_ma4_series = rsi.ewm(span=4, adjust=False).mean()
+    rsi_ma1, rsi_ma2, rsi_ma4 = rsi.iloc[-2], rsi_ma2_series.iloc[-2], rsi_ma4_series.iloc[-2]
+    ma7_series = close.ewm(span=7, adjust=False).mean()
+    ma7, ma7_2before = ma7_series.iloc[-2], ma7_series.iloc[-3]
+
+    middle = close.rolling(window=20).mean()
+    std = close.rolling(20).std(ddof=0)
+    upper, lower, lower_k2 = middle + std, middle - std, middle - 2 * std
+
+    close_curr, close1, close2 = close.iloc[-1], close.iloc[-2], close.iloc[-3]
+    high1 = df["high"].iloc[-2]
+    low1 = df["low"].iloc[-2]
+    atr1 = calculate_atr(df, period=20, atr_type="rma").iloc[-1]
+
+    condition1 = close1 > ma7
+    condition1_2 = (
+        abs(rsi_ma1 - rsi_ma2) * 100 / rsi_ma1 < 1.8
+        or abs(rsi_ma1 - rsi_ma2) * 100 / rsi_ma2 < 1.8
+        or abs(rsi_ma2 - rsi_ma4) * 100 / rsi_ma4 < 1.8
+    )
+    condition2 = any(
+        rsi.iloc[i] < rsi_ma2_series.iloc[i] < rsi_ma4_series.iloc[i] for i in (-3, -4)
+    )
+    condition3 = any(lower.iloc[-i] > df["low"].iloc[-i] for i in (2, 3, 4, 5))
+
+    sell_condition1 = low1 < lower_k2.iloc[-2]
+    sell_over = (
+        (upper.iloc[-2] < close1 and upper.iloc[-3] > close2)
+        or sell_condition1
+        or (low1 - atr1) > close_curr
+        or (high1 + atr1 * 4) < close_curr
+    )
+    sell_under = (ma7 < close1 and ma7_2before > close2) or sell_condition1 or (close1 * 0.88) > close_curr
+
+    buy = (condition1 or condition1_2) and condition2 and condition3
+    if current_strategy == "STRATEGY_NULL":
+        if close1 > ma7:
+            return "buyCondition_bbrsi_over" if buy and not sell_over else None
+        return "buyCondition_bbrsi_under" if buy and not sell_under else None
+    if current_strategy == "STRATEGY_BBRSI_OVER" and sell_over:
+        return "sellCondition_bbrsi_over"
+    if current_strategy == "STRATEGY_BBRSI_UNDER" and sell_under:
+        return "sellCondition_bbrsi_under"
+    return None
+
+
+class TestIndicatorEngine(unittest.TestCase):
+    def test_streaming_state_matches_vectorized_frame(self):
+        candles = _random_candles()
+        frame = compute_indicator_frame(candles)
+
+        state = IndicatorState()
+        rows = [state.update(ts, candle) for ts, candle in zip(candles.index, candles.to_dict("records"))]
+        streamed = pd.DataFrame(rows, index=candles.index)[list(INDICATOR_COLUMNS)]
+
+        np.testing.assert_allclose(streamed.to_numpy(), frame.to_numpy(), rtol=1e-9, equal_nan=True)
+
+    def test_preview_does_not_change_state(self):
+        candles = _random_candles(60)
+        state = IndicatorState()
+        for ts, candle in zip(candles.index[:-1], candles.iloc[:-1].to_dict("records")):
+            state.update(ts, candle)
+
+        preview = state.preview(candles.iloc[-1])
+        again = state.preview(candles.iloc[-1])
+        committed = state.update(candles.index[-1], candles.iloc[-1])
+
+        self.assertEqual(preview, again)
+        self.assertEqual(preview, committed)
+        self.assertEqual(state.count, 60)
+
+    def test_sync_appends_only_new_closed_candles_and_detects_gaps(self):
+        candles = _random_candles(300)
+        engine = IndicatorEngine()
+
+        self.assertTrue(engine.sync("KRW-BTC", "D", candles.iloc[:251]))
+        self.assertEqual(engine.candles_needed("KRW-BTC", "D", 250), 10)
+        # 겹치는 최근 봉만 받아도 이어서 반영된다.
+        self.assertTrue(engine.sync("KRW-BTC", "D", candles.iloc[245:256]))
+        rows = engine.rows("KRW-BTC", "D", candles.iloc[255])
+
+        reference = IndicatorEngine()
+        reference.sync("KRW-BTC", "D", candles.iloc[:256])
+        self.assertEqual(rows, reference.rows("KRW-BTC", "D", candles.iloc[255]))
+
+        # 마지막 반영 이후 봉이 비면 False (호출자가 reset 후 재워밍업)
+        self.assertFalse(engine.sync("KRW-BTC", "D", candles.iloc[280:290]))
+
+
+class TestBBRSIBacktest(unittest.TestCase):
+    def test_live_and_vectorized_signals_agree(self):
+        candles = _random_candles(320, seed=11)
+        params = BBRSIParams()
+        frame = compute_indicator_frame(candles, params.indicator_params())
+        vectorized = bbrsi_signals(bbrsi_features_from_frame(frame), params)
+
+        engine = IndicatorEngine(params.indicator_params())
+        for end in range(30, len(candles)):
+            window = candles.iloc[: end + 1]
+            self.assertTrue(engine.sync("KRW-BTC", "D", window.iloc[-12:] if engine.is_warm("KRW-BTC", "D") else window))
+            live = bbrsi_signals(bbrsi_features_from_rows(engine.rows("KRW-BTC", "D", window.iloc[-1])), params)
+            for key in ("entry_over", "entry_under", "sell_over", "sell_under"):
+                self.assertEqual(bool(live[key]), bool(vectorized[key][end]), f"{key} @ {end}")
+
+    def test_resolve_action_follows_position_state(self):
+        signals = {"entry_over": False, "entry_under": True, "sell_over": True, "sell_under": False}
+        self.assertEqual(resolve_bbrsi_action("STRATEGY_NULL", signals), "buyCondition_bbrsi_under")
+        self.assertEqual(resolve_bbrsi_action("STRATEGY_BBRSI_OVER", signals), "sellCondition_bbrsi_over")
+        self.assertEqual(resolve_bbrsi_action("STRATEGY_BBRSI_UNDER", signals), "noCondition_bbrsi")
+
+    def test_backtest_trades_follow_signals_and_sweep_reuses_frames(self):
+        candles = _random_candles(1500, seed=3, freq="1h")
+        result = run_bbrsi_backtest(candles, fee_rate=0.0)
+        signals = bbrsi_signals(bbrsi_features_from_frame(compute_indicator_frame(candles)))
+
+        self.assertGreater(result.stats["trade_count"], 0)
+        previous_exit = None
+        for trade in result.trades.itertuples():
+            entry = candles.index.get_loc(trade.entry_time)
+            key = "over" if trade.strategy == "STRATEGY_BBRSI_OVER" else "under"
+            self.assertTrue(signals[f"entry_{key}"][entry])
+            if previous_exit is not None:
+                self.assertGreater(entry, previous_exit)
+            if not trade.open:
+                previous_exit = candles.index.get_loc(trade.exit_time)
+                self.assertTrue(signals[f"sell_{key}"][previous_exit])
+                self.assertFalse(signals[f"sell_{key}"][entry + 1:previous_exit].any())
+
+        # 수수료 0이면 최종 자산 = 거래별 수익률의 곱
+        growth = np.prod(1 + result.trades["return_pct"].to_numpy() / 100)
+        self.assertAlmostEqual(result.equity.iloc[-1], growth, places=9)
+
+        sweep = run_bbrsi_parameter_sweep(candles, {"rsi_threshold": [1.0, 1.8, 3.0], "atr_limit_mult": [2.0, 4.0]})
+        self.assertEqual(len(sweep), 6)
+        self.assertTrue(sweep["total_return_pct"].is_monotonic_decreasing)
+        with self.assertRaises(ValueError):
+            run_bbrsi_parameter_sweep(candles, {"unknown": [1]})
+
+
+class TestStrategyBBRSILive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("UP_ACCESS_KEY", "test-access")
+        os.environ.setdefault("UP_SECRET_KEY", "test-secret")
+        cls.upbit = importlib.import_module("service.upbit.upbit")
+
+    def test_strategy_bbrsi_matches_legacy_full_window_calculation(self):
+        candles = _random_candles(420, seed=5)
+        fetch_counts = []
+        state = {"end": 0}
+
+        def fake_fetch(ticker, candle_interval, count):
+            fetch_counts.append(count)
+            return candles.iloc[: state["end"] + 1].tail(count).copy()
+
+        actions = set()
+        with mock.patch.object(self.upbit, "fetch_candle_data", side_effect=fake_fetch), mock.patch.object(
+            self.upbit, "get_indicator_engine", return_value=IndicatorEngine()
+        ), mock.patch("builtins.print"):
+            for end in range(260, len(candles)):
+                state["end"] = end
+                legacy_window = candles.iloc[: end + 1].tail(250)
+                for strategy in ("STRATEGY_NULL", "STRATEGY_BBRSI_OVER", "STRATEGY_BBRSI_UNDER"):
+                    action = self.upbit.strategy_bbrsi(strategy)
+                    expected = _legacy_full_window_bbrsi(legacy_window, strategy) or "noCondition_bbrsi"
+                    self.assertEqual(action, expected, f"{strategy} @ {end}")
+                    actions.add(action)
+
+        # 첫 호출만 전체 워밍업, 이후에는 겹치는 짧은 구간만 받는다.
+        self.assertEqual(fetch_counts[0], 250)
+        self.assertTrue(all(count < 250 for count in fetch_counts[1:]))
+        # 매수/매도 판단이 실제로 여러 갈래로 나오는 구간인지 확인
+        self.assertGreater(len(actions), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()